@@ -0,0 +1,4 @@
+import os
+
+# benchmarks must run fully offline, including anonymous usage telemetry
+os.environ.setdefault('GRAPHITI_TELEMETRY_ENABLED', 'false')
@@ -0,0 +1,200 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from neo4j import time as neo4j_time
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.utils.bulk_utils import RawEpisode
+from graphiti_core.utils.maintenance.community_operations import Neighbor
+
+FIRST_NAMES = [
+    'Alice', 'Bob', 'Carol', 'David', 'Erin', 'Frank', 'Grace', 'Heidi', 'Ivan', 'Judy',
+    'Mallory', 'Niaj', 'Olivia', 'Peggy', 'Rupert', 'Sybil', 'Trent', 'Victor', 'Walter', 'Yvonne',
+]  # fmt: skip
+LAST_NAMES = ['Chen', 'Garcia', 'Ivanova', 'Kim', 'Muller', 'Okafor', 'Rossi', 'Smith']
+ORGANIZATIONS = [
+    'Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Enterprises',
+    'Hooli', 'Vehement Capital', 'Soylent', 'Cyberdyne',
+]  # fmt: skip
+PLACES = ['Paris', 'Berlin', 'Tokyo', 'Nairobi', 'Lima', 'Toronto', 'Sydney', 'Seoul']
+TOPICS = ['the merger', 'a product launch', 'hiring plans', 'the quarterly budget', 'a lawsuit']
+
+START_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+GROUP_ID = 'benchmark'
+
+
+class Corpus:
+    """
+    Deterministic synthetic conversation data. Names repeat across episodes, so ingestion
+    exercises deduplication and search finds overlapping entities and facts.
+    """
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    def person(self) -> str:
+        return f'{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)}'
+
+    def sentence(self) -> str:
+        speaker, other = self.person(), self.person()
+        organization = self.random.choice(ORGANIZATIONS)
+        place = self.random.choice(PLACES)
+        topic = self.random.choice(TOPICS)
+        return f'{speaker}: I met {other} from {organization} in {place} to talk about {topic}.'
+
+    def raw_episodes(self, count: int) -> list[RawEpisode]:
+        return [
+            RawEpisode(
+                name=f'episode-{i}',
+                content=self.sentence(),
+                source_description='benchmark conversation',
+                source=EpisodeType.message,
+                reference_time=START_TIME + timedelta(minutes=i),
+            )
+            for i in range(count)
+        ]
+
+    def episodic_node(self, raw_episode: RawEpisode) -> EpisodicNode:
+        return EpisodicNode(
+            name=raw_episode.name,
+            group_id=GROUP_ID,
+            labels=[],
+            source=raw_episode.source,
+            source_description=raw_episode.source_description,
+            content=raw_episode.content,
+            valid_at=raw_episode.reference_time,
+            created_at=raw_episode.reference_time,
+        )
+
+    def entity_nodes(self, count: int) -> list[EntityNode]:
+        names = [self.person() for _ in range(count - 1)] + [self.random.choice(ORGANIZATIONS)]
+        return [
+            EntityNode(name=name, group_id=GROUP_ID, labels=['Entity'], created_at=START_TIME)
+            for name in names
+        ]
+
+    def entity_edges(self, count: int, dim: int) -> list[EntityEdge]:
+        """Edges as search hydrates them, with the embedding among the stored properties."""
+        edges = []
+        for i, vector in enumerate(self.vectors(count, dim)):
+            speaker, other = self.person(), self.person()
+            edges.append(
+                EntityEdge(
+                    source_node_uuid=f'node-{speaker}',
+                    target_node_uuid=f'node-{other}',
+                    name='MET',
+                    fact=f'{speaker} met {other} in {self.random.choice(PLACES)}',
+                    group_id=GROUP_ID,
+                    episodes=[f'episode-{i}'],
+                    created_at=START_TIME + timedelta(minutes=i),
+                    valid_at=START_TIME + timedelta(minutes=i),
+                    attributes={'fact_embedding': vector},
+                )
+            )
+        return edges
+
+    def triplets(self, count: int) -> list[tuple[EntityNode, EntityEdge, EntityNode]]:
+        """Hand-built person-organization facts. People and organizations repeat across facts."""
+        triplets = []
+        for i in range(count):
+            person = EntityNode(name=self.person(), group_id=GROUP_ID, created_at=START_TIME)
+            organization = EntityNode(
+                name=self.random.choice(ORGANIZATIONS), group_id=GROUP_ID, created_at=START_TIME
+            )
+            edge = EntityEdge(
+                source_node_uuid=person.uuid,
+                target_node_uuid=organization.uuid,
+                name='WORKS_AT',
+                fact=f'{person.name} works at {organization.name}',
+                group_id=GROUP_ID,
+                created_at=START_TIME + timedelta(minutes=i),
+                valid_at=START_TIME + timedelta(minutes=i),
+            )
+            triplets.append((person, edge, organization))
+        return triplets
+
+    def entity_edge_records(self, count: int) -> list[dict]:
+        """Rows shaped like the entity edge RETURN columns of a Neo4j query."""
+        records = []
+        for edge in self.entity_edges(count, 0):
+            created_at = neo4j_time.DateTime.from_native(edge.created_at)
+            properties = {
+                **edge.model_dump(exclude={'attributes', 'fact_embedding'}),
+                'created_at': created_at,
+                'valid_at': created_at,
+                'strength': self.random.randint(1, 5),
+            }
+            records.append({**properties, 'attributes': properties})
+        return records
+
+    def entity_node_records(self, count: int) -> list[dict]:
+        """Rows shaped like the entity node RETURN columns of a Neo4j query."""
+        records = []
+        for i in range(count):
+            created_at = neo4j_time.DateTime.from_native(START_TIME + timedelta(minutes=i))
+            properties = {
+                'uuid': f'node-{i}',
+                'name': self.person(),
+                'group_id': GROUP_ID,
+                'summary': f'Met people in {self.random.choice(PLACES)}',
+                'created_at': created_at,
+                'age': self.random.randint(20, 70),
+            }
+            records.append({**properties, 'labels': ['Entity'], 'attributes': properties})
+        return records
+
+    def queries(self, count: int) -> list[str]:
+        return [
+            f'What did {self.person()} discuss in {self.random.choice(PLACES)}?'
+            for _ in range(count)
+        ]
+
+    def projection(self, node_count: int, cluster_size: int = 10) -> dict[str, list[Neighbor]]:
+        """
+        Cliques of single edges joined by one bridge each, as community detection sees them.
+
+        label_propagation updates every node at once and can oscillate forever on arbitrary
+        weighted graphs, so the benchmark uses a shape it is known to converge on.
+        """
+        uuids = [f'node-{i}' for i in range(node_count)]
+        edges: dict[str, set[str]] = {uuid: set() for uuid in uuids}
+        for start in range(0, node_count, cluster_size):
+            members = uuids[start : start + cluster_size]
+            for i, uuid in enumerate(members):
+                for other in members[i + 1 :]:
+                    edges[uuid].add(other)
+                    edges[other].add(uuid)
+
+            next_members = uuids[start + cluster_size : start + 2 * cluster_size]
+            if next_members:
+                uuid, other = self.random.choice(members), self.random.choice(next_members)
+                edges[uuid].add(other)
+                edges[other].add(uuid)
+
+        return {
+            uuid: [Neighbor(node_uuid=neighbor, edge_count=1) for neighbor in sorted(neighbors)]
+            for uuid, neighbors in edges.items()
+        }
+
+    def vectors(self, count: int, dim: int) -> list[list[float]]:
+        generator = np.random.default_rng(self.seed)
+        return generator.standard_normal((count, dim)).tolist()
@@ -0,0 +1,298 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import hashlib
+import math
+import re
+import typing
+from collections import Counter
+from collections.abc import Iterable
+from types import NoneType, UnionType
+from typing import Any
+
+from pydantic import BaseModel
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.llm_client import LLMClient, LLMConfig
+from graphiti_core.llm_client.config import DEFAULT_MAX_TOKENS, ModelSize
+from graphiti_core.llm_client.usage import TokenUsage
+from graphiti_core.prompts.models import Message
+from graphiti_core.utils.context_window import estimate_tokens, truncate_to_tokens
+
+FAKE_MODEL = 'fake-llm'
+FAKE_EMBEDDING_DIM = 256
+
+# capitalized words, optionally followed by more capitalized words ("Alice Chen", "Acme Corp")
+_ENTITY_PATTERN = re.compile(r'\b[A-Z][a-z]+(?: [A-Z][a-z]+)*\b')
+_TOKEN_PATTERN = re.compile(r'\w+')
+_CURRENT_EPISODE_TAGS = ('当前消息', '文本', 'JSON')
+# context entries rendered with json.dumps (dedupe_nodes.nodes)
+_JSON_ID_NAME = re.compile(r'"id": (\d+),\s*"name": "((?:[^"\\]|\\.)*)"')
+_JSON_IDX_NAME = re.compile(r'"idx": (\d+),\s*"name": "((?:[^"\\]|\\.)*)"')
+# context entries rendered with str() (extract_edges.edge)
+_REPR_ID_NAME = re.compile(r"'id': (\d+), 'name': '((?:[^'\\]|\\.)*)'")
+
+
+def _stable_hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'big')
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _tagged_block(text: str, tag: str) -> str | None:
+    match = re.search(rf'<{tag}>\n(.*?)\n</{tag}>', text, re.DOTALL)
+    return match.group(1) if match else None
+
+
+class FakeLLMClient(LLMClient):
+    """
+    Answers every prompt Graphiti sends with a deterministic response derived from the prompt.
+
+    Capitalized phrases of the current episode become entities, consecutive entities are
+    connected by a fact, extracted entities are deduplicated against existing ones by name and
+    nothing is ever invalidated. Token usage is estimated from the prompt so usage accounting
+    runs as it would against a provider.
+    """
+
+    def __init__(self, latency: float = 0.0, config: LLMConfig | None = None):
+        super().__init__(config or LLMConfig(model=FAKE_MODEL, small_model=FAKE_MODEL))
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+
+    async def _generate_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        model_size: ModelSize = ModelSize.medium,
+    ) -> dict[str, Any]:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+        model_name = response_model.__name__ if response_model is not None else 'text'
+        self.calls[model_name] += 1
+
+        prompt = messages[-1].content
+        response = self._respond(model_name, response_model, prompt)
+
+        self._record_usage(
+            self.model,
+            TokenUsage(
+                input_tokens=sum(estimate_tokens(m.content) for m in messages),
+                output_tokens=estimate_tokens(str(response)),
+            ),
+        )
+        return response
+
+    def _respond(
+        self, model_name: str, response_model: type[BaseModel] | None, prompt: str
+    ) -> dict[str, Any]:
+        if model_name == 'ExtractedEntities':
+            return {'extracted_entities': self._extract_entities(prompt)}
+        if model_name == 'MissedEntities':
+            return {'missed_entities': []}
+        if model_name == 'NodeResolutions':
+            return {'entity_resolutions': self._resolve_nodes(prompt)}
+        if model_name == 'ExtractedEdges':
+            return {'edges': self._extract_edges(prompt)}
+        if model_name == 'MissingFacts':
+            return {'missing_facts': []}
+        if model_name == 'EdgeDuplicate':
+            return {'duplicate_facts': [], 'contradicted_facts': [], 'fact_type': 'DEFAULT'}
+        if model_name == 'InvalidatedEdges':
+            return {'contradicted_facts': []}
+        if model_name == 'EdgeDates':
+            return {'valid_at': None, 'invalid_at': None}
+        if response_model is None:
+            return {'content': self._summarize(prompt)}
+        return self._synthesize(response_model, prompt)
+
+    def _current_episode(self, prompt: str) -> str:
+        for tag in _CURRENT_EPISODE_TAGS:
+            block = _tagged_block(prompt, tag)
+            if block is not None:
+                return block
+        return prompt
+
+    def _extract_entities(self, prompt: str) -> list[dict[str, Any]]:
+        names = dict.fromkeys(_ENTITY_PATTERN.findall(self._current_episode(prompt)))
+        return [{'name': name, 'entity_type_id': 0} for name in names]
+
+    def _resolve_nodes(self, prompt: str) -> list[dict[str, Any]]:
+        existing = {name: int(idx) for idx, name in _JSON_IDX_NAME.findall(prompt)}
+        resolutions = []
+        for node_id, name in _JSON_ID_NAME.findall(prompt):
+            duplicate_idx = existing.get(name, -1)
+            resolutions.append(
+                {
+                    'id': int(node_id),
+                    'duplicate_idx': duplicate_idx,
+                    'name': name,
+                    'duplicates': [duplicate_idx] if duplicate_idx >= 0 else [],
+                }
+            )
+        return resolutions
+
+    def _extract_edges(self, prompt: str) -> list[dict[str, Any]]:
+        nodes = [(int(node_id), name) for node_id, name in _REPR_ID_NAME.findall(prompt)]
+        return [
+            {
+                'relation_type': 'RELATES_TO',
+                'source_entity_id': source_id,
+                'target_entity_id': target_id,
+                'fact': f'{source_name} is related to {target_name}',
+                'valid_at': None,
+                'invalid_at': None,
+            }
+            for (source_id, source_name), (target_id, target_name) in zip(
+                nodes, nodes[1:], strict=False
+            )
+        ]
+
+    def _summarize(self, prompt: str) -> str:
+        return truncate_to_tokens(self._current_episode(prompt).strip(), 50)
+
+    def _synthesize(self, response_model: type[BaseModel], prompt: str) -> dict[str, Any]:
+        """Fill every field of an arbitrary response model with a plausible value."""
+        response: dict[str, Any] = {}
+        for name, field in response_model.model_fields.items():
+            annotation = field.annotation
+            if typing.get_origin(annotation) in (UnionType, typing.Union):
+                options = [arg for arg in typing.get_args(annotation) if arg is not NoneType]
+                annotation = options[0] if options else str
+
+            if annotation is str:
+                response[name] = self._summarize(prompt)
+            elif annotation is bool:
+                response[name] = False
+            elif annotation in (int, float):
+                response[name] = annotation(0)
+            elif typing.get_origin(annotation) is list:
+                response[name] = []
+            else:
+                response[name] = None
+        return response
+
+
+class FakeEmbedder(EmbedderClient):
+    """
+    Hashed bag-of-words embeddings: texts sharing words get a high cosine similarity, so vector
+    search and MMR see realistic score distributions.
+    """
+
+    def __init__(self, embedding_dim: int = FAKE_EMBEDDING_DIM, latency: float = 0.0):
+        self.embedding_dim = embedding_dim
+        self.latency = latency
+        self.calls = 0
+
+    def embed(self, text: str) -> list[float]:
+        vector = [0.0] * self.embedding_dim
+        for token in _tokens(text) or [text]:
+            token_hash = _stable_hash(token)
+            sign = 1.0 if token_hash & 1 else -1.0
+            vector[(token_hash >> 1) % self.embedding_dim] += sign
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        self.calls += 1
+
+        text = input_data if isinstance(input_data, str) else ' '.join(map(str, input_data))
+        return self.embed(text)
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        self.calls += 1
+
+        return [self.embed(text) for text in input_data_list]
+
+
+class FakeCrossEncoder(CrossEncoderClient):
+    """Scores passages by the share of query words they contain."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        self.calls += 1
+
+        query_tokens = set(_tokens(query))
+        ranked = []
+        for passage in passages:
+            overlap = len(query_tokens.intersection(_tokens(passage)))
+            ranked.append((passage, overlap / len(query_tokens) if query_tokens else 0.0))
+        return sorted(ranked, key=lambda item: item[1], reverse=True)
+
+
+class NullSession(GraphDriverSession):
+    def __init__(self, driver: 'NullDriver'):
+        self.driver = driver
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    async def run(self, query: str, **kwargs: Any) -> Any:
+        self.driver.queries += 1
+        return None
+
+    async def close(self):
+        pass
+
+    async def execute_write(self, func, *args, **kwargs):
+        return await func(self, *args, **kwargs)
+
+
+class NullDriver(GraphDriver):
+    """
+    Accepts every query and returns no rows. Benchmarks run against it measure Graphiti's own
+    overhead (prompt building, LLM orchestration, embedding and result handling) with the
+    database cost removed.
+    """
+
+    provider = GraphProvider.NEO4J
+
+    def __init__(self, latency: float = 0.0, database: str = 'benchmark'):
+        self.latency = latency
+        self.queries = 0
+        self._database = database
+
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        self.queries += 1
+        return [], None, []
+
+    def session(self, database: str | None = None) -> GraphDriverSession:
+        return NullSession(self)
+
+    async def close(self):
+        pass
+
+    async def delete_all_indexes(self):
+        pass
@@ -0,0 +1,469 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from importlib import metadata
+from time import perf_counter
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from benchmarks.corpus import GROUP_ID, Corpus
+from benchmarks.fakes import FakeCrossEncoder, FakeEmbedder, FakeLLMClient, NullDriver
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.memory_driver import InMemoryDriver
+from graphiti_core.edges import get_entity_edge_from_record
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.nodes import EntityNode, get_entity_node_from_record
+from graphiti_core.search import search_config_recipes
+from graphiti_core.search.search_config import SearchConfig
+from graphiti_core.search.search_utils import maximal_marginal_relevance
+from graphiti_core.utils.bulk_utils import dedupe_nodes_bulk
+from graphiti_core.utils.maintenance.community_operations import label_propagation
+from graphiti_core.utils.serialization import dumps, entity_edge_to_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEATS = 3
+DEFAULT_QUERIES = 20
+DEFAULT_THRESHOLD = 0.2
+# center node used when the benchmarked graph has no entities
+CENTER_NODE_UUID = '00000000-0000-0000-0000-000000000000'
+
+SEARCH_RECIPES: dict[str, SearchConfig] = {
+    name: config
+    for name, config in vars(search_config_recipes).items()
+    if isinstance(config, SearchConfig)
+}
+
+
+class BenchmarkOptions(BaseModel):
+    seed: int = 0
+    repeats: int = DEFAULT_REPEATS
+    queries: int = Field(default=DEFAULT_QUERIES, description='search queries timed per recipe')
+    llm_latency: float = Field(default=0.0, description='seconds per fake LLM call')
+    embedder_latency: float = Field(default=0.0, description='seconds per fake embedder call')
+    cross_encoder_latency: float = Field(
+        default=0.0, description='seconds per fake cross-encoder call'
+    )
+    backend: Literal['memory', 'null'] = Field(
+        default='memory',
+        description='in-memory graph, or a driver that accepts every query and returns no rows',
+    )
+    db_latency: float = Field(
+        default=0.0, description='seconds per database query, null backend only'
+    )
+
+
+class Sample(BaseModel):
+    seconds: float
+    llm_calls: int = 0
+    embedder_calls: int = 0
+    db_queries: int = 0
+
+
+class BenchmarkResult(BaseModel):
+    name: str
+    scale: int
+    samples: list[Sample]
+
+    @property
+    def key(self) -> str:
+        return f'{self.name}[{self.scale}]'
+
+    def summary(self) -> dict:
+        seconds = [sample.seconds for sample in self.samples]
+        last = self.samples[-1]
+        return {
+            'name': self.name,
+            'scale': self.scale,
+            'repeats': len(seconds),
+            'median_s': statistics.median(seconds),
+            'min_s': min(seconds),
+            'max_s': max(seconds),
+            'mean_s': statistics.fmean(seconds),
+            'llm_calls': last.llm_calls,
+            'embedder_calls': last.embedder_calls,
+            'db_queries': last.db_queries,
+        }
+
+
+class Harness:
+    """Fake clients and an offline driver shared by one benchmark repeat."""
+
+    def __init__(self, options: BenchmarkOptions):
+        self.driver: GraphDriver = (
+            InMemoryDriver() if options.backend == 'memory' else NullDriver(options.db_latency)
+        )
+        self.llm_client = FakeLLMClient(latency=options.llm_latency)
+        self.embedder = FakeEmbedder(latency=options.embedder_latency)
+        self.cross_encoder = FakeCrossEncoder(latency=options.cross_encoder_latency)
+        self.graphiti = Graphiti(
+            graph_driver=self.driver,
+            llm_client=self.llm_client,
+            embedder=self.embedder,
+            cross_encoder=self.cross_encoder,
+        )
+        self.clients: GraphitiClients = self.graphiti.clients
+        self.center_node_uuid = CENTER_NODE_UUID
+
+    async def timed(self, run: Callable[[], Awaitable[object]]) -> Sample:
+        llm_calls = sum(self.llm_client.calls.values())
+        embedder_calls = self.embedder.calls
+        db_queries = self.db_queries()
+
+        start = perf_counter()
+        await run()
+        seconds = perf_counter() - start
+
+        return Sample(
+            seconds=seconds,
+            llm_calls=sum(self.llm_client.calls.values()) - llm_calls,
+            embedder_calls=self.embedder.calls - embedder_calls,
+            db_queries=self.db_queries() - db_queries,
+        )
+
+    def db_queries(self) -> int:
+        # the in-memory backend runs driver operations, not queries
+        return self.driver.queries if isinstance(self.driver, NullDriver) else 0
+
+
+Benchmark = Callable[[int, BenchmarkOptions], Awaitable[Sample]]
+
+
+async def bench_add_episode(scale: int, options: BenchmarkOptions) -> Sample:
+    harness = Harness(options)
+    episodes = Corpus(options.seed).raw_episodes(scale)
+
+    async def run():
+        for episode in episodes:
+            await harness.graphiti.add_episode(
+                name=episode.name,
+                episode_body=episode.content,
+                source_description=episode.source_description,
+                reference_time=episode.reference_time,
+                source=episode.source,
+                group_id=GROUP_ID,
+            )
+
+    return await harness.timed(run)
+
+
+async def bench_add_episode_bulk(scale: int, options: BenchmarkOptions) -> Sample:
+    harness = Harness(options)
+    episodes = Corpus(options.seed).raw_episodes(scale)
+
+    return await harness.timed(
+        lambda: harness.graphiti.add_episode_bulk(episodes, group_id=GROUP_ID)
+    )
+
+
+async def bench_add_triplet(scale: int, options: BenchmarkOptions) -> Sample:
+    harness = Harness(options)
+    triplets = Corpus(options.seed).triplets(scale)
+
+    async def run():
+        for source_node, edge, target_node in triplets:
+            await harness.graphiti.add_triplet(source_node, edge, target_node)
+
+    return await harness.timed(run)
+
+
+async def bench_add_triplets_bulk(scale: int, options: BenchmarkOptions) -> Sample:
+    harness = Harness(options)
+    triplets = Corpus(options.seed).triplets(scale)
+
+    return await harness.timed(lambda: harness.graphiti.add_triplets_bulk(triplets))
+
+
+# Searching does not modify the graph, so every recipe and repeat reuses the graph built for a
+# given scale instead of ingesting it again.
+_search_harnesses: dict[tuple[int, str], Harness] = {}
+
+
+async def _search_harness(scale: int, options: BenchmarkOptions) -> Harness:
+    key = (scale, options.model_dump_json())
+    if key not in _search_harnesses:
+        harness = Harness(options)
+        episodes = Corpus(options.seed).raw_episodes(scale)
+        await harness.graphiti.add_episode_bulk(episodes, group_id=GROUP_ID)
+        # node distance reranking needs a center node, any entity of the graph will do
+        entities = await EntityNode.get_by_group_ids(harness.driver, [GROUP_ID], limit=1)
+        harness.center_node_uuid = entities[0].uuid if entities else CENTER_NODE_UUID
+        _search_harnesses[key] = harness
+    return _search_harnesses[key]
+
+
+def make_search_benchmark(config: SearchConfig) -> Benchmark:
+    async def bench_search(scale: int, options: BenchmarkOptions) -> Sample:
+        harness = await _search_harness(scale, options)
+        corpus = Corpus(options.seed)
+        queries = corpus.queries(options.queries)
+
+        async def run():
+            for query in queries:
+                await harness.graphiti.search_(
+                    query,
+                    config=config,
+                    group_ids=[GROUP_ID],
+                    center_node_uuid=harness.center_node_uuid,
+                )
+
+        return await harness.timed(run)
+
+    return bench_search
+
+
+async def bench_dedupe_nodes_bulk(scale: int, options: BenchmarkOptions) -> Sample:
+    harness = Harness(options)
+    corpus = Corpus(options.seed)
+    raw_episodes = corpus.raw_episodes(scale)
+    episode_tuples = [(corpus.episodic_node(episode), []) for episode in raw_episodes]
+    extracted_nodes = [corpus.entity_nodes(4) for _ in raw_episodes]
+
+    return await harness.timed(
+        lambda: dedupe_nodes_bulk(harness.clients, extracted_nodes, episode_tuples)
+    )
+
+
+async def bench_label_propagation(scale: int, options: BenchmarkOptions) -> Sample:
+    projection = Corpus(options.seed).projection(scale)
+
+    start = perf_counter()
+    label_propagation(projection)
+    return Sample(seconds=perf_counter() - start)
+
+
+async def bench_mmr(scale: int, options: BenchmarkOptions) -> Sample:
+    corpus = Corpus(options.seed)
+    vectors = corpus.vectors(scale + 1, FakeEmbedder().embedding_dim)
+    query_vector = vectors[0]
+    candidates = {f'candidate-{i}': vector for i, vector in enumerate(vectors[1:])}
+
+    start = perf_counter()
+    maximal_marginal_relevance(query_vector, candidates)
+    return Sample(seconds=perf_counter() - start)
+
+
+def _dump_edges_with_pydantic(edges: list) -> bytes:
+    # the model_dump round trip the MCP server used before the lean serializer
+    results = []
+    for edge in edges:
+        result = edge.model_dump(mode='json', exclude={'fact_embedding'})
+        result['attributes'].pop('fact_embedding', None)
+        results.append(result)
+    return json.dumps(results).encode()
+
+
+def make_serialize_benchmark(serialize: Callable[[list], bytes]) -> Benchmark:
+    async def bench_serialize(scale: int, options: BenchmarkOptions) -> Sample:
+        edges = Corpus(options.seed).entity_edges(scale, FakeEmbedder().embedding_dim)
+
+        start = perf_counter()
+        serialize(edges)
+        return Sample(seconds=perf_counter() - start)
+
+    return bench_serialize
+
+
+async def bench_hydrate_entity_edges(scale: int, options: BenchmarkOptions) -> Sample:
+    records = Corpus(options.seed).entity_edge_records(scale)
+
+    start = perf_counter()
+    [get_entity_edge_from_record(record) for record in records]
+    return Sample(seconds=perf_counter() - start)
+
+
+async def bench_hydrate_entity_nodes(scale: int, options: BenchmarkOptions) -> Sample:
+    records = Corpus(options.seed).entity_node_records(scale)
+
+    start = perf_counter()
+    [get_entity_node_from_record(record) for record in records]
+    return Sample(seconds=perf_counter() - start)
+
+
+# Benchmarks and their default scales. Scales count episodes or triplets for ingestion, episodes
+# in the searched graph for search, nodes for label propagation, candidates for MMR, database
+# rows for hydration and edges for serialization.
+BENCHMARKS: dict[str, tuple[Benchmark, list[int]]] = {
+    'add_episode': (bench_add_episode, [10, 50]),
+    'add_episode_bulk': (bench_add_episode_bulk, [10, 100]),
+    **{
+        f'search/{name}': (make_search_benchmark(config), [10, 100])
+        for name, config in SEARCH_RECIPES.items()
+    },
+    'add_triplet': (bench_add_triplet, [10, 100]),
+    'add_triplets_bulk': (bench_add_triplets_bulk, [100, 1000]),
+    'dedupe_nodes_bulk': (bench_dedupe_nodes_bulk, [10, 50, 100]),
+    'label_propagation': (bench_label_propagation, [100, 1000, 5000]),
+    'mmr': (bench_mmr, [100, 500, 2000]),
+    'hydrate/entity_edges': (bench_hydrate_entity_edges, [10000, 100000]),
+    'hydrate/entity_nodes': (bench_hydrate_entity_nodes, [10000, 100000]),
+    'serialize_edges/pydantic': (
+        make_serialize_benchmark(_dump_edges_with_pydantic),
+        [1000, 10000],
+    ),
+    'serialize_edges/lean': (
+        make_serialize_benchmark(lambda edges: dumps([entity_edge_to_json(e) for e in edges])),
+        [1000, 10000],
+    ),
+}
+
+
+async def run_benchmarks(
+    options: BenchmarkOptions,
+    names: list[str] | None = None,
+    scales: list[int] | None = None,
+) -> list[BenchmarkResult]:
+    """Run the selected benchmarks. Names select every benchmark starting with them."""
+    results: list[BenchmarkResult] = []
+    for name, (benchmark, default_scales) in BENCHMARKS.items():
+        if names and not any(name.startswith(prefix) for prefix in names):
+            continue
+
+        for scale in scales or default_scales:
+            samples = [await benchmark(scale, options) for _ in range(options.repeats)]
+            result = BenchmarkResult(name=name, scale=scale, samples=samples)
+            summary = result.summary()
+            print(
+                f'{result.key:<60} median {summary["median_s"] * 1000:10.2f} ms '
+                f'(min {summary["min_s"] * 1000:.2f} ms)',
+                file=sys.stderr,
+            )
+            results.append(result)
+
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _graphiti_version() -> str | None:
+    try:
+        return metadata.version('graphiti-core')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def build_report(options: BenchmarkOptions, results: list[BenchmarkResult]) -> dict:
+    return {
+        'metadata': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'git_commit': _git_commit(),
+            'graphiti_version': _graphiti_version(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'options': options.model_dump(),
+        },
+        'results': {result.key: result.summary() for result in results},
+    }
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    Compare median timings of the benchmarks both reports ran. Returns the keys that got slower
+    than the baseline by more than the threshold (0.2 meaning 20%).
+    """
+    regressions: list[str] = []
+    for key, result in current['results'].items():
+        baseline_result = baseline['results'].get(key)
+        if baseline_result is None or baseline_result['median_s'] <= 0:
+            continue
+
+        ratio = result['median_s'] / baseline_result['median_s']
+        marker = ''
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            marker = '  REGRESSION'
+        print(
+            f'{key:<60} {baseline_result["median_s"] * 1000:10.2f} ms -> '
+            f'{result["median_s"] * 1000:10.2f} ms ({ratio:.2f}x){marker}'
+        )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Offline performance benchmarks for ingestion and search.'
+    )
+    parser.add_argument(
+        '--only', nargs='*', help='benchmark name prefixes to run, e.g. search/NODE add_episode'
+    )
+    parser.add_argument('--scales', type=str, help='comma separated scales overriding defaults')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    parser.add_argument('--queries', type=int, default=DEFAULT_QUERIES)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--llm-latency', type=float, default=0.0)
+    parser.add_argument('--embedder-latency', type=float, default=0.0)
+    parser.add_argument('--cross-encoder-latency', type=float, default=0.0)
+    parser.add_argument('--backend', choices=['memory', 'null'], default='memory')
+    parser.add_argument('--db-latency', type=float, default=0.0)
+    parser.add_argument('--output', type=str, help='write the JSON report to this file')
+    parser.add_argument('--compare', type=str, help='baseline JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    options = BenchmarkOptions(
+        seed=args.seed,
+        repeats=args.repeats,
+        queries=args.queries,
+        llm_latency=args.llm_latency,
+        embedder_latency=args.embedder_latency,
+        cross_encoder_latency=args.cross_encoder_latency,
+        backend=args.backend,
+        db_latency=args.db_latency,
+    )
+    scales = [int(scale) for scale in args.scales.split(',')] if args.scales else None
+
+    results = asyncio.run(run_benchmarks(options, args.only, scales))
+    report = build_report(options, results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.threshold)
+        if regressions:
+            print(f'{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}')
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,7 +14,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from .cached_client import CachedCrossEncoderClient
 from .client import CrossEncoderClient
 from .openai_reranker_client import OpenAIRerankerClient
 
-__all__ = ['CrossEncoderClient', 'OpenAIRerankerClient']
+__all__ = ['CachedCrossEncoderClient', 'CrossEncoderClient', 'OpenAIRerankerClient']
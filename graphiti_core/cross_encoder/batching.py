@@ -0,0 +1,170 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from time import perf_counter
+
+from pydantic import BaseModel
+
+from graphiti_core.telemetry.metrics import record_reranker_batch_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 5.0
+
+Pair = list[str]
+
+
+class BatchStats(BaseModel):
+    requests: int = 0
+    batches: int = 0
+    pairs: int = 0
+    predict_ms: float = 0
+    # time requests spent waiting for their batch to start
+    queue_wait_ms: float = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.pairs / self.batches if self.batches else 0
+
+    @property
+    def pairs_per_second(self) -> float:
+        return self.pairs / (self.predict_ms / 1000) if self.predict_ms else 0
+
+    @property
+    def mean_queue_wait_ms(self) -> float:
+        return self.queue_wait_ms / self.requests if self.requests else 0
+
+
+@dataclass
+class _Request:
+    pairs: list[Pair]
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class BatchedPredictor:
+    """
+    Runs a synchronous (query, passage) scoring function on a dedicated worker thread, merging
+    the pairs of concurrent callers into shared batches.
+
+    A batch is started once it holds max_batch_size pairs or its oldest request has waited
+    max_wait_ms. While a batch runs, new requests queue up and form the next one, so batches
+    grow with load and single requests only pay the short wait.
+    """
+
+    def __init__(
+        self,
+        predict: Callable[[list[Pair]], Sequence[float]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        name: str = 'graphiti-predict',
+    ):
+        self.predict_fn = predict
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.name = name
+        self.stats = BatchStats()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._pending: list[_Request] = []
+        self._pending_pairs = 0
+        self._batch_full: asyncio.Event | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def predict(self, pairs: list[Pair]) -> list[float]:
+        if not pairs:
+            return []
+
+        loop = asyncio.get_running_loop()
+        request = _Request(pairs=pairs, future=loop.create_future(), enqueued_at=perf_counter())
+        self._pending.append(request)
+        self._pending_pairs += len(pairs)
+
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._worker = loop.create_task(self._run())
+        elif self._pending_pairs >= self.max_batch_size and self._batch_full is not None:
+            self._batch_full.set()
+
+        return await request.future
+
+    def _take_batch(self) -> list[_Request]:
+        batch: list[_Request] = []
+        size = 0
+        while self._pending:
+            request = self._pending[0]
+            if batch and size + len(request.pairs) > self.max_batch_size:
+                break
+            self._pending.pop(0)
+            self._pending_pairs -= len(request.pairs)
+            # callers that gave up, e.g. on a search timeout, are not scored
+            if request.future.done():
+                continue
+            batch.append(request)
+            size += len(request.pairs)
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            self._batch_full = asyncio.Event()
+            wait = self.max_wait_ms / 1000 - (perf_counter() - self._pending[0].enqueued_at)
+            if self._pending_pairs < self.max_batch_size and wait > 0:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._batch_full.wait(), wait)
+
+            batch = self._take_batch()
+            if not batch:
+                continue
+
+            pairs = [pair for request in batch for pair in request.pairs]
+            start = perf_counter()
+            try:
+                scores = await loop.run_in_executor(self._executor, self.predict_fn, pairs)
+            except Exception as e:
+                logger.error(f'{self.name}: batch of {len(pairs)} pairs failed: {e}')
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+
+            self._record_batch(batch, len(pairs), start)
+            offset = 0
+            for request in batch:
+                end = offset + len(request.pairs)
+                if not request.future.done():
+                    request.future.set_result([float(score) for score in scores[offset:end]])
+                offset = end
+
+    def _record_batch(self, batch: list[_Request], size: int, start: float):
+        predict_ms = (perf_counter() - start) * 1000
+        self.stats.requests += len(batch)
+        self.stats.batches += 1
+        self.stats.pairs += size
+        self.stats.predict_ms += predict_ms
+        self.stats.queue_wait_ms += sum((start - r.enqueued_at) * 1000 for r in batch)
+        record_reranker_batch_metrics(self.name, size, predict_ms)
+        logger.debug(
+            f'{self.name}: scored {size} pairs from {len(batch)} requests in {predict_ms:.0f} ms'
+        )
+
+    def close(self):
+        self._executor.shutdown(wait=False)
@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import asyncio
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,22 +28,73 @@ else:
             'Install it with: pip install graphiti-core[sentence-transformers]'
         ) from None
 
+from graphiti_core.cross_encoder.batching import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT_MS,
+    BatchedPredictor,
+    BatchStats,
+)
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 
+DEFAULT_MODEL = 'BAAI/bge-reranker-v2-m3'
+
 
 class BGERerankerClient(CrossEncoderClient):
-    def __init__(self):
-        self.model = CrossEncoder('BAAI/bge-reranker-v2-m3')
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        device: str | None = None,
+        num_threads: int | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ):
+        """
+        Initialize the BGERerankerClient.
+
+        The model is loaded on first use and runs on a dedicated worker thread. Pairs from
+        concurrent rank calls are merged into shared predict batches of up to max_batch_size
+        pairs, waiting at most max_wait_ms for a batch to fill.
+
+        Args:
+            model_name (str): The sentence-transformers cross-encoder model to load.
+            device (str | None): The torch device to run on. Defaults to sentence-transformers' choice.
+            num_threads (int | None): Number of torch CPU threads. torch applies this to the whole process.
+            max_batch_size (int): Maximum number of (query, passage) pairs per predict call.
+            max_wait_ms (float): Maximum time a request waits for its batch to fill.
+        """
+        self.model_name = model_name
+        self.device = device
+        self.num_threads = num_threads
+        self._model: CrossEncoder | None = None
+        self._model_lock = threading.Lock()
+        self._batcher = BatchedPredictor(
+            self._predict, max_batch_size, max_wait_ms, name='graphiti-bge-reranker'
+        )
+
+    @property
+    def model(self) -> CrossEncoder:
+        with self._model_lock:
+            if self._model is None:
+                if self.num_threads is not None:
+                    import torch  # type: ignore[import-not-found]  # comes with sentence-transformers
+
+                    torch.set_num_threads(self.num_threads)
+                self._model = CrossEncoder(self.model_name, device=self.device)
+            return self._model
+
+    @property
+    def stats(self) -> BatchStats:
+        return self._batcher.stats
+
+    def _predict(self, input_pairs: list[list[str]]) -> list[float]:
+        return self.model.predict(input_pairs, batch_size=self._batcher.max_batch_size).tolist()
 
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         if not passages:
             return []
 
         input_pairs = [[query, passage] for passage in passages]
-
-        # Run the synchronous predict method in an executor
-        loop = asyncio.get_running_loop()
-        scores = await loop.run_in_executor(None, self.model.predict, input_pairs)
+        scores = await self._batcher.predict(input_pairs)
 
         ranked_passages = sorted(
             [(passage, float(score)) for passage, score in zip(passages, scores, strict=False)],
@@ -52,3 +103,6 @@ class BGERerankerClient(CrossEncoderClient):
         )
 
         return ranked_passages
+
+    def close(self):
+        self._batcher.close()
@@ -0,0 +1,122 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+from graphiti_core.telemetry.metrics import record_reranker_cache_metrics
+
+from .client import CrossEncoderClient
+
+logger = logging.getLogger(__name__)
+
+RERANKER_CACHE_SIZE = 10_000
+
+
+class RerankerCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    # rank calls that had to reach the underlying reranker
+    reranker_calls: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+class CachedCrossEncoderClient(CrossEncoderClient):
+    """
+    Wraps any CrossEncoderClient with a bounded LRU cache of (query, passage) scores.
+
+    Only passages without a cached score for the query are sent to the underlying reranker;
+    cached scores are merged into its result. Scores are keyed by model so that rerankers with
+    different models never share entries.
+    """
+
+    def __init__(
+        self,
+        client: CrossEncoderClient,
+        cache_size: int = RERANKER_CACHE_SIZE,
+        model: str | None = None,
+    ):
+        self.client = client
+        self.cache_size = cache_size
+        self.model = model or _default_model(client)
+        self.stats = RerankerCacheStats()
+        self._scores: OrderedDict[bytes, float] = OrderedDict()
+
+    def _cache_key(self, query: str, passage: str) -> bytes:
+        key = hashlib.sha256()
+        for part in (self.model, query, passage):
+            encoded = part.encode()
+            # length prefixes keep ('ab', 'c') and ('a', 'bc') apart
+            key.update(len(encoded).to_bytes(8, 'big'))
+            key.update(encoded)
+        return key.digest()
+
+    def _cache_put(self, key: bytes, score: float):
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.cache_size:
+            self._scores.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self):
+        self._scores.clear()
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        keys = {passage: self._cache_key(query, passage) for passage in passages}
+
+        scores: dict[str, float] = {}
+        missing: list[str] = []
+        for passage, key in keys.items():
+            score = self._scores.get(key)
+            if score is None:
+                missing.append(passage)
+            else:
+                self._scores.move_to_end(key)
+                scores[passage] = score
+
+        hits = len(scores)
+        self.stats.hits += hits
+        self.stats.misses += len(missing)
+        record_reranker_cache_metrics(self.model, hits, len(missing))
+
+        if missing:
+            self.stats.reranker_calls += 1
+            ranked = dict(await self.client.rank(query, missing))
+            for passage in missing:
+                if passage in ranked:
+                    scores[passage] = ranked[passage]
+                    self._cache_put(keys[passage], ranked[passage])
+
+        logger.debug(f'Reranker cache: {hits} of {len(keys)} passages served from cache')
+
+        results = [(passage, scores[passage]) for passage in passages if passage in scores]
+        results.sort(reverse=True, key=lambda x: x[1])
+        return results
+
+
+def _default_model(client: CrossEncoderClient) -> str:
+    config = getattr(client, 'config', None)
+    model = getattr(config, 'model', None)
+    name = type(client).__name__
+    return f'{name}:{model}' if model else name
@@ -15,18 +15,27 @@ limitations under the License.
 """
 
 import copy
+import functools
+import inspect
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Coroutine
+from collections.abc import Awaitable, Callable, Coroutine
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 
 logger = logging.getLogger(__name__)
 
+F = TypeVar('F', bound=Callable[..., Awaitable[Any]])
+
+# operation name -> the parameters a driver override receives, i.e. the default implementation's
+# signature without `cls` and `driver`
+DRIVER_OPERATIONS: dict[str, inspect.Signature] = {}
+
 
 class GraphProvider(Enum):
     NEO4J = 'neo4j'
     FALKORDB = 'falkordb'
+    MEMORY = 'memory'
 
 
 class GraphDriverSession(ABC):
@@ -57,6 +66,8 @@ class GraphDriver(ABC):
         ''  # Neo4j (default) syntax does not require a prefix for fulltext queries
     )
     _database: str
+    # bulk write transactions that may run at the same time, see add_nodes_and_edges_bulk
+    bulk_write_concurrency: int = 1
 
     @abstractmethod
     def execute_query(self, cypher_query_: str, **kwargs: Any) -> Coroutine:
@@ -74,6 +85,13 @@ class GraphDriver(ABC):
     def delete_all_indexes(self) -> Coroutine:
         raise NotImplementedError()
 
+    def is_transient_error(self, exception: BaseException) -> bool:
+        """
+        Whether a failed write can be retried as is, e.g. after a dropped connection. Errors that
+        the driver's managed transactions already retry should not be reported.
+        """
+        return isinstance(exception, ConnectionError | TimeoutError)
+
     def with_database(self, database: str) -> 'GraphDriver':
         """
         Returns a shallow copy of this driver with a different default database.
@@ -83,3 +101,80 @@ class GraphDriver(ABC):
         cloned._database = database
 
         return cloned
+
+
+def driver_operation(name: str) -> Callable[[F], F]:
+    """
+    Mark an async function or method taking a `driver` argument as a named database operation.
+
+    The decorated body is the default (Cypher) implementation. A driver class that defines a
+    method called `name` handles the operation itself: that method is awaited with the remaining
+    arguments in declaration order, i.e. without `cls` and `driver`, and with `self` first for
+    instance methods. Overrides can be checked against the defaults with
+    `validate_driver_operations`.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+        driver_index = list(signature.parameters).index('driver')
+        operation_signature = signature.replace(
+            parameters=[
+                param
+                for param_name, param in signature.parameters.items()
+                if param_name not in ('cls', 'driver')
+            ]
+        )
+        DRIVER_OPERATIONS[name] = operation_signature
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            driver = args[driver_index] if len(args) > driver_index else kwargs['driver']
+            # looked up on the class so that mocked drivers keep running the default implementation
+            operation = getattr(type(driver), name, None)
+            if operation is None:
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            operation_args = [
+                value for param, value in bound.arguments.items() if param not in ('cls', 'driver')
+            ]
+            return await operation(driver, *operation_args)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def validate_driver_operations(driver_cls: type[GraphDriver]) -> list[str]:
+    """
+    Return the names of the registered operations `driver_cls` overrides, raising a TypeError
+    if an override cannot accept the arguments of the default implementation.
+
+    Operations are registered when the modules defining them are imported, so this should run
+    once graphiti_core is fully imported, e.g. from a driver's tests.
+    """
+    overridden = []
+    for name, signature in DRIVER_OPERATIONS.items():
+        operation = getattr(driver_cls, name, None)
+        if operation is None:
+            continue
+
+        if not inspect.iscoroutinefunction(operation):
+            raise TypeError(f'{driver_cls.__name__}.{name} must be an async method')
+
+        override_params = list(inspect.signature(operation).parameters)[1:]
+        default_params = list(signature.parameters)
+        # the model instance of instance-method operations is passed under any name
+        if len(override_params) != len(default_params) or any(
+            override != default
+            for override, default in zip(override_params, default_params, strict=True)
+            if default != 'self'
+        ):
+            raise TypeError(
+                f'{driver_cls.__name__}.{name} takes ({", ".join(override_params)}) '
+                f'but the operation passes ({", ".join(signature.parameters)})'
+            )
+        overridden.append(name)
+
+    return overridden
@@ -16,15 +16,22 @@ limitations under the License.
 
 import logging
 from datetime import datetime
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from falkordb import Graph as FalkorGraph
     from falkordb.asyncio import FalkorDB
+    from redis.exceptions import ConnectionError as RedisConnectionError
+    from redis.exceptions import TimeoutError as RedisTimeoutError
+
+    from graphiti_core.nodes import Node
 else:
     try:
         from falkordb import Graph as FalkorGraph
         from falkordb.asyncio import FalkorDB
+        from redis.exceptions import ConnectionError as RedisConnectionError
+        from redis.exceptions import TimeoutError as RedisTimeoutError
     except ImportError:
         # If falkordb is not installed, raise an ImportError
         raise ImportError(
@@ -33,6 +40,8 @@ else:
         ) from None
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.query_stats import canonical_query, record_query
+from graphiti_core.telemetry.tracing import query_fingerprint, start_span
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +109,11 @@ class FalkorDriver(GraphDriver):
 
         self.fulltext_syntax = '@'  # FalkorDB uses a redisearch-like syntax for fulltext queries see https://redis.io/docs/latest/develop/ai/search-and-query/query/full-text/
 
+    def is_transient_error(self, exception: BaseException) -> bool:
+        return super().is_transient_error(exception) or isinstance(
+            exception, RedisConnectionError | RedisTimeoutError
+        )
+
     def _get_graph(self, graph_name: str | None) -> FalkorGraph:
         # FalkorDB requires a non-None database name for multi-tenant graphs; the default is "default_db"
         if graph_name is None:
@@ -111,16 +125,31 @@ class FalkorDriver(GraphDriver):
 
         # Convert datetime objects to ISO strings (FalkorDB does not support datetime objects directly)
         params = convert_datetimes_to_strings(dict(kwargs))
-
-        try:
-            result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
-        except Exception as e:
-            if 'already indexed' in str(e):
-                # check if index already exists
-                logger.info(f'Index already exists: {e}')
-                return None
-            logger.error(f'Error executing FalkorDB query: {e}\n{cypher_query_}\n{params}')
-            raise
+        # identical query shapes must produce identical text to reuse FalkorDB's cached plan
+        cypher_query_ = canonical_query(cypher_query_)
+
+        with start_span(
+            'graphiti.db.query',
+            {
+                'db.system': 'falkordb',
+                'db.namespace': self._database,
+                'db.query.fingerprint': query_fingerprint(cypher_query_),
+            },
+        ) as span:
+            start = perf_counter()
+            try:
+                result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+            except Exception as e:
+                if 'already indexed' in str(e):
+                    # check if index already exists
+                    logger.info(f'Index already exists: {e}')
+                    return None
+                logger.error(f'Error executing FalkorDB query: {e}\n{cypher_query_}\n{params}')
+                raise
+            finally:
+                record_query(cypher_query_, (perf_counter() - start) * 1000)
+
+            span.set_attribute('db.response.returned_rows', len(result.result_set))
 
         # Convert the result header to a list of strings
         header = [h[1] for h in result.header]
@@ -156,6 +185,70 @@ class FalkorDriver(GraphDriver):
             'CALL db.indexes() YIELD name DROP INDEX name',
         )
 
+    # Driver operations, see graphiti_core.driver.driver.driver_operation
+    async def delete_node(self, node: 'Node'):
+        # FalkorDB does not support label alternatives (n:A|B) in MATCH patterns
+        for label in ['Entity', 'Episodic', 'Community']:
+            await self.execute_query(
+                f"""
+                MATCH (n:{label} {{uuid: $uuid}})
+                DETACH DELETE n
+                """,
+                uuid=node.uuid,
+            )
+
+        logger.debug(f'Deleted Node: {node.uuid}')
+
+    async def delete_nodes_by_group_id(self, group_id: str, batch_size: int) -> int:
+        deleted = await self._delete_nodes_in_chunks(
+            'n.group_id = $group_id', batch_size, group_id=group_id
+        )
+
+        logger.debug(f'Deleted {deleted} nodes for group: {group_id}')
+
+        return deleted
+
+    async def delete_nodes_by_uuids(self, uuids: list[str], batch_size: int) -> int:
+        deleted = 0
+        for i in range(0, len(uuids), batch_size):
+            deleted += await self._delete_nodes_in_chunks(
+                'n.uuid IN $uuids', batch_size, uuids=uuids[i : i + batch_size]
+            )
+
+        logger.debug(f'Deleted {deleted} nodes by uuid')
+
+        return deleted
+
+    async def _delete_nodes_in_chunks(self, condition: str, batch_size: int, **params: Any) -> int:
+        """
+        FalkorDB has no CALL {} IN TRANSACTIONS, so delete in LIMIT-ed chunks until none are left.
+        """
+        deleted = 0
+        for label in ['Entity', 'Episodic', 'Community']:
+            while True:
+                result = await self.execute_query(
+                    f"""
+                    MATCH (n:{label})
+                    WHERE {condition}
+                    WITH n LIMIT $batch_size
+                    DETACH DELETE n
+                    RETURN count(*) AS deleted
+                    """,
+                    batch_size=batch_size,
+                    **params,
+                )
+                if result is None:
+                    break
+                records, _, _ = result
+                batch_deleted = records[0]['deleted'] if records else 0
+                deleted += batch_deleted
+                if batch_deleted > 0:
+                    logger.info(f'Deleted {deleted} nodes so far')
+                if batch_deleted < batch_size:
+                    break
+
+        return deleted
+
     def clone(self, database: str) -> 'GraphDriver':
         """
         Returns a shallow copy of this driver with a different default database.
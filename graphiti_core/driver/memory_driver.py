@@ -0,0 +1,1304 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import copy
+import logging
+import math
+import re
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.edges import (
+    CommunityEdge,
+    Edge,
+    EntityEdge,
+    EpisodicEdge,
+    create_entity_edge_embeddings,
+)
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError, NodeNotFoundError
+from graphiti_core.nodes import (
+    CommunityNode,
+    EntityNode,
+    EpisodeType,
+    EpisodicNode,
+    Node,
+    create_entity_node_embeddings,
+)
+from graphiti_core.search.search_filters import ComparisonOperator, DateFilter, SearchFilters
+from graphiti_core.utils.maintenance.community_operations import Neighbor
+
+logger = logging.getLogger(__name__)
+
+# CJK scripts are not whitespace separated, so every ideograph / kana is its own token
+_CJK = r'\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff'
+_TOKEN_PATTERN = re.compile(rf'[{_CJK}]|[^\W{_CJK}]+')
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+VECTOR_INDEX_INITIAL_CAPACITY = 64
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class _FulltextIndex:
+    """Incrementally maintained BM25 index, the in-memory stand-in for a Lucene fulltext index."""
+
+    def __init__(self):
+        self.postings: dict[str, dict[str, int]] = defaultdict(dict)
+        self.terms: dict[str, list[str]] = {}
+        self.lengths: dict[str, int] = {}
+        self.total_length = 0
+
+    def add(self, key: str, text: str):
+        self.remove(key)
+        tokens = tokenize(text)
+        term_counts = Counter(tokens)
+        for term, count in term_counts.items():
+            self.postings[term][key] = count
+        self.terms[key] = list(term_counts)
+        self.lengths[key] = len(tokens)
+        self.total_length += len(tokens)
+
+    def remove(self, key: str):
+        if key not in self.lengths:
+            return
+        self.total_length -= self.lengths.pop(key)
+        for term in self.terms.pop(key):
+            del self.postings[term][key]
+            if not self.postings[term]:
+                del self.postings[term]
+
+    def search(self, query: str) -> list[tuple[str, float]]:
+        """Every document matching at least one query term, best match first."""
+        if not self.lengths:
+            return []
+
+        document_count = len(self.lengths)
+        average_length = self.total_length / document_count or 1
+        scores: dict[str, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (document_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for key, count in docs.items():
+                norm = 1 - BM25_B + BM25_B * self.lengths[key] / average_length
+                scores[key] += idf * count * (BM25_K1 + 1) / (count + BM25_K1 * norm)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class _VectorIndex:
+    """
+    Unit-normalized embeddings in one preallocated matrix, so that a cosine search is a single
+    matrix-vector product. Scores are normalized to [0, 1] like Neo4j's vector.similarity.cosine.
+    """
+
+    def __init__(self):
+        self.matrix: NDArray[np.float32] | None = None
+        self.slots: dict[str, int] = {}
+        self.keys: list[str | None] = []
+        self.free_slots: list[int] = []
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> NDArray[np.float32]:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return (array / norm).astype(np.float32) if norm > 0 else array
+
+    def set(self, key: str, vector: list[float] | None):
+        if vector is None:
+            self.remove(key)
+            return
+
+        array = self._normalize(vector)
+        if self.matrix is None:
+            self.matrix = np.zeros((VECTOR_INDEX_INITIAL_CAPACITY, len(array)), dtype=np.float32)
+        elif len(array) != self.matrix.shape[1]:
+            raise ValueError(
+                f'embedding of {key} has {len(array)} dimensions, expected {self.matrix.shape[1]}'
+            )
+
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self._allocate(key)
+        self.matrix[slot] = array
+
+    def _allocate(self, key: str) -> int:
+        assert self.matrix is not None
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            self.keys[slot] = key
+        else:
+            slot = len(self.keys)
+            self.keys.append(key)
+            if slot >= len(self.matrix):
+                grown = np.zeros((len(self.matrix) * 2, self.matrix.shape[1]), dtype=np.float32)
+                grown[: len(self.matrix)] = self.matrix
+                self.matrix = grown
+        self.slots[key] = slot
+        return slot
+
+    def remove(self, key: str):
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return
+        assert self.matrix is not None
+        self.matrix[slot] = 0
+        self.keys[slot] = None
+        self.free_slots.append(slot)
+
+    def similarity(self, key: str, vector: list[float]) -> float | None:
+        slot = self.slots.get(key)
+        if slot is None or self.matrix is None:
+            return None
+        return float((1 + self.matrix[slot] @ self._normalize(vector)) / 2)
+
+    def search(
+        self,
+        vector: list[float],
+        min_score: float,
+        accept: Callable[[str], bool],
+        keys: Iterable[str] | None = None,
+    ) -> Iterator[tuple[str, float]]:
+        """
+        Accepted keys scoring above min_score, best match first. Passing keys scores only those
+        rows instead of the whole matrix.
+        """
+        if self.matrix is None or not self.slots:
+            return
+
+        if keys is None:
+            slots = np.arange(len(self.keys))
+            matrix = self.matrix[: len(self.keys)]
+        else:
+            slots = np.sort(
+                np.fromiter((self.slots[key] for key in keys if key in self.slots), dtype=np.intp)
+            )
+            matrix = self.matrix[slots]
+
+        scores = (1 + matrix @ self._normalize(vector)) / 2
+        candidates = np.flatnonzero(scores > min_score)
+        for row in candidates[np.argsort(-scores[candidates], kind='stable')]:
+            key = self.keys[slots[row]]
+            if key is not None and accept(key):
+                yield key, float(scores[row])
+
+
+class InMemorySession(GraphDriverSession):
+    def __init__(self, driver: 'InMemoryDriver'):
+        self.driver = driver
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    async def run(self, query: str, **kwargs: Any) -> Any:
+        raise NotImplementedError('InMemoryDriver does not execute Cypher queries')
+
+    async def close(self):
+        pass
+
+    async def execute_write(self, func, *args, **kwargs):
+        return await func(self, *args, **kwargs)
+
+
+def _compare(value: datetime | None, date_filter: DateFilter) -> bool:
+    # as in Cypher, comparisons with a missing date are never true
+    if value is None:
+        return False
+    try:
+        match date_filter.comparison_operator:
+            case ComparisonOperator.equals:
+                return value == date_filter.date
+            case ComparisonOperator.not_equals:
+                return value != date_filter.date
+            case ComparisonOperator.greater_than:
+                return value > date_filter.date
+            case ComparisonOperator.less_than:
+                return value < date_filter.date
+            case ComparisonOperator.greater_than_equal:
+                return value >= date_filter.date
+            case ComparisonOperator.less_than_equal:
+                return value <= date_filter.date
+    except TypeError:
+        # naive and aware datetimes don't compare
+        return False
+    return False
+
+
+def _match_dates(value: datetime | None, date_filters: list[list[DateFilter]] | None) -> bool:
+    # mirrors the Cypher filter compiler, which leaves empty alternatives unconstrained
+    if not date_filters or not all(date_filters):
+        return True
+    return any(all(_compare(value, f) for f in and_filters) for and_filters in date_filters)
+
+
+def _match_group(group_id: str, group_ids: list[str] | None) -> bool:
+    return group_ids is None or group_id in group_ids
+
+
+def _utc(value: datetime) -> datetime:
+    # naive datetimes are taken to be UTC, so that they order against aware ones
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _fact_start(edge: EntityEdge) -> datetime:
+    # a fact without a known valid_at holds from when it was recorded, as in the Cypher filter
+    return _utc(edge.valid_at if edge.valid_at is not None else edge.created_at)
+
+
+def _holds_at(edge: EntityEdge, as_of: datetime) -> bool:
+    as_of = _utc(as_of)
+    return _fact_start(edge) <= as_of and (edge.invalid_at is None or _utc(edge.invalid_at) > as_of)
+
+
+class InMemoryDriver(GraphDriver):
+    """
+    Graph driver that keeps the whole graph in process memory, for tests, benchmarks and small
+    embedded deployments that don't want to run a database.
+
+    Rather than interpreting Cypher, it implements every named driver operation (see
+    `driver_operation`) directly on indexed Python and NumPy structures: fulltext search is BM25
+    over a per-type inverted index and similarity search is a matrix-vector product over
+    unit-normalized embeddings. `execute_query` is not supported.
+
+    Unlike the Cypher implementations, a group_ids of None means every group. Nothing is
+    persisted; the graph lives as long as the driver.
+    """
+
+    provider = GraphProvider.MEMORY
+
+    def __init__(self, database: str = 'default_db'):
+        super().__init__()
+        self._database = database
+
+        self.episodes: dict[str, EpisodicNode] = {}
+        self.entities: dict[str, EntityNode] = {}
+        self.communities: dict[str, CommunityNode] = {}
+        self.entity_edges: dict[str, EntityEdge] = {}
+        self.episodic_edges: dict[str, EpisodicEdge] = {}
+        self.community_edges: dict[str, CommunityEdge] = {}
+
+        # adjacency: node uuid -> uuids of the edges touching it, per edge type
+        self._entity_edges_by_node: dict[str, set[str]] = defaultdict(set)
+        self._episodic_edges_by_node: dict[str, set[str]] = defaultdict(set)
+        self._community_edges_by_node: dict[str, set[str]] = defaultdict(set)
+        # group id -> episodes as (valid_at, uuid), sorted
+        self._episode_timeline: dict[str, list[tuple[datetime, str]]] = defaultdict(list)
+        # group id -> entity edges as (start of validity, uuid), sorted, for as_of searches
+        self._edge_timeline: dict[str, list[tuple[datetime, str]]] = defaultdict(list)
+
+        self._episode_text = _FulltextIndex()
+        self._entity_text = _FulltextIndex()
+        self._community_text = _FulltextIndex()
+        self._edge_text = _FulltextIndex()
+        self._entity_vectors = _VectorIndex()
+        self._community_vectors = _VectorIndex()
+        self._edge_vectors = _VectorIndex()
+
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        raise NotImplementedError(
+            'InMemoryDriver does not execute Cypher queries, only named driver operations'
+        )
+
+    def session(self, database: str | None = None) -> GraphDriverSession:
+        return InMemorySession(self)
+
+    async def close(self):
+        pass
+
+    async def delete_all_indexes(self):
+        pass
+
+    # copies, so that callers can't mutate the stored graph
+    @staticmethod
+    def _episode_copy(episode: EpisodicNode) -> EpisodicNode:
+        return episode.model_copy(
+            update={'labels': list(episode.labels), 'entity_edges': list(episode.entity_edges)}
+        )
+
+    @staticmethod
+    def _entity_copy(node: EntityNode, with_embedding: bool = False) -> EntityNode:
+        embedding = node.name_embedding
+        return node.model_copy(
+            update={
+                'labels': list(node.labels),
+                'attributes': copy.deepcopy(node.attributes),
+                'name_embedding': list(embedding) if with_embedding and embedding else None,
+            }
+        )
+
+    @staticmethod
+    def _community_copy(community: CommunityNode) -> CommunityNode:
+        embedding = community.name_embedding
+        return community.model_copy(
+            update={
+                'labels': list(community.labels),
+                'name_embedding': list(embedding) if embedding else None,
+            }
+        )
+
+    @staticmethod
+    def _entity_edge_copy(edge: EntityEdge, with_embedding: bool = False) -> EntityEdge:
+        embedding = edge.fact_embedding
+        return edge.model_copy(
+            update={
+                'episodes': list(edge.episodes),
+                'attributes': copy.deepcopy(edge.attributes),
+                'fact_embedding': list(embedding) if with_embedding and embedding else None,
+            }
+        )
+
+    # filters
+    @staticmethod
+    def _match_labels(node: EntityNode, search_filter: SearchFilters) -> bool:
+        node_labels = search_filter.node_labels
+        return node_labels is None or any(label in node.labels for label in node_labels)
+
+    def _match_node(self, node: EntityNode, search_filter: SearchFilters) -> bool:
+        return self._match_labels(node, search_filter) and _match_dates(
+            node.created_at, search_filter.created_at
+        )
+
+    def _match_edge(self, edge: EntityEdge, search_filter: SearchFilters) -> bool:
+        if search_filter.edge_types is not None and edge.name not in search_filter.edge_types:
+            return False
+        if search_filter.node_labels is not None:
+            for node_uuid in (edge.source_node_uuid, edge.target_node_uuid):
+                node = self.entities.get(node_uuid)
+                if node is None or not self._match_labels(node, search_filter):
+                    return False
+        if search_filter.as_of is not None and not _holds_at(edge, search_filter.as_of):
+            return False
+        return (
+            _match_dates(edge.valid_at, search_filter.valid_at)
+            and _match_dates(edge.invalid_at, search_filter.invalid_at)
+            and _match_dates(edge.created_at, search_filter.created_at)
+            and _match_dates(edge.expired_at, search_filter.expired_at)
+        )
+
+    @staticmethod
+    def _page(items: Iterable[Any], limit: int | None, uuid_cursor: str | None) -> list[Any]:
+        page = sorted(items, key=lambda item: item.uuid, reverse=True)
+        if uuid_cursor:
+            page = [item for item in page if item.uuid < uuid_cursor]
+        return page[:limit] if limit is not None else page
+
+    # writes
+    def _put_episode(self, episode: EpisodicNode):
+        self._drop_episode_timeline(episode.uuid)
+        stored = self._episode_copy(episode)
+        self.episodes[stored.uuid] = stored
+        insort(self._episode_timeline[stored.group_id], (stored.valid_at, stored.uuid))
+        self._episode_text.add(
+            stored.uuid, f'{stored.content} {stored.source.value} {stored.source_description}'
+        )
+
+    def _drop_episode_timeline(self, uuid: str):
+        episode = self.episodes.get(uuid)
+        if episode is None:
+            return
+        timeline = self._episode_timeline[episode.group_id]
+        index = bisect_left(timeline, (episode.valid_at, uuid))
+        if index < len(timeline) and timeline[index] == (episode.valid_at, uuid):
+            del timeline[index]
+
+    def _put_entity(self, node: EntityNode):
+        existing = self.entities.get(node.uuid)
+        stored = self._entity_copy(node, with_embedding=True)
+        # saving replaces the properties but, like SET n:Label, only ever adds labels
+        labels = (existing.labels if existing is not None else []) + node.labels + ['Entity']
+        stored.labels = list(dict.fromkeys(labels))
+        self.entities[stored.uuid] = stored
+        self._entity_text.add(stored.uuid, f'{stored.name} {stored.summary}')
+        self._entity_vectors.set(stored.uuid, stored.name_embedding)
+
+    def _put_community(self, community: CommunityNode):
+        stored = self._community_copy(community)
+        self.communities[stored.uuid] = stored
+        self._community_text.add(stored.uuid, stored.name)
+        self._community_vectors.set(stored.uuid, stored.name_embedding)
+
+    def _put_entity_edge(self, edge: EntityEdge):
+        # edges are only created between existing nodes, as with MATCH ... MERGE
+        if edge.source_node_uuid not in self.entities or edge.target_node_uuid not in self.entities:
+            logger.debug(f'Skipped edge {edge.uuid}: source or target node does not exist')
+            return
+        self._drop_edge(edge.uuid)
+        stored = self._entity_edge_copy(edge, with_embedding=True)
+        self.entity_edges[stored.uuid] = stored
+        self._entity_edges_by_node[stored.source_node_uuid].add(stored.uuid)
+        self._entity_edges_by_node[stored.target_node_uuid].add(stored.uuid)
+        insort(self._edge_timeline[stored.group_id], (_fact_start(stored), stored.uuid))
+        self._edge_text.add(stored.uuid, f'{stored.name} {stored.fact}')
+        self._edge_vectors.set(stored.uuid, stored.fact_embedding)
+
+    def _put_episodic_edge(self, edge: EpisodicEdge):
+        if edge.source_node_uuid not in self.episodes or edge.target_node_uuid not in self.entities:
+            logger.debug(f'Skipped edge {edge.uuid}: episode or entity does not exist')
+            return
+        self._drop_edge(edge.uuid)
+        stored = edge.model_copy()
+        self.episodic_edges[stored.uuid] = stored
+        self._episodic_edges_by_node[stored.source_node_uuid].add(stored.uuid)
+        self._episodic_edges_by_node[stored.target_node_uuid].add(stored.uuid)
+
+    def _put_community_edge(self, edge: CommunityEdge):
+        if edge.source_node_uuid not in self.communities or (
+            edge.target_node_uuid not in self.entities
+            and edge.target_node_uuid not in self.communities
+        ):
+            logger.debug(f'Skipped edge {edge.uuid}: community or member does not exist')
+            return
+        self._drop_edge(edge.uuid)
+        stored = edge.model_copy()
+        self.community_edges[stored.uuid] = stored
+        self._community_edges_by_node[stored.source_node_uuid].add(stored.uuid)
+        self._community_edges_by_node[stored.target_node_uuid].add(stored.uuid)
+
+    def _drop_edge(self, uuid: str) -> bool:
+        for edges, index in (
+            (self.entity_edges, self._entity_edges_by_node),
+            (self.episodic_edges, self._episodic_edges_by_node),
+            (self.community_edges, self._community_edges_by_node),
+        ):
+            edge: Edge | None = edges.pop(uuid, None)  # type: ignore[assignment]
+            if edge is None:
+                continue
+            for node_uuid in (edge.source_node_uuid, edge.target_node_uuid):
+                index[node_uuid].discard(uuid)
+                if not index[node_uuid]:
+                    del index[node_uuid]
+            if isinstance(edge, EntityEdge):
+                self._drop_edge_timeline(edge)
+            self._edge_text.remove(uuid)
+            self._edge_vectors.remove(uuid)
+            return True
+        return False
+
+    def _drop_edge_timeline(self, edge: EntityEdge):
+        timeline = self._edge_timeline[edge.group_id]
+        entry = (_fact_start(edge), edge.uuid)
+        index = bisect_left(timeline, entry)
+        if index < len(timeline) and timeline[index] == entry:
+            del timeline[index]
+
+    def _edges_holding_at(self, as_of: datetime, group_ids: list[str] | None) -> list[str]:
+        """Uuids of the entity edges that were true at as_of, from the sorted edge timelines."""
+        as_of = _utc(as_of)
+        timelines = (
+            [self._edge_timeline.get(group_id, []) for group_id in group_ids]
+            if group_ids is not None
+            else list(self._edge_timeline.values())
+        )
+        uuids: list[str] = []
+        for timeline in timelines:
+            # every fact that started by as_of, minus the ones invalidated since
+            end = bisect_right(timeline, (as_of, '\U0010ffff'))
+            for _, uuid in timeline[:end]:
+                invalid_at = self.entity_edges[uuid].invalid_at
+                if invalid_at is None or _utc(invalid_at) > as_of:
+                    uuids.append(uuid)
+        return uuids
+
+    def _drop_node(self, uuid: str) -> bool:
+        """DETACH DELETE: the node goes together with every edge touching it."""
+        for index in (
+            self._entity_edges_by_node,
+            self._episodic_edges_by_node,
+            self._community_edges_by_node,
+        ):
+            for edge_uuid in list(index.get(uuid, ())):
+                self._drop_edge(edge_uuid)
+
+        if uuid in self.episodes:
+            self._drop_episode_timeline(uuid)
+            del self.episodes[uuid]
+            self._episode_text.remove(uuid)
+            return True
+        if uuid in self.entities:
+            del self.entities[uuid]
+            self._entity_text.remove(uuid)
+            self._entity_vectors.remove(uuid)
+            return True
+        if uuid in self.communities:
+            del self.communities[uuid]
+            self._community_text.remove(uuid)
+            self._community_vectors.remove(uuid)
+            return True
+        return False
+
+    def _neighbor_edges(self, node_uuid: str) -> list[EntityEdge]:
+        return [self.entity_edges[uuid] for uuid in self._entity_edges_by_node.get(node_uuid, ())]
+
+    # nodes
+    async def delete_node(self, node: Node):
+        self._drop_node(node.uuid)
+
+    async def delete_nodes_by_group_id(self, group_id: str, batch_size: int) -> int:
+        uuids = [
+            node.uuid
+            for nodes in (self.entities, self.episodes, self.communities)
+            for node in nodes.values()
+            if node.group_id == group_id
+        ]
+        return sum(self._drop_node(uuid) for uuid in uuids)
+
+    async def delete_nodes_by_uuids(self, uuids: list[str], batch_size: int) -> int:
+        return sum(self._drop_node(uuid) for uuid in uuids)
+
+    async def save_episodic_node(self, node: EpisodicNode):
+        self._put_episode(node)
+
+    async def get_episodic_node_by_uuid(self, uuid: str) -> EpisodicNode:
+        episode = self.episodes.get(uuid)
+        if episode is None:
+            raise NodeNotFoundError(uuid)
+        return self._episode_copy(episode)
+
+    async def get_episodic_nodes_by_uuids(self, uuids: list[str]) -> list[EpisodicNode]:
+        return [self._episode_copy(self.episodes[uuid]) for uuid in uuids if uuid in self.episodes]
+
+    async def get_episodic_nodes_by_group_ids(
+        self, group_ids: list[str], limit: int | None, uuid_cursor: str | None
+    ) -> list[EpisodicNode]:
+        episodes = (e for e in self.episodes.values() if e.group_id in group_ids)
+        return [self._episode_copy(e) for e in self._page(episodes, limit, uuid_cursor)]
+
+    async def get_episodic_nodes_by_entity_node_uuid(
+        self, entity_node_uuid: str
+    ) -> list[EpisodicNode]:
+        episode_uuids = {
+            self.episodic_edges[edge_uuid].source_node_uuid
+            for edge_uuid in self._episodic_edges_by_node.get(entity_node_uuid, ())
+        }
+        return [self._episode_copy(self.episodes[uuid]) for uuid in episode_uuids]
+
+    async def load_entity_node_embedding(self, node: EntityNode):
+        stored = self.entities.get(node.uuid)
+        if stored is None:
+            raise NodeNotFoundError(node.uuid)
+        node.name_embedding = list(stored.name_embedding) if stored.name_embedding else None
+
+    async def save_entity_node(self, node: EntityNode):
+        self._put_entity(node)
+
+    async def get_entity_node_by_uuid(self, uuid: str) -> EntityNode:
+        node = self.entities.get(uuid)
+        if node is None:
+            raise NodeNotFoundError(uuid)
+        return self._entity_copy(node)
+
+    async def get_entity_nodes_by_uuids(self, uuids: list[str]) -> list[EntityNode]:
+        return [self._entity_copy(self.entities[uuid]) for uuid in uuids if uuid in self.entities]
+
+    async def get_entity_nodes_by_group_ids(
+        self,
+        group_ids: list[str],
+        limit: int | None,
+        uuid_cursor: str | None,
+        with_embeddings: bool,
+    ) -> list[EntityNode]:
+        nodes = (n for n in self.entities.values() if n.group_id in group_ids)
+        return [
+            self._entity_copy(n, with_embeddings) for n in self._page(nodes, limit, uuid_cursor)
+        ]
+
+    async def save_community_node(self, node: CommunityNode):
+        self._put_community(node)
+
+    async def load_community_node_embedding(self, node: CommunityNode):
+        stored = self.communities.get(node.uuid)
+        if stored is None:
+            raise NodeNotFoundError(node.uuid)
+        node.name_embedding = list(stored.name_embedding) if stored.name_embedding else None
+
+    async def get_community_node_by_uuid(self, uuid: str) -> CommunityNode:
+        community = self.communities.get(uuid)
+        if community is None:
+            raise NodeNotFoundError(uuid)
+        return self._community_copy(community)
+
+    async def get_community_nodes_by_uuids(self, uuids: list[str]) -> list[CommunityNode]:
+        return [
+            self._community_copy(self.communities[uuid])
+            for uuid in uuids
+            if uuid in self.communities
+        ]
+
+    async def get_community_nodes_by_group_ids(
+        self, group_ids: list[str], limit: int | None, uuid_cursor: str | None
+    ) -> list[CommunityNode]:
+        communities = (c for c in self.communities.values() if c.group_id in group_ids)
+        return [self._community_copy(c) for c in self._page(communities, limit, uuid_cursor)]
+
+    # edges
+    async def delete_edge(self, edge: Edge):
+        self._drop_edge(edge.uuid)
+
+    async def delete_edges_by_uuids(self, uuids: list[str], batch_size: int) -> int:
+        return sum(self._drop_edge(uuid) for uuid in uuids)
+
+    async def save_episodic_edge(self, edge: EpisodicEdge):
+        self._put_episodic_edge(edge)
+
+    async def get_episodic_edge_by_uuid(self, uuid: str) -> EpisodicEdge:
+        edge = self.episodic_edges.get(uuid)
+        if edge is None:
+            raise EdgeNotFoundError(uuid)
+        return edge.model_copy()
+
+    async def get_episodic_edges_by_uuids(self, uuids: list[str]) -> list[EpisodicEdge]:
+        edges = [
+            self.episodic_edges[uuid].model_copy() for uuid in uuids if uuid in self.episodic_edges
+        ]
+        if len(edges) == 0:
+            raise EdgeNotFoundError(uuids[0])
+        return edges
+
+    async def get_episodic_edges_by_group_ids(
+        self, group_ids: list[str], limit: int | None, uuid_cursor: str | None
+    ) -> list[EpisodicEdge]:
+        edges = (e for e in self.episodic_edges.values() if e.group_id in group_ids)
+        page = [e.model_copy() for e in self._page(edges, limit, uuid_cursor)]
+        if len(page) == 0:
+            raise GroupsEdgesNotFoundError(group_ids)
+        return page
+
+    async def load_entity_edge_embedding(self, edge: EntityEdge):
+        stored = self.entity_edges.get(edge.uuid)
+        if stored is None:
+            raise EdgeNotFoundError(edge.uuid)
+        edge.fact_embedding = list(stored.fact_embedding) if stored.fact_embedding else None
+
+    async def save_entity_edge(self, edge: EntityEdge):
+        self._put_entity_edge(edge)
+
+    async def get_entity_edge_by_uuid(self, uuid: str) -> EntityEdge:
+        edge = self.entity_edges.get(uuid)
+        if edge is None:
+            raise EdgeNotFoundError(uuid)
+        return self._entity_edge_copy(edge)
+
+    async def get_entity_edges_by_uuids(self, uuids: list[str]) -> list[EntityEdge]:
+        return [
+            self._entity_edge_copy(self.entity_edges[uuid])
+            for uuid in uuids
+            if uuid in self.entity_edges
+        ]
+
+    async def get_entity_edges_by_group_ids(
+        self,
+        group_ids: list[str],
+        limit: int | None,
+        uuid_cursor: str | None,
+        with_embeddings: bool,
+    ) -> list[EntityEdge]:
+        edges = (e for e in self.entity_edges.values() if e.group_id in group_ids)
+        page = [
+            self._entity_edge_copy(e, with_embeddings)
+            for e in self._page(edges, limit, uuid_cursor)
+        ]
+        if len(page) == 0:
+            raise GroupsEdgesNotFoundError(group_ids)
+        return page
+
+    async def get_entity_edges_by_node_uuid(self, node_uuid: str) -> list[EntityEdge]:
+        return [self._entity_edge_copy(edge) for edge in self._neighbor_edges(node_uuid)]
+
+    async def save_community_edge(self, edge: CommunityEdge):
+        self._put_community_edge(edge)
+
+    async def get_community_edge_by_uuid(self, uuid: str) -> CommunityEdge:
+        edge = self.community_edges.get(uuid)
+        if edge is None:
+            raise EdgeNotFoundError(uuid)
+        return edge.model_copy()
+
+    async def get_community_edges_by_uuids(self, uuids: list[str]) -> list[CommunityEdge]:
+        return [
+            self.community_edges[uuid].model_copy()
+            for uuid in uuids
+            if uuid in self.community_edges
+        ]
+
+    async def get_community_edges_by_group_ids(
+        self, group_ids: list[str], limit: int | None, uuid_cursor: str | None
+    ) -> list[CommunityEdge]:
+        edges = (e for e in self.community_edges.values() if e.group_id in group_ids)
+        return [e.model_copy() for e in self._page(edges, limit, uuid_cursor)]
+
+    # search
+    async def get_mentioned_nodes(self, episodes: list[EpisodicNode]) -> list[EntityNode]:
+        node_uuids: dict[str, None] = {}
+        for episode in episodes:
+            for edge_uuid in self._episodic_edges_by_node.get(episode.uuid, ()):
+                node_uuids[self.episodic_edges[edge_uuid].target_node_uuid] = None
+        return [self._entity_copy(self.entities[uuid]) for uuid in node_uuids]
+
+    async def get_communities_by_nodes(self, nodes: list[EntityNode]) -> list[CommunityNode]:
+        community_uuids: dict[str, None] = {}
+        for node in nodes:
+            for edge_uuid in self._community_edges_by_node.get(node.uuid, ()):
+                edge = self.community_edges[edge_uuid]
+                if edge.target_node_uuid == node.uuid:
+                    community_uuids[edge.source_node_uuid] = None
+        return [self._community_copy(self.communities[uuid]) for uuid in community_uuids]
+
+    async def fulltext_search_edges(
+        self,
+        query: str,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+    ) -> list[EntityEdge]:
+        edges: list[EntityEdge] = []
+        for uuid, _ in self._edge_text.search(query):
+            edge = self.entity_edges[uuid]
+            if _match_group(edge.group_id, group_ids) and self._match_edge(edge, search_filter):
+                edges.append(self._entity_edge_copy(edge))
+                if len(edges) >= limit:
+                    break
+        return edges
+
+    async def vector_search_edges(
+        self,
+        search_vector: list[float],
+        source_node_uuid: str | None,
+        target_node_uuid: str | None,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+    ) -> list[EntityEdge]:
+        def accept(uuid: str) -> bool:
+            edge = self.entity_edges[uuid]
+            return (
+                _match_group(edge.group_id, group_ids)
+                and source_node_uuid in (None, edge.source_node_uuid)
+                and target_node_uuid in (None, edge.target_node_uuid)
+                and self._match_edge(edge, search_filter)
+            )
+
+        # historical searches only score the facts that held at the time
+        keys = (
+            self._edges_holding_at(search_filter.as_of, group_ids)
+            if search_filter.as_of is not None
+            else None
+        )
+        edges: list[EntityEdge] = []
+        for uuid, _ in self._edge_vectors.search(search_vector, min_score, accept, keys):
+            edges.append(self._entity_edge_copy(self.entity_edges[uuid]))
+            if len(edges) >= limit:
+                break
+        return edges
+
+    def _traverse(
+        self, origin_uuids: list[str], max_depth: int
+    ) -> Iterator[tuple[str, str, EntityEdge | None]]:
+        """
+        Breadth-first walk along outgoing RELATES_TO and MENTIONS edges, yielding
+        (origin uuid, reached entity uuid, traversed entity edge or None for a mention).
+        """
+        for origin_uuid in origin_uuids:
+            if origin_uuid not in self.entities and origin_uuid not in self.episodes:
+                continue
+            visited = {origin_uuid}
+            frontier = [origin_uuid]
+            for _ in range(max_depth):
+                next_frontier: list[str] = []
+                for node_uuid in frontier:
+                    steps: list[tuple[str, EntityEdge | None]] = [
+                        (self.episodic_edges[uuid].target_node_uuid, None)
+                        for uuid in self._episodic_edges_by_node.get(node_uuid, ())
+                        if self.episodic_edges[uuid].source_node_uuid == node_uuid
+                    ]
+                    steps.extend(
+                        (edge.target_node_uuid, edge)
+                        for edge in self._neighbor_edges(node_uuid)
+                        if edge.source_node_uuid == node_uuid
+                    )
+                    for target_uuid, edge in steps:
+                        yield origin_uuid, target_uuid, edge
+                        if target_uuid not in visited:
+                            visited.add(target_uuid)
+                            next_frontier.append(target_uuid)
+                frontier = next_frontier
+
+    async def bfs_edges(
+        self,
+        bfs_origin_node_uuids: list[str] | None,
+        bfs_max_depth: int,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+    ) -> list[EntityEdge]:
+        if bfs_origin_node_uuids is None:
+            return []
+
+        edges: dict[str, EntityEdge] = {}
+        for _, _, edge in self._traverse(bfs_origin_node_uuids, bfs_max_depth):
+            if (
+                edge is None
+                or edge.uuid in edges
+                or not _match_group(edge.group_id, group_ids)
+                or not self._match_edge(edge, search_filter)
+            ):
+                continue
+            edges[edge.uuid] = self._entity_edge_copy(edge)
+            if len(edges) >= limit:
+                break
+        return list(edges.values())
+
+    async def fulltext_search_nodes(
+        self,
+        query: str,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+    ) -> list[EntityNode]:
+        nodes: list[EntityNode] = []
+        for uuid, _ in self._entity_text.search(query):
+            node = self.entities[uuid]
+            if _match_group(node.group_id, group_ids) and self._match_node(node, search_filter):
+                nodes.append(self._entity_copy(node))
+                if len(nodes) >= limit:
+                    break
+        return nodes
+
+    async def vector_search_nodes(
+        self,
+        search_vector: list[float],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+    ) -> list[EntityNode]:
+        def accept(uuid: str) -> bool:
+            node = self.entities[uuid]
+            return _match_group(node.group_id, group_ids) and self._match_node(node, search_filter)
+
+        nodes: list[EntityNode] = []
+        for uuid, _ in self._entity_vectors.search(search_vector, min_score, accept):
+            nodes.append(self._entity_copy(self.entities[uuid]))
+            if len(nodes) >= limit:
+                break
+        return nodes
+
+    async def bfs_nodes(
+        self,
+        bfs_origin_node_uuids: list[str] | None,
+        search_filter: SearchFilters,
+        bfs_max_depth: int,
+        group_ids: list[str] | None,
+        limit: int,
+    ) -> list[EntityNode]:
+        if bfs_origin_node_uuids is None:
+            return []
+
+        nodes: dict[str, EntityNode] = {}
+        for origin_uuid, node_uuid, _ in self._traverse(bfs_origin_node_uuids, bfs_max_depth):
+            origin = self.entities.get(origin_uuid) or self.episodes[origin_uuid]
+            node = self.entities[node_uuid]
+            if (
+                node_uuid in nodes
+                or node.group_id != origin.group_id
+                or not _match_group(origin.group_id, group_ids)
+                or not self._match_node(node, search_filter)
+            ):
+                continue
+            nodes[node_uuid] = self._entity_copy(node)
+            if len(nodes) >= limit:
+                break
+        return list(nodes.values())
+
+    async def fulltext_search_episodes(
+        self,
+        query: str,
+        _search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+    ) -> list[EpisodicNode]:
+        episodes: list[EpisodicNode] = []
+        for uuid, _ in self._episode_text.search(query):
+            episode = self.episodes[uuid]
+            if _match_group(episode.group_id, group_ids):
+                episodes.append(self._episode_copy(episode))
+                if len(episodes) >= limit:
+                    break
+        return episodes
+
+    async def fulltext_search_communities(
+        self, query: str, group_ids: list[str] | None, limit: int
+    ) -> list[CommunityNode]:
+        communities: list[CommunityNode] = []
+        for uuid, _ in self._community_text.search(query):
+            community = self.communities[uuid]
+            if _match_group(community.group_id, group_ids):
+                communities.append(self._community_copy(community))
+                if len(communities) >= limit:
+                    break
+        return communities
+
+    async def vector_search_communities(
+        self,
+        search_vector: list[float],
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+    ) -> list[CommunityNode]:
+        def accept(uuid: str) -> bool:
+            return _match_group(self.communities[uuid].group_id, group_ids)
+
+        communities: list[CommunityNode] = []
+        for uuid, _ in self._community_vectors.search(search_vector, min_score, accept):
+            communities.append(self._community_copy(self.communities[uuid]))
+            if len(communities) >= limit:
+                break
+        return communities
+
+    async def get_relevant_nodes(
+        self,
+        nodes: list[EntityNode],
+        search_filter: SearchFilters,
+        min_score: float,
+        limit: int,
+    ) -> list[list[EntityNode]]:
+        if len(nodes) == 0:
+            return []
+
+        group_id = nodes[0].group_id
+
+        def accept(uuid: str) -> bool:
+            node = self.entities[uuid]
+            return node.group_id == group_id and self._match_node(node, search_filter)
+
+        relevant_nodes: list[list[EntityNode]] = []
+        for node in nodes:
+            matches: dict[str, None] = {}
+            if node.name_embedding is not None:
+                for uuid, _ in self._entity_vectors.search(node.name_embedding, min_score, accept):
+                    matches[uuid] = None
+                    if len(matches) >= limit:
+                        break
+
+            fulltext_matches = 0
+            for uuid, _ in self._entity_text.search(node.name):
+                if fulltext_matches >= limit:
+                    break
+                if self.entities[uuid].group_id == group_id:
+                    matches[uuid] = None
+                    fulltext_matches += 1
+
+            relevant_nodes.append(
+                [self._entity_copy(self.entities[uuid], with_embedding=True) for uuid in matches]
+            )
+
+        return relevant_nodes
+
+    def _score_edges(
+        self,
+        edge: EntityEdge,
+        candidates: Iterable[EntityEdge],
+        search_filter: SearchFilters,
+        min_score: float,
+        limit: int,
+    ) -> list[EntityEdge]:
+        if edge.fact_embedding is None:
+            return []
+
+        scored: list[tuple[float, EntityEdge]] = []
+        for candidate in candidates:
+            if candidate.group_id != edge.group_id or not self._match_edge(
+                candidate, search_filter
+            ):
+                continue
+            score = self._edge_vectors.similarity(candidate.uuid, edge.fact_embedding)
+            if score is not None and score > min_score:
+                scored.append((score, candidate))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [self._entity_edge_copy(e, with_embedding=True) for _, e in scored[:limit]]
+
+    async def get_relevant_edges(
+        self,
+        edges: list[EntityEdge],
+        search_filter: SearchFilters,
+        min_score: float,
+        limit: int,
+    ) -> list[list[EntityEdge]]:
+        relevant_edges: list[list[EntityEdge]] = []
+        for edge in edges:
+            endpoints = {edge.source_node_uuid, edge.target_node_uuid}
+            candidates = [
+                candidate
+                for candidate in self._neighbor_edges(edge.source_node_uuid)
+                if {candidate.source_node_uuid, candidate.target_node_uuid} == endpoints
+            ]
+            relevant_edges.append(
+                self._score_edges(edge, candidates, search_filter, min_score, limit)
+            )
+        return relevant_edges
+
+    async def get_edge_invalidation_candidates(
+        self,
+        edges: list[EntityEdge],
+        search_filter: SearchFilters,
+        min_score: float,
+        limit: int,
+    ) -> list[list[EntityEdge]]:
+        invalidation_edges: list[list[EntityEdge]] = []
+        for edge in edges:
+            candidates = {
+                candidate.uuid: candidate
+                for node_uuid in (edge.source_node_uuid, edge.target_node_uuid)
+                for candidate in self._neighbor_edges(node_uuid)
+            }
+            invalidation_edges.append(
+                self._score_edges(edge, candidates.values(), search_filter, min_score, limit)
+            )
+        return invalidation_edges
+
+    async def get_connected_node_uuids(
+        self, center_node_uuid: str, node_uuids: list[str]
+    ) -> list[str]:
+        neighbors = {
+            uuid
+            for edge in self._neighbor_edges(center_node_uuid)
+            for uuid in (edge.source_node_uuid, edge.target_node_uuid)
+        }
+        return [uuid for uuid in node_uuids if uuid in neighbors]
+
+    async def get_episode_mention_counts(self, node_uuids: list[str]) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for uuid in node_uuids:
+            mentions = sum(
+                self.episodic_edges[edge_uuid].target_node_uuid == uuid
+                for edge_uuid in self._episodic_edges_by_node.get(uuid, ())
+            )
+            if mentions > 0:
+                counts[uuid] = mentions
+        return counts
+
+    async def get_embeddings_for_nodes(self, nodes: list[EntityNode]) -> dict[str, list[float]]:
+        return {
+            node.uuid: list(self.entities[node.uuid].name_embedding)  # type: ignore[arg-type]
+            for node in nodes
+            if node.uuid in self.entities and self.entities[node.uuid].name_embedding is not None
+        }
+
+    async def get_embeddings_for_communities(
+        self, communities: list[CommunityNode]
+    ) -> dict[str, list[float]]:
+        return {
+            c.uuid: list(self.communities[c.uuid].name_embedding)  # type: ignore[arg-type]
+            for c in communities
+            if c.uuid in self.communities and self.communities[c.uuid].name_embedding is not None
+        }
+
+    async def get_embeddings_for_edges(self, edges: list[EntityEdge]) -> dict[str, list[float]]:
+        return {
+            e.uuid: list(self.entity_edges[e.uuid].fact_embedding)  # type: ignore[arg-type]
+            for e in edges
+            if e.uuid in self.entity_edges and self.entity_edges[e.uuid].fact_embedding is not None
+        }
+
+    # maintenance
+    async def add_nodes_and_edges_bulk(
+        self,
+        episodic_nodes: list[EpisodicNode],
+        episodic_edges: list[EpisodicEdge],
+        entity_nodes: list[EntityNode],
+        entity_edges: list[EntityEdge],
+        embedder: EmbedderClient,
+    ):
+        await create_entity_node_embeddings(
+            embedder, [node for node in entity_nodes if node.name_embedding is None]
+        )
+        await create_entity_edge_embeddings(
+            embedder, [edge for edge in entity_edges if edge.fact_embedding is None]
+        )
+
+        # no awaits below, so concurrent readers never see a partial write
+        for episode in episodic_nodes:
+            self._put_episode(episode)
+        for node in entity_nodes:
+            self._put_entity(node)
+        for episodic_edge in episodic_edges:
+            self._put_episodic_edge(episodic_edge)
+        for edge in entity_edges:
+            self._put_entity_edge(edge)
+
+    async def get_entity_group_ids(self) -> list[str]:
+        return list(dict.fromkeys(node.group_id for node in self.entities.values()))
+
+    async def get_community_projection(self, group_id: str) -> dict[str, list[Neighbor]]:
+        projection: dict[str, list[Neighbor]] = {}
+        for node in self.entities.values():
+            if node.group_id != group_id:
+                continue
+            counts: Counter[str] = Counter()
+            for edge in self._neighbor_edges(node.uuid):
+                other_uuid = (
+                    edge.target_node_uuid
+                    if edge.source_node_uuid == node.uuid
+                    else edge.source_node_uuid
+                )
+                if self.entities[other_uuid].group_id == group_id:
+                    counts[other_uuid] += 1
+            projection[node.uuid] = [
+                Neighbor(node_uuid=uuid, edge_count=count) for uuid, count in counts.items()
+            ]
+        return projection
+
+    async def remove_communities(self):
+        for uuid in list(self.communities):
+            self._drop_node(uuid)
+
+    def _communities_of(self, node_uuid: str) -> list[str]:
+        return [
+            self.community_edges[edge_uuid].source_node_uuid
+            for edge_uuid in self._community_edges_by_node.get(node_uuid, ())
+            if self.community_edges[edge_uuid].target_node_uuid == node_uuid
+        ]
+
+    async def determine_entity_community(
+        self, entity: EntityNode
+    ) -> tuple[CommunityNode | None, bool]:
+        # the entity's own community first, else the most common one among its neighbors
+        communities = self._communities_of(entity.uuid)
+        if communities:
+            return self._community_copy(self.communities[communities[0]]), False
+
+        counts: Counter[str] = Counter()
+        for edge in self._neighbor_edges(entity.uuid):
+            other_uuid = (
+                edge.target_node_uuid
+                if edge.source_node_uuid == entity.uuid
+                else edge.source_node_uuid
+            )
+            counts.update(self._communities_of(other_uuid))
+
+        if not counts:
+            return None, False
+
+        community_uuid, _ = counts.most_common(1)[0]
+        return self._community_copy(self.communities[community_uuid]), True
+
+    async def filter_existing_duplicate_of_edges(
+        self, duplicates_node_tuples: list[tuple[EntityNode, EntityNode]]
+    ) -> list[tuple[EntityNode, EntityNode]]:
+        duplicate_nodes_map = {
+            (source.uuid, target.uuid): (source, target)
+            for source, target in duplicates_node_tuples
+        }
+        for source_uuid, target_uuid in list(duplicate_nodes_map):
+            if any(
+                edge.name == 'IS_DUPLICATE_OF'
+                and edge.source_node_uuid == source_uuid
+                and edge.target_node_uuid == target_uuid
+                for edge in self._neighbor_edges(source_uuid)
+            ):
+                del duplicate_nodes_map[(source_uuid, target_uuid)]
+        return list(duplicate_nodes_map.values())
+
+    async def build_indices_and_constraints(self, delete_existing: bool):
+        # indexes are maintained on every write
+        pass
+
+    async def clear_data(self, group_ids: list[str] | None):
+        uuids = [
+            node.uuid
+            for nodes in (self.entities, self.episodes, self.communities)
+            for node in nodes.values()
+            if group_ids is None or node.group_id in group_ids
+        ]
+        for uuid in uuids:
+            self._drop_node(uuid)
+
+    async def retrieve_episodes(
+        self,
+        reference_time: datetime,
+        last_n: int,
+        group_ids: list[str] | None,
+        source: EpisodeType | None,
+    ) -> list[EpisodicNode]:
+        timelines = (
+            [self._episode_timeline.get(group_id, []) for group_id in group_ids]
+            if group_ids
+            else list(self._episode_timeline.values())
+        )
+        candidates: list[tuple[datetime, str]] = []
+        for timeline in timelines:
+            end = bisect_right(timeline, (reference_time, '\U0010ffff'))
+            if source is None:
+                candidates.extend(timeline[max(0, end - last_n) : end])
+            else:
+                candidates.extend(
+                    (valid_at, uuid)
+                    for valid_at, uuid in timeline[:end]
+                    if self.episodes[uuid].source == source
+                )
+
+        candidates.sort()
+        return [self._episode_copy(self.episodes[uuid]) for _, uuid in candidates[-last_n:]]
+
+    async def retrieve_episodes_in_window(
+        self,
+        group_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        last_n: int,
+        exclude_uuids: list[str] | None,
+    ) -> list[EpisodicNode]:
+        excluded = set(exclude_uuids or [])
+        timeline = [
+            (valid_at, uuid)
+            for valid_at, uuid in self._episode_timeline.get(group_id, [])
+            if uuid not in excluded
+        ]
+        start = bisect_left(timeline, (start_time, ''))
+        end = bisect_right(timeline, (end_time, '\U0010ffff'))
+        window = timeline[max(0, start - last_n) : end]
+        return [self._episode_copy(self.episodes[uuid]) for _, uuid in window]
+
+    async def get_nodes_mentioned_only_by_episode(self, episode_uuid: str) -> list[str]:
+        mentioned = [
+            self.episodic_edges[edge_uuid].target_node_uuid
+            for edge_uuid in self._episodic_edges_by_node.get(episode_uuid, ())
+            if self.episodic_edges[edge_uuid].source_node_uuid == episode_uuid
+        ]
+        return [
+            uuid
+            for uuid in dict.fromkeys(mentioned)
+            if len(
+                {
+                    self.episodic_edges[edge_uuid].source_node_uuid
+                    for edge_uuid in self._episodic_edges_by_node[uuid]
+                }
+            )
+            == 1
+        ]
@@ -16,18 +16,23 @@ limitations under the License.
 
 import logging
 from collections.abc import Coroutine
+from time import perf_counter
 from typing import Any
 
 from neo4j import AsyncGraphDatabase, EagerResult
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.query_stats import canonical_query, record_query
+from graphiti_core.telemetry.tracing import query_fingerprint, start_span
 
 logger = logging.getLogger(__name__)
 
 
 class Neo4jDriver(GraphDriver):
     provider = GraphProvider.NEO4J
+    # managed transactions retry deadlocks between concurrent writers
+    bulk_write_concurrency = 4
 
     def __init__(self, uri: str, user: str | None, password: str | None, database: str = 'neo4j'):
         super().__init__()
@@ -44,12 +49,29 @@ class Neo4jDriver(GraphDriver):
         if params is None:
             params = {}
         params.setdefault('database_', self._database)
-
-        try:
-            result = await self.client.execute_query(cypher_query_, parameters_=params, **kwargs)
-        except Exception as e:
-            logger.error(f'Error executing Neo4j query: {e}\n{cypher_query_}\n{params}')
-            raise
+        # identical query shapes must produce identical text to reuse the server's cached plan
+        cypher_query_ = canonical_query(cypher_query_)  # type: ignore[assignment]
+
+        with start_span(
+            'graphiti.db.query',
+            {
+                'db.system': 'neo4j',
+                'db.namespace': params['database_'],
+                'db.query.fingerprint': query_fingerprint(cypher_query_),
+            },
+        ) as span:
+            start = perf_counter()
+            try:
+                result = await self.client.execute_query(
+                    cypher_query_, parameters_=params, **kwargs
+                )
+            except Exception as e:
+                logger.error(f'Error executing Neo4j query: {e}\n{cypher_query_}\n{params}')
+                raise
+            finally:
+                record_query(cypher_query_, (perf_counter() - start) * 1000)
+
+            span.set_attribute('db.response.returned_rows', len(result.records))
 
         return result
 
@@ -0,0 +1,116 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import functools
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pydantic import BaseModel, Field
+
+from graphiti_core.telemetry.tracing import query_fingerprint
+
+# distinct query texts kept canonicalized; queries are built from a bounded set of shapes
+QUERY_CACHE_SIZE = 1024
+
+# string literals are matched first so that whitespace and comment markers inside them are left
+# untouched. Comments are dropped along with the whitespace around them, since collapsing a line
+# break would otherwise turn the rest of the query into a // comment.
+_QUERY_TOKENS = re.compile(
+    r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`|(?:\s|//[^\n]*|/\*[\s\S]*?\*/)+"""
+)
+
+
+def _collapse(match: re.Match[str]) -> str:
+    token = match.group(0)
+    return token if token[0] in '\'"`' else ' '
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def canonical_query(query: str) -> str:
+    """
+    Collapse the layout of a generated Cypher query so that every call building the same query
+    shape sends the same text, which is what the database's query plan cache is keyed on.
+    Comments outside string literals are removed.
+    """
+    return _QUERY_TOKENS.sub(_collapse, query).strip()
+
+
+class QueryShapeStats(BaseModel):
+    query: str
+    calls: int = 0
+    total_ms: float = 0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0
+
+
+class QueryStats(BaseModel):
+    shapes: dict[str, QueryShapeStats] = Field(
+        default_factory=dict, description='statistics per query fingerprint'
+    )
+
+    @property
+    def calls(self) -> int:
+        return sum(shape.calls for shape in self.shapes.values())
+
+    @property
+    def total_ms(self) -> float:
+        return sum(shape.total_ms for shape in self.shapes.values())
+
+    def record(self, query: str, elapsed_ms: float):
+        fingerprint = query_fingerprint(query)
+        shape = self.shapes.get(fingerprint)
+        if shape is None:
+            shape = self.shapes[fingerprint] = QueryShapeStats(query=query)
+        shape.calls += 1
+        shape.total_ms += elapsed_ms
+
+    def slowest(self, limit: int = 10) -> list[QueryShapeStats]:
+        return sorted(self.shapes.values(), key=lambda shape: shape.total_ms, reverse=True)[:limit]
+
+    def report(self, limit: int = 10, query_chars: int = 120) -> str:
+        lines = [f'{len(self.shapes)} query shapes, {self.calls} calls, {self.total_ms:.1f} ms']
+        for shape in self.slowest(limit):
+            lines.append(
+                f'{shape.calls:>6} calls {shape.total_ms:>10.1f} ms  {shape.query[:query_chars]}'
+            )
+        return '\n'.join(lines)
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar('graphiti_query_stats', default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect call counts and cumulative time per distinct query text for every query a driver
+    executes inside the block, including in child tasks.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def record_query(query: str, elapsed_ms: float):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(query, elapsed_ms)
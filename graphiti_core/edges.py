@@ -16,6 +16,7 @@ limitations under the License.
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from time import time
 from typing import Any
@@ -24,23 +25,49 @@ from uuid import uuid4
 from pydantic import BaseModel, Field
 from typing_extensions import LiteralString
 
-from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.driver import GraphDriver, driver_operation
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError
-from graphiti_core.helpers import parse_db_date
+from graphiti_core.helpers import (
+    DEFAULT_DELETE_BATCH_SIZE,
+    DEFAULT_SCAN_BATCH_SIZE,
+    construct_trusted,
+    parse_db_date,
+    scan_pages,
+)
 from graphiti_core.models.edges.edge_db_queries import (
     COMMUNITY_EDGE_RETURN,
-    ENTITY_EDGE_RETURN,
     EPISODIC_EDGE_RETURN,
     EPISODIC_EDGE_SAVE,
     get_community_edge_save_query,
+    get_entity_edge_return_query,
     get_entity_edge_save_query,
 )
 from graphiti_core.nodes import Node
+from graphiti_core.telemetry.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
+# stored edge properties that are model fields rather than custom attributes
+ENTITY_EDGE_RESERVED_KEYS = frozenset(
+    {
+        'uuid',
+        'source_node_uuid',
+        'target_node_uuid',
+        'fact',
+        'fact_embedding',
+        'name',
+        'group_id',
+        'episodes',
+        'created_at',
+        'expired_at',
+        'valid_at',
+        'invalid_at',
+    }
+)
+
+
 class Edge(BaseModel, ABC):
     uuid: str = Field(default_factory=lambda: str(uuid4()))
     group_id: str = Field(description='partition of the graph')
@@ -51,6 +78,7 @@ class Edge(BaseModel, ABC):
     @abstractmethod
     async def save(self, driver: GraphDriver): ...
 
+    @driver_operation('delete_edge')
     async def delete(self, driver: GraphDriver):
         result = await driver.execute_query(
             """
@@ -64,6 +92,31 @@ class Edge(BaseModel, ABC):
 
         return result
 
+    @classmethod
+    @driver_operation('delete_edges_by_uuids')
+    async def delete_by_uuids(
+        cls,
+        driver: GraphDriver,
+        uuids: list[str],
+        batch_size: int = DEFAULT_DELETE_BATCH_SIZE,
+    ) -> int:
+        deleted = 0
+        for i in range(0, len(uuids), batch_size):
+            records, _, _ = await driver.execute_query(
+                """
+                MATCH (n)-[e:MENTIONS|RELATES_TO|HAS_MEMBER]->(m)
+                WHERE e.uuid IN $uuids
+                DELETE e
+                RETURN count(*) AS deleted
+                """,
+                uuids=uuids[i : i + batch_size],
+            )
+            deleted += records[0]['deleted'] if records else 0
+
+        logger.debug(f'Deleted {deleted} edges by uuid')
+
+        return deleted
+
     def __hash__(self):
         return hash(self.uuid)
 
@@ -77,6 +130,7 @@ class Edge(BaseModel, ABC):
 
 
 class EpisodicEdge(Edge):
+    @driver_operation('save_episodic_edge')
     async def save(self, driver: GraphDriver):
         result = await driver.execute_query(
             EPISODIC_EDGE_SAVE,
@@ -92,6 +146,7 @@ class EpisodicEdge(Edge):
         return result
 
     @classmethod
+    @driver_operation('get_episodic_edge_by_uuid')
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
         records, _, _ = await driver.execute_query(
             """
@@ -110,6 +165,7 @@ class EpisodicEdge(Edge):
         return edges[0]
 
     @classmethod
+    @driver_operation('get_episodic_edges_by_uuids')
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
         records, _, _ = await driver.execute_query(
             """
@@ -129,6 +185,7 @@ class EpisodicEdge(Edge):
         return edges
 
     @classmethod
+    @driver_operation('get_episodic_edges_by_group_ids')
     async def get_by_group_ids(
         cls,
         driver: GraphDriver,
@@ -165,6 +222,23 @@ class EpisodicEdge(Edge):
             raise GroupsEdgesNotFoundError(group_ids)
         return edges
 
+    @classmethod
+    def scan(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+    ) -> AsyncIterator[list['EpisodicEdge']]:
+        """Yields the episodic edges of the groups in batches, paged by uuid."""
+
+        async def fetch(uuid_cursor: str | None) -> list['EpisodicEdge']:
+            try:
+                return await cls.get_by_group_ids(driver, group_ids, batch_size, uuid_cursor)
+            except GroupsEdgesNotFoundError:
+                return []
+
+        return scan_pages(fetch, batch_size)
+
 
 class EntityEdge(Edge):
     name: str = Field(description='name of the edge, relation name')
@@ -198,6 +272,7 @@ class EntityEdge(Edge):
 
         return self.fact_embedding
 
+    @driver_operation('load_entity_edge_embedding')
     async def load_fact_embedding(self, driver: GraphDriver):
         records, _, _ = await driver.execute_query(
             """
@@ -213,6 +288,7 @@ class EntityEdge(Edge):
 
         self.fact_embedding = records[0]['fact_embedding']
 
+    @driver_operation('save_entity_edge')
     async def save(self, driver: GraphDriver):
         edge_data: dict[str, Any] = {
             'source_uuid': self.source_node_uuid,
@@ -241,13 +317,14 @@ class EntityEdge(Edge):
         return result
 
     @classmethod
+    @driver_operation('get_entity_edge_by_uuid')
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
         records, _, _ = await driver.execute_query(
             """
             MATCH (n:Entity)-[e:RELATES_TO {uuid: $uuid}]->(m:Entity)
             RETURN
             """
-            + ENTITY_EDGE_RETURN,
+            + get_entity_edge_return_query(driver.provider),
             uuid=uuid,
             routing_='r',
         )
@@ -259,6 +336,7 @@ class EntityEdge(Edge):
         return edges[0]
 
     @classmethod
+    @driver_operation('get_entity_edges_by_uuids')
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
         if len(uuids) == 0:
             return []
@@ -269,7 +347,7 @@ class EntityEdge(Edge):
             WHERE e.uuid IN $uuids
             RETURN
             """
-            + ENTITY_EDGE_RETURN,
+            + get_entity_edge_return_query(driver.provider),
             uuids=uuids,
             routing_='r',
         )
@@ -279,6 +357,7 @@ class EntityEdge(Edge):
         return edges
 
     @classmethod
+    @driver_operation('get_entity_edges_by_group_ids')
     async def get_by_group_ids(
         cls,
         driver: GraphDriver,
@@ -289,14 +368,6 @@ class EntityEdge(Edge):
     ):
         cursor_query: LiteralString = 'AND e.uuid < $uuid' if uuid_cursor else ''
         limit_query: LiteralString = 'LIMIT $limit' if limit is not None else ''
-        with_embeddings_query: LiteralString = (
-            """,
-                e.fact_embedding AS fact_embedding
-                """
-            if with_embeddings
-            else ''
-        )
-
         records, _, _ = await driver.execute_query(
             """
             MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
@@ -306,8 +377,7 @@ class EntityEdge(Edge):
             + """
             RETURN
             """
-            + ENTITY_EDGE_RETURN
-            + with_embeddings_query
+            + get_entity_edge_return_query(driver.provider, include_embeddings=with_embeddings)
             + """
             ORDER BY e.uuid DESC 
             """
@@ -325,13 +395,34 @@ class EntityEdge(Edge):
         return edges
 
     @classmethod
+    def scan(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+        with_embeddings: bool = False,
+    ) -> AsyncIterator[list['EntityEdge']]:
+        """Yields the entity edges of the groups in batches, paged by uuid."""
+
+        async def fetch(uuid_cursor: str | None) -> list['EntityEdge']:
+            try:
+                return await cls.get_by_group_ids(
+                    driver, group_ids, batch_size, uuid_cursor, with_embeddings
+                )
+            except GroupsEdgesNotFoundError:
+                return []
+
+        return scan_pages(fetch, batch_size)
+
+    @classmethod
+    @driver_operation('get_entity_edges_by_node_uuid')
     async def get_by_node_uuid(cls, driver: GraphDriver, node_uuid: str):
         records, _, _ = await driver.execute_query(
             """
             MATCH (n:Entity {uuid: $node_uuid})-[e:RELATES_TO]-(m:Entity)
             RETURN
             """
-            + ENTITY_EDGE_RETURN,
+            + get_entity_edge_return_query(driver.provider),
             node_uuid=node_uuid,
             routing_='r',
         )
@@ -342,6 +433,7 @@ class EntityEdge(Edge):
 
 
 class CommunityEdge(Edge):
+    @driver_operation('save_community_edge')
     async def save(self, driver: GraphDriver):
         result = await driver.execute_query(
             get_community_edge_save_query(driver.provider),
@@ -357,6 +449,7 @@ class CommunityEdge(Edge):
         return result
 
     @classmethod
+    @driver_operation('get_community_edge_by_uuid')
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
         records, _, _ = await driver.execute_query(
             """
@@ -373,6 +466,7 @@ class CommunityEdge(Edge):
         return edges[0]
 
     @classmethod
+    @driver_operation('get_community_edges_by_uuids')
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
         records, _, _ = await driver.execute_query(
             """
@@ -390,6 +484,7 @@ class CommunityEdge(Edge):
         return edges
 
     @classmethod
+    @driver_operation('get_community_edges_by_group_ids')
     async def get_by_group_ids(
         cls,
         driver: GraphDriver,
@@ -424,6 +519,19 @@ class CommunityEdge(Edge):
 
         return edges
 
+    @classmethod
+    def scan(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+    ) -> AsyncIterator[list['CommunityEdge']]:
+        """Yields the community edges of the groups in batches, paged by uuid."""
+        return scan_pages(
+            lambda uuid_cursor: cls.get_by_group_ids(driver, group_ids, batch_size, uuid_cursor),
+            batch_size,
+        )
+
 
 # Edge helpers
 def get_episodic_edge_from_record(record: Any) -> EpisodicEdge:
@@ -437,36 +545,31 @@ def get_episodic_edge_from_record(record: Any) -> EpisodicEdge:
 
 
 def get_entity_edge_from_record(record: Any) -> EntityEdge:
-    edge = EntityEdge(
-        uuid=record['uuid'],
-        source_node_uuid=record['source_node_uuid'],
-        target_node_uuid=record['target_node_uuid'],
-        fact=record['fact'],
-        fact_embedding=record.get('fact_embedding'),
-        name=record['name'],
-        group_id=record['group_id'],
-        episodes=record['episodes'],
-        created_at=parse_db_date(record['created_at']),  # type: ignore
-        expired_at=parse_db_date(record['expired_at']),
-        valid_at=parse_db_date(record['valid_at']),
-        invalid_at=parse_db_date(record['invalid_at']),
-        attributes=record['attributes'],
+    # records come from our own queries and already hold the field types, and validating
+    # every row again dominates the cost of large reads
+    return construct_trusted(
+        EntityEdge,
+        {
+            'uuid': record['uuid'],
+            'group_id': record['group_id'],
+            'source_node_uuid': record['source_node_uuid'],
+            'target_node_uuid': record['target_node_uuid'],
+            'created_at': parse_db_date(record['created_at']),
+            'name': record['name'],
+            'fact': record['fact'],
+            'fact_embedding': record.get('fact_embedding'),
+            'episodes': record['episodes'] or [],
+            'expired_at': parse_db_date(record['expired_at']),
+            'valid_at': parse_db_date(record['valid_at']),
+            'invalid_at': parse_db_date(record['invalid_at']),
+            'attributes': {
+                key: value
+                for key, value in (record['attributes'] or {}).items()
+                if key not in ENTITY_EDGE_RESERVED_KEYS
+            },
+        },
     )
 
-    edge.attributes.pop('uuid', None)
-    edge.attributes.pop('source_node_uuid', None)
-    edge.attributes.pop('target_node_uuid', None)
-    edge.attributes.pop('fact', None)
-    edge.attributes.pop('name', None)
-    edge.attributes.pop('group_id', None)
-    edge.attributes.pop('episodes', None)
-    edge.attributes.pop('created_at', None)
-    edge.attributes.pop('expired_at', None)
-    edge.attributes.pop('valid_at', None)
-    edge.attributes.pop('invalid_at', None)
-
-    return edge
-
 
 def get_community_edge_from_record(record: Any):
     return CommunityEdge(
@@ -478,6 +581,7 @@ def get_community_edge_from_record(record: Any):
     )
 
 
+@traced('graphiti.embed.entity_edges')
 async def create_entity_edge_embeddings(embedder: EmbedderClient, edges: list[EntityEdge]):
     if len(edges) == 0:
         return
@@ -15,18 +15,18 @@ limitations under the License.
 """
 
 import logging
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from datetime import datetime
 from time import time
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
-from typing_extensions import LiteralString
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.driver.neo4j_driver import Neo4jDriver
-from graphiti_core.edges import CommunityEdge, EntityEdge, EpisodicEdge
+from graphiti_core.edges import CommunityEdge, Edge, EntityEdge, EpisodicEdge
 from graphiti_core.embedder import EmbedderClient, OpenAIEmbedder
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import (
@@ -36,9 +36,10 @@ from graphiti_core.helpers import (
     validate_group_id,
 )
 from graphiti_core.llm_client import LLMClient, OpenAIClient
-from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode
-from graphiti_core.search.search import SearchConfig, search
-from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults
+from graphiti_core.llm_client.usage import UsageSummary, track_usage
+from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode, Node
+from graphiti_core.search.search import SearchConfig, search, search_stream
+from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults, SearchUpdate
 from graphiti_core.search.search_config_recipes import (
     COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
     EDGE_HYBRID_SEARCH_NODE_DISTANCE,
@@ -52,15 +53,21 @@ from graphiti_core.search.search_utils import (
     get_relevant_edges,
 )
 from graphiti_core.telemetry import capture_event
+from graphiti_core.telemetry.tracing import set_span_attributes, traced
 from graphiti_core.utils.bulk_utils import (
+    TRIPLET_CHUNK_SIZE,
+    AddTripletsBulkResults,
     RawEpisode,
+    Triplet,
     add_nodes_and_edges_bulk,
+    add_triplets_bulk,
     dedupe_edges_bulk,
     dedupe_nodes_bulk,
     extract_nodes_and_edges_bulk,
     resolve_edge_pointers,
     retrieve_previous_episodes_bulk,
 )
+from graphiti_core.utils.context_window import ContextWindowManager
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.community_operations import (
     build_communities,
@@ -77,6 +84,7 @@ from graphiti_core.utils.maintenance.edge_operations import (
 from graphiti_core.utils.maintenance.graph_data_operations import (
     EPISODE_WINDOW_LEN,
     build_indices_and_constraints,
+    get_nodes_mentioned_only_by_episode,
     retrieve_episodes,
 )
 from graphiti_core.utils.maintenance.node_operations import (
@@ -98,6 +106,14 @@ class AddEpisodeResults(BaseModel):
     edges: list[EntityEdge]
     communities: list[CommunityNode]
     community_edges: list[CommunityEdge]
+    usage: UsageSummary | None = None
+
+
+def _with_as_of(search_filter: SearchFilters | None, as_of: datetime | None) -> SearchFilters:
+    search_filter = search_filter if search_filter is not None else SearchFilters()
+    if as_of is None:
+        return search_filter
+    return search_filter.model_copy(update={'as_of': as_of})
 
 
 class Graphiti:
@@ -112,6 +128,7 @@ class Graphiti:
         store_raw_episode_content: bool = True,
         graph_driver: GraphDriver | None = None,
         max_coroutines: int | None = None,
+        context_window: ContextWindowManager | None = None,
     ):
         """
         Initialize a Graphiti instance.
@@ -144,6 +161,10 @@ class Graphiti:
         max_coroutines : int | None, optional
             The maximum number of concurrent operations allowed. Overrides SEMAPHORE_LIMIT set in the environment.
             If not set, the Graphiti default is used.
+        context_window : ContextWindowManager | None, optional
+            Controls how much previous-episode history is sent with each prompt.
+            If not provided, previous episodes are truncated to the default per-prompt token budgets.
+            Pass a ContextWindowManager with an llm_client to summarize long episodes instead.
 
         Returns
         -------
@@ -191,6 +212,7 @@ class Graphiti:
             llm_client=self.llm_client,
             embedder=self.embedder,
             cross_encoder=self.cross_encoder,
+            context_window=context_window or ContextWindowManager(),
         )
 
         # Capture telemetry event
@@ -349,6 +371,7 @@ class Graphiti:
         """
         return await retrieve_episodes(self.driver, reference_time, last_n, group_ids, source)
 
+    @traced('graphiti.add_episode')
     async def add_episode(
         self,
         name: str,
@@ -421,136 +444,159 @@ class Graphiti:
                 return {"message": "Episode processing started"}
         """
         try:
-            start = time()
-            now = utc_now()
-
-            # if group_id is None, use the default group id by the provider
-            group_id = group_id or get_default_group_id(self.driver.provider)
-            validate_entity_types(entity_types)
-
-            validate_excluded_entity_types(excluded_entity_types, entity_types)
-            validate_group_id(group_id)
+            with track_usage() as usage:
+                start = time()
+                now = utc_now()
+
+                # if group_id is None, use the default group id by the provider
+                group_id = group_id or get_default_group_id(self.driver.provider)
+                validate_entity_types(entity_types)
+
+                validate_excluded_entity_types(excluded_entity_types, entity_types)
+                validate_group_id(group_id)
+
+                previous_episodes = (
+                    await self.retrieve_episodes(
+                        reference_time,
+                        last_n=RELEVANT_SCHEMA_LIMIT,
+                        group_ids=[group_id],
+                        source=source,
+                    )
+                    if previous_episode_uuids is None
+                    else await EpisodicNode.get_by_uuids(self.driver, previous_episode_uuids)
+                )
 
-            previous_episodes = (
-                await self.retrieve_episodes(
-                    reference_time,
-                    last_n=RELEVANT_SCHEMA_LIMIT,
-                    group_ids=[group_id],
-                    source=source,
+                episode = (
+                    await EpisodicNode.get_by_uuid(self.driver, uuid)
+                    if uuid is not None
+                    else EpisodicNode(
+                        name=name,
+                        group_id=group_id,
+                        labels=[],
+                        source=source,
+                        content=episode_body,
+                        source_description=source_description,
+                        created_at=now,
+                        valid_at=reference_time,
+                    )
                 )
-                if previous_episode_uuids is None
-                else await EpisodicNode.get_by_uuids(self.driver, previous_episode_uuids)
-            )
 
-            episode = (
-                await EpisodicNode.get_by_uuid(self.driver, uuid)
-                if uuid is not None
-                else EpisodicNode(
-                    name=name,
-                    group_id=group_id,
-                    labels=[],
-                    source=source,
-                    content=episode_body,
-                    source_description=source_description,
-                    created_at=now,
-                    valid_at=reference_time,
+                # Create default edge type map
+                edge_type_map_default = (
+                    {('Entity', 'Entity'): list(edge_types.keys())}
+                    if edge_types is not None
+                    else {('Entity', 'Entity'): []}
                 )
-            )
 
-            # Create default edge type map
-            edge_type_map_default = (
-                {('Entity', 'Entity'): list(edge_types.keys())}
-                if edge_types is not None
-                else {('Entity', 'Entity'): []}
-            )
+                # Summarize long previous episodes once so every prompt below can reuse the summaries
+                await self.clients.context_window.summarize_episodes(previous_episodes)
 
-            # Extract entities as nodes
+                # Extract entities as nodes
 
-            extracted_nodes = await extract_nodes(
-                self.clients, episode, previous_episodes, entity_types, excluded_entity_types
-            )
+                extracted_nodes = await extract_nodes(
+                    self.clients, episode, previous_episodes, entity_types, excluded_entity_types
+                )
 
-            # Extract edges and resolve nodes
-            (nodes, uuid_map, node_duplicates), extracted_edges = await semaphore_gather(
-                resolve_extracted_nodes(
-                    self.clients,
-                    extracted_nodes,
-                    episode,
-                    previous_episodes,
-                    entity_types,
-                ),
-                extract_edges(
-                    self.clients,
-                    episode,
-                    extracted_nodes,
-                    previous_episodes,
-                    edge_type_map or edge_type_map_default,
-                    group_id,
-                    edge_types,
-                ),
-                max_coroutines=self.max_coroutines,
-            )
+                # Extract edges and resolve nodes
+                (nodes, uuid_map, node_duplicates), extracted_edges = await semaphore_gather(
+                    resolve_extracted_nodes(
+                        self.clients,
+                        extracted_nodes,
+                        episode,
+                        previous_episodes,
+                        entity_types,
+                    ),
+                    extract_edges(
+                        self.clients,
+                        episode,
+                        extracted_nodes,
+                        previous_episodes,
+                        edge_type_map or edge_type_map_default,
+                        group_id,
+                        edge_types,
+                    ),
+                    max_coroutines=self.max_coroutines,
+                )
 
-            edges = resolve_edge_pointers(extracted_edges, uuid_map)
-
-            (resolved_edges, invalidated_edges), hydrated_nodes = await semaphore_gather(
-                resolve_extracted_edges(
-                    self.clients,
-                    edges,
-                    episode,
-                    nodes,
-                    edge_types or {},
-                    edge_type_map or edge_type_map_default,
-                ),
-                extract_attributes_from_nodes(
-                    self.clients, nodes, episode, previous_episodes, entity_types
-                ),
-                max_coroutines=self.max_coroutines,
-            )
+                edges = resolve_edge_pointers(extracted_edges, uuid_map)
 
-            duplicate_of_edges = build_duplicate_of_edges(episode, now, node_duplicates)
+                (resolved_edges, invalidated_edges), hydrated_nodes = await semaphore_gather(
+                    resolve_extracted_edges(
+                        self.clients,
+                        edges,
+                        episode,
+                        nodes,
+                        edge_types or {},
+                        edge_type_map or edge_type_map_default,
+                    ),
+                    extract_attributes_from_nodes(
+                        self.clients, nodes, episode, previous_episodes, entity_types
+                    ),
+                    max_coroutines=self.max_coroutines,
+                )
 
-            entity_edges = resolved_edges + invalidated_edges + duplicate_of_edges
+                duplicate_of_edges = build_duplicate_of_edges(episode, now, node_duplicates)
 
-            episodic_edges = build_episodic_edges(nodes, episode.uuid, now)
+                entity_edges = resolved_edges + invalidated_edges + duplicate_of_edges
 
-            episode.entity_edges = [edge.uuid for edge in entity_edges]
+                episodic_edges = build_episodic_edges(nodes, episode.uuid, now)
 
-            if not self.store_raw_episode_content:
-                episode.content = ''
+                episode.entity_edges = [edge.uuid for edge in entity_edges]
 
-            await add_nodes_and_edges_bulk(
-                self.driver, [episode], episodic_edges, hydrated_nodes, entity_edges, self.embedder
-            )
+                if not self.store_raw_episode_content:
+                    episode.content = ''
 
-            communities = []
-            community_edges = []
+                await add_nodes_and_edges_bulk(
+                    self.driver,
+                    [episode],
+                    episodic_edges,
+                    hydrated_nodes,
+                    entity_edges,
+                    self.embedder,
+                )
 
-            # Update any communities
-            if update_communities:
-                communities, community_edges = await semaphore_gather(
-                    *[
-                        update_community(self.driver, self.llm_client, self.embedder, node)
-                        for node in nodes
-                    ],
-                    max_coroutines=self.max_coroutines,
+                communities = []
+                community_edges = []
+
+                # Update any communities
+                if update_communities:
+                    communities, community_edges = await semaphore_gather(
+                        *[
+                            update_community(self.driver, self.llm_client, self.embedder, node)
+                            for node in nodes
+                        ],
+                        max_coroutines=self.max_coroutines,
+                    )
+                end = time()
+                set_span_attributes(
+                    **{
+                        'graphiti.nodes': len(hydrated_nodes),
+                        'graphiti.edges': len(entity_edges),
+                        'gen_ai.usage.input_tokens': usage.total.input_tokens,
+                        'gen_ai.usage.output_tokens': usage.total.output_tokens,
+                        'graphiti.llm.cached_input_tokens': usage.total.cached_input_tokens,
+                    }
+                )
+                logger.info(
+                    f'Completed add_episode in {(end - start) * 1000} ms, '
+                    f'{usage.total.input_tokens} input tokens, {usage.total.output_tokens} output tokens'
+                )
+
+                return AddEpisodeResults(
+                    episode=episode,
+                    episodic_edges=episodic_edges,
+                    nodes=hydrated_nodes,
+                    edges=entity_edges,
+                    communities=communities,
+                    community_edges=community_edges,
+                    usage=usage,
                 )
-            end = time()
-            logger.info(f'Completed add_episode in {(end - start) * 1000} ms')
-
-            return AddEpisodeResults(
-                episode=episode,
-                episodic_edges=episodic_edges,
-                nodes=hydrated_nodes,
-                edges=entity_edges,
-                communities=communities,
-                community_edges=community_edges,
-            )
 
         except Exception as e:
             raise e
 
     ##### EXPERIMENTAL #####
+    @traced('graphiti.add_episode_bulk')
     async def add_episode_bulk(
         self,
         bulk_episodes: list[RawEpisode],
@@ -643,6 +689,15 @@ class Graphiti:
 
             # Get previous episode context for each episode
             episode_context = await retrieve_previous_episodes_bulk(self.driver, episodes)
+            await self.clients.context_window.summarize_episodes(
+                list(
+                    {
+                        previous.uuid: previous
+                        for _, previous_episodes in episode_context
+                        for previous in previous_episodes
+                    }.values()
+                )
+            )
 
             # Extract all nodes and edges for each episode
             extracted_nodes_bulk, extracted_edges_bulk = await extract_nodes_and_edges_bulk(
@@ -870,6 +925,7 @@ class Graphiti:
         group_ids: list[str] | None = None,
         num_results=DEFAULT_SEARCH_LIMIT,
         search_filter: SearchFilters | None = None,
+        as_of: datetime | None = None,
     ) -> list[EntityEdge]:
         """
         Perform a hybrid search on the knowledge graph.
@@ -890,6 +946,10 @@ class Graphiti:
             The graph partitions to return data from.
         num_results : int, optional
             The maximum number of results to return. Defaults to 10.
+        search_filter : SearchFilters, optional
+            Filters applied to the search results.
+        as_of : datetime, optional
+            Only return facts that were true at this point in time.
 
         Returns
         -------
@@ -906,8 +966,7 @@ class Graphiti:
         """
         search_config = (
             EDGE_HYBRID_SEARCH_RRF if center_node_uuid is None else EDGE_HYBRID_SEARCH_NODE_DISTANCE
-        )
-        search_config.limit = num_results
+        ).model_copy(update={'limit': num_results})
 
         edges = (
             await search(
@@ -915,7 +974,7 @@ class Graphiti:
                 query,
                 group_ids,
                 search_config,
-                search_filter if search_filter is not None else SearchFilters(),
+                _with_as_of(search_filter, as_of),
                 center_node_uuid,
             )
         ).edges
@@ -944,12 +1003,14 @@ class Graphiti:
         center_node_uuid: str | None = None,
         bfs_origin_node_uuids: list[str] | None = None,
         search_filter: SearchFilters | None = None,
+        as_of: datetime | None = None,
     ) -> SearchResults:
         """search_ (replaces _search) is our advanced search method that returns Graph objects (nodes and edges) rather
         than a list of facts. This endpoint allows the end user to utilize more advanced features such as filters and
         different search and reranker methodologies across different layers in the graph.
 
-        For different config recipes refer to search/search_config_recipes.
+        For different config recipes refer to search/search_config_recipes. Passing as_of restricts
+        the facts to those that were true at that point in time.
         """
 
         return await search(
@@ -957,7 +1018,32 @@ class Graphiti:
             query,
             group_ids,
             config,
-            search_filter if search_filter is not None else SearchFilters(),
+            _with_as_of(search_filter, as_of),
+            center_node_uuid,
+            bfs_origin_node_uuids,
+        )
+
+    def search_stream(
+        self,
+        query: str,
+        config: SearchConfig = COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+        group_ids: list[str] | None = None,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        search_filter: SearchFilters | None = None,
+        as_of: datetime | None = None,
+    ) -> AsyncIterator[SearchUpdate]:
+        """
+        Incremental version of search_: yields each layer's results as soon as they are ready.
+        Layers reranked by a cross-encoder yield their first-stage results before the reranked
+        ones, so callers can start working with the first results right away.
+        """
+        return search_stream(
+            self.clients,
+            query,
+            group_ids,
+            config,
+            _with_as_of(search_filter, as_of),
             center_node_uuid,
             bfs_origin_node_uuids,
         )
@@ -1016,6 +1102,38 @@ class Graphiti:
             self.driver, [], [], resolved_nodes, [resolved_edge] + invalidated_edges, self.embedder
         )
 
+    async def add_triplets_bulk(
+        self,
+        triplets: Iterable[Triplet] | AsyncIterable[Triplet],
+        chunk_size: int = TRIPLET_CHUNK_SIZE,
+        llm_fallback: bool = False,
+    ) -> AddTripletsBulkResults:
+        """
+        Add a stream of pre-structured (source node, edge, target node) triplets to the graph.
+
+        Unlike add_triplet, nodes and edges are deduplicated by name and embedding similarity
+        instead of by the LLM, and are written chunk_size triplets per transaction, which makes
+        this suitable for migrating an existing knowledge graph.
+
+        Parameters
+        ----------
+        triplets : Iterable[Triplet] | AsyncIterable[Triplet]
+            The triplets to add. The edge must point from the source node to the target node.
+        chunk_size : int
+            The number of triplets embedded, deduplicated and written together.
+        llm_fallback : bool
+            Resolve nodes that are similar to, but not clearly the same as, an existing node
+            with the LLM. By default they are added as new nodes.
+
+        Returns
+        -------
+        AddTripletsBulkResults
+            The number of nodes and edges created and merged into existing ones.
+        """
+        return await add_triplets_bulk(
+            self.clients, triplets, chunk_size=chunk_size, llm_fallback=llm_fallback
+        )
+
     async def remove_episode(self, episode_uuid: str):
         # Find the episode to be deleted
         episode = await EpisodicNode.get_by_uuid(self.driver, episode_uuid)
@@ -1024,29 +1142,13 @@ class Graphiti:
         edges = await EntityEdge.get_by_uuids(self.driver, episode.entity_edges)
 
         # We should only delete edges created by the episode
-        edges_to_delete: list[EntityEdge] = []
-        for edge in edges:
-            if edge.episodes and edge.episodes[0] == episode.uuid:
-                edges_to_delete.append(edge)
-
-        # Find nodes mentioned by the episode
-        nodes = await get_mentioned_nodes(self.driver, [episode])
-        # We should delete all nodes that are only mentioned in the deleted episode
-        nodes_to_delete: list[EntityNode] = []
-        for node in nodes:
-            query: LiteralString = 'MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $uuid}) RETURN count(*) AS episode_count'
-            records, _, _ = await self.driver.execute_query(query, uuid=node.uuid, routing_='r')
-
-            for record in records:
-                if record['episode_count'] == 1:
-                    nodes_to_delete.append(node)
+        edge_uuids_to_delete: list[str] = [
+            edge.uuid for edge in edges if edge.episodes and edge.episodes[0] == episode.uuid
+        ]
 
-        await semaphore_gather(
-            *[node.delete(self.driver) for node in nodes_to_delete],
-            max_coroutines=self.max_coroutines,
-        )
-        await semaphore_gather(
-            *[edge.delete(self.driver) for edge in edges_to_delete],
-            max_coroutines=self.max_coroutines,
-        )
+        # We should delete all nodes that are only mentioned in the deleted episode.
+        node_uuids_to_delete = await get_nodes_mentioned_only_by_episode(self.driver, episode.uuid)
+
+        await Node.delete_by_uuids(self.driver, node_uuids_to_delete)
+        await Edge.delete_by_uuids(self.driver, edge_uuids_to_delete)
         await episode.delete(self.driver)
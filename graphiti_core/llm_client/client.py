@@ -28,6 +28,7 @@ from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_
 from ..prompts.models import Message
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError
+from .usage import TokenUsage, record_attempt, record_attempt_usage, track_llm_call
 
 DEFAULT_TEMPERATURE = 0
 DEFAULT_CACHE_DIR = './llm_cache'
@@ -39,6 +40,24 @@ MULTILINGUAL_EXTRACTION_RESPONSES = (
 logger = logging.getLogger(__name__)
 
 
+def add_static_instructions(
+    messages: list[Message], response_model: type[BaseModel] | None = None
+) -> None:
+    """
+    Append the static output instructions (language rules and JSON schema) to the system message.
+
+    Keeping them in the system message, ahead of any per-call content, gives every call of the
+    same prompt a byte-identical prefix that providers can serve from their prompt cache.
+    """
+    messages[0].content += MULTILINGUAL_EXTRACTION_RESPONSES
+
+    if response_model is not None:
+        serialized_model = json.dumps(response_model.model_json_schema())
+        messages[0].content += (
+            f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
+        )
+
+
 def is_server_or_retry_error(exception):
     if isinstance(exception, RateLimitError | json.decoder.JSONDecodeError):
         return True
@@ -91,6 +110,8 @@ class LLMClient(ABC):
         stop=stop_after_attempt(4),
         wait=wait_random_exponential(multiplier=10, min=5, max=120),
         retry=retry_if_exception(is_server_or_retry_error),
+        # counted as they start, since attempts that fail often report no usage
+        before=lambda retry_state: record_attempt(),
         after=lambda retry_state: logger.warning(
             f'Retrying {retry_state.fn.__name__ if retry_state.fn else "function"} after {retry_state.attempt_number} attempts...'
         )
@@ -136,16 +157,7 @@ class LLMClient(ABC):
         if max_tokens is None:
             max_tokens = self.max_tokens
 
-        if response_model is not None:
-            serialized_model = json.dumps(response_model.model_json_schema())
-            messages[
-                -1
-            ].content += (
-                f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
-            )
-
-        # Add multilingual extraction instructions
-        messages[0].content += MULTILINGUAL_EXTRACTION_RESPONSES
+        add_static_instructions(messages, response_model)
 
         if self.cache_enabled and self.cache_dir is not None:
             cache_key = self._get_cache_key(messages)
@@ -158,9 +170,10 @@ class LLMClient(ABC):
         for message in messages:
             message.content = self._clean_input(message.content)
 
-        response = await self._generate_response_with_retry(
-            messages, response_model, max_tokens, model_size
-        )
+        with track_llm_call(self.model):
+            response = await self._generate_response_with_retry(
+                messages, response_model, max_tokens, model_size
+            )
 
         if self.cache_enabled and self.cache_dir is not None:
             cache_key = self._get_cache_key(messages)
@@ -168,6 +181,10 @@ class LLMClient(ABC):
 
         return response
 
+    def _record_usage(self, model: str | None, usage: TokenUsage) -> None:
+        """Report the token usage of a single provider attempt."""
+        record_attempt_usage(model, usage)
+
     def _get_failed_generation_log(self, messages: list[Message], output: str | None) -> str:
         """
         Log the full input messages, the raw output (if any), and the exception for debugging failed generations.
@@ -26,6 +26,7 @@ from ..prompts.models import Message
 from .client import MULTILINGUAL_EXTRACTION_RESPONSES, LLMClient
 from .config import LLMConfig, ModelSize
 from .errors import RateLimitError
+from .usage import TokenUsage, record_attempt, track_llm_call
 
 if TYPE_CHECKING:
     from google import genai
@@ -306,6 +307,19 @@ class GeminiClient(LLMClient):
                 config=generation_config,
             )
 
+            # Gemini 2.5 models cache repeated prefixes implicitly, the system instruction and
+            # schema are sent first so every call of a prompt shares the same prefix
+            usage_metadata = getattr(response, 'usage_metadata', None)
+            if usage_metadata is not None:
+                self._record_usage(
+                    model,
+                    TokenUsage(
+                        input_tokens=usage_metadata.prompt_token_count or 0,
+                        output_tokens=usage_metadata.candidates_token_count or 0,
+                        cached_input_tokens=usage_metadata.cached_content_token_count or 0,
+                    ),
+                )
+
             # Always capture the raw output for debugging
             raw_output = getattr(response, 'text', None)
 
@@ -381,48 +395,50 @@ class GeminiClient(LLMClient):
         # Add multilingual extraction instructions
         messages[0].content += MULTILINGUAL_EXTRACTION_RESPONSES
 
-        while retry_count < self.MAX_RETRIES:
-            try:
-                response = await self._generate_response(
-                    messages=messages,
-                    response_model=response_model,
-                    max_tokens=max_tokens,
-                    model_size=model_size,
-                )
-                last_output = (
-                    response.get('content')
-                    if isinstance(response, dict) and 'content' in response
-                    else None
-                )
-                return response
-            except RateLimitError as e:
-                # Rate limit errors should not trigger retries (fail fast)
-                raise e
-            except Exception as e:
-                last_error = e
-
-                # Check if this is a safety block - these typically shouldn't be retried
-                error_text = str(e) or (str(e.__cause__) if e.__cause__ else '')
-                if 'safety' in error_text.lower() or 'blocked' in error_text.lower():
-                    logger.warning(f'Content blocked by safety filters: {e}')
-                    raise Exception(f'Content blocked by safety filters: {e}') from e
-
-                retry_count += 1
-
-                # Construct a detailed error message for the LLM
-                error_context = (
-                    f'The previous response attempt was invalid. '
-                    f'Error type: {e.__class__.__name__}. '
-                    f'Error details: {str(e)}. '
-                    f'Please try again with a valid response, ensuring the output matches '
-                    f'the expected format and constraints.'
-                )
-
-                error_message = Message(role='user', content=error_context)
-                messages.append(error_message)
-                logger.warning(
-                    f'Retrying after application error (attempt {retry_count}/{self.MAX_RETRIES}): {e}'
-                )
+        with track_llm_call(self.model):
+            while retry_count < self.MAX_RETRIES:
+                record_attempt()
+                try:
+                    response = await self._generate_response(
+                        messages=messages,
+                        response_model=response_model,
+                        max_tokens=max_tokens,
+                        model_size=model_size,
+                    )
+                    last_output = (
+                        response.get('content')
+                        if isinstance(response, dict) and 'content' in response
+                        else None
+                    )
+                    return response
+                except RateLimitError as e:
+                    # Rate limit errors should not trigger retries (fail fast)
+                    raise e
+                except Exception as e:
+                    last_error = e
+
+                    # Check if this is a safety block - these typically shouldn't be retried
+                    error_text = str(e) or (str(e.__cause__) if e.__cause__ else '')
+                    if 'safety' in error_text.lower() or 'blocked' in error_text.lower():
+                        logger.warning(f'Content blocked by safety filters: {e}')
+                        raise Exception(f'Content blocked by safety filters: {e}') from e
+
+                    retry_count += 1
+
+                    # Construct a detailed error message for the LLM
+                    error_context = (
+                        f'The previous response attempt was invalid. '
+                        f'Error type: {e.__class__.__name__}. '
+                        f'Error details: {str(e)}. '
+                        f'Please try again with a valid response, ensuring the output matches '
+                        f'the expected format and constraints.'
+                    )
+
+                    error_message = Message(role='user', content=error_context)
+                    messages.append(error_message)
+                    logger.warning(
+                        f'Retrying after application error (attempt {retry_count}/{self.MAX_RETRIES}): {e}'
+                    )
 
         # If we exit the loop without returning, all retries are exhausted
         logger.error('🦀 LLM generation failed and retries are exhausted.')
@@ -38,6 +38,7 @@ from ..prompts.models import Message
 from .client import LLMClient
 from .config import LLMConfig, ModelSize
 from .errors import RateLimitError
+from .usage import TokenUsage
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +77,14 @@ class GroqClient(LLMClient):
                 max_tokens=max_tokens or self.max_tokens,
                 response_format={'type': 'json_object'},
             )
+            if response.usage is not None:
+                self._record_usage(
+                    response.model,
+                    TokenUsage(
+                        input_tokens=response.usage.prompt_tokens,
+                        output_tokens=response.usage.completion_tokens,
+                    ),
+                )
             result = response.choices[0].message.content or ''
             from .utils import safe_json_loads
             return safe_json_loads(result)
@@ -25,9 +25,10 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import MULTILINGUAL_EXTRACTION_RESPONSES, LLMClient
+from .client import LLMClient, add_static_instructions
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
+from .usage import TokenUsage, record_attempt, track_llm_call
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,20 @@ DEFAULT_MODEL = 'gpt-4.1-mini'
 DEFAULT_SMALL_MODEL = 'gpt-4.1-nano'
 
 
+def openai_token_usage(response: Any) -> TokenUsage:
+    """Read token usage, including prompt-cache hits, from a chat completion response."""
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return TokenUsage()
+
+    prompt_tokens_details = getattr(usage, 'prompt_tokens_details', None)
+    return TokenUsage(
+        input_tokens=usage.prompt_tokens or 0,
+        output_tokens=usage.completion_tokens or 0,
+        cached_input_tokens=getattr(prompt_tokens_details, 'cached_tokens', None) or 0,
+    )
+
+
 class BaseOpenAIClient(LLMClient):
     """
     Base client class for OpenAI-compatible APIs (OpenAI and Azure OpenAI).
@@ -142,6 +157,7 @@ class BaseOpenAIClient(LLMClient):
                     max_tokens=max_tokens or self.max_tokens,
                     response_model=response_model,
                 )
+                self._record_usage(model, openai_token_usage(response))
                 return self._handle_structured_response(response)
             else:
                 response = await self._create_completion(
@@ -150,6 +166,7 @@ class BaseOpenAIClient(LLMClient):
                     temperature=self.temperature,
                     max_tokens=max_tokens or self.max_tokens,
                 )
+                self._record_usage(model, openai_token_usage(response))
                 return self._handle_json_response(response)
 
         except openai.LengthFinishReasonError as e:
@@ -174,45 +191,48 @@ class BaseOpenAIClient(LLMClient):
         retry_count = 0
         last_error = None
 
-        # Add multilingual extraction instructions
-        messages[0].content += MULTILINGUAL_EXTRACTION_RESPONSES
-
-        while retry_count <= self.MAX_RETRIES:
-            try:
-                response = await self._generate_response(
-                    messages, response_model, max_tokens, model_size
-                )
-                return response
-            except (RateLimitError, RefusalError):
-                # These errors should not trigger retries
-                raise
-            except (openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError):
-                # Let OpenAI's client handle these retries
-                raise
-            except Exception as e:
-                last_error = e
-
-                # Don't retry if we've hit the max retries
-                if retry_count >= self.MAX_RETRIES:
-                    logger.error(f'Max retries ({self.MAX_RETRIES}) exceeded. Last error: {e}')
+        # Structured completions carry the schema in response_format, so only the language rules
+        # are added to the system message here
+        add_static_instructions(messages)
+
+        with track_llm_call(self.model):
+            while retry_count <= self.MAX_RETRIES:
+                record_attempt()
+                try:
+                    response = await self._generate_response(
+                        messages, response_model, max_tokens, model_size
+                    )
+                    return response
+                except (RateLimitError, RefusalError):
+                    # These errors should not trigger retries
                     raise
-
-                retry_count += 1
-
-                # Construct a detailed error message for the LLM
-                error_context = (
-                    f'The previous response attempt was invalid. '
-                    f'Error type: {e.__class__.__name__}. '
-                    f'Error details: {str(e)}. '
-                    f'Please try again with a valid response, ensuring the output matches '
-                    f'the expected format and constraints.'
-                )
-
-                error_message = Message(role='user', content=error_context)
-                messages.append(error_message)
-                logger.warning(
-                    f'Retrying after application error (attempt {retry_count}/{self.MAX_RETRIES}): {e}'
-                )
+                except (openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError):
+                    # Let OpenAI's client handle these retries
+                    raise
+                except Exception as e:
+                    last_error = e
+
+                    # Don't retry if we've hit the max retries
+                    if retry_count >= self.MAX_RETRIES:
+                        logger.error(f'Max retries ({self.MAX_RETRIES}) exceeded. Last error: {e}')
+                        raise
+
+                    retry_count += 1
+
+                    # Construct a detailed error message for the LLM
+                    error_context = (
+                        f'The previous response attempt was invalid. '
+                        f'Error type: {e.__class__.__name__}. '
+                        f'Error details: {str(e)}. '
+                        f'Please try again with a valid response, ensuring the output matches '
+                        f'the expected format and constraints.'
+                    )
+
+                    error_message = Message(role='user', content=error_context)
+                    messages.append(error_message)
+                    logger.warning(
+                        f'Retrying after application error (attempt {retry_count}/{self.MAX_RETRIES}): {e}'
+                    )
 
         # If we somehow get here, raise the last error
         raise last_error or Exception('Max retries exceeded with no specific error')
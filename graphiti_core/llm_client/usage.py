@@ -0,0 +1,192 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from pydantic import BaseModel, Field
+
+from graphiti_core.telemetry.metrics import record_llm_call_metrics
+from graphiti_core.telemetry.tracing import start_span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STAGE = 'unknown'
+
+
+class TokenUsage(BaseModel):
+    input_tokens: int = 0
+    output_tokens: int = 0
+    # input tokens served from the provider's prompt cache
+    cached_input_tokens: int = 0
+    # input tokens written to the provider's prompt cache (Anthropic only)
+    cache_creation_input_tokens: int = 0
+
+    def add(self, other: 'TokenUsage'):
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cached_input_tokens += other.cached_input_tokens
+        self.cache_creation_input_tokens += other.cache_creation_input_tokens
+
+
+class LLMCallUsage(TokenUsage):
+    """Usage of a single generate_response call, summed over its provider attempts."""
+
+    stage: str = DEFAULT_STAGE
+    model: str | None = None
+    latency_ms: float = 0
+    attempts: int = 0
+    # the exception type of a call that failed after all of its attempts
+    error: str | None = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+
+class StageUsage(TokenUsage):
+    calls: int = 0
+    failed_calls: int = 0
+    retries: int = 0
+    latency_ms: float = 0
+
+
+class UsageSummary(BaseModel):
+    calls: list[LLMCallUsage] = Field(default_factory=list)
+
+    @property
+    def total(self) -> StageUsage:
+        total = StageUsage()
+        for call in self.calls:
+            _add_call(total, call)
+        return total
+
+    @property
+    def by_stage(self) -> dict[str, StageUsage]:
+        stages: dict[str, StageUsage] = {}
+        for call in self.calls:
+            _add_call(stages.setdefault(call.stage, StageUsage()), call)
+        return stages
+
+
+def _add_call(stage_usage: StageUsage, call: LLMCallUsage):
+    stage_usage.add(call)
+    stage_usage.calls += 1
+    stage_usage.failed_calls += call.failed
+    stage_usage.retries += call.retries
+    stage_usage.latency_ms += call.latency_ms
+
+
+_current_stage: ContextVar[str] = ContextVar('graphiti_llm_stage', default=DEFAULT_STAGE)
+_current_call: ContextVar[LLMCallUsage | None] = ContextVar('graphiti_llm_call', default=None)
+_current_summary: ContextVar[UsageSummary | None] = ContextVar(
+    'graphiti_llm_usage_summary', default=None
+)
+
+
+@contextmanager
+def usage_stage(stage: str) -> Iterator[None]:
+    """Tag every LLM call made inside the block, including in child tasks, with a stage name."""
+    token = _current_stage.set(stage)
+    try:
+        yield
+    finally:
+        _current_stage.reset(token)
+
+
+@contextmanager
+def track_usage() -> Iterator[UsageSummary]:
+    """Collect the usage of every LLM call made inside the block, including in child tasks."""
+    summary = UsageSummary()
+    token = _current_summary.set(summary)
+    try:
+        yield summary
+    finally:
+        _current_summary.reset(token)
+
+
+@contextmanager
+def track_llm_call(model: str | None) -> Iterator[LLMCallUsage]:
+    """
+    Measure one generate_response call. Provider attempts made inside the block are counted by
+    record_attempt when they start and report their tokens through record_attempt_usage.
+    """
+    call = LLMCallUsage(stage=_current_stage.get(), model=model)
+    with start_span(
+        'graphiti.llm.generate', {'graphiti.stage': call.stage, 'gen_ai.request.model': model}
+    ) as span:
+        token = _current_call.set(call)
+        start = perf_counter()
+        try:
+            yield call
+        except BaseException as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            call.latency_ms = (perf_counter() - start) * 1000
+            _current_call.reset(token)
+            span.set_attributes(
+                {
+                    'gen_ai.response.model': call.model or '',
+                    'gen_ai.usage.input_tokens': call.input_tokens,
+                    'gen_ai.usage.output_tokens': call.output_tokens,
+                    'graphiti.llm.cached_input_tokens': call.cached_input_tokens,
+                    'graphiti.llm.retries': call.retries,
+                    'graphiti.llm.failed': call.failed,
+                }
+            )
+            # calls answered from the local response cache never reached the provider
+            if call.attempts > 0:
+                _finish_call(call)
+
+
+def record_attempt():
+    """Count a provider attempt of the current call, whether or not it ends up reporting usage."""
+    call = _current_call.get()
+    if call is not None:
+        call.attempts += 1
+
+
+def record_attempt_usage(model: str | None, usage: TokenUsage):
+    call = _current_call.get()
+    if call is None:
+        return
+
+    call.add(usage)
+    if model is not None:
+        call.model = model
+
+
+def _finish_call(call: LLMCallUsage):
+    outcome = f'failed with {call.error}' if call.failed else 'succeeded'
+    logger.debug(
+        f'LLM call [{call.stage}] to {call.model} {outcome}: {call.input_tokens} input tokens '
+        f'({call.cached_input_tokens} cached), {call.output_tokens} output tokens, '
+        f'{call.retries} retries in {call.latency_ms:.0f} ms'
+    )
+
+    summary = _current_summary.get()
+    if summary is not None:
+        summary.calls.append(call)
+
+    record_llm_call_metrics(call)
@@ -102,6 +102,41 @@ ENTITY_EDGE_RETURN = """
 """
 
 
+def get_entity_edge_attributes_query(provider: GraphProvider, alias: str = 'e') -> str:
+    """The edge's property map without the fact embedding, which is dropped in the database."""
+    if provider == GraphProvider.FALKORDB:
+        # the embedding is dropped from the attributes when the record is hydrated instead
+        return f'properties({alias})'
+    return f'{alias} {{.*, fact_embedding: NULL}}'
+
+
+def get_entity_edge_return_query(
+    provider: GraphProvider, include_embeddings: bool = False, include_attributes: bool = True
+) -> str:
+    """
+    RETURN columns for an entity edge e between the nodes n and m.
+
+    Embeddings are large and most readers never look at them, so they are only returned when
+    include_embeddings is set. Without include_attributes the custom attributes are skipped too.
+    """
+    attributes = get_entity_edge_attributes_query(provider) if include_attributes else '{}'
+    embedding = ',\n    e.fact_embedding AS fact_embedding' if include_embeddings else ''
+    return f"""
+    e.uuid AS uuid,
+    n.uuid AS source_node_uuid,
+    m.uuid AS target_node_uuid,
+    e.group_id AS group_id,
+    e.name AS name,
+    e.fact AS fact,
+    e.episodes AS episodes,
+    e.created_at AS created_at,
+    e.expired_at AS expired_at,
+    e.valid_at AS valid_at,
+    e.invalid_at AS invalid_at,
+    {attributes} AS attributes{embedding}
+"""
+
+
 def get_community_edge_save_query(provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         return """
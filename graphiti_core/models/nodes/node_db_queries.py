@@ -107,6 +107,36 @@ ENTITY_NODE_RETURN = """
 """
 
 
+def get_entity_node_attributes_query(provider: GraphProvider, alias: str = 'n') -> str:
+    """The node's property map without the name embedding, which is dropped in the database."""
+    if provider == GraphProvider.FALKORDB:
+        # the embedding is dropped from the attributes when the record is hydrated instead
+        return f'properties({alias})'
+    return f'{alias} {{.*, name_embedding: NULL}}'
+
+
+def get_entity_node_return_query(
+    provider: GraphProvider, include_embeddings: bool = False, include_attributes: bool = True
+) -> str:
+    """
+    RETURN columns for an entity node n.
+
+    Embeddings are large and most readers never look at them, so they are only returned when
+    include_embeddings is set. Without include_attributes the custom attributes are skipped too.
+    """
+    attributes = get_entity_node_attributes_query(provider) if include_attributes else '{}'
+    embedding = ',\n    n.name_embedding AS name_embedding' if include_embeddings else ''
+    return f"""
+    n.uuid AS uuid,
+    n.name AS name,
+    n.group_id AS group_id,
+    n.created_at AS created_at,
+    n.summary AS summary,
+    labels(n) AS labels,
+    {attributes} AS attributes{embedding}
+"""
+
+
 def get_community_node_save_query(provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         return """
@@ -131,3 +161,15 @@ COMMUNITY_NODE_RETURN = """
     n.summary AS summary,
     n.created_at AS created_at
 """
+
+
+def get_community_node_return_query(include_embeddings: bool = False) -> str:
+    """RETURN columns for a community node n, with its name embedding if include_embeddings."""
+    embedding = '\n    n.name_embedding AS name_embedding,' if include_embeddings else ''
+    return f"""
+    n.uuid AS uuid,
+    n.name AS name,{embedding}
+    n.group_id AS group_id,
+    n.summary AS summary,
+    n.created_at AS created_at
+"""
@@ -16,6 +16,7 @@ limitations under the License.
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from enum import Enum
 from time import time
@@ -25,23 +26,36 @@ from uuid import uuid4
 from pydantic import BaseModel, Field
 from typing_extensions import LiteralString
 
-from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.driver.driver import GraphDriver, driver_operation
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.errors import NodeNotFoundError
-from graphiti_core.helpers import parse_db_date
+from graphiti_core.helpers import (
+    DEFAULT_DELETE_BATCH_SIZE,
+    DEFAULT_SCAN_BATCH_SIZE,
+    construct_trusted,
+    parse_db_date,
+    scan_pages,
+)
 from graphiti_core.models.nodes.node_db_queries import (
     COMMUNITY_NODE_RETURN,
-    ENTITY_NODE_RETURN,
     EPISODIC_NODE_RETURN,
     EPISODIC_NODE_SAVE,
     get_community_node_save_query,
+    get_entity_node_return_query,
     get_entity_node_save_query,
 )
+from graphiti_core.telemetry.tracing import traced
 from graphiti_core.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
 
 
+# stored node properties that are model fields rather than custom attributes
+ENTITY_NODE_RESERVED_KEYS = frozenset(
+    {'uuid', 'name', 'group_id', 'name_embedding', 'summary', 'created_at'}
+)
+
+
 class EpisodeType(Enum):
     """
     Enumeration of different types of episodes that can be processed.
@@ -88,24 +102,15 @@ class Node(BaseModel, ABC):
     @abstractmethod
     async def save(self, driver: GraphDriver): ...
 
+    @driver_operation('delete_node')
     async def delete(self, driver: GraphDriver):
-        if driver.provider == GraphProvider.FALKORDB:
-            for label in ['Entity', 'Episodic', 'Community']:
-                await driver.execute_query(
-                    f"""
-                    MATCH (n:{label} {{uuid: $uuid}})
-                    DETACH DELETE n
-                    """,
-                    uuid=self.uuid,
-                )
-        else:
-            await driver.execute_query(
-                """
-                MATCH (n:Entity|Episodic|Community {uuid: $uuid})
-                DETACH DELETE n
-                """,
-                uuid=self.uuid,
-            )
+        await driver.execute_query(
+            """
+            MATCH (n:Entity|Episodic|Community {uuid: $uuid})
+            DETACH DELETE n
+            """,
+            uuid=self.uuid,
+        )
 
         logger.debug(f'Deleted Node: {self.uuid}')
 
@@ -118,25 +123,47 @@ class Node(BaseModel, ABC):
         return False
 
     @classmethod
-    async def delete_by_group_id(cls, driver: GraphDriver, group_id: str):
-        if driver.provider == GraphProvider.FALKORDB:
-            for label in ['Entity', 'Episodic', 'Community']:
-                await driver.execute_query(
-                    f"""
-                    MATCH (n:{label} {{group_id: $group_id}})
-                    DETACH DELETE n
-                    """,
-                    group_id=group_id,
-                )
-        else:
-            await driver.execute_query(
-                """
-                MATCH (n:Entity|Episodic|Community {group_id: $group_id})
-                DETACH DELETE n
-                """,
-                group_id=group_id,
+    @driver_operation('delete_nodes_by_group_id')
+    async def delete_by_group_id(
+        cls,
+        driver: GraphDriver,
+        group_id: str,
+        batch_size: int = DEFAULT_DELETE_BATCH_SIZE,
+    ) -> int:
+        deleted = await delete_nodes_in_batches(
+            driver,
+            ['Entity', 'Episodic', 'Community'],
+            'n.group_id = $group_id',
+            batch_size,
+            group_id=group_id,
+        )
+
+        logger.debug(f'Deleted {deleted} nodes for group: {group_id}')
+
+        return deleted
+
+    @classmethod
+    @driver_operation('delete_nodes_by_uuids')
+    async def delete_by_uuids(
+        cls,
+        driver: GraphDriver,
+        uuids: list[str],
+        batch_size: int = DEFAULT_DELETE_BATCH_SIZE,
+    ) -> int:
+        deleted = 0
+        for i in range(0, len(uuids), batch_size):
+            deleted += await delete_nodes_in_batches(
+                driver,
+                ['Entity', 'Episodic', 'Community'],
+                'n.uuid IN $uuids',
+                batch_size,
+                uuids=uuids[i : i + batch_size],
             )
 
+        logger.debug(f'Deleted {deleted} nodes by uuid')
+
+        return deleted
+
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str): ...
 
@@ -156,6 +183,7 @@ class EpisodicNode(Node):
         default_factory=list,
     )
 
+    @driver_operation('save_episodic_node')
     async def save(self, driver: GraphDriver):
         result = await driver.execute_query(
             EPISODIC_NODE_SAVE,
@@ -175,6 +203,7 @@ class EpisodicNode(Node):
         return result
 
     @classmethod
+    @driver_operation('get_episodic_node_by_uuid')
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
         records, _, _ = await driver.execute_query(
             """
@@ -194,6 +223,7 @@ class EpisodicNode(Node):
         return episodes[0]
 
     @classmethod
+    @driver_operation('get_episodic_nodes_by_uuids')
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
         records, _, _ = await driver.execute_query(
             """
@@ -211,6 +241,7 @@ class EpisodicNode(Node):
         return episodes
 
     @classmethod
+    @driver_operation('get_episodic_nodes_by_group_ids')
     async def get_by_group_ids(
         cls,
         driver: GraphDriver,
@@ -246,6 +277,20 @@ class EpisodicNode(Node):
         return episodes
 
     @classmethod
+    def scan(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+    ) -> AsyncIterator[list['EpisodicNode']]:
+        """Yields the episodes of the groups in batches, paged by uuid."""
+        return scan_pages(
+            lambda uuid_cursor: cls.get_by_group_ids(driver, group_ids, batch_size, uuid_cursor),
+            batch_size,
+        )
+
+    @classmethod
+    @driver_operation('get_episodic_nodes_by_entity_node_uuid')
     async def get_by_entity_node_uuid(cls, driver: GraphDriver, entity_node_uuid: str):
         records, _, _ = await driver.execute_query(
             """
@@ -278,6 +323,7 @@ class EntityNode(Node):
 
         return self.name_embedding
 
+    @driver_operation('load_entity_node_embedding')
     async def load_name_embedding(self, driver: GraphDriver):
         records, _, _ = await driver.execute_query(
             """
@@ -293,6 +339,7 @@ class EntityNode(Node):
 
         self.name_embedding = records[0]['name_embedding']
 
+    @driver_operation('save_entity_node')
     async def save(self, driver: GraphDriver):
         entity_data: dict[str, Any] = {
             'uuid': self.uuid,
@@ -316,13 +363,14 @@ class EntityNode(Node):
         return result
 
     @classmethod
+    @driver_operation('get_entity_node_by_uuid')
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
         records, _, _ = await driver.execute_query(
             """
             MATCH (n:Entity {uuid: $uuid})
             RETURN
             """
-            + ENTITY_NODE_RETURN,
+            + get_entity_node_return_query(driver.provider),
             uuid=uuid,
             routing_='r',
         )
@@ -335,6 +383,7 @@ class EntityNode(Node):
         return nodes[0]
 
     @classmethod
+    @driver_operation('get_entity_nodes_by_uuids')
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
         records, _, _ = await driver.execute_query(
             """
@@ -342,7 +391,7 @@ class EntityNode(Node):
             WHERE n.uuid IN $uuids
             RETURN
             """
-            + ENTITY_NODE_RETURN,
+            + get_entity_node_return_query(driver.provider),
             uuids=uuids,
             routing_='r',
         )
@@ -352,6 +401,7 @@ class EntityNode(Node):
         return nodes
 
     @classmethod
+    @driver_operation('get_entity_nodes_by_group_ids')
     async def get_by_group_ids(
         cls,
         driver: GraphDriver,
@@ -362,14 +412,6 @@ class EntityNode(Node):
     ):
         cursor_query: LiteralString = 'AND n.uuid < $uuid' if uuid_cursor else ''
         limit_query: LiteralString = 'LIMIT $limit' if limit is not None else ''
-        with_embeddings_query: LiteralString = (
-            """,
-            n.name_embedding AS name_embedding
-            """
-            if with_embeddings
-            else ''
-        )
-
         records, _, _ = await driver.execute_query(
             """
             MATCH (n:Entity)
@@ -379,8 +421,7 @@ class EntityNode(Node):
             + """
             RETURN
             """
-            + ENTITY_NODE_RETURN
-            + with_embeddings_query
+            + get_entity_node_return_query(driver.provider, include_embeddings=with_embeddings)
             + """
             ORDER BY n.uuid DESC
             """
@@ -395,11 +436,28 @@ class EntityNode(Node):
 
         return nodes
 
+    @classmethod
+    def scan(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+        with_embeddings: bool = False,
+    ) -> AsyncIterator[list['EntityNode']]:
+        """Yields the entity nodes of the groups in batches, paged by uuid."""
+        return scan_pages(
+            lambda uuid_cursor: cls.get_by_group_ids(
+                driver, group_ids, batch_size, uuid_cursor, with_embeddings
+            ),
+            batch_size,
+        )
+
 
 class CommunityNode(Node):
     name_embedding: list[float] | None = Field(default=None, description='embedding of the name')
     summary: str = Field(description='region summary of member nodes', default_factory=str)
 
+    @driver_operation('save_community_node')
     async def save(self, driver: GraphDriver):
         result = await driver.execute_query(
             get_community_node_save_query(driver.provider),
@@ -424,6 +482,7 @@ class CommunityNode(Node):
 
         return self.name_embedding
 
+    @driver_operation('load_community_node_embedding')
     async def load_name_embedding(self, driver: GraphDriver):
         records, _, _ = await driver.execute_query(
             """
@@ -440,6 +499,7 @@ class CommunityNode(Node):
         self.name_embedding = records[0]['name_embedding']
 
     @classmethod
+    @driver_operation('get_community_node_by_uuid')
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
         records, _, _ = await driver.execute_query(
             """
@@ -459,6 +519,7 @@ class CommunityNode(Node):
         return nodes[0]
 
     @classmethod
+    @driver_operation('get_community_nodes_by_uuids')
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
         records, _, _ = await driver.execute_query(
             """
@@ -476,6 +537,7 @@ class CommunityNode(Node):
         return communities
 
     @classmethod
+    @driver_operation('get_community_nodes_by_group_ids')
     async def get_by_group_ids(
         cls,
         driver: GraphDriver,
@@ -510,8 +572,60 @@ class CommunityNode(Node):
 
         return communities
 
+    @classmethod
+    def scan(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+    ) -> AsyncIterator[list['CommunityNode']]:
+        """Yields the communities of the groups in batches, paged by uuid."""
+        return scan_pages(
+            lambda uuid_cursor: cls.get_by_group_ids(driver, group_ids, batch_size, uuid_cursor),
+            batch_size,
+        )
+
 
 # Node helpers
+async def delete_nodes_in_batches(
+    driver: GraphDriver,
+    labels: list[str],
+    condition: str,
+    batch_size: int = DEFAULT_DELETE_BATCH_SIZE,
+    **params: Any,
+) -> int:
+    """
+    DETACH DELETE every node carrying one of `labels` that matches `condition` (a Cypher
+    predicate over `n`), `batch_size` nodes per transaction so that large deletes don't have
+    to fit in a single transaction, logging progress after every batch. Returns the number of
+    deleted nodes.
+    """
+    deleted = 0
+    for label in labels:
+        # a LIMIT-ed delete per query rather than CALL {} IN TRANSACTIONS, which only reports
+        # back once every batch of the label is done
+        while True:
+            records, _, _ = await driver.execute_query(
+                f"""
+                MATCH (n:{label})
+                WHERE {condition}
+                WITH n LIMIT $batch_size
+                DETACH DELETE n
+                RETURN count(*) AS deleted
+                """,
+                batch_size=batch_size,
+                **params,
+            )
+            batch_deleted = records[0]['deleted'] if records else 0
+            deleted += batch_deleted
+            if batch_deleted > 0:
+                logger.info(f'Deleted {deleted} nodes so far')
+            if batch_deleted < batch_size:
+                break
+
+    return deleted
+
+
 def get_episodic_node_from_record(record: Any) -> EpisodicNode:
     created_at = parse_db_date(record['created_at'])
     valid_at = parse_db_date(record['valid_at'])
@@ -535,38 +649,38 @@ def get_episodic_node_from_record(record: Any) -> EpisodicNode:
 
 
 def get_entity_node_from_record(record: Any) -> EntityNode:
-    entity_node = EntityNode(
-        uuid=record['uuid'],
-        name=record['name'],
-        name_embedding=record.get('name_embedding'),
-        group_id=record['group_id'],
-        labels=record['labels'],
-        created_at=parse_db_date(record['created_at']),  # type: ignore
-        summary=record['summary'],
-        attributes=record['attributes'],
+    # see get_entity_edge_from_record, rows from our own queries skip validation
+    return construct_trusted(
+        EntityNode,
+        {
+            'uuid': record['uuid'],
+            'name': record['name'],
+            'group_id': record['group_id'],
+            'labels': record['labels'],
+            'created_at': parse_db_date(record['created_at']),
+            'name_embedding': record.get('name_embedding'),
+            'summary': record['summary'] or '',
+            'attributes': {
+                key: value
+                for key, value in (record['attributes'] or {}).items()
+                if key not in ENTITY_NODE_RESERVED_KEYS
+            },
+        },
     )
 
-    entity_node.attributes.pop('uuid', None)
-    entity_node.attributes.pop('name', None)
-    entity_node.attributes.pop('group_id', None)
-    entity_node.attributes.pop('name_embedding', None)
-    entity_node.attributes.pop('summary', None)
-    entity_node.attributes.pop('created_at', None)
-
-    return entity_node
-
 
 def get_community_node_from_record(record: Any) -> CommunityNode:
     return CommunityNode(
         uuid=record['uuid'],
         name=record['name'],
         group_id=record['group_id'],
-        name_embedding=record['name_embedding'],
+        name_embedding=record.get('name_embedding'),
         created_at=parse_db_date(record['created_at']),  # type: ignore
         summary=record['summary'],
     )
 
 
+@traced('graphiti.embed.entity_nodes')
 async def create_entity_node_embeddings(embedder: EmbedderClient, nodes: list[EntityNode]):
     if not nodes:  # Handle empty list case
         return
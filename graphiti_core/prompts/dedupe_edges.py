@@ -116,42 +116,41 @@ def resolve_edge(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
             role='system',
-            content='你是一个有用的助手，从事实列表中去重事实并确定新事实与哪些现有事实矛盾。',
-        ),
-        Message(
-            role='user',
-            content=f"""
-        <新事实>
-        {context['new_edge']}
-        </新事实>
-        
-        <现有事实>
-        {context['existing_edges']}
-        </现有事实>
-        <事实无效化候选>
-        {context['edge_invalidation_candidates']}
-        </事实无效化候选>
-        
-        <事实类型>
-        {context['edge_types']}
-        </事实类型>
-        
+            content="""你是一个有用的助手，从事实列表中去重事实并确定新事实与哪些现有事实矛盾。
 
         任务：
         如果新事实代表现有事实中一个或多个的相同事实信息，返回重复事实的idx。
         包含关键差异的相似信息的事实不应该被标记为重复。
         如果新事实不是任何现有事实的重复，返回空列表。
-        
+
         给定预定义的事实类型，确定新事实是否应该被分类为这些类型之一。
         返回事实类型作为fact_type，如果新事实不是事实类型之一，则返回DEFAULT。
-        
+
         基于提供的事实无效化候选和新事实，确定新事实与哪些现有事实矛盾。
         返回包含新事实矛盾的所有事实idx的列表。
         如果没有矛盾的事实，返回空列表。
 
         指导原则：
         1. 一些事实可能非常相似，但会有关键差异，特别是围绕事实中的数值。
-            不要将这些事实标记为重复。
+            不要将这些事实标记为重复。""",
+        ),
+        Message(
+            role='user',
+            content=f"""
+        <事实类型>
+        {context['edge_types']}
+        </事实类型>
+
+        <新事实>
+        {context['new_edge']}
+        </新事实>
+
+        <现有事实>
+        {context['existing_edges']}
+        </现有事实>
+        <事实无效化候选>
+        {context['edge_invalidation_candidates']}
+        </事实无效化候选>
         """,
         ),
     ]
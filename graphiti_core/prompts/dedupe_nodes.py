@@ -105,45 +105,26 @@ def nodes(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
             role='system',
-            content='你是一个有用的助手，确定从对话中提取的实体是否是现有实体的重复。',
-        ),
-        Message(
-            role='user',
-            content=f"""
-        <历史消息>
-        {json.dumps([ep for ep in context['previous_episodes']], indent=2)}
-        </历史消息>
-        <当前消息>
-        {context['episode_content']}
-        </当前消息>
-        
-        
-        以下每个实体都是从当前消息中提取的。
+            content="""你是一个有用的助手，确定从对话中提取的实体是否是现有实体的重复。
+
+        用户会提供从当前消息中提取的实体以及现有实体。
         实体中的每个实体都表示为具有以下结构的JSON对象：
-        {{
+        {
             id: 实体的整数ID,
             name: "实体名称",
             entity_type: "实体的本体分类",
             entity_type_description: "实体类型代表什么的描述",
             duplication_candidates: [
-                {{
+                {
                     idx: 候选实体的整数索引,
                     name: "候选实体名称",
                     entity_type: "候选实体的本体分类",
                     ...<附加属性>
-                }}
+                }
             ]
-        }}
-        
-        <实体>
-        {json.dumps(context['extracted_nodes'], indent=2)}
-        </实体>
-        
-        <现有实体>
-        {json.dumps(context['existing_nodes'], indent=2)}
-        </现有实体>
+        }
 
-        对于上述每个实体，确定该实体是否是任何现有实体的重复。
+        对于每个实体，确定该实体是否是任何现有实体的重复。
 
         只有当实体指向*相同的现实世界对象或概念*时，才应该被认为是重复的。
 
@@ -153,11 +134,29 @@ def nodes(context: dict[str, Any]) -> list[Message]:
 
         任务：
         你的响应将是一个名为entity_resolutions的列表，其中包含每个实体的一个条目。
-        
+
         对于每个实体，返回实体的ID作为id，实体的名称作为name，duplicate_idx作为整数，以及duplicates作为列表。
-        
+
         - 如果一个实体是现有实体之一的重复，返回它重复的候选的idx。
-        - 如果一个实体不是现有实体之一的重复，返回-1作为duplication_idx
+        - 如果一个实体不是现有实体之一的重复，返回-1作为duplication_idx""",
+        ),
+        Message(
+            role='user',
+            content=f"""
+        <历史消息>
+        {json.dumps([ep for ep in context['previous_episodes']], indent=2)}
+        </历史消息>
+        <当前消息>
+        {context['episode_content']}
+        </当前消息>
+
+        <实体>
+        {json.dumps(context['extracted_nodes'], indent=2)}
+        </实体>
+
+        <现有实体>
+        {json.dumps(context['existing_nodes'], indent=2)}
+        </现有实体>
         """,
         ),
     ]
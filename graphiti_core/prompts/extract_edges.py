@@ -64,33 +64,11 @@ def edge(context: dict[str, Any]) -> list[Message]:
             content='你是一个从文本中提取事实三元组的专业事实提取器。'
             '1. 提取的事实三元组还应该提取相关的日期信息。'
             '2. 将当前时间视为当前消息发送的时间。所有时间信息都应该相对于这个时间提取。'
-            '重要：你必须直接返回纯JSON格式，不要使用任何markdown代码块格式（如```json），不要添加任何额外的文本。',
-        ),
-        Message(
-            role='user',
-            content=f"""
-<事实类型>
-{context['edge_types']}
-</事实类型>
-
-<历史消息>
-{json.dumps([ep for ep in context['previous_episodes']], indent=2)}
-</历史消息>
-
-<当前消息>
-{context['episode_content']}
-</当前消息>
-
-<实体>
-{context['nodes']} 
-</实体>
-
-<参考时间>
-{context['reference_time']}  # ISO 8601 (UTC); 用于解析相对时间提及
-</参考时间>
+            '重要：你必须直接返回纯JSON格式，不要使用任何markdown代码块格式（如```json），不要添加任何额外的文本。'
+            """
 
 # 任务
-基于当前消息提取给定实体之间的所有事实关系。
+基于用户提供的当前消息提取给定实体之间的所有事实关系。
 只提取满足以下条件的事实：
 - 涉及实体列表中的两个不同实体，
 - 在当前消息中明确陈述或无歧义暗示，
@@ -101,9 +79,6 @@ def edge(context: dict[str, Any]) -> list[Message]:
 
 你可以使用历史消息中的信息仅用于消歧引用或支持连续性。
 
-
-{context['custom_prompt']}
-
 # 提取规则
 
 1. 只输出主语和宾语都匹配实体中ID的事实。
@@ -121,7 +96,32 @@ def edge(context: dict[str, Any]) -> list[Message]:
 - 如果表达了变化/终止，将`invalid_at`设置为相关时间戳。
 - 如果没有明确或可解析的时间陈述，则将两个字段都留为`null`。
 - 如果只提到日期（没有时间），假设为00:00:00。
-- 如果只提到年份，使用1月1日00:00:00。
+- 如果只提到年份，使用1月1日00:00:00。""",
+        ),
+        Message(
+            role='user',
+            content=f"""
+<事实类型>
+{context['edge_types']}
+</事实类型>
+
+<历史消息>
+{json.dumps([ep for ep in context['previous_episodes']], indent=2)}
+</历史消息>
+
+<当前消息>
+{context['episode_content']}
+</当前消息>
+
+<实体>
+{context['nodes']} 
+</实体>
+
+<参考时间>
+{context['reference_time']}  # ISO 8601 (UTC); 用于解析相对时间提及
+</参考时间>
+
+{context['custom_prompt']}
         """,
         ),
     ]
@@ -72,25 +72,10 @@ class Versions(TypedDict):
 def extract_message(context: dict[str, Any]) -> list[Message]:
     sys_prompt = """你是一个从对话消息中提取实体节点的AI助手。
     你的主要任务是提取和分类说话者以及对话中提到的其他重要实体。
-    
-    重要：你必须直接返回纯JSON格式，不要使用任何markdown代码块格式（如```json），不要添加任何额外的文本。"""
-
-    user_prompt = f"""
-<实体类型>
-{context['entity_types']}
-</实体类型>
-
-<历史消息>
-{json.dumps([ep for ep in context['previous_episodes']], indent=2)}
-</历史消息>
-
-<当前消息>
-{context['episode_content']}
-</当前消息>
 
 指令:
 
-给定对话上下文和当前消息，你的任务是提取当前消息中**显式或隐式**提及的**实体节点**。
+给定用户提供的对话上下文和当前消息，你的任务是提取当前消息中**显式或隐式**提及的**实体节点**。
 代词引用如他/她/他们或这/那/那些应该被消歧到引用实体的名称。
 
 1. **说话者提取**: 始终提取说话者（每个对话行中冒号 `:` 前面的部分）作为第一个实体节点。
@@ -111,6 +96,21 @@ def extract_message(context: dict[str, Any]) -> list[Message]:
 5. **格式化**:
    - 在命名实体时要**明确且无歧义**（例如，在可用时使用全名）。
 
+    重要：你必须直接返回纯JSON格式，不要使用任何markdown代码块格式（如```json），不要添加任何额外的文本。"""
+
+    user_prompt = f"""
+<实体类型>
+{context['entity_types']}
+</实体类型>
+
+<历史消息>
+{json.dumps([ep for ep in context['previous_episodes']], indent=2)}
+</历史消息>
+
+<当前消息>
+{context['episode_content']}
+</当前消息>
+
 {context['custom_prompt']}
 """
     return [
@@ -122,7 +122,15 @@ def extract_message(context: dict[str, Any]) -> list[Message]:
 def extract_json(context: dict[str, Any]) -> list[Message]:
     sys_prompt = """你是一个从JSON中提取实体节点的AI助手。
     你的主要任务是从JSON文件中提取和分类相关实体。
-    
+
+给定用户提供的源描述和JSON，从提供的JSON中提取相关实体。
+对于每个提取的实体，还要根据提供的实体类型及其描述确定其实体类型。
+通过提供其entity_type_id来指示分类的实体类型。
+
+指导原则：
+1. 始终尝试提取JSON代表的实体。这通常是像"name"或"user"字段这样的内容
+2. 不要提取任何包含日期的属性
+
     重要：你必须直接返回纯JSON格式，不要使用任何markdown代码块格式（如```json），不要添加任何额外的文本。"""
 
     user_prompt = f"""
@@ -138,14 +146,6 @@ def extract_json(context: dict[str, Any]) -> list[Message]:
 </JSON>
 
 {context['custom_prompt']}
-
-给定上述源描述和JSON，从提供的JSON中提取相关实体。
-对于每个提取的实体，还要根据提供的实体类型及其描述确定其实体类型。
-通过提供其entity_type_id来指示分类的实体类型。
-
-指导原则：
-1. 始终尝试提取JSON代表的实体。这通常是像"name"或"user"字段这样的内容
-2. 不要提取任何包含日期的属性
 """
     return [
         Message(role='system', content=sys_prompt),
@@ -156,7 +156,17 @@ def extract_json(context: dict[str, Any]) -> list[Message]:
 def extract_text(context: dict[str, Any]) -> list[Message]:
     sys_prompt = """你是一个从文本中提取实体节点的AI助手。
     你的主要任务是提取和分类说话者以及提供文本中提到的其他重要实体。
-    
+
+给定用户提供的文本，从文本中提取显式或隐式提及的实体。
+对于每个提取的实体，还要根据提供的实体类型及其描述确定其实体类型。
+通过提供其entity_type_id来指示分类的实体类型。
+
+指导原则：
+1. 提取对话中提到的重要实体、概念或参与者。
+2. 避免为关系或行为创建节点。
+3. 避免为时间信息（如日期、时间或年份）创建节点（这些将稍后添加到边中）。
+4. 在节点名称中尽可能明确，使用全名并避免缩写。
+
     重要：你必须直接返回纯JSON格式，不要使用任何markdown代码块格式（如```json），不要添加任何额外的文本。"""
 
     user_prompt = f"""
@@ -168,17 +178,7 @@ def extract_text(context: dict[str, Any]) -> list[Message]:
 {context['episode_content']}
 </文本>
 
-给定上述文本，从文本中提取显式或隐式提及的实体。
-对于每个提取的实体，还要根据提供的实体类型及其描述确定其实体类型。
-通过提供其entity_type_id来指示分类的实体类型。
-
 {context['custom_prompt']}
-
-指导原则：
-1. 提取对话中提到的重要实体、概念或参与者。
-2. 避免为关系或行为创建节点。
-3. 避免为时间信息（如日期、时间或年份）创建节点（这些将稍后添加到边中）。
-4. 在节点名称中尽可能明确，使用全名并避免缩写。
 """
     return [
         Message(role='system', content=sys_prompt),
@@ -245,26 +245,27 @@ def extract_attributes(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
             role='system',
-            content='你是一个有用的助手，负责从提供的文本中提取实体属性。请不要转义unicode字符。\n\n提取的任何信息都应该以与写入时相同的语言返回。',
+            content="""你是一个有用的助手，负责从提供的文本中提取实体属性。请不要转义unicode字符。
+
+提取的任何信息都应该以与写入时相同的语言返回。
+
+根据用户提供的消息和实体，基于消息中提供的信息更新实体的任何属性。
+使用提供的属性描述来更好地理解每个属性应该如何确定。
+
+指导原则：
+1. 如果在当前上下文中找不到实体属性值，不要编造实体属性值。
+2. 仅使用提供的消息和实体来设置属性值。
+3. summary（摘要）属性代表实体的摘要，应该根据消息中关于该实体的新信息进行更新。
+   摘要不得超过250个字。""",
         ),
         Message(
             role='user',
             content=f"""
-
         <消息>
         {json.dumps(context['previous_episodes'], indent=2)}
         {json.dumps(context['episode_content'], indent=2)}
         </消息>
 
-        根据上述消息和以下实体，基于消息中提供的信息更新实体的任何属性。
-        使用提供的属性描述来更好地理解每个属性应该如何确定。
-
-        指导原则：
-        1. 如果在当前上下文中找不到实体属性值，不要编造实体属性值。
-        2. 仅使用提供的消息和实体来设置属性值。
-        3. summary（摘要）属性代表实体的摘要，应该根据消息中关于该实体的新信息进行更新。
-           摘要不得超过250个字。
-        
         <实体>
         {context['node']}
         </实体>
@@ -33,16 +33,22 @@ class SummaryDescription(BaseModel):
     description: str = Field(..., description='提供摘要的单句描述')
 
 
+class EpisodeSummary(BaseModel):
+    summary: str = Field(..., description='保留消息中所有实体、事实和时间信息的简洁摘要')
+
+
 class Prompt(Protocol):
     summarize_pair: PromptVersion
     summarize_context: PromptVersion
     summary_description: PromptVersion
+    summarize_episode: PromptVersion
 
 
 class Versions(TypedDict):
     summarize_pair: PromptFunction
     summarize_context: PromptFunction
     summary_description: PromptFunction
+    summarize_episode: PromptFunction
 
 
 def summarize_pair(context: dict[str, Any]) -> list[Message]:
@@ -125,8 +131,32 @@ def summary_description(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def summarize_episode(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='你是一个有用的助手，将消息压缩为简洁的摘要。',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        将以下消息压缩为简洁的摘要，作为后续消息的上下文使用。
+        保留提到的所有实体名称、它们之间的关系以及任何日期或时间信息。
+        不要添加消息中没有的信息。
+
+        摘要必须少于{context['max_words']}字。
+
+        <消息>
+        {context['episode_content']}
+        </消息>
+        """,
+        ),
+    ]
+
+
 versions: Versions = {
     'summarize_pair': summarize_pair,
     'summarize_context': summarize_context,
     'summary_description': summary_description,
+    'summarize_episode': summarize_episode,
 }
\ No newline at end of file
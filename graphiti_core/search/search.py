@@ -14,9 +14,14 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
 from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
 from time import time
+from typing import Any, Literal
+
+from pydantic import BaseModel
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
@@ -38,17 +43,21 @@ from graphiti_core.search.search_config import (
     NodeSearchConfig,
     NodeSearchMethod,
     SearchConfig,
+    SearchLayer,
     SearchResults,
+    SearchUpdate,
 )
 from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.search.search_utils import (
     community_fulltext_search,
     community_similarity_search,
+    cross_encoder_rerank,
     edge_bfs_search,
     edge_fulltext_search,
     edge_similarity_search,
     episode_fulltext_search,
     episode_mentions_reranker,
+    first_stage_rank,
     get_embeddings_for_communities,
     get_embeddings_for_edges,
     get_embeddings_for_nodes,
@@ -59,10 +68,12 @@ from graphiti_core.search.search_utils import (
     node_similarity_search,
     rrf,
 )
+from graphiti_core.telemetry.tracing import set_span_attributes, start_span, traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced('graphiti.search')
 async def search(
     clients: GraphitiClients,
     query: str,
@@ -75,17 +86,13 @@ async def search(
 ) -> SearchResults:
     start = time()
 
-    driver = clients.driver
     embedder = clients.embedder
-    cross_encoder = clients.cross_encoder
 
     if query.strip() == '':
         return SearchResults()
-    query_vector = (
-        query_vector
-        if query_vector is not None
-        else await embedder.create(input_data=[query.replace('\n', ' ')])
-    )
+    if query_vector is None:
+        with start_span('graphiti.embed.query'):
+            query_vector = await embedder.create(input_data=[query.replace('\n', ' ')])
 
     # if group_ids is empty, set it to None
     group_ids = group_ids if group_ids and group_ids != [''] else None
@@ -95,7 +102,70 @@ async def search(
         (episodes, episode_reranker_scores),
         (communities, community_reranker_scores),
     ) = await semaphore_gather(
-        edge_search(
+        *_layer_searches(
+            clients,
+            query,
+            query_vector,
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+        ).values()
+    )
+
+    results = SearchResults(
+        edges=edges,
+        edge_reranker_scores=edge_reranker_scores,
+        nodes=nodes,
+        node_reranker_scores=node_reranker_scores,
+        episodes=episodes,
+        episode_reranker_scores=episode_reranker_scores,
+        communities=communities,
+        community_reranker_scores=community_reranker_scores,
+    )
+
+    latency = (time() - start) * 1000
+
+    logger.debug(f'search returned context for query {query} in {latency} ms')
+    set_span_attributes(
+        **{
+            'graphiti.search.edges': len(edges),
+            'graphiti.search.nodes': len(nodes),
+            'graphiti.search.episodes': len(episodes),
+            'graphiti.search.communities': len(communities),
+        }
+    )
+
+    return results
+
+
+FirstStageListener = Callable[[list[Any], list[float]], None]
+
+_LAYER_SCORE_FIELDS: dict[SearchLayer, str] = {
+    'edges': 'edge_reranker_scores',
+    'nodes': 'node_reranker_scores',
+    'episodes': 'episode_reranker_scores',
+    'communities': 'community_reranker_scores',
+}
+
+
+def _layer_searches(
+    clients: GraphitiClients,
+    query: str,
+    query_vector: list[float],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None,
+    bfs_origin_node_uuids: list[str] | None,
+    listeners: dict[SearchLayer, FirstStageListener] | None = None,
+) -> dict[SearchLayer, Coroutine[Any, Any, tuple[list[Any], list[float]]]]:
+    listeners = listeners or {}
+    driver = clients.driver
+    cross_encoder = clients.cross_encoder
+    return {
+        'edges': edge_search(
             driver,
             cross_encoder,
             query,
@@ -107,8 +177,9 @@ async def search(
             bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            listeners.get('edges'),
         ),
-        node_search(
+        'nodes': node_search(
             driver,
             cross_encoder,
             query,
@@ -120,8 +191,9 @@ async def search(
             bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            listeners.get('nodes'),
         ),
-        episode_search(
+        'episodes': episode_search(
             driver,
             cross_encoder,
             query,
@@ -131,8 +203,9 @@ async def search(
             search_filter,
             config.limit,
             config.reranker_min_score,
+            listeners.get('episodes'),
         ),
-        community_search(
+        'communities': community_search(
             driver,
             cross_encoder,
             query,
@@ -141,27 +214,103 @@ async def search(
             config.community_config,
             config.limit,
             config.reranker_min_score,
+            listeners.get('communities'),
         ),
-    )
+    }
 
-    results = SearchResults(
-        edges=edges,
-        edge_reranker_scores=edge_reranker_scores,
-        nodes=nodes,
-        node_reranker_scores=node_reranker_scores,
-        episodes=episodes,
-        episode_reranker_scores=episode_reranker_scores,
-        communities=communities,
-        community_reranker_scores=community_reranker_scores,
+
+def _search_update(
+    layer: SearchLayer,
+    stage: Literal['first_stage', 'final'],
+    items: list[Any],
+    scores: list[float],
+) -> SearchUpdate:
+    return SearchUpdate(
+        layer=layer,
+        stage=stage,
+        results=SearchResults(**{layer: items, _LAYER_SCORE_FIELDS[layer]: scores}),
     )
 
-    latency = (time() - start) * 1000
 
-    logger.debug(f'search returned context for query {query} in {latency} ms')
+async def search_stream(
+    clients: GraphitiClients,
+    query: str,
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    query_vector: list[float] | None = None,
+) -> AsyncIterator[SearchUpdate]:
+    """
+    Run the same search as search(), yielding each layer's results as soon as they are ready
+    instead of waiting for all of them. Layers reranked by a cross-encoder first yield their
+    first-stage order, then the reranked results. Layers without a config yield nothing.
+    """
+    if query.strip() == '':
+        return
+    if query_vector is None:
+        with start_span('graphiti.embed.query'):
+            query_vector = await clients.embedder.create(input_data=[query.replace('\n', ' ')])
 
-    return results
+    # each layer task puts its updates, then its error if it failed and None once it is done
+    updates: asyncio.Queue[SearchUpdate | Exception | None] = asyncio.Queue()
 
+    def listener(layer: SearchLayer) -> FirstStageListener:
+        return lambda items, scores: updates.put_nowait(
+            _search_update(layer, 'first_stage', items, scores)
+        )
 
+    async def run_layer(layer: SearchLayer, layer_search: Coroutine):
+        try:
+            items, scores = await layer_search
+            updates.put_nowait(_search_update(layer, 'final', items, scores))
+        except Exception as e:
+            updates.put_nowait(e)
+        finally:
+            updates.put_nowait(None)
+
+    layers: dict[SearchLayer, BaseModel | None] = {
+        'edges': config.edge_config,
+        'nodes': config.node_config,
+        'episodes': config.episode_config,
+        'communities': config.community_config,
+    }
+    group_ids = group_ids if group_ids and group_ids != [''] else None
+    layer_searches = _layer_searches(
+        clients,
+        query,
+        query_vector,
+        group_ids,
+        config,
+        search_filter,
+        center_node_uuid,
+        bfs_origin_node_uuids,
+        {layer: listener(layer) for layer in layers},
+    )
+    tasks = []
+    for layer, layer_search in layer_searches.items():
+        if layers[layer] is None:
+            layer_search.close()
+            continue
+        tasks.append(asyncio.create_task(run_layer(layer, layer_search)))
+
+    try:
+        remaining = len(tasks)
+        while remaining:
+            update = await updates.get()
+            if update is None:
+                remaining -= 1
+            elif isinstance(update, Exception):
+                raise update
+            else:
+                yield update
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@traced('graphiti.search.edges')
 async def edge_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -174,6 +323,7 @@ async def edge_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    on_first_stage: FirstStageListener | None = None,
 ) -> tuple[list[EntityEdge], list[float]]:
     if config is None:
         return [], []
@@ -235,12 +385,18 @@ async def edge_search(
             reranker_min_score,
         )
     elif config.reranker == EdgeReranker.cross_encoder:
-        fact_to_uuid_map = {edge.fact: edge.uuid for edge in list(edge_uuid_map.values())[:limit]}
-        reranked_facts = await cross_encoder.rank(query, list(fact_to_uuid_map.keys()))
-        reranked_uuids = [
-            fact_to_uuid_map[fact] for fact, score in reranked_facts if score >= reranker_min_score
-        ]
-        edge_scores = [score for _, score in reranked_facts if score >= reranker_min_score]
+        reranked_uuids, edge_scores = await _cross_encoder_rerank(
+            cross_encoder,
+            query,
+            query_vector,
+            [[edge.uuid for edge in result] for result in search_results],
+            {uuid: edge.fact for uuid, edge in edge_uuid_map.items()},
+            lambda: get_embeddings_for_edges(driver, list(edge_uuid_map.values())),
+            config,
+            limit,
+            reranker_min_score,
+            _map_first_stage(on_first_stage, edge_uuid_map, limit),
+        )
     elif config.reranker == EdgeReranker.node_distance:
         if center_node_uuid is None:
             raise SearchRerankerError('No center node provided for Node Distance reranker')
@@ -274,6 +430,7 @@ async def edge_search(
     return reranked_edges[:limit], edge_scores[:limit]
 
 
+@traced('graphiti.search.nodes')
 async def node_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -286,6 +443,7 @@ async def node_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    on_first_stage: FirstStageListener | None = None,
 ) -> tuple[list[EntityNode], list[float]]:
     if config is None:
         return [], []
@@ -340,15 +498,18 @@ async def node_search(
             reranker_min_score,
         )
     elif config.reranker == NodeReranker.cross_encoder:
-        name_to_uuid_map = {node.name: node.uuid for node in list(node_uuid_map.values())}
-
-        reranked_node_names = await cross_encoder.rank(query, list(name_to_uuid_map.keys()))
-        reranked_uuids = [
-            name_to_uuid_map[name]
-            for name, score in reranked_node_names
-            if score >= reranker_min_score
-        ]
-        node_scores = [score for _, score in reranked_node_names if score >= reranker_min_score]
+        reranked_uuids, node_scores = await _cross_encoder_rerank(
+            cross_encoder,
+            query,
+            query_vector,
+            search_result_uuids,
+            {uuid: node.name for uuid, node in node_uuid_map.items()},
+            lambda: get_embeddings_for_nodes(driver, list(node_uuid_map.values())),
+            config,
+            limit,
+            reranker_min_score,
+            _map_first_stage(on_first_stage, node_uuid_map, limit),
+        )
     elif config.reranker == NodeReranker.episode_mentions:
         reranked_uuids, node_scores = await episode_mentions_reranker(
             driver, search_result_uuids, min_score=reranker_min_score
@@ -368,6 +529,7 @@ async def node_search(
     return reranked_nodes[:limit], node_scores[:limit]
 
 
+@traced('graphiti.search.episodes')
 async def episode_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -378,6 +540,7 @@ async def episode_search(
     search_filter: SearchFilters,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    on_first_stage: FirstStageListener | None = None,
 ) -> tuple[list[EpisodicNode], list[float]]:
     if config is None:
         return [], []
@@ -398,25 +561,26 @@ async def episode_search(
         reranked_uuids, episode_scores = rrf(search_result_uuids, min_score=reranker_min_score)
 
     elif config.reranker == EpisodeReranker.cross_encoder:
-        # use rrf as a preliminary reranker
-        rrf_result_uuids, episode_scores = rrf(search_result_uuids, min_score=reranker_min_score)
-        rrf_results = [episode_uuid_map[uuid] for uuid in rrf_result_uuids][:limit]
-
-        content_to_uuid_map = {episode.content: episode.uuid for episode in rrf_results}
-
-        reranked_contents = await cross_encoder.rank(query, list(content_to_uuid_map.keys()))
-        reranked_uuids = [
-            content_to_uuid_map[content]
-            for content, score in reranked_contents
-            if score >= reranker_min_score
-        ]
-        episode_scores = [score for _, score in reranked_contents if score >= reranker_min_score]
+        # episodes have no embeddings, so the first stage is rrf alone
+        reranked_uuids, episode_scores = await _cross_encoder_rerank(
+            cross_encoder,
+            query,
+            None,
+            search_result_uuids,
+            {uuid: episode.content for uuid, episode in episode_uuid_map.items()},
+            None,
+            config,
+            limit,
+            reranker_min_score,
+            _map_first_stage(on_first_stage, episode_uuid_map, limit),
+        )
 
     reranked_episodes = [episode_uuid_map[uuid] for uuid in reranked_uuids]
 
     return reranked_episodes[:limit], episode_scores[:limit]
 
 
+@traced('graphiti.search.communities')
 async def community_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -426,6 +590,7 @@ async def community_search(
     config: CommunitySearchConfig | None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    on_first_stage: FirstStageListener | None = None,
 ) -> tuple[list[CommunityNode], list[float]]:
     if config is None:
         return [], []
@@ -459,13 +624,88 @@ async def community_search(
             query_vector, search_result_uuids_and_vectors, config.mmr_lambda, reranker_min_score
         )
     elif config.reranker == CommunityReranker.cross_encoder:
-        name_to_uuid_map = {node.name: node.uuid for result in search_results for node in result}
-        reranked_nodes = await cross_encoder.rank(query, list(name_to_uuid_map.keys()))
-        reranked_uuids = [
-            name_to_uuid_map[name] for name, score in reranked_nodes if score >= reranker_min_score
-        ]
-        community_scores = [score for _, score in reranked_nodes if score >= reranker_min_score]
+        reranked_uuids, community_scores = await _cross_encoder_rerank(
+            cross_encoder,
+            query,
+            query_vector,
+            search_result_uuids,
+            {uuid: community.name for uuid, community in community_uuid_map.items()},
+            lambda: get_embeddings_for_communities(driver, list(community_uuid_map.values())),
+            config,
+            limit,
+            reranker_min_score,
+            _map_first_stage(on_first_stage, community_uuid_map, limit),
+        )
 
     reranked_communities = [community_uuid_map[uuid] for uuid in reranked_uuids]
 
     return reranked_communities[:limit], community_scores[:limit]
+
+
+def _map_first_stage(
+    on_first_stage: FirstStageListener | None, uuid_map: dict[str, Any], limit: int
+) -> Callable[[list[str], list[float]], None] | None:
+    if on_first_stage is None:
+        return None
+    return lambda uuids, scores: on_first_stage(
+        [uuid_map[uuid] for uuid in uuids[:limit]], scores[:limit]
+    )
+
+
+async def _cross_encoder_rerank(
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    query_vector: list[float] | None,
+    search_result_uuids: list[list[str]],
+    passages: dict[str, str],
+    load_embeddings: Callable[[], Awaitable[dict[str, list[float]]]] | None,
+    config: EdgeSearchConfig | NodeSearchConfig | EpisodeSearchConfig | CommunitySearchConfig,
+    limit: int,
+    reranker_min_score: float,
+    on_first_stage: Callable[[list[str], list[float]], None] | None = None,
+) -> tuple[list[str], list[float]]:
+    """
+    Two-stage reranking: order the candidates by their first-stage score, send at most
+    config.reranker_candidates of them to the cross-encoder and fall back to the first-stage
+    order if the cross-encoder exceeds config.reranker_timeout.
+    """
+    budget = config.reranker_candidates or limit
+    # embeddings are only worth fetching when some candidates have to be pruned
+    embeddings = (
+        await load_embeddings()
+        if load_embeddings is not None and query_vector is not None and len(passages) > budget
+        else None
+    )
+    first_stage_uuids, first_stage_scores = first_stage_rank(
+        search_result_uuids, query_vector, embeddings
+    )
+    if on_first_stage is not None:
+        on_first_stage(first_stage_uuids, first_stage_scores)
+
+    passage_to_uuid: dict[str, str] = {}
+    for uuid in first_stage_uuids[:budget]:
+        passage_to_uuid.setdefault(passages[uuid], uuid)
+
+    with start_span(
+        'graphiti.search.rerank', {'graphiti.rerank.candidates': len(passage_to_uuid)}
+    ) as span:
+        ranked_passages = await cross_encoder_rerank(
+            cross_encoder,
+            query,
+            list(passage_to_uuid),
+            limit,
+            config.reranker_early_exit,
+            config.reranker_timeout,
+        )
+        span.set_attribute('graphiti.rerank.fallback', ranked_passages is None)
+
+    if ranked_passages is None:
+        return first_stage_uuids[:budget], first_stage_scores[:budget]
+
+    ranked_passages = [
+        (passage, score) for passage, score in ranked_passages if score >= reranker_min_score
+    ]
+    return (
+        [passage_to_uuid[passage] for passage, _ in ranked_passages],
+        [score for _, score in ranked_passages],
+    )
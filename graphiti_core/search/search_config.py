@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 from enum import Enum
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -77,7 +78,25 @@ class CommunityReranker(Enum):
     cross_encoder = 'cross_encoder'
 
 
-class EdgeSearchConfig(BaseModel):
+class CrossEncoderRerankConfig(BaseModel):
+    """Cross-encoder reranking options shared by the search configs of every layer."""
+
+    reranker_candidates: int | None = Field(
+        default=None,
+        description='Candidates sent to the cross-encoder, best first-stage score first; '
+        'defaults to the search limit',
+    )
+    reranker_early_exit: bool = Field(
+        default=True, description='Stop cross-encoder reranking once the top results are stable'
+    )
+    reranker_timeout: float | None = Field(
+        default=None,
+        description='Seconds allowed for cross-encoder reranking before falling back to the '
+        'first-stage order',
+    )
+
+
+class EdgeSearchConfig(CrossEncoderRerankConfig):
     search_methods: list[EdgeSearchMethod]
     reranker: EdgeReranker = Field(default=EdgeReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
@@ -85,7 +104,7 @@ class EdgeSearchConfig(BaseModel):
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
 
-class NodeSearchConfig(BaseModel):
+class NodeSearchConfig(CrossEncoderRerankConfig):
     search_methods: list[NodeSearchMethod]
     reranker: NodeReranker = Field(default=NodeReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
@@ -93,7 +112,7 @@ class NodeSearchConfig(BaseModel):
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
 
-class EpisodeSearchConfig(BaseModel):
+class EpisodeSearchConfig(CrossEncoderRerankConfig):
     search_methods: list[EpisodeSearchMethod]
     reranker: EpisodeReranker = Field(default=EpisodeReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
@@ -101,7 +120,7 @@ class EpisodeSearchConfig(BaseModel):
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
 
-class CommunitySearchConfig(BaseModel):
+class CommunitySearchConfig(CrossEncoderRerankConfig):
     search_methods: list[CommunitySearchMethod]
     reranker: CommunityReranker = Field(default=CommunityReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
@@ -127,3 +146,18 @@ class SearchResults(BaseModel):
     episode_reranker_scores: list[float] = Field(default_factory=list)
     communities: list[CommunityNode] = Field(default_factory=list)
     community_reranker_scores: list[float] = Field(default_factory=list)
+
+
+SearchLayer = Literal['edges', 'nodes', 'episodes', 'communities']
+
+
+class SearchUpdate(BaseModel):
+    """
+    Partial results of an incremental search for one layer of the graph. Results for the
+    'first_stage' are in first-stage order while a cross-encoder is still reranking them; a
+    'final' update replaces any earlier update for the same layer.
+    """
+
+    layer: SearchLayer
+    stage: Literal['first_stage', 'final']
+    results: SearchResults
@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import functools
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -48,137 +49,169 @@ class SearchFilters(BaseModel):
     invalid_at: list[list[DateFilter]] | None = Field(default=None)
     created_at: list[list[DateFilter]] | None = Field(default=None)
     expired_at: list[list[DateFilter]] | None = Field(default=None)
+    as_of: datetime | None = Field(
+        default=None,
+        description='Only return facts that were true at this point in time (valid time)',
+    )
 
 
-def node_search_filter_query_constructor(
+# date properties carried by each kind of search result, all of them backed by a range index
+NODE_DATE_FIELDS = ('created_at',)
+EDGE_DATE_FIELDS = ('valid_at', 'created_at', 'expired_at', 'invalid_at')
+
+# rough selectivity rank of a comparison, lower is more selective
+_OPERATOR_RANK = {
+    ComparisonOperator.equals: 0,
+    ComparisonOperator.greater_than: 1,
+    ComparisonOperator.less_than: 1,
+    ComparisonOperator.greater_than_equal: 1,
+    ComparisonOperator.less_than_equal: 1,
+    ComparisonOperator.not_equals: 2,
+}
+
+# (field, OR-groups of AND-ed comparison operators)
+DateFilterShape = tuple[str, tuple[tuple[ComparisonOperator, ...], ...]]
+
+
+def _date_filter_shapes(
+    filters: SearchFilters, fields: tuple[str, ...]
+) -> tuple[DateFilterShape, ...]:
+    shapes: list[DateFilterShape] = []
+    for field in fields:
+        or_list: list[list[DateFilter]] | None = getattr(filters, field)
+        # no alternatives, or an empty (always true) one, leave the field unconstrained
+        if not or_list or not all(or_list):
+            continue
+        shapes.append(
+            (
+                field,
+                tuple(
+                    tuple(date_filter.comparison_operator for date_filter in and_list)
+                    for and_list in or_list
+                ),
+            )
+        )
+    return tuple(shapes)
+
+
+def _date_filter_params(
+    filters: SearchFilters, shapes: tuple[DateFilterShape, ...]
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+    for field, _ in shapes:
+        for i, and_list in enumerate(getattr(filters, field)):
+            for j, date_filter in enumerate(and_list):
+                params[f'{field}_{i}_{j}'] = date_filter.date
+    return params
+
+
+def _selectivity(shape: DateFilterShape) -> int:
+    # a disjunction is only as selective as its least selective branch
+    return max(min(_OPERATOR_RANK[op] for op in operators) for operators in shape[1])
+
+
+def _date_predicates(alias: str, shapes: tuple[DateFilterShape, ...]) -> list[str]:
+    predicates = []
+    for field, or_groups in sorted(shapes, key=_selectivity):
+        # plain `alias.field <op> $param` comparisons so the planner can use the range index
+        branches = [
+            ' AND '.join(
+                f'{alias}.{field} {op.value} ${field}_{i}_{j}' for j, op in enumerate(operators)
+            )
+            for i, operators in enumerate(or_groups)
+        ]
+        if len(branches) == 1:
+            predicates.append(branches[0])
+        else:
+            predicates.append('(' + ' OR '.join(f'({branch})' for branch in branches) + ')')
+    return predicates
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_node_filters(
+    node_labels: tuple[str, ...] | None, date_shapes: tuple[DateFilterShape, ...]
+) -> tuple[str, ...]:
+    predicates = _date_predicates('n', date_shapes)
+    if node_labels is not None:
+        predicates.append('n:' + '|'.join(node_labels))
+    return tuple(predicates)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_edge_filters(
+    has_edge_types: bool,
+    has_as_of: bool,
+    node_labels: tuple[str, ...] | None,
+    date_shapes: tuple[DateFilterShape, ...],
+) -> tuple[str, ...]:
+    predicates = []
+    if has_edge_types:
+        predicates.append('e.name IN $edge_types')
+    if has_as_of:
+        # a fact holds from valid_at (or, when that is unknown, from when it was recorded) until
+        # invalid_at; both bounds are range predicates on indexed properties
+        predicates.append(
+            '(e.valid_at <= $as_of OR (e.valid_at IS NULL AND e.created_at <= $as_of))'
+        )
+        predicates.append('(e.invalid_at IS NULL OR e.invalid_at > $as_of)')
+    predicates.extend(_date_predicates('e', date_shapes))
+    if node_labels is not None:
+        labels = '|'.join(node_labels)
+        predicates.append(f'n:{labels} AND m:{labels}')
+    return tuple(predicates)
+
+
+def node_search_filter_predicates(
     filters: SearchFilters,
-) -> tuple[str, dict[str, Any]]:
-    filter_query: str = ''
-    filter_params: dict[str, Any] = {}
+) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """
+    Compile the filters on entity nodes, bound to `n`, into Cypher predicates and their
+    parameters. Entity nodes only carry created_at, so the edge date filters and as_of, which
+    restricts facts, are ignored.
+    """
+    date_shapes = _date_filter_shapes(filters, NODE_DATE_FIELDS)
+    node_labels = tuple(filters.node_labels) if filters.node_labels is not None else None
+    predicates = _compile_node_filters(node_labels, date_shapes)
+    return predicates, _date_filter_params(filters, date_shapes)
+
+
+def edge_search_filter_predicates(
+    filters: SearchFilters,
+) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """
+    Compile the filters on entity edges, bound to `e` with endpoints `n` and `m`, into Cypher
+    predicates and their parameters. Predicates on indexed properties come first, most
+    selective first; the query text only depends on the shape of the filters, so repeated
+    searches reuse both the compiled text and the database's cached plan.
+    """
+    date_shapes = _date_filter_shapes(filters, EDGE_DATE_FIELDS)
+    params = _date_filter_params(filters, date_shapes)
+    if filters.edge_types is not None:
+        params['edge_types'] = filters.edge_types
+    if filters.as_of is not None:
+        params['as_of'] = filters.as_of
 
-    if filters.node_labels is not None:
-        node_labels = '|'.join(filters.node_labels)
-        node_label_filter = ' AND n:' + node_labels
-        filter_query += node_label_filter
+    node_labels = tuple(filters.node_labels) if filters.node_labels is not None else None
+    predicates = _compile_edge_filters(
+        filters.edge_types is not None, filters.as_of is not None, node_labels, date_shapes
+    )
+    return predicates, params
 
-    return filter_query, filter_params
 
+@functools.lru_cache(maxsize=256)
+def _and_clause(predicates: tuple[str, ...]) -> str:
+    return ''.join(f'\nAND {predicate}' for predicate in predicates)
 
-def edge_search_filter_query_constructor(
+
+def node_search_filter_query_constructor(
     filters: SearchFilters,
 ) -> tuple[str, dict[str, Any]]:
-    filter_query: str = ''
-    filter_params: dict[str, Any] = {}
+    predicates, params = node_search_filter_predicates(filters)
+    return _and_clause(predicates), params
 
-    if filters.edge_types is not None:
-        edge_types = filters.edge_types
-        edge_types_filter = '\nAND e.name in $edge_types'
-        filter_query += edge_types_filter
-        filter_params['edge_types'] = edge_types
-
-    if filters.node_labels is not None:
-        node_labels = '|'.join(filters.node_labels)
-        node_label_filter = '\nAND n:' + node_labels + ' AND m:' + node_labels
-        filter_query += node_label_filter
-
-    if filters.valid_at is not None:
-        valid_at_filter = '\nAND ('
-        for i, or_list in enumerate(filters.valid_at):
-            for j, date_filter in enumerate(or_list):
-                filter_params['valid_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                '(e.valid_at ' + date_filter.comparison_operator.value + f' $valid_at_{j})'
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            valid_at_filter += and_filter_query
-
-            if i == len(filters.valid_at) - 1:
-                valid_at_filter += ')'
-            else:
-                valid_at_filter += ' OR '
-
-        filter_query += valid_at_filter
-
-    if filters.invalid_at is not None:
-        invalid_at_filter = ' AND ('
-        for i, or_list in enumerate(filters.invalid_at):
-            for j, date_filter in enumerate(or_list):
-                filter_params['invalid_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                '(e.invalid_at ' + date_filter.comparison_operator.value + f' $invalid_at_{j})'
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            invalid_at_filter += and_filter_query
-
-            if i == len(filters.invalid_at) - 1:
-                invalid_at_filter += ')'
-            else:
-                invalid_at_filter += ' OR '
-
-        filter_query += invalid_at_filter
-
-    if filters.created_at is not None:
-        created_at_filter = ' AND ('
-        for i, or_list in enumerate(filters.created_at):
-            for j, date_filter in enumerate(or_list):
-                filter_params['created_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                '(e.created_at ' + date_filter.comparison_operator.value + f' $created_at_{j})'
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            created_at_filter += and_filter_query
-
-            if i == len(filters.created_at) - 1:
-                created_at_filter += ')'
-            else:
-                created_at_filter += ' OR '
-
-        filter_query += created_at_filter
-
-    if filters.expired_at is not None:
-        expired_at_filter = ' AND ('
-        for i, or_list in enumerate(filters.expired_at):
-            for j, date_filter in enumerate(or_list):
-                filter_params['expired_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                '(e.expired_at ' + date_filter.comparison_operator.value + f' $expired_at_{j})'
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            expired_at_filter += and_filter_query
-
-            if i == len(filters.expired_at) - 1:
-                expired_at_filter += ')'
-            else:
-                expired_at_filter += ' OR '
-
-        filter_query += expired_at_filter
-
-    return filter_query, filter_params
+
+def edge_search_filter_query_constructor(
+    filters: SearchFilters,
+) -> tuple[str, dict[str, Any]]:
+    predicates, params = edge_search_filter_predicates(filters)
+    return _and_clause(predicates), params
@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
 from collections import defaultdict
 from time import time
@@ -23,7 +24,8 @@ import numpy as np
 from numpy._typing import NDArray
 from typing_extensions import LiteralString
 
-from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver, driver_operation
 from graphiti_core.edges import EntityEdge, get_entity_edge_from_record
 from graphiti_core.graph_queries import (
     get_nodes_query,
@@ -36,10 +38,17 @@ from graphiti_core.helpers import (
     normalize_l2,
     semaphore_gather,
 )
-from graphiti_core.models.edges.edge_db_queries import ENTITY_EDGE_RETURN
-from graphiti_core.models.nodes.node_db_queries import COMMUNITY_NODE_RETURN, EPISODIC_NODE_RETURN
+from graphiti_core.models.edges.edge_db_queries import (
+    get_entity_edge_attributes_query,
+    get_entity_edge_return_query,
+)
+from graphiti_core.models.nodes.node_db_queries import (
+    EPISODIC_NODE_RETURN,
+    get_community_node_return_query,
+    get_entity_node_attributes_query,
+    get_entity_node_return_query,
+)
 from graphiti_core.nodes import (
-    ENTITY_NODE_RETURN,
     CommunityNode,
     EntityNode,
     EpisodicNode,
@@ -52,6 +61,7 @@ from graphiti_core.search.search_filters import (
     edge_search_filter_query_constructor,
     node_search_filter_query_constructor,
 )
+from graphiti_core.telemetry.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +107,7 @@ async def get_episodes_by_mentions(
     return episodes
 
 
+@driver_operation('get_mentioned_nodes')
 async def get_mentioned_nodes(
     driver: GraphDriver, episodes: list[EpisodicNode]
 ) -> list[EntityNode]:
@@ -108,7 +119,7 @@ async def get_mentioned_nodes(
         WHERE episode.uuid IN $uuids
         RETURN DISTINCT
         """
-        + ENTITY_NODE_RETURN,
+        + get_entity_node_return_query(driver.provider),
         uuids=episode_uuids,
         routing_='r',
     )
@@ -118,6 +129,7 @@ async def get_mentioned_nodes(
     return nodes
 
 
+@driver_operation('get_communities_by_nodes')
 async def get_communities_by_nodes(
     driver: GraphDriver, nodes: list[EntityNode]
 ) -> list[CommunityNode]:
@@ -129,7 +141,7 @@ async def get_communities_by_nodes(
         WHERE m.uuid IN $uuids
         RETURN DISTINCT
         """
-        + COMMUNITY_NODE_RETURN,
+        + get_community_node_return_query(),
         uuids=node_uuids,
         routing_='r',
     )
@@ -139,6 +151,8 @@ async def get_communities_by_nodes(
     return communities
 
 
+@traced('graphiti.search.edge_fulltext_search')
+@driver_operation('fulltext_search_edges')
 async def edge_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -164,7 +178,7 @@ async def edge_fulltext_search(
         WITH e, score, n, m
         RETURN
         """
-        + ENTITY_EDGE_RETURN
+        + get_entity_edge_return_query(driver.provider)
         + """
         ORDER BY score DESC
         LIMIT $limit
@@ -185,6 +199,8 @@ async def edge_fulltext_search(
     return edges
 
 
+@traced('graphiti.search.edge_similarity_search')
+@driver_operation('vector_search_edges')
 async def edge_similarity_search(
     driver: GraphDriver,
     search_vector: list[float],
@@ -228,7 +244,7 @@ async def edge_similarity_search(
         WHERE score > $min_score
         RETURN
         """
-        + ENTITY_EDGE_RETURN
+        + get_entity_edge_return_query(driver.provider)
         + """
         ORDER BY score DESC
         LIMIT $limit
@@ -249,6 +265,8 @@ async def edge_similarity_search(
     return edges
 
 
+@traced('graphiti.search.edge_bfs_search')
+@driver_operation('bfs_edges')
 async def edge_bfs_search(
     driver: GraphDriver,
     bfs_origin_node_uuids: list[str] | None,
@@ -276,7 +294,7 @@ async def edge_bfs_search(
         + """
         RETURN DISTINCT
         """
-        + ENTITY_EDGE_RETURN
+        + get_entity_edge_return_query(driver.provider)
         + """
         LIMIT $limit
         """
@@ -296,6 +314,8 @@ async def edge_bfs_search(
     return edges
 
 
+@traced('graphiti.search.node_fulltext_search')
+@driver_operation('fulltext_search_nodes')
 async def node_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -314,14 +334,14 @@ async def node_fulltext_search(
         + """
         YIELD node AS n, score
         WHERE n:Entity AND n.group_id IN $group_ids
-        WITH n, score
-        LIMIT $limit
         """
         + filter_query
         + """
+        WITH n, score
+        LIMIT $limit
         RETURN
         """
-        + ENTITY_NODE_RETURN
+        + get_entity_node_return_query(driver.provider)
         + """
         ORDER BY score DESC
         """
@@ -341,6 +361,8 @@ async def node_fulltext_search(
     return nodes
 
 
+@traced('graphiti.search.node_similarity_search')
+@driver_operation('vector_search_nodes')
 async def node_similarity_search(
     driver: GraphDriver,
     search_vector: list[float],
@@ -374,7 +396,7 @@ async def node_similarity_search(
         WHERE score > $min_score
         RETURN
         """
-        + ENTITY_NODE_RETURN
+        + get_entity_node_return_query(driver.provider)
         + """
         ORDER BY score DESC
         LIMIT $limit
@@ -395,6 +417,8 @@ async def node_similarity_search(
     return nodes
 
 
+@traced('graphiti.search.node_bfs_search')
+@driver_operation('bfs_nodes')
 async def node_bfs_search(
     driver: GraphDriver,
     bfs_origin_node_uuids: list[str] | None,
@@ -420,7 +444,7 @@ async def node_bfs_search(
         + """
         RETURN
         """
-        + ENTITY_NODE_RETURN
+        + get_entity_node_return_query(driver.provider)
         + """
         LIMIT $limit
         """
@@ -439,6 +463,8 @@ async def node_bfs_search(
     return nodes
 
 
+@traced('graphiti.search.episode_fulltext_search')
+@driver_operation('fulltext_search_episodes')
 async def episode_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -479,6 +505,8 @@ async def episode_fulltext_search(
     return episodes
 
 
+@traced('graphiti.search.community_fulltext_search')
+@driver_operation('fulltext_search_communities')
 async def community_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -497,7 +525,7 @@ async def community_fulltext_search(
         WHERE n.group_id IN $group_ids
         RETURN
         """
-        + COMMUNITY_NODE_RETURN
+        + get_community_node_return_query()
         + """
         ORDER BY score DESC
         LIMIT $limit
@@ -516,6 +544,8 @@ async def community_fulltext_search(
     return communities
 
 
+@traced('graphiti.search.community_similarity_search')
+@driver_operation('vector_search_communities')
 async def community_similarity_search(
     driver: GraphDriver,
     search_vector: list[float],
@@ -545,7 +575,7 @@ async def community_similarity_search(
         WHERE score > $min_score
         RETURN
         """
-        + COMMUNITY_NODE_RETURN
+        + get_community_node_return_query()
         + """
         ORDER BY score DESC
         LIMIT $limit
@@ -639,6 +669,7 @@ async def hybrid_node_search(
     return relevant_nodes
 
 
+@driver_operation('get_relevant_nodes')
 async def get_relevant_nodes(
     driver: GraphDriver,
     nodes: list[EntityNode],
@@ -661,7 +692,8 @@ async def get_relevant_nodes(
         RUNTIME_QUERY
         + """
         UNWIND $nodes AS node
-        MATCH (n:Entity {group_id: $group_id})
+        MATCH (n:Entity)
+        WHERE n.group_id = $group_id
         """
         + filter_query
         + """
@@ -696,7 +728,9 @@ async def get_relevant_nodes(
             created_at: x.created_at,
             summary: x.summary,
             labels: labels(x),
-            attributes: properties(x)
+            attributes: """
+        + get_entity_node_attributes_query(driver.provider, 'x')
+        + """
           }] AS matches
         """
     )
@@ -733,6 +767,7 @@ async def get_relevant_nodes(
     return relevant_nodes
 
 
+@driver_operation('get_relevant_edges')
 async def get_relevant_edges(
     driver: GraphDriver,
     edges: list[EntityEdge],
@@ -752,7 +787,8 @@ async def get_relevant_edges(
         RUNTIME_QUERY
         + """
         UNWIND $edges AS edge
-        MATCH (n:Entity {uuid: edge.source_node_uuid})-[e:RELATES_TO {group_id: edge.group_id}]-(m:Entity {uuid: edge.target_node_uuid})
+        MATCH (n:Entity {uuid: edge.source_node_uuid})-[e:RELATES_TO]-(m:Entity {uuid: edge.target_node_uuid})
+        WHERE e.group_id = edge.group_id
         """
         + filter_query
         + """
@@ -776,7 +812,9 @@ async def get_relevant_edges(
                 expired_at: e.expired_at,
                 valid_at: e.valid_at,
                 invalid_at: e.invalid_at,
-                attributes: properties(e)
+                attributes: """
+        + get_entity_edge_attributes_query(driver.provider)
+        + """
             })[..$limit] AS matches
         """
     )
@@ -802,6 +840,7 @@ async def get_relevant_edges(
     return relevant_edges
 
 
+@driver_operation('get_edge_invalidation_candidates')
 async def get_edge_invalidation_candidates(
     driver: GraphDriver,
     edges: list[EntityEdge],
@@ -822,7 +861,7 @@ async def get_edge_invalidation_candidates(
         + """
         UNWIND $edges AS edge
         MATCH (n:Entity)-[e:RELATES_TO {group_id: edge.group_id}]->(m:Entity)
-        WHERE n.uuid IN [edge.source_node_uuid, edge.target_node_uuid] OR m.uuid IN [edge.target_node_uuid, edge.source_node_uuid]
+        WHERE (n.uuid IN [edge.source_node_uuid, edge.target_node_uuid] OR m.uuid IN [edge.target_node_uuid, edge.source_node_uuid])
         """
         + filter_query
         + """
@@ -846,7 +885,9 @@ async def get_edge_invalidation_candidates(
                 expired_at: e.expired_at,
                 valid_at: e.valid_at,
                 invalid_at: e.invalid_at,
-                attributes: properties(e)
+                attributes: """
+        + get_entity_edge_attributes_query(driver.provider)
+        + """
             })[..$limit] AS matches
         """
     )
@@ -890,6 +931,41 @@ def rrf(
     ]
 
 
+@driver_operation('get_connected_node_uuids')
+async def get_connected_node_uuids(
+    driver: GraphDriver, center_node_uuid: str, node_uuids: list[str]
+) -> list[str]:
+    """Return the uuids in node_uuids that share a RELATES_TO edge with the center node."""
+    results, _, _ = await driver.execute_query(
+        """
+        UNWIND $node_uuids AS node_uuid
+        MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]-(n:Entity {uuid: node_uuid})
+        RETURN 1 AS score, node_uuid AS uuid
+        """,
+        node_uuids=node_uuids,
+        center_uuid=center_node_uuid,
+        routing_='r',
+    )
+    return [result['uuid'] for result in results]
+
+
+@driver_operation('get_episode_mention_counts')
+async def get_episode_mention_counts(driver: GraphDriver, node_uuids: list[str]) -> dict[str, int]:
+    """Return, for each of the nodes mentioned by at least one episode, its number of mentions."""
+    results, _, _ = await driver.execute_query(
+        """
+        UNWIND $node_uuids AS node_uuid
+        MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
+        RETURN count(*) AS score, n.uuid AS uuid
+        """,
+        node_uuids=node_uuids,
+        routing_='r',
+    )
+
+    return {result['uuid']: result['score'] for result in results}
+
+
+@traced('graphiti.search.node_distance_reranker')
 async def node_distance_reranker(
     driver: GraphDriver,
     node_uuids: list[str],
@@ -901,23 +977,8 @@ async def node_distance_reranker(
     scores: dict[str, float] = {center_node_uuid: 0.0}
 
     # Find the shortest path to center node
-    results, header, _ = await driver.execute_query(
-        """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]-(n:Entity {uuid: node_uuid})
-        RETURN 1 AS score, node_uuid AS uuid
-        """,
-        node_uuids=filtered_uuids,
-        center_uuid=center_node_uuid,
-        routing_='r',
-    )
-    if driver.provider == GraphProvider.FALKORDB:
-        results = [dict(zip(header, row, strict=True)) for row in results]
-
-    for result in results:
-        uuid = result['uuid']
-        score = result['score']
-        scores[uuid] = score
+    for uuid in await get_connected_node_uuids(driver, center_node_uuid, filtered_uuids):
+        scores[uuid] = 1
 
     for uuid in filtered_uuids:
         if uuid not in scores:
@@ -936,6 +997,7 @@ async def node_distance_reranker(
     ]
 
 
+@traced('graphiti.search.episode_mentions_reranker')
 async def episode_mentions_reranker(
     driver: GraphDriver, node_uuids: list[list[str]], min_score: float = 0
 ) -> tuple[list[str], list[float]]:
@@ -944,18 +1006,7 @@ async def episode_mentions_reranker(
     scores: dict[str, float] = {}
 
     # Find the shortest path to center node
-    results, _, _ = await driver.execute_query(
-        """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
-        RETURN count(*) AS score, n.uuid AS uuid
-        """,
-        node_uuids=sorted_uuids,
-        routing_='r',
-    )
-
-    for result in results:
-        scores[result['uuid']] = result['score']
+    scores.update(await get_episode_mention_counts(driver, sorted_uuids))
 
     # rerank on shortest distance
     sorted_uuids.sort(key=lambda cur_uuid: scores[cur_uuid])
@@ -965,6 +1016,77 @@ async def episode_mentions_reranker(
     ]
 
 
+def first_stage_rank(
+    search_result_uuids: list[list[str]],
+    query_vector: list[float] | None = None,
+    embeddings: dict[str, list[float]] | None = None,
+) -> tuple[list[str], list[float]]:
+    """
+    Cheap ranking of search candidates ahead of an expensive reranker: reciprocal rank fusion of
+    the result lists, normalized to [0, 1], plus the normalized cosine similarity of each
+    candidate's embedding to the query when embeddings are given.
+    """
+    uuids, rrf_scores = rrf(search_result_uuids)
+    if not uuids or query_vector is None or not embeddings:
+        return uuids, rrf_scores
+
+    query_array = normalize_l2(query_vector)
+    top_score = rrf_scores[0]
+    scores: dict[str, float] = {}
+    for uuid, rrf_score in zip(uuids, rrf_scores, strict=True):
+        embedding = embeddings.get(uuid)
+        cosine = (1 + float(np.dot(query_array, normalize_l2(embedding)))) / 2 if embedding else 0
+        scores[uuid] = rrf_score / top_score + cosine
+
+    uuids.sort(reverse=True, key=lambda uuid: scores[uuid])
+
+    return uuids, [scores[uuid] for uuid in uuids]
+
+
+async def cross_encoder_rerank(
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    passages: list[str],
+    limit: int,
+    early_exit: bool = True,
+    timeout: float | None = None,
+) -> list[tuple[str, float]] | None:
+    """
+    Rerank passages, given best first, with a cross-encoder.
+
+    With early_exit the passages are ranked in batches of limit and ranking stops as soon as a
+    batch leaves the top limit unchanged, so candidates far down the first-stage order are
+    usually never sent. Returns None when ranking takes longer than timeout seconds, so that
+    callers can fall back to the first-stage order.
+    """
+    if not passages:
+        return []
+
+    batch_size = limit if early_exit and limit > 0 else len(passages)
+    scores: dict[str, float] = {}
+
+    async def rank():
+        top: list[str] = []
+        for start in range(0, len(passages), batch_size):
+            ranked = await cross_encoder.rank(query, passages[start : start + batch_size])
+            scores.update(ranked)
+            new_top = sorted(scores, key=lambda passage: scores[passage], reverse=True)[:limit]
+            if early_exit and set(new_top) == set(top):
+                logger.debug(f'Stopped reranking after {len(scores)} of {len(passages)} passages')
+                break
+            top = new_top
+
+    try:
+        await asyncio.wait_for(rank(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(
+            f'Reranking {len(passages)} passages exceeded {timeout}s, using first-stage order'
+        )
+        return None
+
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
 def maximal_marginal_relevance(
     query_vector: list[float],
     candidates: dict[str, list[float]],
@@ -1006,6 +1128,7 @@ def maximal_marginal_relevance(
     ]
 
 
+@driver_operation('get_embeddings_for_nodes')
 async def get_embeddings_for_nodes(
     driver: GraphDriver, nodes: list[EntityNode]
 ) -> dict[str, list[float]]:
@@ -1031,6 +1154,7 @@ async def get_embeddings_for_nodes(
     return embeddings_dict
 
 
+@driver_operation('get_embeddings_for_communities')
 async def get_embeddings_for_communities(
     driver: GraphDriver, communities: list[CommunityNode]
 ) -> dict[str, list[float]]:
@@ -1056,6 +1180,7 @@ async def get_embeddings_for_communities(
     return embeddings_dict
 
 
+@driver_operation('get_embeddings_for_edges')
 async def get_embeddings_for_edges(
     driver: GraphDriver, edges: list[EntityEdge]
 ) -> dict[str, list[float]]:
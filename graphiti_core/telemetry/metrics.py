@@ -0,0 +1,176 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from graphiti_core.llm_client.usage import LLMCallUsage
+
+logger = logging.getLogger(__name__)
+
+METER_NAME = 'graphiti_core'
+
+# Each exporter is used when its library is installed (graphiti-core[prometheus] or
+# graphiti-core[opentelemetry]) and is a no-op otherwise. OpenTelemetry metrics are only
+# exported once the application configures a MeterProvider.
+
+_otel_instruments: dict[str, Any] | None = None
+_prometheus_instruments: dict[str, Any] | None = None
+
+
+def _get_otel_instruments() -> dict[str, Any]:
+    global _otel_instruments
+    if _otel_instruments is None:
+        try:
+            from opentelemetry import metrics
+
+            meter = metrics.get_meter(METER_NAME)
+            _otel_instruments = {
+                'tokens': meter.create_counter(
+                    'graphiti.llm.tokens', unit='{token}', description='LLM tokens by type'
+                ),
+                'calls': meter.create_counter(
+                    'graphiti.llm.calls', description='LLM calls by status (ok or failed)'
+                ),
+                'retries': meter.create_counter(
+                    'graphiti.llm.retries', description='LLM call retries'
+                ),
+                'latency': meter.create_histogram(
+                    'graphiti.llm.latency', unit='ms', description='LLM call latency'
+                ),
+                'reranker_cache': meter.create_counter(
+                    'graphiti.reranker.cache_lookups',
+                    description='Reranker score cache lookups by result',
+                ),
+                'reranker_batch_size': meter.create_histogram(
+                    'graphiti.reranker.batch_size',
+                    unit='{pair}',
+                    description='Pairs scored per local reranker batch',
+                ),
+                'reranker_latency': meter.create_histogram(
+                    'graphiti.reranker.latency',
+                    unit='ms',
+                    description='Local reranker batch latency',
+                ),
+            }
+        except ImportError:
+            _otel_instruments = {}
+
+    return _otel_instruments
+
+
+def _get_prometheus_instruments() -> dict[str, Any]:
+    global _prometheus_instruments
+    if _prometheus_instruments is None:
+        try:
+            from prometheus_client import Counter, Histogram
+
+            labels = ['stage', 'model']
+            _prometheus_instruments = {
+                'tokens': Counter(
+                    'graphiti_llm_tokens', 'LLM tokens by type', [*labels, 'token_type']
+                ),
+                'calls': Counter(
+                    'graphiti_llm_calls', 'LLM calls by status (ok or failed)', [*labels, 'status']
+                ),
+                'retries': Counter('graphiti_llm_retries', 'LLM call retries', labels),
+                'latency': Histogram(
+                    'graphiti_llm_latency_seconds', 'LLM call latency in seconds', labels
+                ),
+                'reranker_cache': Counter(
+                    'graphiti_reranker_cache_lookups',
+                    'Reranker score cache lookups by result',
+                    ['model', 'result'],
+                ),
+                'reranker_batch_size': Histogram(
+                    'graphiti_reranker_batch_size',
+                    'Pairs scored per local reranker batch',
+                    ['reranker'],
+                    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+                ),
+                'reranker_latency': Histogram(
+                    'graphiti_reranker_latency_seconds',
+                    'Local reranker batch latency in seconds',
+                    ['reranker'],
+                ),
+            }
+        except ImportError:
+            _prometheus_instruments = {}
+
+    return _prometheus_instruments
+
+
+def record_llm_call_metrics(call: 'LLMCallUsage'):
+    token_counts = {
+        'input': call.input_tokens,
+        'output': call.output_tokens,
+        'cached_input': call.cached_input_tokens,
+        'cache_creation_input': call.cache_creation_input_tokens,
+    }
+    model = call.model or 'unknown'
+    status = 'failed' if call.failed else 'ok'
+
+    try:
+        otel = _get_otel_instruments()
+        if otel:
+            attributes = {'stage': call.stage, 'model': model}
+            for token_type, count in token_counts.items():
+                otel['tokens'].add(count, {**attributes, 'token_type': token_type})
+            otel['calls'].add(1, {**attributes, 'status': status})
+            otel['retries'].add(call.retries, attributes)
+            otel['latency'].record(call.latency_ms, attributes)
+
+        prometheus = _get_prometheus_instruments()
+        if prometheus:
+            for token_type, count in token_counts.items():
+                prometheus['tokens'].labels(call.stage, model, token_type).inc(count)
+            prometheus['calls'].labels(call.stage, model, status).inc()
+            prometheus['retries'].labels(call.stage, model).inc(call.retries)
+            prometheus['latency'].labels(call.stage, model).observe(call.latency_ms / 1000)
+    except Exception as e:
+        # metrics must never break an LLM call
+        logger.debug(f'Failed to record LLM metrics: {e}')
+
+
+def record_reranker_cache_metrics(model: str, hits: int, misses: int):
+    try:
+        otel = _get_otel_instruments()
+        if otel:
+            otel['reranker_cache'].add(hits, {'model': model, 'result': 'hit'})
+            otel['reranker_cache'].add(misses, {'model': model, 'result': 'miss'})
+
+        prometheus = _get_prometheus_instruments()
+        if prometheus:
+            prometheus['reranker_cache'].labels(model, 'hit').inc(hits)
+            prometheus['reranker_cache'].labels(model, 'miss').inc(misses)
+    except Exception as e:
+        logger.debug(f'Failed to record reranker cache metrics: {e}')
+
+
+def record_reranker_batch_metrics(reranker: str, batch_size: int, latency_ms: float):
+    try:
+        otel = _get_otel_instruments()
+        if otel:
+            otel['reranker_batch_size'].record(batch_size, {'reranker': reranker})
+            otel['reranker_latency'].record(latency_ms, {'reranker': reranker})
+
+        prometheus = _get_prometheus_instruments()
+        if prometheus:
+            prometheus['reranker_batch_size'].labels(reranker).observe(batch_size)
+            prometheus['reranker_latency'].labels(reranker).observe(latency_ms / 1000)
+    except Exception as e:
+        logger.debug(f'Failed to record reranker batch metrics: {e}')
@@ -0,0 +1,162 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import re
+from collections.abc import Callable, Coroutine, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any, ParamSpec, TypeVar
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = 'graphiti_core'
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+# Spans are created through the OpenTelemetry API when graphiti-core[opentelemetry] is installed.
+# Without an SDK and exporter configured by the application the API itself is a no-op, and
+# without the package every helper here does nothing.
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+
+    _tracer: Any = trace.get_tracer(TRACER_NAME)
+except ImportError:
+    trace = None  # type: ignore[assignment]
+    _tracer = None
+
+
+class _NoOpSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+def _clean_attributes(attributes: Mapping[str, Any] | None) -> dict[str, Any]:
+    """OpenTelemetry only accepts primitives and homogeneous sequences of primitives."""
+    cleaned: dict[str, Any] = {}
+    for key, value in (attributes or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, str | bool | int | float):
+            cleaned[key] = value
+        elif isinstance(value, list | tuple):
+            cleaned[key] = [str(item) for item in value]
+        else:
+            cleaned[key] = str(value)
+    return cleaned
+
+
+@contextmanager
+def start_span(name: str, attributes: Mapping[str, Any] | None = None) -> Iterator[Any]:
+    """Start a span as the current span. Yields a no-op span when OpenTelemetry is absent."""
+    if _tracer is None:
+        yield _NOOP_SPAN
+        return
+
+    with _tracer.start_as_current_span(
+        name, attributes=_clean_attributes(attributes), record_exception=False
+    ) as span:
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, str(e)))
+            raise
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Add attributes to the current span, if any."""
+    if trace is None:
+        return
+
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attributes(_clean_attributes(attributes))
+
+
+def _result_size(result: Any) -> int | None:
+    if isinstance(result, list):
+        return len(result)
+    # search methods return (results, scores)
+    if isinstance(result, tuple) and result and isinstance(result[0], list):
+        return len(result[0])
+    return None
+
+
+def traced(
+    name: str,
+) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
+    """
+    Trace an async function. Its group_id / group_ids argument and the size of its list result
+    are added as span attributes.
+    """
+
+    def decorator(func: Callable[P, Coroutine[Any, Any, R]]) -> Callable[P, Coroutine[Any, Any, R]]:
+        signature = inspect.signature(func)
+        group_params = [
+            param for param in ('group_id', 'group_ids') if param in signature.parameters
+        ]
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _tracer is None:
+                return await func(*args, **kwargs)
+
+            with start_span(name) as span:
+                if span.is_recording() and group_params:
+                    arguments = signature.bind_partial(*args, **kwargs).arguments
+                    span.set_attributes(
+                        _clean_attributes(
+                            {f'graphiti.{param}': arguments.get(param) for param in group_params}
+                        )
+                    )
+
+                result = await func(*args, **kwargs)
+
+                size = _result_size(result)
+                if size is not None:
+                    span.set_attribute('graphiti.result_count', size)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=1024)
+def query_fingerprint(query: str) -> str:
+    """Stable short identifier for a query text, independent of formatting."""
+    normalized = _WHITESPACE.sub(' ', str(query)).strip()
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16]
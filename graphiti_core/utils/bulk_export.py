@@ -0,0 +1,202 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Sequence
+from typing import IO, Any
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.edges import CommunityEdge, EntityEdge, EpisodicEdge
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.helpers import DEFAULT_SCAN_BATCH_SIZE, semaphore_gather
+from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
+from graphiti_core.utils.bulk_utils import add_nodes_and_edges_bulk
+from graphiti_core.utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMAT = 'graphiti-export'
+EXPORT_VERSION = 1
+
+# Record types in the order they are exported. Nodes come before the edges between them, so an
+# import can write every chunk as soon as it has been read.
+EXPORT_MODELS: dict[str, type[BaseModel]] = {
+    'episodes': EpisodicNode,
+    'entities': EntityNode,
+    'communities': CommunityNode,
+    'episodic_edges': EpisodicEdge,
+    'entity_edges': EntityEdge,
+    'community_edges': CommunityEdge,
+}
+
+
+class ExportStats(BaseModel):
+    episodes: int = 0
+    entities: int = 0
+    communities: int = 0
+    episodic_edges: int = 0
+    entity_edges: int = 0
+    community_edges: int = 0
+
+
+def embedding_block(
+    items: Sequence[EntityNode | EntityEdge | CommunityNode],
+) -> tuple[list[str], NDArray[np.float32]]:
+    """
+    Returns the uuids of the items that have an embedding and their embeddings as the rows of a
+    float32 matrix.
+    """
+    uuids: list[str] = []
+    vectors: list[list[float]] = []
+    for item in items:
+        vector = item.fact_embedding if isinstance(item, EntityEdge) else item.name_embedding
+        if vector is not None:
+            uuids.append(item.uuid)
+            vectors.append(vector)
+    return uuids, np.array(vectors, dtype=np.float32)
+
+
+async def scan_embeddings(
+    driver: GraphDriver,
+    group_ids: list[str],
+    model: type[EntityNode] | type[EntityEdge],
+    batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+) -> AsyncIterator[tuple[list[str], NDArray[np.float32]]]:
+    """Streams the name or fact embeddings of the groups as blocks of at most batch_size rows."""
+    async for batch in model.scan(driver, group_ids, batch_size, with_embeddings=True):
+        uuids, block = embedding_block(batch)
+        if uuids:
+            yield uuids, block
+
+
+async def export_graph(
+    driver: GraphDriver,
+    group_ids: list[str],
+    path: str,
+    batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+    with_embeddings: bool = True,
+) -> ExportStats:
+    """
+    Writes the nodes and edges of the groups to a JSON Lines file, one batch at a time.
+
+    The first line is a header, every other line holds one record as {"type": ..., "data": ...}
+    with the model's JSON dump. Without with_embeddings the file is much smaller, and the
+    embeddings are recomputed by import_graph.
+    """
+    stats = ExportStats()
+    with open(path, 'wb') as file:
+        header = {'format': EXPORT_FORMAT, 'version': EXPORT_VERSION, 'group_ids': group_ids}
+        await asyncio.to_thread(file.write, dumps(header) + b'\n')
+
+        scans: dict[str, AsyncIterator[list[Any]]] = {
+            'episodes': EpisodicNode.scan(driver, group_ids, batch_size),
+            'entities': EntityNode.scan(driver, group_ids, batch_size, with_embeddings),
+            'communities': CommunityNode.scan(driver, group_ids, batch_size),
+            'episodic_edges': EpisodicEdge.scan(driver, group_ids, batch_size),
+            'entity_edges': EntityEdge.scan(driver, group_ids, batch_size, with_embeddings),
+            'community_edges': CommunityEdge.scan(driver, group_ids, batch_size),
+        }
+        exclude = None if with_embeddings else {'name_embedding', 'fact_embedding'}
+        for record_type, scan in scans.items():
+            async for batch in scan:
+                lines = [
+                    dumps(
+                        {'type': record_type, 'data': item.model_dump(mode='json', exclude=exclude)}
+                    )
+                    + b'\n'
+                    for item in batch
+                ]
+                await asyncio.to_thread(file.writelines, lines)
+                setattr(stats, record_type, getattr(stats, record_type) + len(batch))
+
+    logger.info(f'Exported {stats} from groups {group_ids} to {path}')
+    return stats
+
+
+def _read_lines(file: IO[bytes], count: int) -> list[bytes]:
+    lines = []
+    for line in file:
+        if line.strip():
+            lines.append(line)
+            if len(lines) == count:
+                break
+    return lines
+
+
+async def _write_chunk(
+    driver: GraphDriver, embedder: EmbedderClient, chunk: dict[str, list[Any]]
+) -> None:
+    if chunk['episodes'] or chunk['entities'] or chunk['episodic_edges'] or chunk['entity_edges']:
+        await add_nodes_and_edges_bulk(
+            driver,
+            chunk['episodes'],
+            chunk['episodic_edges'],
+            chunk['entities'],
+            chunk['entity_edges'],
+            embedder,
+        )
+
+    communities: list[CommunityNode] = chunk['communities']
+    await semaphore_gather(
+        *[
+            community.generate_name_embedding(embedder)
+            for community in communities
+            if community.name_embedding is None
+        ]
+    )
+    await semaphore_gather(*[community.save(driver) for community in communities])
+    await semaphore_gather(*[edge.save(driver) for edge in chunk['community_edges']])
+
+
+async def import_graph(
+    driver: GraphDriver,
+    path: str,
+    embedder: EmbedderClient,
+    batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+) -> ExportStats:
+    """
+    Loads a file written by export_graph, batch_size records per write.
+
+    The file is read incrementally. Records are saved by uuid, so importing a file twice leaves a
+    single copy. Missing embeddings are created with the embedder.
+    """
+    stats = ExportStats()
+    with open(path, 'rb') as file:
+        header_lines = await asyncio.to_thread(_read_lines, file, 1)
+        header = json.loads(header_lines[0]) if header_lines else {}
+        if header.get('format') != EXPORT_FORMAT or header.get('version') != EXPORT_VERSION:
+            raise ValueError(f'{path} is not a version {EXPORT_VERSION} {EXPORT_FORMAT} file')
+
+        while lines := await asyncio.to_thread(_read_lines, file, batch_size):
+            chunk: dict[str, list[Any]] = {record_type: [] for record_type in EXPORT_MODELS}
+            for line in lines:
+                record = json.loads(line)
+                chunk[record['type']].append(
+                    EXPORT_MODELS[record['type']].model_validate(record['data'])
+                )
+
+            await _write_chunk(driver, embedder, chunk)
+            for record_type, items in chunk.items():
+                setattr(stats, record_type, getattr(stats, record_type) + len(items))
+
+    logger.info(f'Imported {stats} from {path}')
+    return stats
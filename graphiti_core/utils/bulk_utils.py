@@ -15,14 +15,20 @@ limitations under the License.
 """
 
 import logging
+import os
 import typing
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from datetime import datetime
 
 import numpy as np
+from numpy.typing import NDArray
 from pydantic import BaseModel, Field
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
 from typing_extensions import Any
 
-from graphiti_core.driver.driver import GraphDriver, GraphDriverSession
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, driver_operation
 from graphiti_core.edges import Edge, EntityEdge, EpisodicEdge, create_entity_edge_embeddings
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.graphiti_types import GraphitiClients
@@ -36,13 +42,20 @@ from graphiti_core.models.nodes.node_db_queries import (
     get_entity_node_save_bulk_query,
 )
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode, create_entity_node_embeddings
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import (
+    DEFAULT_MIN_SCORE,
+    get_relevant_edges,
+    get_relevant_nodes,
+)
+from graphiti_core.telemetry.tracing import traced
 from graphiti_core.utils.maintenance.edge_operations import (
     extract_edges,
     resolve_extracted_edge,
 )
 from graphiti_core.utils.maintenance.graph_data_operations import (
     EPISODE_WINDOW_LEN,
-    retrieve_episodes,
+    retrieve_episodes_in_window,
 )
 from graphiti_core.utils.maintenance.node_operations import (
     extract_nodes,
@@ -52,6 +65,10 @@ from graphiti_core.utils.maintenance.node_operations import (
 logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 10
+# limits of one add_nodes_and_edges_bulk transaction, in rows and approximate payload bytes
+BULK_WRITE_CHUNK_ROWS = int(os.getenv('BULK_WRITE_CHUNK_ROWS', 1000))
+BULK_WRITE_CHUNK_BYTES = int(os.getenv('BULK_WRITE_CHUNK_BYTES', 8 * 1024 * 1024))
+BULK_WRITE_ATTEMPTS = 3
 
 
 class RawEpisode(BaseModel):
@@ -63,63 +80,103 @@ class RawEpisode(BaseModel):
     reference_time: datetime
 
 
+@traced('graphiti.retrieve_previous_episodes_bulk')
 async def retrieve_previous_episodes_bulk(
     driver: GraphDriver, episodes: list[EpisodicNode]
 ) -> list[tuple[EpisodicNode, list[EpisodicNode]]]:
-    previous_episodes_list = await semaphore_gather(
+    """
+    Retrieve the previous-episode context (the last EPISODE_WINDOW_LEN episodes up to and including
+    each episode's valid_at) for a batch of episodes.
+
+    Rather than running one LIMIT query per episode, the union of the needed windows is fetched once
+    per group and the per-episode windows are sliced locally. Episodes from the batch itself are
+    served from memory instead of being read back from the database.
+    """
+    episodes_by_group: dict[str, list[EpisodicNode]] = defaultdict(list)
+    for episode in episodes:
+        episodes_by_group[episode.group_id].append(episode)
+
+    group_ids = list(episodes_by_group.keys())
+    fetched_episodes_by_group: list[list[EpisodicNode]] = await semaphore_gather(
         *[
-            retrieve_episodes(
-                driver, episode.valid_at, last_n=EPISODE_WINDOW_LEN, group_ids=[episode.group_id]
+            retrieve_episodes_in_window(
+                driver,
+                group_id,
+                min(episode.valid_at for episode in episodes_by_group[group_id]),
+                max(episode.valid_at for episode in episodes_by_group[group_id]),
+                last_n=EPISODE_WINDOW_LEN,
+                exclude_uuids=[episode.uuid for episode in episodes_by_group[group_id]],
             )
-            for episode in episodes
+            for group_id in group_ids
         ]
     )
+
+    previous_episodes_map: dict[str, list[EpisodicNode]] = {}
+    for group_id, fetched_episodes in zip(group_ids, fetched_episodes_by_group, strict=True):
+        # stable sort keeps the database order for ties, with in-memory episodes after them
+        timeline = sorted(fetched_episodes + episodes_by_group[group_id], key=lambda e: e.valid_at)
+        timeline_valid_ats = [e.valid_at for e in timeline]
+        for episode in episodes_by_group[group_id]:
+            end = bisect_right(timeline_valid_ats, episode.valid_at)
+            previous_episodes_map[episode.uuid] = timeline[max(0, end - EPISODE_WINDOW_LEN) : end]
+
     episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]] = [
-        (episode, previous_episodes_list[i]) for i, episode in enumerate(episodes)
+        (episode, previous_episodes_map[episode.uuid]) for episode in episodes
     ]
 
     return episode_tuples
 
 
-async def add_nodes_and_edges_bulk(
-    driver: GraphDriver,
-    episodic_nodes: list[EpisodicNode],
-    episodic_edges: list[EpisodicEdge],
-    entity_nodes: list[EntityNode],
-    entity_edges: list[EntityEdge],
-    embedder: EmbedderClient,
-):
-    session = driver.session()
-    try:
-        await session.execute_write(
-            add_nodes_and_edges_bulk_tx,
-            episodic_nodes,
-            episodic_edges,
-            entity_nodes,
-            entity_edges,
-            embedder,
-            driver=driver,
-        )
-    finally:
-        await session.close()
-
-
-async def add_nodes_and_edges_bulk_tx(
-    tx: GraphDriverSession,
-    episodic_nodes: list[EpisodicNode],
-    episodic_edges: list[EpisodicEdge],
-    entity_nodes: list[EntityNode],
-    entity_edges: list[EntityEdge],
-    embedder: EmbedderClient,
-    driver: GraphDriver,
-):
+def _value_bytes(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, list | tuple):
+        # embeddings dominate the payload, price their floats without visiting each one
+        if value and isinstance(value[0], float):
+            return 8 * len(value)
+        return sum(_value_bytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(len(key) + _value_bytes(item) for key, item in value.items())
+    return 8
+
+
+def chunk_rows(
+    rows: list[dict[str, Any]],
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Splits query parameter rows into chunks of at most max_rows rows and roughly max_bytes of
+    payload, BULK_WRITE_CHUNK_ROWS and BULK_WRITE_CHUNK_BYTES by default. A row larger than
+    max_bytes gets a chunk of its own.
+    """
+    max_rows = max_rows or BULK_WRITE_CHUNK_ROWS
+    max_bytes = max_bytes or BULK_WRITE_CHUNK_BYTES
+    chunks: list[list[dict[str, Any]]] = []
+    chunk: list[dict[str, Any]] = []
+    chunk_bytes = 0
+    for row in rows:
+        row_bytes = _value_bytes(row)
+        if chunk and (len(chunk) >= max_rows or chunk_bytes + row_bytes > max_bytes):
+            chunks.append(chunk)
+            chunk, chunk_bytes = [], 0
+        chunk.append(row)
+        chunk_bytes += row_bytes
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def episodic_node_rows(episodic_nodes: list[EpisodicNode]) -> list[dict[str, Any]]:
     episodes = [dict(episode) for episode in episodic_nodes]
     for episode in episodes:
         episode['source'] = str(episode['source'].value)
+    return episodes
+
+
+def entity_node_rows(entity_nodes: list[EntityNode]) -> list[dict[str, Any]]:
     nodes: list[dict[str, Any]] = []
     for node in entity_nodes:
-        if node.name_embedding is None:
-            await node.generate_name_embedding(embedder)
         entity_data: dict[str, Any] = {
             'uuid': node.uuid,
             'name': node.name,
@@ -132,11 +189,12 @@ async def add_nodes_and_edges_bulk_tx(
         entity_data.update(node.attributes or {})
         entity_data['labels'] = list(set(node.labels + ['Entity']))
         nodes.append(entity_data)
+    return nodes
 
+
+def entity_edge_rows(entity_edges: list[EntityEdge]) -> list[dict[str, Any]]:
     edges: list[dict[str, Any]] = []
     for edge in entity_edges:
-        if edge.fact_embedding is None:
-            await edge.generate_embedding(embedder)
         edge_data: dict[str, Any] = {
             'uuid': edge.uuid,
             'source_node_uuid': edge.source_node_uuid,
@@ -154,6 +212,130 @@ async def add_nodes_and_edges_bulk_tx(
 
         edge_data.update(edge.attributes or {})
         edges.append(edge_data)
+    return edges
+
+
+async def execute_write_with_retry(driver: GraphDriver, func, *args, **kwargs) -> Any:
+    """
+    Runs func in a write transaction of its own session, retrying errors the driver reports as
+    transient. Each attempt starts a new transaction, so func must be safe to run again.
+    """
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception(driver.is_transient_error),
+        stop=stop_after_attempt(BULK_WRITE_ATTEMPTS),
+        wait=wait_random_exponential(multiplier=0.5, max=10),
+        before_sleep=lambda state: logger.warning(
+            f'Retrying bulk write after {state.outcome.exception() if state.outcome else None}'
+        ),
+        reraise=True,
+    ):
+        with attempt:
+            session = driver.session()
+            try:
+                return await session.execute_write(func, *args, **kwargs)
+            finally:
+                await session.close()
+
+
+async def _run_tx(tx: GraphDriverSession, query: Any, **params: Any):
+    await tx.run(query, **params)
+
+
+@traced('graphiti.add_nodes_and_edges_bulk')
+@driver_operation('add_nodes_and_edges_bulk')
+async def add_nodes_and_edges_bulk(
+    driver: GraphDriver,
+    episodic_nodes: list[EpisodicNode],
+    episodic_edges: list[EpisodicEdge],
+    entity_nodes: list[EntityNode],
+    entity_edges: list[EntityEdge],
+    embedder: EmbedderClient,
+):
+    """
+    Saves the nodes and edges with bulk UNWIND queries.
+
+    Missing embeddings are created with batched embedder calls before any transaction is opened.
+    Loads within BULK_WRITE_CHUNK_ROWS rows and BULK_WRITE_CHUNK_BYTES bytes are written in a
+    single transaction. Larger loads are split into chunks of their own transactions: episodes
+    and entity nodes are written before the edges between them, and the chunks of one kind run
+    up to driver.bulk_write_concurrency at a time. A chunk that fails with a transient error is
+    retried on its own, and chunks written before a permanent failure are kept.
+    """
+    await semaphore_gather(
+        create_entity_node_embeddings(
+            embedder, [node for node in entity_nodes if node.name_embedding is None]
+        ),
+        create_entity_edge_embeddings(
+            embedder, [edge for edge in entity_edges if edge.fact_embedding is None]
+        ),
+    )
+
+    episodes = episodic_node_rows(episodic_nodes)
+    nodes = entity_node_rows(entity_nodes)
+    episodic_edge_rows = [edge.model_dump() for edge in episodic_edges]
+    edges = entity_edge_rows(entity_edges)
+
+    all_rows = episodes + nodes + episodic_edge_rows + edges
+    if len(chunk_rows(all_rows)) <= 1:
+        await execute_write_with_retry(
+            driver,
+            add_nodes_and_edges_bulk_tx,
+            episodic_nodes,
+            episodic_edges,
+            entity_nodes,
+            entity_edges,
+            embedder,
+            driver,
+        )
+        return
+
+    phases: list[list[tuple[Any, dict[str, Any]]]] = [
+        [(EPISODIC_NODE_SAVE_BULK, {'episodes': chunk}) for chunk in chunk_rows(episodes)],
+        [
+            (get_entity_node_save_bulk_query(driver.provider, chunk), {'nodes': chunk})
+            for chunk in chunk_rows(nodes)
+        ],
+        [
+            (EPISODIC_EDGE_SAVE_BULK, {'episodic_edges': chunk})
+            for chunk in chunk_rows(episodic_edge_rows)
+        ],
+        [
+            (get_entity_edge_save_bulk_query(driver.provider), {'entity_edges': chunk})
+            for chunk in chunk_rows(edges)
+        ],
+    ]
+    logger.debug(
+        f'Writing {len(all_rows)} rows in {sum(len(phase) for phase in phases)} transactions'
+    )
+    for phase in phases:
+        await semaphore_gather(
+            *[
+                execute_write_with_retry(driver, _run_tx, query, **params)
+                for query, params in phase
+            ],
+            max_coroutines=driver.bulk_write_concurrency,
+        )
+
+
+async def add_nodes_and_edges_bulk_tx(
+    tx: GraphDriverSession,
+    episodic_nodes: list[EpisodicNode],
+    episodic_edges: list[EpisodicEdge],
+    entity_nodes: list[EntityNode],
+    entity_edges: list[EntityEdge],
+    embedder: EmbedderClient,
+    driver: GraphDriver,
+):
+    for node in entity_nodes:
+        if node.name_embedding is None:
+            await node.generate_name_embedding(embedder)
+    for edge in entity_edges:
+        if edge.fact_embedding is None:
+            await edge.generate_embedding(embedder)
+
+    episodes = episodic_node_rows(episodic_nodes)
+    nodes = entity_node_rows(entity_nodes)
+    edges = entity_edge_rows(entity_edges)
 
     await tx.run(EPISODIC_NODE_SAVE_BULK, episodes=episodes)
     entity_node_save_bulk = get_entity_node_save_bulk_query(driver.provider, nodes)
@@ -165,6 +347,7 @@ async def add_nodes_and_edges_bulk_tx(
     await tx.run(entity_edge_save_bulk, entity_edges=edges)
 
 
+@traced('graphiti.extract_nodes_and_edges_bulk')
 async def extract_nodes_and_edges_bulk(
     clients: GraphitiClients,
     episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]],
@@ -198,6 +381,7 @@ async def extract_nodes_and_edges_bulk(
     return extracted_nodes_bulk, extracted_edges_bulk
 
 
+@traced('graphiti.dedupe_nodes_bulk')
 async def dedupe_nodes_bulk(
     clients: GraphitiClients,
     extracted_nodes: list[list[EntityNode]],
@@ -285,6 +469,7 @@ async def dedupe_nodes_bulk(
     return nodes_by_episode, compressed_map
 
 
+@traced('graphiti.dedupe_edges_bulk')
 async def dedupe_edges_bulk(
     clients: GraphitiClients,
     extracted_edges: list[list[EntityEdge]],
@@ -425,3 +610,263 @@ def resolve_edge_pointers(edges: list[E], uuid_map: dict[str, str]):
         edge.target_node_uuid = uuid_map.get(target_uuid, target_uuid)
 
     return edges
+
+
+Triplet = tuple[EntityNode, EntityEdge, EntityNode]
+
+TRIPLET_CHUNK_SIZE = 500
+# cosine similarity above which two entity names or two facts are merged without asking the LLM
+NODE_MATCH_THRESHOLD = 0.95
+EDGE_MATCH_THRESHOLD = 0.95
+
+
+class AddTripletsBulkResults(BaseModel):
+    nodes_created: int = 0
+    nodes_merged: int = 0
+    nodes_resolved_by_llm: int = 0
+    edges_created: int = 0
+    edges_merged: int = 0
+
+
+def normalize_name(name: str) -> str:
+    return ' '.join(name.casefold().split())
+
+
+async def _triplet_chunks(
+    triplets: Iterable[Triplet] | AsyncIterable[Triplet], chunk_size: int
+) -> AsyncIterator[list[Triplet]]:
+    chunk: list[Triplet] = []
+    if isinstance(triplets, AsyncIterable):
+        async for triplet in triplets:
+            chunk.append(triplet)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for triplet in triplets:
+            chunk.append(triplet)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _normalize_rows(matrix: NDArray[np.float32]) -> NDArray[np.float32]:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms != 0)
+
+
+def _name_embeddings(nodes: list[EntityNode], dim: int) -> NDArray[np.float32]:
+    matrix = np.zeros((len(nodes), dim), dtype=np.float32)
+    for i, node in enumerate(nodes):
+        if node.name_embedding is not None and len(node.name_embedding) == dim:
+            matrix[i] = node.name_embedding
+    return _normalize_rows(matrix)
+
+
+def match_existing_node(
+    node: EntityNode,
+    candidates: list[EntityNode],
+    threshold: float = NODE_MATCH_THRESHOLD,
+    ambiguity_floor: float = DEFAULT_MIN_SCORE,
+) -> tuple[EntityNode | None, bool]:
+    """
+    Returns the candidate that node is a duplicate of, and whether the match is ambiguous.
+
+    A candidate matches when its normalized name equals the node's or its name embedding is at
+    least threshold similar. Without a match, the best candidate scoring between ambiguity_floor
+    and threshold makes the node ambiguous.
+    """
+    name = normalize_name(node.name)
+    for candidate in candidates:
+        if normalize_name(candidate.name) == name:
+            return candidate, False
+
+    if node.name_embedding is None or not candidates:
+        return None, False
+    dim = len(node.name_embedding)
+    vector = _name_embeddings([node], dim)[0]
+    scores = _name_embeddings(candidates, dim) @ vector
+    best = int(np.argmax(scores))
+    if scores[best] >= threshold:
+        return candidates[best], False
+    return None, bool(scores[best] >= ambiguity_floor)
+
+
+def _merge_similar_nodes(nodes: list[EntityNode], threshold: float) -> list[tuple[str, str]]:
+    # pairs of new nodes whose names are near duplicates of each other
+    embedded = [node for node in nodes if node.name_embedding is not None]
+    if len(embedded) < 2:
+        return []
+    matrix = _name_embeddings(embedded, len(embedded[0].name_embedding or []))
+    scores = np.triu(matrix @ matrix.T, k=1)
+    return [
+        (embedded[i].uuid, embedded[j].uuid)
+        for i, j in zip(*np.nonzero(scores >= threshold), strict=True)
+        if embedded[i].group_id == embedded[j].group_id
+    ]
+
+
+async def _resolve_ambiguous_nodes(
+    clients: GraphitiClients, ambiguous: list[tuple[EntityNode, list[EntityNode]]]
+) -> dict[str, str]:
+    chunks = [ambiguous[i : i + CHUNK_SIZE] for i in range(0, len(ambiguous), CHUNK_SIZE)]
+    resolutions = await semaphore_gather(
+        *[
+            resolve_extracted_nodes(
+                clients,
+                [node for node, _ in chunk],
+                existing_nodes_override=list(
+                    {
+                        candidate.uuid: candidate
+                        for _, candidates in chunk
+                        for candidate in candidates
+                    }.values()
+                ),
+            )
+            for chunk in chunks
+        ]
+    )
+    return {
+        uuid: resolved_uuid
+        for _, uuid_map, _ in resolutions
+        for uuid, resolved_uuid in uuid_map.items()
+        if uuid != resolved_uuid
+    }
+
+
+async def _add_triplet_chunk(
+    clients: GraphitiClients,
+    triplets: list[Triplet],
+    results: AddTripletsBulkResults,
+    node_threshold: float,
+    edge_threshold: float,
+    llm_fallback: bool,
+):
+    driver = clients.driver
+
+    # nodes repeated within the chunk, by uuid or by normalized name, are resolved once
+    uuid_map: dict[str, str] = {}
+    unique_nodes: dict[tuple[str, str], EntityNode] = {}
+    for source_node, _, target_node in triplets:
+        for node in (source_node, target_node):
+            key = (node.group_id, normalize_name(node.name))
+            canonical = unique_nodes.setdefault(key, node)
+            if canonical.uuid != node.uuid:
+                uuid_map[node.uuid] = canonical.uuid
+    nodes = list(unique_nodes.values())
+    edges = [edge for _, edge, _ in triplets]
+
+    await semaphore_gather(
+        create_entity_node_embeddings(
+            clients.embedder, [node for node in nodes if node.name_embedding is None]
+        ),
+        create_entity_edge_embeddings(
+            clients.embedder, [edge for edge in edges if edge.fact_embedding is None]
+        ),
+    )
+
+    nodes_by_group: dict[str, list[EntityNode]] = defaultdict(list)
+    for node in nodes:
+        nodes_by_group[node.group_id].append(node)
+    candidates_by_group: list[list[list[EntityNode]]] = await semaphore_gather(
+        *[
+            get_relevant_nodes(driver, group_nodes, SearchFilters())
+            for group_nodes in nodes_by_group.values()
+        ]
+    )
+
+    resolved_map: dict[str, str] = {}
+    new_nodes: list[EntityNode] = []
+    ambiguous: list[tuple[EntityNode, list[EntityNode]]] = []
+    for group_nodes, group_candidates in zip(
+        nodes_by_group.values(), candidates_by_group, strict=True
+    ):
+        for node, candidates in zip(group_nodes, group_candidates, strict=True):
+            match, is_ambiguous = match_existing_node(node, candidates, node_threshold)
+            if match is not None:
+                resolved_map[node.uuid] = match.uuid
+            elif is_ambiguous and llm_fallback:
+                ambiguous.append((node, candidates))
+            else:
+                new_nodes.append(node)
+
+    if ambiguous:
+        llm_map = await _resolve_ambiguous_nodes(clients, ambiguous)
+        resolved_map.update(llm_map)
+        new_nodes += [node for node, _ in ambiguous if node.uuid not in llm_map]
+        results.nodes_resolved_by_llm += len(ambiguous)
+
+    merged_new_nodes = compress_uuid_map(_merge_similar_nodes(new_nodes, node_threshold))
+    resolved_map.update((uuid, root) for uuid, root in merged_new_nodes.items() if uuid != root)
+    new_nodes = [node for node in new_nodes if node.uuid not in resolved_map]
+    uuid_map = {
+        uuid: resolved_map.get(canonical, canonical) for uuid, canonical in uuid_map.items()
+    }
+    uuid_map.update(resolved_map)
+    resolve_edge_pointers(edges, uuid_map)
+
+    # edges repeated within the chunk are written once
+    unique_edges: dict[tuple[str, str, str, str, str], EntityEdge] = {}
+    for edge in edges:
+        key = (
+            edge.group_id,
+            edge.source_node_uuid,
+            edge.target_node_uuid,
+            edge.name,
+            normalize_name(edge.fact),
+        )
+        unique_edges.setdefault(key, edge)
+
+    # only edges between two existing nodes can duplicate an edge in the graph
+    new_node_uuids = {node.uuid for node in new_nodes}
+    new_edges: list[EntityEdge] = []
+    existing_pairs: list[EntityEdge] = []
+    for edge in unique_edges.values():
+        if edge.source_node_uuid in new_node_uuids or edge.target_node_uuid in new_node_uuids:
+            new_edges.append(edge)
+        else:
+            existing_pairs.append(edge)
+    related_edges = await get_relevant_edges(
+        driver, existing_pairs, SearchFilters(), min_score=edge_threshold
+    )
+    for edge, related in zip(existing_pairs, related_edges, strict=True):
+        if not any(candidate.name == edge.name for candidate in related):
+            new_edges.append(edge)
+
+    await add_nodes_and_edges_bulk(driver, [], [], new_nodes, new_edges, clients.embedder)
+
+    results.nodes_created += len(new_nodes)
+    results.nodes_merged += len({node.uuid for s, _, t in triplets for node in (s, t)}) - len(
+        new_nodes
+    )
+    results.edges_created += len(new_edges)
+    results.edges_merged += len(edges) - len(new_edges)
+
+
+@traced('graphiti.add_triplets_bulk')
+async def add_triplets_bulk(
+    clients: GraphitiClients,
+    triplets: Iterable[Triplet] | AsyncIterable[Triplet],
+    chunk_size: int = TRIPLET_CHUNK_SIZE,
+    node_threshold: float = NODE_MATCH_THRESHOLD,
+    edge_threshold: float = EDGE_MATCH_THRESHOLD,
+    llm_fallback: bool = False,
+) -> AddTripletsBulkResults:
+    """
+    Adds (source node, edge, target node) triplets to the graph, chunk_size triplets at a time.
+
+    Names and facts are embedded with one batch call per chunk. Nodes are deduplicated against
+    each other and the graph by normalized name or name embedding similarity, edges by their
+    endpoints, name and fact similarity, without calling the LLM. With llm_fallback, nodes that
+    are similar to an existing node but below node_threshold are resolved by the LLM. Each chunk
+    is written in a single transaction, so later chunks are deduplicated against earlier ones.
+    """
+    results = AddTripletsBulkResults()
+    async for chunk in _triplet_chunks(triplets, chunk_size):
+        await _add_triplet_chunk(
+            clients, chunk, results, node_threshold, edge_threshold, llm_fallback
+        )
+        logger.debug(f'Added triplet chunk of {len(chunk)}: {results}')
+    return results
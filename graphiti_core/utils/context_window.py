@@ -0,0 +1,210 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+import math
+import os
+from collections import OrderedDict
+
+from pydantic import BaseModel, Field
+
+from graphiti_core.helpers import semaphore_gather
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.llm_client.config import ModelSize
+from graphiti_core.llm_client.usage import usage_stage
+from graphiti_core.nodes import EpisodicNode
+from graphiti_core.prompts import prompt_library
+from graphiti_core.prompts.summarize_nodes import EpisodeSummary
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_CACHE_SIZE = int(os.getenv('CONTEXT_CACHE_SIZE', 1024))
+# Episodes shorter than this are never summarized, truncation is cheaper than an LLM call
+MIN_SUMMARY_TOKENS = int(os.getenv('MIN_SUMMARY_TOKENS', 200))
+TRUNCATION_MARKER = '…'
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate. CJK characters are roughly one token each, everything else
+    averages about four characters per token.
+    """
+    cjk = sum(1 for char in text if ord(char) >= 0x2E80)
+    return cjk + math.ceil((len(text) - cjk) / 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    if max_tokens <= 0:
+        return ''
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # binary search for the longest prefix that fits the budget
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) < max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+
+    return text[:low] + TRUNCATION_MARKER
+
+
+class PreviousEpisodesPolicy(BaseModel):
+    max_episodes: int = Field(description='maximum number of most recent episodes to include')
+    token_budget: int = Field(description='total token budget shared by the included episodes')
+
+
+DEFAULT_POLICY = PreviousEpisodesPolicy(max_episodes=10, token_budget=2000)
+
+DEFAULT_POLICIES: dict[str, PreviousEpisodesPolicy] = {
+    'extract_nodes': PreviousEpisodesPolicy(max_episodes=10, token_budget=2000),
+    'extract_nodes_reflexion': PreviousEpisodesPolicy(max_episodes=5, token_budget=1000),
+    'extract_edges': PreviousEpisodesPolicy(max_episodes=10, token_budget=2000),
+    'dedupe_nodes': PreviousEpisodesPolicy(max_episodes=5, token_budget=1000),
+    'extract_attributes': PreviousEpisodesPolicy(max_episodes=3, token_budget=500),
+}
+
+
+class ContextWindowManager:
+    """
+    Fits previous episodes into a per-prompt token budget.
+
+    Each prompt type has a policy saying how many of the most recent episodes to include and
+    how many tokens they may use in total. Episodes that do not fit are replaced by a cached
+    LLM summary when one is available and truncated otherwise.
+    """
+
+    def __init__(
+        self,
+        policies: dict[str, PreviousEpisodesPolicy] | None = None,
+        llm_client: LLMClient | None = None,
+        summary_tokens: int = 200,
+        cache_size: int = CONTEXT_CACHE_SIZE,
+    ):
+        self.policies = {**DEFAULT_POLICIES, **(policies or {})}
+        self.llm_client = llm_client
+        self.summary_tokens = summary_tokens
+        self.cache_size = cache_size
+        self._summaries: OrderedDict[str, str] = OrderedDict()
+        self._fitted: OrderedDict[tuple[str, int], str] = OrderedDict()
+
+    def get_policy(self, prompt_type: str) -> PreviousEpisodesPolicy:
+        return self.policies.get(prompt_type, DEFAULT_POLICY)
+
+    def _cache_put(self, cache: OrderedDict, key, value: str):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def _fit_episode(self, episode: EpisodicNode, max_tokens: int) -> str:
+        if estimate_tokens(episode.content) <= max_tokens:
+            return episode.content
+
+        key = (episode.uuid, max_tokens)
+        fitted = self._fitted.get(key)
+        if fitted is not None:
+            self._fitted.move_to_end(key)
+            return fitted
+
+        summary = self._summaries.get(episode.uuid)
+        if summary is not None and estimate_tokens(summary) <= max_tokens:
+            fitted = summary
+        else:
+            fitted = truncate_to_tokens(summary or episode.content, max_tokens)
+
+        self._cache_put(self._fitted, key, fitted)
+        return fitted
+
+    def get_previous_episodes(
+        self, prompt_type: str, previous_episodes: list[EpisodicNode] | None
+    ) -> list[str]:
+        if not previous_episodes:
+            return []
+
+        policy = self.get_policy(prompt_type)
+        if policy.max_episodes <= 0:
+            return []
+
+        # previous episodes are ordered oldest first, keep the most recent ones
+        episodes = previous_episodes[-policy.max_episodes :]
+        sizes = [estimate_tokens(episode.content) for episode in episodes]
+
+        # Water-fill the budget: short episodes are kept whole and the tokens they leave unused
+        # are shared among the longer ones.
+        allowances = [0] * len(episodes)
+        remaining_budget = policy.token_budget
+        remaining = len(episodes)
+        for i in sorted(range(len(episodes)), key=lambda idx: sizes[idx]):
+            share = remaining_budget // remaining
+            allowances[i] = min(sizes[i], share)
+            remaining_budget -= allowances[i]
+            remaining -= 1
+
+        return [
+            self._fit_episode(episode, allowance)
+            for episode, allowance in zip(episodes, allowances, strict=True)
+            if allowance > 0
+        ]
+
+    async def summarize_episodes(self, episodes: list[EpisodicNode]):
+        """
+        Summarize long episodes that are not yet cached so later prompts can use the summary
+        instead of a truncated prefix. Does nothing without an LLM client.
+        """
+        if self.llm_client is None:
+            return
+
+        pending = [
+            episode
+            for episode in episodes
+            if episode.uuid not in self._summaries
+            and estimate_tokens(episode.content) > max(self.summary_tokens, MIN_SUMMARY_TOKENS)
+        ]
+        if not pending:
+            return
+
+        summaries = await semaphore_gather(
+            *[self._summarize_episode(episode) for episode in pending]
+        )
+        for episode, summary in zip(pending, summaries, strict=True):
+            if summary:
+                self._cache_put(self._summaries, episode.uuid, summary)
+                # drop truncations computed before the summary existed
+                for key in [key for key in self._fitted if key[0] == episode.uuid]:
+                    del self._fitted[key]
+
+    async def _summarize_episode(self, episode: EpisodicNode) -> str:
+        assert self.llm_client is not None
+        context = {'episode_content': episode.content, 'max_words': self.summary_tokens}
+        try:
+            with usage_stage('summarize_episode'):
+                llm_response = await self.llm_client.generate_response(
+                    prompt_library.summarize_nodes.summarize_episode(context),
+                    response_model=EpisodeSummary,
+                    model_size=ModelSize.small,
+                )
+        except Exception as e:
+            logger.warning(f'Failed to summarize episode {episode.uuid}: {e}')
+            return ''
+
+        return llm_response.get('summary', '')
+
+    def clear(self):
+        self._summaries.clear()
+        self._fitted.clear()
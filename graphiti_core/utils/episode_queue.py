@@ -0,0 +1,468 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+EpisodeStatus = Literal['pending', 'running', 'completed', 'failed']
+
+DEFAULT_MAX_ATTEMPTS = 3
+# seconds before the first retry of a failed episode; doubled on every further attempt
+DEFAULT_RETRY_DELAY = 5.0
+# completed episodes are kept this long so re-submitting their uuid stays a no-op
+DEFAULT_RETENTION = 7 * 24 * 3600.0
+
+
+class QueuedEpisode(BaseModel):
+    seq: int = Field(description='position in the queue; episodes of a group run in seq order')
+    uuid: str = Field(description='idempotency key, the uuid of the episode to add')
+    group_id: str
+    job_id: str | None = Field(default=None, description='submission the episode belongs to')
+    payload: dict[str, Any]
+    status: EpisodeStatus = 'pending'
+    attempts: int = 0
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class NewEpisode(BaseModel):
+    uuid: str
+    group_id: str
+    job_id: str | None = None
+    payload: dict[str, Any]
+
+
+class EpisodeQueue(ABC):
+    """
+    Durable queue of episodes waiting to be added to the graph, with at-least-once delivery.
+
+    Episodes of one group are claimed in the order they were enqueued and never by two workers
+    at once. Claimed episodes must be completed, failed or released; episodes that were running
+    when the process stopped are returned to the queue by recover().
+    """
+
+    @abstractmethod
+    async def enqueue(self, episodes: list[NewEpisode]) -> list[QueuedEpisode]:
+        """Add episodes; an episode whose uuid is already queued or done is returned unchanged."""
+
+    @abstractmethod
+    async def claim(self, limit: int) -> list[QueuedEpisode]:
+        """Claim up to limit of the next pending episodes of the longest-waiting idle group."""
+
+    @abstractmethod
+    async def complete(self, episodes: list[QueuedEpisode]):
+        pass
+
+    @abstractmethod
+    async def fail(self, episodes: list[QueuedEpisode], error: str):
+        """Schedule a retry with backoff, or mark episodes failed once out of attempts."""
+
+    @abstractmethod
+    async def release(self, episodes: list[QueuedEpisode]):
+        """Return claimed episodes to the queue without counting an attempt."""
+
+    @abstractmethod
+    async def recover(self) -> int:
+        """Requeue episodes left running by a previous process. Returns their number."""
+
+    @abstractmethod
+    async def get(self, uuid: str) -> QueuedEpisode | None:
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> list[QueuedEpisode]:
+        pass
+
+    @abstractmethod
+    async def counts(self, group_id: str | None = None) -> dict[str, dict[EpisodeStatus, int]]:
+        """Number of episodes per group and status."""
+
+    @abstractmethod
+    async def close(self):
+        pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    uuid TEXT NOT NULL UNIQUE,
+    group_id TEXT NOT NULL,
+    job_id TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    available_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS episodes_group_status ON episodes (group_id, status, seq);
+CREATE INDEX IF NOT EXISTS episodes_status ON episodes (status);
+CREATE INDEX IF NOT EXISTS episodes_job ON episodes (job_id);
+"""
+
+_COLUMNS = 'seq, uuid, group_id, job_id, payload, status, attempts, error, created_at, updated_at'
+
+# the next group to work on: the one whose oldest pending episode is oldest, is due, and has
+# no episode running
+_NEXT_GROUP = """
+WITH heads AS (
+    SELECT group_id, MIN(seq) AS seq FROM episodes WHERE status = 'pending' GROUP BY group_id
+)
+SELECT h.group_id FROM heads h JOIN episodes e ON e.seq = h.seq
+WHERE e.available_at <= ?
+    AND NOT EXISTS (
+        SELECT 1 FROM episodes r WHERE r.group_id = h.group_id AND r.status = 'running'
+    )
+ORDER BY h.seq
+LIMIT 1
+"""
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def _row_to_episode(row: tuple) -> QueuedEpisode:
+    seq, uuid, group_id, job_id, payload, status, attempts, error, created_at, updated_at = row
+    return QueuedEpisode(
+        seq=seq,
+        uuid=uuid,
+        group_id=group_id,
+        job_id=job_id,
+        payload=json.loads(payload),
+        status=status,
+        attempts=attempts,
+        error=error,
+        created_at=_to_datetime(created_at),
+        updated_at=_to_datetime(updated_at),
+    )
+
+
+class SQLiteEpisodeQueue(EpisodeQueue):
+    """
+    EpisodeQueue in a local SQLite database in WAL mode. A database file must only be used by
+    one process at a time. Calls run on a worker thread so they never block the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        retention: float = DEFAULT_RETENTION,
+    ):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(_SCHEMA)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.to_thread(self._transaction, func, *args)
+
+    def _transaction(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                result = func(cursor, *args)
+            except BaseException:
+                cursor.execute('ROLLBACK')
+                raise
+            cursor.execute('COMMIT')
+            return result
+
+    @staticmethod
+    def _select(cursor: sqlite3.Cursor, where: str, params: tuple) -> list[QueuedEpisode]:
+        rows = cursor.execute(f'SELECT {_COLUMNS} FROM episodes {where}', params).fetchall()
+        return [_row_to_episode(row) for row in rows]
+
+    async def enqueue(self, episodes: list[NewEpisode]) -> list[QueuedEpisode]:
+        def enqueue(cursor: sqlite3.Cursor) -> list[QueuedEpisode]:
+            now = time.time()
+            cursor.executemany(
+                """
+                INSERT INTO episodes
+                    (uuid, group_id, job_id, payload, available_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (uuid) DO NOTHING
+                """,
+                [
+                    (e.uuid, e.group_id, e.job_id, json.dumps(e.payload), now, now, now)
+                    for e in episodes
+                ],
+            )
+            queued = {
+                episode.uuid: episode
+                for episode in self._select(
+                    cursor,
+                    f'WHERE uuid IN ({", ".join("?" * len(episodes))})',
+                    tuple(e.uuid for e in episodes),
+                )
+            }
+            return [queued[e.uuid] for e in episodes]
+
+        if not episodes:
+            return []
+        return await self._run(enqueue)
+
+    async def claim(self, limit: int) -> list[QueuedEpisode]:
+        def claim(cursor: sqlite3.Cursor) -> list[QueuedEpisode]:
+            now = time.time()
+            row = cursor.execute(_NEXT_GROUP, (now,)).fetchone()
+            if row is None:
+                return []
+
+            episodes = self._select(
+                cursor,
+                "WHERE group_id = ? AND status = 'pending' ORDER BY seq LIMIT ?",
+                (row[0], limit),
+            )
+            cursor.executemany(
+                """
+                UPDATE episodes SET status = 'running', attempts = attempts + 1, updated_at = ?
+                WHERE seq = ?
+                """,
+                [(now, episode.seq) for episode in episodes],
+            )
+            return [
+                episode.model_copy(
+                    update={
+                        'status': 'running',
+                        'attempts': episode.attempts + 1,
+                        'updated_at': _to_datetime(now),
+                    }
+                )
+                for episode in episodes
+            ]
+
+        return await self._run(claim)
+
+    async def complete(self, episodes: list[QueuedEpisode]):
+        def complete(cursor: sqlite3.Cursor):
+            now = time.time()
+            cursor.executemany(
+                "UPDATE episodes SET status = 'completed', error = NULL, updated_at = ? "
+                'WHERE seq = ?',
+                [(now, episode.seq) for episode in episodes],
+            )
+
+        await self._run(complete)
+
+    async def fail(self, episodes: list[QueuedEpisode], error: str):
+        def fail(cursor: sqlite3.Cursor):
+            now = time.time()
+            updates = []
+            for episode in episodes:
+                if episode.attempts >= self.max_attempts:
+                    status, available_at = 'failed', now
+                else:
+                    status = 'pending'
+                    available_at = now + self.retry_delay * 2 ** (episode.attempts - 1)
+                updates.append((status, error, available_at, now, episode.seq))
+            cursor.executemany(
+                """
+                UPDATE episodes SET status = ?, error = ?, available_at = ?, updated_at = ?
+                WHERE seq = ?
+                """,
+                updates,
+            )
+
+        await self._run(fail)
+
+    async def release(self, episodes: list[QueuedEpisode]):
+        def release(cursor: sqlite3.Cursor):
+            now = time.time()
+            cursor.executemany(
+                """
+                UPDATE episodes SET status = 'pending', attempts = attempts - 1, updated_at = ?
+                WHERE seq = ? AND status = 'running'
+                """,
+                [(now, episode.seq) for episode in episodes],
+            )
+
+        await self._run(release)
+
+    async def recover(self) -> int:
+        def recover(cursor: sqlite3.Cursor) -> int:
+            now = time.time()
+            cursor.execute(
+                "DELETE FROM episodes WHERE status = 'completed' AND updated_at < ?",
+                (now - self.retention,),
+            )
+            return cursor.execute(
+                "UPDATE episodes SET status = 'pending', updated_at = ? WHERE status = 'running'",
+                (now,),
+            ).rowcount
+
+        recovered = await self._run(recover)
+        if recovered:
+            logger.info(f'Requeued {recovered} episodes that were running at the last shutdown')
+        return recovered
+
+    async def get(self, uuid: str) -> QueuedEpisode | None:
+        episodes = await self._run(lambda cursor: self._select(cursor, 'WHERE uuid = ?', (uuid,)))
+        return episodes[0] if episodes else None
+
+    async def get_job(self, job_id: str) -> list[QueuedEpisode]:
+        return await self._run(
+            lambda cursor: self._select(cursor, 'WHERE job_id = ? ORDER BY seq', (job_id,))
+        )
+
+    async def counts(self, group_id: str | None = None) -> dict[str, dict[EpisodeStatus, int]]:
+        def counts(cursor: sqlite3.Cursor) -> dict[str, dict[EpisodeStatus, int]]:
+            query = 'SELECT group_id, status, COUNT(*) FROM episodes'
+            params: tuple = ()
+            if group_id is not None:
+                query += ' WHERE group_id = ?'
+                params = (group_id,)
+            result: dict[str, dict[EpisodeStatus, int]] = {}
+            for group, status, count in cursor.execute(
+                f'{query} GROUP BY group_id, status', params
+            ):
+                result.setdefault(group, {})[status] = count
+            return result
+
+        return await self._run(counts)
+
+    async def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class EpisodeQueueWorkers:
+    """
+    A pool of workers that claim episodes from an EpisodeQueue and hand them to a handler.
+
+    With handle_batch, each claimed batch of up to batch_size episodes of one group is passed to
+    it in a single call, e.g. to add them with add_episode_bulk, and succeeds or fails as a
+    whole. Otherwise episodes are handled one at a time; after a failure the rest of the batch
+    is released so that the group's order is kept while the failed episode is retried.
+    """
+
+    def __init__(
+        self,
+        queue: EpisodeQueue,
+        handle: Callable[[QueuedEpisode], Awaitable[Any]],
+        handle_batch: Callable[[list[QueuedEpisode]], Awaitable[Any]] | None = None,
+        workers: int = 4,
+        batch_size: int = 10,
+        poll_interval: float = 1.0,
+    ):
+        self.queue = queue
+        self.handle = handle
+        self.handle_batch = handle_batch
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._active = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self):
+        await self.queue.recover()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    def notify(self):
+        """Wake up idle workers after new episodes were enqueued."""
+        self._idle.clear()
+        self._wakeup.set()
+
+    async def wait_idle(self, timeout: float | None = None) -> bool:
+        """Wait until no claimable episode is left. Returns False on timeout."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self, timeout: float | None = None):
+        # episodes still queued stay in the queue and are picked up after the next start
+        if timeout:
+            await self.wait_idle(timeout)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self):
+        while True:
+            self._active += 1
+            self._idle.clear()
+            try:
+                episodes = await self.queue.claim(self.batch_size)
+                if episodes:
+                    await self._process(episodes)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                episodes = []
+                logger.error(f'Episode queue worker error: {e}')
+            finally:
+                self._active -= 1
+
+            if episodes:
+                # other groups may have become claimable while this one was running
+                self.notify()
+                continue
+
+            if self._active == 0:
+                self._idle.set()
+            self._wakeup.clear()
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+    async def _process(self, episodes: list[QueuedEpisode]):
+        if self.handle_batch is not None:
+            try:
+                await self.handle_batch(episodes)
+            except Exception as e:
+                logger.error(f'Failed to add {len(episodes)} episodes: {e}')
+                await self.queue.fail(episodes, str(e))
+            else:
+                await self.queue.complete(episodes)
+            return
+
+        for i, episode in enumerate(episodes):
+            try:
+                await self.handle(episode)
+            except Exception as e:
+                logger.error(f'Failed to add episode {episode.uuid}: {e}')
+                await self.queue.fail([episode], str(e))
+                await self.queue.release(episodes[i + 1 :])
+                return
+            await self.queue.complete([episode])
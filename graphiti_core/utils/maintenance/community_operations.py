@@ -4,14 +4,16 @@ from collections import defaultdict
 
 from pydantic import BaseModel
 
-from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.driver import GraphDriver, driver_operation
 from graphiti_core.edges import CommunityEdge
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.helpers import semaphore_gather
 from graphiti_core.llm_client import LLMClient
+from graphiti_core.llm_client.usage import usage_stage
 from graphiti_core.nodes import CommunityNode, EntityNode, get_community_node_from_record
 from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.summarize_nodes import Summary, SummaryDescription
+from graphiti_core.telemetry.tracing import traced
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.edge_operations import build_community_edges
 
@@ -31,35 +33,10 @@ async def get_community_clusters(
     community_clusters: list[list[EntityNode]] = []
 
     if group_ids is None:
-        group_id_values, _, _ = await driver.execute_query(
-            """
-        MATCH (n:Entity WHERE n.group_id IS NOT NULL)
-        RETURN
-            collect(DISTINCT n.group_id) AS group_ids
-        """,
-        )
-
-        group_ids = group_id_values[0]['group_ids'] if group_id_values else []
+        group_ids = await get_entity_group_ids(driver)
 
     for group_id in group_ids:
-        projection: dict[str, list[Neighbor]] = {}
-        nodes = await EntityNode.get_by_group_ids(driver, [group_id])
-        for node in nodes:
-            records, _, _ = await driver.execute_query(
-                """
-            MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[r:RELATES_TO]-(m: Entity {group_id: $group_id})
-            WITH count(r) AS count, m.uuid AS uuid
-            RETURN
-                uuid,
-                count
-            """,
-                uuid=node.uuid,
-                group_id=group_id,
-            )
-
-            projection[node.uuid] = [
-                Neighbor(node_uuid=record['uuid'], edge_count=record['count']) for record in records
-            ]
+        projection = await get_community_projection(driver, group_id)
 
         cluster_uuids = label_propagation(projection)
 
@@ -74,6 +51,51 @@ async def get_community_clusters(
     return community_clusters
 
 
+@driver_operation('get_entity_group_ids')
+async def get_entity_group_ids(driver: GraphDriver) -> list[str]:
+    group_id_values, _, _ = await driver.execute_query(
+        """
+    MATCH (n:Entity WHERE n.group_id IS NOT NULL)
+    RETURN
+        collect(DISTINCT n.group_id) AS group_ids
+    """,
+    )
+
+    return group_id_values[0]['group_ids'] if group_id_values else []
+
+
+@driver_operation('get_community_projection')
+async def get_community_projection(driver: GraphDriver, group_id: str) -> dict[str, list[Neighbor]]:
+    """Map every entity of the group to its neighbors in the group and the edge count to each."""
+    projection: dict[str, list[Neighbor]] = {}
+    # only the uuids are kept, the nodes are streamed with one neighbor query per batch
+    async for nodes in EntityNode.scan(driver, [group_id]):
+        uuids = [node.uuid for node in nodes]
+        for uuid in uuids:
+            projection[uuid] = []
+
+        records, _, _ = await driver.execute_query(
+            """
+        UNWIND $uuids AS uuid
+        MATCH (n:Entity {group_id: $group_id, uuid: uuid})-[r:RELATES_TO]-(m: Entity {group_id: $group_id})
+        WITH n.uuid AS node_uuid, m.uuid AS uuid, count(r) AS count
+        RETURN
+            node_uuid,
+            uuid,
+            count
+        """,
+            uuids=uuids,
+            group_id=group_id,
+        )
+
+        for record in records:
+            projection[record['node_uuid']].append(
+                Neighbor(node_uuid=record['uuid'], edge_count=record['count'])
+            )
+
+    return projection
+
+
 def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
     # Implement the label propagation community detection algorithm.
     # 1. Start with each node being assigned its own community
@@ -126,9 +148,10 @@ async def summarize_pair(llm_client: LLMClient, summary_pair: tuple[str, str]) -
     # Prepare context for LLM
     context = {'node_summaries': [{'summary': summary} for summary in summary_pair]}
 
-    llm_response = await llm_client.generate_response(
-        prompt_library.summarize_nodes.summarize_pair(context), response_model=Summary
-    )
+    with usage_stage('summarize_community'):
+        llm_response = await llm_client.generate_response(
+            prompt_library.summarize_nodes.summarize_pair(context), response_model=Summary
+        )
 
     pair_summary = llm_response.get('summary', '')
 
@@ -138,10 +161,11 @@ async def summarize_pair(llm_client: LLMClient, summary_pair: tuple[str, str]) -
 async def generate_summary_description(llm_client: LLMClient, summary: str) -> str:
     context = {'summary': summary}
 
-    llm_response = await llm_client.generate_response(
-        prompt_library.summarize_nodes.summary_description(context),
-        response_model=SummaryDescription,
-    )
+    with usage_stage('summarize_community'):
+        llm_response = await llm_client.generate_response(
+            prompt_library.summarize_nodes.summary_description(context),
+            response_model=SummaryDescription,
+        )
 
     description = llm_response.get('description', '')
 
@@ -190,6 +214,7 @@ async def build_community(
     return community_node, community_edges
 
 
+@traced('graphiti.build_communities')
 async def build_communities(
     driver: GraphDriver, llm_client: LLMClient, group_ids: list[str] | None
 ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
@@ -216,6 +241,7 @@ async def build_communities(
     return community_nodes, community_edges
 
 
+@driver_operation('remove_communities')
 async def remove_communities(driver: GraphDriver):
     await driver.execute_query(
         """
@@ -225,6 +251,7 @@ async def remove_communities(driver: GraphDriver):
     )
 
 
+@driver_operation('determine_entity_community')
 async def determine_entity_community(
     driver: GraphDriver, entity: EntityNode
 ) -> tuple[CommunityNode | None, bool]:
@@ -284,6 +311,7 @@ async def determine_entity_community(
     return None, False
 
 
+@traced('graphiti.update_community')
 async def update_community(
     driver: GraphDriver, llm_client: LLMClient, embedder: EmbedderClient, entity: EntityNode
 ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
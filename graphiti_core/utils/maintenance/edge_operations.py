@@ -21,7 +21,7 @@ from time import time
 from pydantic import BaseModel
 from typing_extensions import LiteralString
 
-from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.driver import GraphDriver, driver_operation
 from graphiti_core.edges import (
     CommunityEdge,
     EntityEdge,
@@ -32,12 +32,14 @@ from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import MAX_REFLEXION_ITERATIONS, semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.config import ModelSize
+from graphiti_core.llm_client.usage import usage_stage
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.dedupe_edges import EdgeDuplicate
 from graphiti_core.prompts.extract_edges import ExtractedEdges, MissingFacts
 from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.search.search_utils import get_edge_invalidation_candidates, get_relevant_edges
+from graphiti_core.telemetry.tracing import traced
 from graphiti_core.utils.datetime_utils import ensure_utc, utc_now
 
 logger = logging.getLogger(__name__)
@@ -107,6 +109,7 @@ def build_community_edges(
     return edges
 
 
+@traced('graphiti.extract_edges')
 async def extract_edges(
     clients: GraphitiClients,
     episode: EpisodicNode,
@@ -147,7 +150,9 @@ async def extract_edges(
             {'id': idx, 'name': node.name, 'entity_types': node.labels}
             for idx, node in enumerate(nodes)
         ],
-        'previous_episodes': [ep.content for ep in previous_episodes],
+        'previous_episodes': clients.context_window.get_previous_episodes(
+            'extract_edges', previous_episodes
+        ),
         'reference_time': episode.valid_at,
         'edge_types': edge_types_context,
         'custom_prompt': '',
@@ -156,22 +161,24 @@ async def extract_edges(
     facts_missed = True
     reflexion_iterations = 0
     while facts_missed and reflexion_iterations <= MAX_REFLEXION_ITERATIONS:
-        llm_response = await llm_client.generate_response(
-            prompt_library.extract_edges.edge(context),
-            response_model=ExtractedEdges,
-            max_tokens=extract_edges_max_tokens,
-        )
+        with usage_stage('extract_edges'):
+            llm_response = await llm_client.generate_response(
+                prompt_library.extract_edges.edge(context),
+                response_model=ExtractedEdges,
+                max_tokens=extract_edges_max_tokens,
+            )
         edges_data = ExtractedEdges(**llm_response).edges
 
         context['extracted_facts'] = [edge_data.fact for edge_data in edges_data]
 
         reflexion_iterations += 1
         if reflexion_iterations < MAX_REFLEXION_ITERATIONS:
-            reflexion_response = await llm_client.generate_response(
-                prompt_library.extract_edges.reflexion(context),
-                response_model=MissingFacts,
-                max_tokens=extract_edges_max_tokens,
-            )
+            with usage_stage('extract_edges'):
+                reflexion_response = await llm_client.generate_response(
+                    prompt_library.extract_edges.reflexion(context),
+                    response_model=MissingFacts,
+                    max_tokens=extract_edges_max_tokens,
+                )
 
             missing_facts = reflexion_response.get('missing_facts', [])
 
@@ -244,6 +251,7 @@ async def extract_edges(
     return edges
 
 
+@traced('graphiti.resolve_extracted_edges')
 async def resolve_extracted_edges(
     clients: GraphitiClients,
     extracted_edges: list[EntityEdge],
@@ -417,11 +425,12 @@ async def resolve_extracted_edge(
         'edge_types': edge_types_context,
     }
 
-    llm_response = await llm_client.generate_response(
-        prompt_library.dedupe_edges.resolve_edge(context),
-        response_model=EdgeDuplicate,
-        model_size=ModelSize.small,
-    )
+    with usage_stage('resolve_edge'):
+        llm_response = await llm_client.generate_response(
+            prompt_library.dedupe_edges.resolve_edge(context),
+            response_model=EdgeDuplicate,
+            model_size=ModelSize.small,
+        )
     response_object = EdgeDuplicate(**llm_response)
     duplicate_facts = response_object.duplicate_facts
 
@@ -453,11 +462,12 @@ async def resolve_extracted_edge(
 
         edge_model = edge_types.get(fact_type)
         if edge_model is not None and len(edge_model.model_fields) != 0:
-            edge_attributes_response = await llm_client.generate_response(
-                prompt_library.extract_edges.extract_attributes(edge_attributes_context),
-                response_model=edge_model,  # type: ignore
-                model_size=ModelSize.small,
-            )
+            with usage_stage('extract_edge_attributes'):
+                edge_attributes_response = await llm_client.generate_response(
+                    prompt_library.extract_edges.extract_attributes(edge_attributes_context),
+                    response_model=edge_model,  # type: ignore
+                    model_size=ModelSize.small,
+                )
 
             resolved_edge.attributes = edge_attributes_response
 
@@ -496,6 +506,7 @@ async def resolve_extracted_edge(
     return resolved_edge, invalidated_edges, duplicate_edges
 
 
+@driver_operation('filter_existing_duplicate_of_edges')
 async def filter_existing_duplicate_of_edges(
     driver: GraphDriver, duplicates_node_tuples: list[tuple[EntityNode, EntityNode]]
 ) -> list[tuple[EntityNode, EntityNode]]:
@@ -19,17 +19,19 @@ from datetime import datetime
 
 from typing_extensions import LiteralString
 
-from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.driver import GraphDriver, driver_operation
 from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
 from graphiti_core.helpers import semaphore_gather
 from graphiti_core.models.nodes.node_db_queries import EPISODIC_NODE_RETURN
 from graphiti_core.nodes import EpisodeType, EpisodicNode, get_episodic_node_from_record
+from graphiti_core.telemetry.tracing import traced
 
 EPISODE_WINDOW_LEN = 3
 
 logger = logging.getLogger(__name__)
 
 
+@driver_operation('build_indices_and_constraints')
 async def build_indices_and_constraints(driver: GraphDriver, delete_existing: bool = False):
     if delete_existing:
         records, _, _ = await driver.execute_query(
@@ -63,6 +65,7 @@ async def build_indices_and_constraints(driver: GraphDriver, delete_existing: bo
     )
 
 
+@driver_operation('clear_data')
 async def clear_data(driver: GraphDriver, group_ids: list[str] | None = None):
     async with driver.session() as session:
 
@@ -81,6 +84,27 @@ async def clear_data(driver: GraphDriver, group_ids: list[str] | None = None):
             await session.execute_write(delete_group_ids)
 
 
+@driver_operation('get_nodes_mentioned_only_by_episode')
+async def get_nodes_mentioned_only_by_episode(driver: GraphDriver, episode_uuid: str) -> list[str]:
+    """Return the uuids of the entities that no episode other than episode_uuid mentions."""
+    # Mention counts are aggregated in a single query instead of one count per node.
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (:Episodic {uuid: $uuid})-[:MENTIONS]->(n:Entity)
+        MATCH (e:Episodic)-[:MENTIONS]->(n)
+        WITH n, count(DISTINCT e) AS episode_count
+        WHERE episode_count = 1
+        RETURN n.uuid AS uuid
+        """,
+        uuid=episode_uuid,
+        routing_='r',
+    )
+
+    return [record['uuid'] for record in records]
+
+
+@traced('graphiti.retrieve_episodes')
+@driver_operation('retrieve_episodes')
 async def retrieve_episodes(
     driver: GraphDriver,
     reference_time: datetime,
@@ -133,3 +157,67 @@ async def retrieve_episodes(
 
     episodes = [get_episodic_node_from_record(record) for record in result]
     return list(reversed(episodes))  # Return in chronological order
+
+
+@driver_operation('retrieve_episodes_in_window')
+async def retrieve_episodes_in_window(
+    driver: GraphDriver,
+    group_id: str,
+    start_time: datetime,
+    end_time: datetime,
+    last_n: int = EPISODE_WINDOW_LEN,
+    exclude_uuids: list[str] | None = None,
+) -> list[EpisodicNode]:
+    """
+    Retrieve, in a single query, every episode of a group with a valid_at between start_time and
+    end_time (inclusive) plus the last_n episodes before start_time. This is the union of the
+    previous-episode windows of any set of episodes whose valid_at falls within [start_time, end_time].
+
+    Args:
+        driver (Driver): The graph driver instance.
+        group_id (str): The group id to return data from.
+        start_time (datetime): The start of the window.
+        end_time (datetime): The end of the window.
+        last_n (int, optional): The number of episodes to retrieve before start_time.
+        exclude_uuids (list[str], optional): Episode uuids that should not be fetched, e.g. because
+                                             they are already held in memory by the caller.
+
+    Returns:
+        list[EpisodicNode]: The retrieved episodes in chronological order.
+    """
+    query: LiteralString = (
+        """
+        MATCH (e:Episodic)
+        WHERE e.group_id = $group_id
+        AND e.valid_at < $start_time
+        AND NOT e.uuid IN $exclude_uuids
+        RETURN
+        """
+        + EPISODIC_NODE_RETURN
+        + """
+        ORDER BY e.valid_at DESC
+        LIMIT $num_episodes
+        UNION
+        MATCH (e:Episodic)
+        WHERE e.group_id = $group_id
+        AND e.valid_at >= $start_time
+        AND e.valid_at <= $end_time
+        AND NOT e.uuid IN $exclude_uuids
+        RETURN
+        """
+        + EPISODIC_NODE_RETURN
+    )
+    result, _, _ = await driver.execute_query(
+        query,
+        group_id=group_id,
+        start_time=start_time,
+        end_time=end_time,
+        num_episodes=last_n,
+        exclude_uuids=exclude_uuids or [],
+        routing_='r',
+    )
+
+    episodes = [get_episodic_node_from_record(record) for record in result]
+    episodes.sort(key=lambda episode: episode.valid_at)
+
+    return episodes
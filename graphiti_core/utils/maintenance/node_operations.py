@@ -18,7 +18,6 @@ import logging
 from contextlib import suppress
 from time import time
 from typing import Any
-from uuid import uuid4
 
 import pydantic
 from pydantic import BaseModel, Field
@@ -27,6 +26,7 @@ from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import MAX_REFLEXION_ITERATIONS, semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.config import ModelSize
+from graphiti_core.llm_client.usage import usage_stage
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode, create_entity_node_embeddings
 from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.dedupe_nodes import NodeDuplicate, NodeResolutions
@@ -39,6 +39,8 @@ from graphiti_core.search.search import search
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.telemetry.tracing import traced
+from graphiti_core.utils.context_window import ContextWindowManager
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.edge_operations import filter_existing_duplicate_of_edges
 
@@ -50,22 +52,29 @@ async def extract_nodes_reflexion(
     episode: EpisodicNode,
     previous_episodes: list[EpisodicNode],
     node_names: list[str],
+    context_window: ContextWindowManager | None = None,
 ) -> list[str]:
     # Prepare context for LLM
     context = {
         'episode_content': episode.content,
-        'previous_episodes': [ep.content for ep in previous_episodes],
+        'previous_episodes': context_window.get_previous_episodes(
+            'extract_nodes_reflexion', previous_episodes
+        )
+        if context_window is not None
+        else [ep.content for ep in previous_episodes],
         'extracted_entities': node_names,
     }
 
-    llm_response = await llm_client.generate_response(
-        prompt_library.extract_nodes.reflexion(context), MissedEntities
-    )
+    with usage_stage('extract_nodes'):
+        llm_response = await llm_client.generate_response(
+            prompt_library.extract_nodes.reflexion(context), MissedEntities
+        )
     missed_entities = llm_response.get('missed_entities', [])
 
     return missed_entities
 
 
+@traced('graphiti.extract_nodes')
 async def extract_nodes(
     clients: GraphitiClients,
     episode: EpisodicNode,
@@ -104,7 +113,9 @@ async def extract_nodes(
     context = {
         'episode_content': episode.content,
         'episode_timestamp': episode.valid_at.isoformat(),
-        'previous_episodes': [ep.content for ep in previous_episodes],
+        'previous_episodes': clients.context_window.get_previous_episodes(
+            'extract_nodes', previous_episodes
+        ),
         'custom_prompt': custom_prompt,
         'entity_types': entity_types_context,
         'source_description': episode.source_description,
@@ -112,22 +123,28 @@ async def extract_nodes(
 
     while entities_missed and reflexion_iterations <= MAX_REFLEXION_ITERATIONS:
         if episode.source == EpisodeType.message:
-            llm_response = await llm_client.generate_response(
-                prompt_library.extract_nodes.extract_message(context),
-                response_model=ExtractedEntities,
-            )
+            with usage_stage('extract_nodes'):
+                llm_response = await llm_client.generate_response(
+                    prompt_library.extract_nodes.extract_message(context),
+                    response_model=ExtractedEntities,
+                )
         elif episode.source == EpisodeType.text:
-            llm_response = await llm_client.generate_response(
-                prompt_library.extract_nodes.extract_text(context), response_model=ExtractedEntities
-            )
+            with usage_stage('extract_nodes'):
+                llm_response = await llm_client.generate_response(
+                    prompt_library.extract_nodes.extract_text(context),
+                    response_model=ExtractedEntities,
+                )
         elif episode.source == EpisodeType.json:
-            llm_response = await llm_client.generate_response(
-                prompt_library.extract_nodes.extract_json(context), response_model=ExtractedEntities
-            )
+            with usage_stage('extract_nodes'):
+                llm_response = await llm_client.generate_response(
+                    prompt_library.extract_nodes.extract_json(context),
+                    response_model=ExtractedEntities,
+                )
 
         # Handle potential JSON string input using safe_json_loads
         if isinstance(llm_response, str):
             from graphiti_core.llm_client.utils import safe_json_loads
+
             llm_response = safe_json_loads(llm_response)
         response_object = ExtractedEntities(**llm_response)
 
@@ -140,6 +157,7 @@ async def extract_nodes(
                 episode,
                 previous_episodes,
                 [entity.name for entity in extracted_entities],
+                clients.context_window,
             )
 
             entities_missed = len(missing_entities) != 0
@@ -179,6 +197,7 @@ async def extract_nodes(
     return extracted_nodes
 
 
+@traced('graphiti.resolve_extracted_nodes')
 async def resolve_extracted_nodes(
     clients: GraphitiClients,
     extracted_nodes: list[EntityNode],
@@ -190,24 +209,23 @@ async def resolve_extracted_nodes(
     llm_client = clients.llm_client
     driver = clients.driver
 
-    search_results: list[SearchResults] = await semaphore_gather(
-        *[
-            search(
-                clients=clients,
-                query=node.name,
-                group_ids=[node.group_id],
-                search_filter=SearchFilters(),
-                config=NODE_HYBRID_SEARCH_RRF,
-            )
-            for node in extracted_nodes
-        ]
-    )
-
-    candidate_nodes: list[EntityNode] = (
-        [node for result in search_results for node in result.nodes]
-        if existing_nodes_override is None
-        else existing_nodes_override
-    )
+    candidate_nodes: list[EntityNode]
+    if existing_nodes_override is None:
+        search_results: list[SearchResults] = await semaphore_gather(
+            *[
+                search(
+                    clients=clients,
+                    query=node.name,
+                    group_ids=[node.group_id],
+                    search_filter=SearchFilters(),
+                    config=NODE_HYBRID_SEARCH_RRF,
+                )
+                for node in extracted_nodes
+            ]
+        )
+        candidate_nodes = [node for result in search_results for node in result.nodes]
+    else:
+        candidate_nodes = existing_nodes_override
 
     existing_nodes_dict: dict[str, EntityNode] = {node.uuid: node for node in candidate_nodes}
 
@@ -247,15 +265,16 @@ async def resolve_extracted_nodes(
         'extracted_nodes': extracted_nodes_context,
         'existing_nodes': existing_nodes_context,
         'episode_content': episode.content if episode is not None else '',
-        'previous_episodes': [ep.content for ep in previous_episodes]
-        if previous_episodes is not None
-        else [],
+        'previous_episodes': clients.context_window.get_previous_episodes(
+            'dedupe_nodes', previous_episodes
+        ),
     }
 
-    llm_response = await llm_client.generate_response(
-        prompt_library.dedupe_nodes.nodes(context),
-        response_model=NodeResolutions,
-    )
+    with usage_stage('dedupe_nodes'):
+        llm_response = await llm_client.generate_response(
+            prompt_library.dedupe_nodes.nodes(context),
+            response_model=NodeResolutions,
+        )
 
     node_resolutions: list[NodeDuplicate] = NodeResolutions(**llm_response).entity_resolutions
 
@@ -296,6 +315,7 @@ async def resolve_extracted_nodes(
     return resolved_nodes, uuid_map, new_node_duplicates
 
 
+@traced('graphiti.extract_attributes_from_nodes')
 async def extract_attributes_from_nodes(
     clients: GraphitiClients,
     nodes: list[EntityNode],
@@ -315,6 +335,7 @@ async def extract_attributes_from_nodes(
                 entity_types.get(next((item for item in node.labels if item != 'Entity'), ''))
                 if entity_types is not None
                 else None,
+                clients.context_window,
             )
             for node in nodes
         ]
@@ -331,6 +352,7 @@ async def extract_attributes_from_node(
     episode: EpisodicNode | None = None,
     previous_episodes: list[EpisodicNode] | None = None,
     entity_type: BaseModel | None = None,
+    context_window: ContextWindowManager | None = None,
 ) -> EntityNode:
     node_context: dict[str, Any] = {
         'name': node.name,
@@ -355,22 +377,33 @@ async def extract_attributes_from_node(
                 Field(description=field_info.description),
             )
 
-    unique_model_name = f'EntityAttributes_{uuid4().hex}'
-    entity_attributes_model = pydantic.create_model(unique_model_name, **attributes_definitions)
+    # A stable model name keeps the response schema, and therefore the prompt prefix, identical
+    # across calls so provider prompt caches can be reused
+    model_name = (
+        f'EntityAttributes_{entity_type.__name__}'
+        if entity_type is not None
+        else 'EntityAttributes'
+    )
+    entity_attributes_model = pydantic.create_model(model_name, **attributes_definitions)
+
+    previous_episode_contents: list[str] = (
+        context_window.get_previous_episodes('extract_attributes', previous_episodes)
+        if context_window is not None
+        else [ep.content for ep in previous_episodes or []]
+    )
 
     summary_context: dict[str, Any] = {
         'node': node_context,
         'episode_content': episode.content if episode is not None else '',
-        'previous_episodes': [ep.content for ep in previous_episodes]
-        if previous_episodes is not None
-        else [],
+        'previous_episodes': previous_episode_contents,
     }
 
-    llm_response = await llm_client.generate_response(
-        prompt_library.extract_nodes.extract_attributes(summary_context),
-        response_model=entity_attributes_model,
-        model_size=ModelSize.small,
-    )
+    with usage_stage('extract_attributes'):
+        llm_response = await llm_client.generate_response(
+            prompt_library.extract_nodes.extract_attributes(summary_context),
+            response_model=entity_attributes_model,
+            model_size=ModelSize.small,
+        )
 
     entity_attributes_model(**llm_response)
 
@@ -21,6 +21,7 @@ from time import time
 from graphiti_core.edges import EntityEdge
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.config import ModelSize
+from graphiti_core.llm_client.usage import usage_stage
 from graphiti_core.nodes import EpisodicNode
 from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.extract_edge_dates import EdgeDates
@@ -42,9 +43,10 @@ async def extract_edge_dates(
         'previous_episodes': [ep.content for ep in previous_episodes],
         'reference_timestamp': current_episode.valid_at.isoformat(),
     }
-    llm_response = await llm_client.generate_response(
-        prompt_library.extract_edge_dates.v1(context), response_model=EdgeDates
-    )
+    with usage_stage('extract_edge_dates'):
+        llm_response = await llm_client.generate_response(
+            prompt_library.extract_edge_dates.v1(context), response_model=EdgeDates
+        )
 
     valid_at = llm_response.get('valid_at')
     invalid_at = llm_response.get('invalid_at')
@@ -81,11 +83,12 @@ async def get_edge_contradictions(
 
     context = {'new_edge': new_edge_context, 'existing_edges': existing_edge_context}
 
-    llm_response = await llm_client.generate_response(
-        prompt_library.invalidate_edges.v2(context),
-        response_model=InvalidatedEdges,
-        model_size=ModelSize.small,
-    )
+    with usage_stage('invalidate_edges'):
+        llm_response = await llm_client.generate_response(
+            prompt_library.invalidate_edges.v2(context),
+            response_model=InvalidatedEdges,
+            model_size=ModelSize.small,
+        )
 
     contradicted_facts: list[int] = llm_response.get('contradicted_facts', [])
 
@@ -0,0 +1,161 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+from collections.abc import Collection
+from datetime import date, datetime, timezone
+from typing import Any
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
+from graphiti_core.search.search_config import SearchResults
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is not installed
+    orjson = None  # type: ignore[assignment]
+
+# Embeddings are copied into the property maps returned by the database, so they can show up
+# among the attributes of a model as well as in their own field.
+EMBEDDING_KEYS = frozenset({'fact_embedding', 'name_embedding'})
+
+FACT_FIELDS = ('uuid', 'name', 'fact', 'valid_at', 'invalid_at', 'created_at', 'expired_at')
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return _isoformat(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _json_value(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_json_value(item) for item in value]
+    return value
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    # same as the json_encoders of the server's response models, so both render times alike
+    return value.astimezone(timezone.utc).isoformat() if value is not None else None
+
+
+def _attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: _json_value(value) for key, value in attributes.items() if key not in EMBEDDING_KEYS
+    }
+
+
+def _select(result: dict[str, Any], fields: Collection[str] | None) -> dict[str, Any]:
+    return result if fields is None else {field: result[field] for field in fields}
+
+
+def entity_edge_to_json(
+    edge: EntityEdge, fields: Collection[str] | None = None, include_embedding: bool = False
+) -> dict[str, Any]:
+    """
+    Returns the edge as a dict of JSON types, without validating or copying it through pydantic.
+
+    The keys match edge.model_dump(mode='json'); fields selects a subset of them. Datetimes are
+    converted to UTC.
+    """
+    result: dict[str, Any] = {
+        'uuid': edge.uuid,
+        'group_id': edge.group_id,
+        'source_node_uuid': edge.source_node_uuid,
+        'target_node_uuid': edge.target_node_uuid,
+        'created_at': _isoformat(edge.created_at),
+        'name': edge.name,
+        'fact': edge.fact,
+        'episodes': list(edge.episodes),
+        'expired_at': _isoformat(edge.expired_at),
+        'valid_at': _isoformat(edge.valid_at),
+        'invalid_at': _isoformat(edge.invalid_at),
+        'attributes': _attributes(edge.attributes),
+    }
+    if include_embedding:
+        result['fact_embedding'] = edge.fact_embedding
+    return _select(result, fields)
+
+
+def entity_node_to_json(
+    node: EntityNode, fields: Collection[str] | None = None, include_embedding: bool = False
+) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        'uuid': node.uuid,
+        'name': node.name,
+        'group_id': node.group_id,
+        'labels': list(node.labels),
+        'created_at': _isoformat(node.created_at),
+        'summary': node.summary,
+        'attributes': _attributes(node.attributes),
+    }
+    if include_embedding:
+        result['name_embedding'] = node.name_embedding
+    return _select(result, fields)
+
+
+def episodic_node_to_json(
+    episode: EpisodicNode, fields: Collection[str] | None = None
+) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        'uuid': episode.uuid,
+        'name': episode.name,
+        'group_id': episode.group_id,
+        'labels': list(episode.labels),
+        'created_at': _isoformat(episode.created_at),
+        'source': episode.source.value,
+        'source_description': episode.source_description,
+        'content': episode.content,
+        'valid_at': _isoformat(episode.valid_at),
+        'entity_edges': list(episode.entity_edges),
+    }
+    return _select(result, fields)
+
+
+def community_node_to_json(
+    community: CommunityNode, fields: Collection[str] | None = None, include_embedding: bool = False
+) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        'uuid': community.uuid,
+        'name': community.name,
+        'group_id': community.group_id,
+        'labels': list(community.labels),
+        'created_at': _isoformat(community.created_at),
+        'summary': community.summary,
+    }
+    if include_embedding:
+        result['name_embedding'] = community.name_embedding
+    return _select(result, fields)
+
+
+def search_results_to_json(results: SearchResults) -> dict[str, Any]:
+    return {
+        'edges': [entity_edge_to_json(edge) for edge in results.edges],
+        'edge_reranker_scores': results.edge_reranker_scores,
+        'nodes': [entity_node_to_json(node) for node in results.nodes],
+        'node_reranker_scores': results.node_reranker_scores,
+        'episodes': [episodic_node_to_json(episode) for episode in results.episodes],
+        'episode_reranker_scores': results.episode_reranker_scores,
+        'communities': [community_node_to_json(community) for community in results.communities],
+        'community_reranker_scores': results.community_reranker_scores,
+    }
+
+
+def dumps(value: Any) -> bytes:
+    """Encodes the output of the *_to_json functions, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode()
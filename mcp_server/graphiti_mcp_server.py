@@ -11,6 +11,7 @@ import sys
 from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any, TypedDict, cast
+from uuid import uuid4
 
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 from dotenv import load_dotenv
@@ -33,7 +34,18 @@ from graphiti_core.search.search_config_recipes import (
     NODE_HYBRID_SEARCH_RRF,
 )
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.episode_queue import (
+    EpisodeQueueWorkers,
+    NewEpisode,
+    QueuedEpisode,
+    SQLiteEpisodeQueue,
+)
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
+from graphiti_core.utils.serialization import (
+    entity_edge_to_json,
+    entity_node_to_json,
+    episodic_node_to_json,
+)
 
 load_dotenv()
 
@@ -47,6 +59,11 @@ DEFAULT_EMBEDDER_MODEL = 'text-embedding-3-small'
 # Increase if you have high rate limits.
 SEMAPHORE_LIMIT = int(os.getenv('SEMAPHORE_LIMIT', 10))
 
+# Queued episodes are stored in this SQLite database so they survive restarts.
+EPISODE_QUEUE_PATH = os.getenv('EPISODE_QUEUE_PATH', 'episode_queue.db')
+# Number of groups whose queued episodes are processed concurrently.
+EPISODE_QUEUE_WORKERS = int(os.getenv('EPISODE_QUEUE_WORKERS', 4))
+
 
 class Requirement(BaseModel):
     """A Requirement represents a specific need, feature, or functionality that a product or service must fulfill.
@@ -570,11 +587,14 @@ mcp = FastMCP(
 
 # Initialize Graphiti client
 graphiti_client: Graphiti | None = None
+# Durable queue of episodes waiting to be added, processed in order per group_id
+episode_queue: SQLiteEpisodeQueue | None = None
+episode_workers: EpisodeQueueWorkers | None = None
 
 
 async def initialize_graphiti():
     """Initialize the Graphiti client with the configured settings."""
-    global graphiti_client, config
+    global graphiti_client, config, episode_queue, episode_workers
 
     try:
         # Create LLM client if possible
@@ -608,6 +628,14 @@ async def initialize_graphiti():
         await graphiti_client.build_indices_and_constraints()
         logger.info('Graphiti client initialized successfully')
 
+        # Resume episodes that were queued or running when the server last stopped
+        episode_queue = SQLiteEpisodeQueue(EPISODE_QUEUE_PATH)
+        episode_workers = EpisodeQueueWorkers(
+            episode_queue, process_queued_episode, workers=EPISODE_QUEUE_WORKERS
+        )
+        await episode_workers.start()
+        logger.info(f'Using episode queue: {EPISODE_QUEUE_PATH}')
+
         # Log configuration details for transparency
         if llm_client:
             logger.info(f'Using OpenAI model: {config.llm.model}')
@@ -629,7 +657,8 @@ async def initialize_graphiti():
 def format_fact_result(edge: EntityEdge) -> dict[str, Any]:
     """Format an entity edge into a readable result.
 
-    Since EntityEdge is a Pydantic BaseModel, we can use its built-in serialization capabilities.
+    Serializes straight from the model's fields instead of round-tripping through
+    model_dump, and leaves out the fact embedding.
 
     Args:
         edge: The EntityEdge to format
@@ -637,55 +666,31 @@ def format_fact_result(edge: EntityEdge) -> dict[str, Any]:
     Returns:
         A dictionary representation of the edge with serialized dates and excluded embeddings
     """
-    result = edge.model_dump(
-        mode='json',
-        exclude={
-            'fact_embedding',
-        },
-    )
-    result.get('attributes', {}).pop('fact_embedding', None)
-    return result
-
-
-# Dictionary to store queues for each group_id
-# Each queue is a list of tasks to be processed sequentially
-episode_queues: dict[str, asyncio.Queue] = {}
-# Dictionary to track if a worker is running for each group_id
-queue_workers: dict[str, bool] = {}
+    return entity_edge_to_json(edge)
 
 
-async def process_episode_queue(group_id: str):
-    """Process episodes for a specific group_id sequentially.
-
-    This function runs as a long-lived task that processes episodes
-    from the queue one at a time.
-    """
-    global queue_workers
-
-    logger.info(f'Starting episode queue worker for group_id: {group_id}')
-    queue_workers[group_id] = True
-
-    try:
-        while True:
-            # Get the next episode processing function from the queue
-            # This will wait if the queue is empty
-            process_func = await episode_queues[group_id].get()
-
-            try:
-                # Process the episode
-                await process_func()
-            except Exception as e:
-                logger.error(f'Error processing queued episode for group_id {group_id}: {str(e)}')
-            finally:
-                # Mark the task as done regardless of success/failure
-                episode_queues[group_id].task_done()
-    except asyncio.CancelledError:
-        logger.info(f'Episode queue worker for group_id {group_id} was cancelled')
-    except Exception as e:
-        logger.error(f'Unexpected error in queue worker for group_id {group_id}: {str(e)}')
-    finally:
-        queue_workers[group_id] = False
-        logger.info(f'Stopped episode queue worker for group_id: {group_id}')
+async def process_queued_episode(episode: QueuedEpisode):
+    """Add a queued episode to the graph. Raising makes the queue retry it later."""
+    if graphiti_client is None:
+        raise RuntimeError('Graphiti client not initialized')
+
+    payload = episode.payload
+    logger.info(f"Processing queued episode '{payload['name']}' for group_id: {episode.group_id}")
+    # Use all entity types if use_custom_entities is enabled, otherwise use empty dict
+    entity_types = ENTITY_TYPES if config.use_custom_entities else {}
+
+    await graphiti_client.add_episode(
+        name=payload['name'],
+        episode_body=payload['episode_body'],
+        source=EpisodeType(payload['source']),
+        source_description=payload['source_description'],
+        group_id=episode.group_id,
+        # only a caller supplied uuid names an episode to load, the queue key is never one
+        uuid=payload.get('uuid'),
+        reference_time=datetime.fromisoformat(payload['reference_time']),
+        entity_types=entity_types,
+    )
+    logger.info(f"Episode '{payload['name']}' processed successfully")
 
 
 @mcp.tool()
@@ -752,9 +757,9 @@ async def add_memory(
         - Entities will be created from appropriate JSON properties
         - Relationships between entities will be established based on the JSON structure
     """
-    global graphiti_client, episode_queues, queue_workers
+    global graphiti_client
 
-    if graphiti_client is None:
+    if graphiti_client is None or episode_queue is None or episode_workers is None:
         return ErrorResponse(error='Graphiti client not initialized')
 
     try:
@@ -772,53 +777,29 @@ async def add_memory(
         # The Graphiti client expects a str for group_id, not Optional[str]
         group_id_str = str(effective_group_id) if effective_group_id is not None else ''
 
-        # We've already checked that graphiti_client is not None above
-        # This assert statement helps type checkers understand that graphiti_client is defined
-        assert graphiti_client is not None, 'graphiti_client should not be None here'
-
-        # Use cast to help the type checker understand that graphiti_client is not None
-        client = cast(Graphiti, graphiti_client)
-
-        # Define the episode processing function
-        async def process_episode():
-            try:
-                logger.info(f"Processing queued episode '{name}' for group_id: {group_id_str}")
-                # Use all entity types if use_custom_entities is enabled, otherwise use empty dict
-                entity_types = ENTITY_TYPES if config.use_custom_entities else {}
-
-                await client.add_episode(
-                    name=name,
-                    episode_body=episode_body,
-                    source=source_type,
-                    source_description=source_description,
-                    group_id=group_id_str,  # Using the string version of group_id
-                    uuid=uuid,
-                    reference_time=datetime.now(timezone.utc),
-                    entity_types=entity_types,
+        # The queue key makes the queued episode idempotent across retries and restarts
+        await episode_queue.enqueue(
+            [
+                NewEpisode(
+                    uuid=uuid or str(uuid4()),
+                    group_id=group_id_str,
+                    payload={
+                        'uuid': uuid,
+                        'name': name,
+                        'episode_body': episode_body,
+                        'source': source_type.value,
+                        'source_description': source_description,
+                        'reference_time': datetime.now(timezone.utc).isoformat(),
+                    },
                 )
-                logger.info(f"Episode '{name}' added successfully")
-
-                logger.info(f"Episode '{name}' processed successfully")
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(
-                    f"Error processing episode '{name}' for group_id {group_id_str}: {error_msg}"
-                )
-
-        # Initialize queue for this group_id if it doesn't exist
-        if group_id_str not in episode_queues:
-            episode_queues[group_id_str] = asyncio.Queue()
-
-        # Add the episode processing function to the queue
-        await episode_queues[group_id_str].put(process_episode)
-
-        # Start a worker for this queue if one isn't already running
-        if not queue_workers.get(group_id_str, False):
-            asyncio.create_task(process_episode_queue(group_id_str))
+            ]
+        )
+        episode_workers.notify()
+        counts = (await episode_queue.counts(group_id_str)).get(group_id_str, {})
 
         # Return immediately with a success message
         return SuccessResponse(
-            message=f"Episode '{name}' queued for processing (position: {episode_queues[group_id_str].qsize()})"
+            message=f"Episode '{name}' queued for processing (position: {counts.get('pending', 0)})"
         )
     except Exception as e:
         error_msg = str(e)
@@ -888,16 +869,7 @@ async def search_memory_nodes(
 
         # Format the node results
         formatted_nodes: list[NodeResult] = [
-            {
-                'uuid': node.uuid,
-                'name': node.name,
-                'summary': node.summary if hasattr(node, 'summary') else '',
-                'labels': node.labels if hasattr(node, 'labels') else [],
-                'group_id': node.group_id,
-                'created_at': node.created_at.isoformat(),
-                'attributes': node.attributes if hasattr(node, 'attributes') else {},
-            }
-            for node in search_results.nodes
+            cast(NodeResult, entity_node_to_json(node)) for node in search_results.nodes
         ]
 
         return NodeSearchResponse(message='Nodes retrieved successfully', nodes=formatted_nodes)
@@ -1089,12 +1061,7 @@ async def get_episodes(
                 message=f'No episodes found for group {effective_group_id}', episodes=[]
             )
 
-        # Use Pydantic's model_dump method for EpisodicNode serialization
-        formatted_episodes = [
-            # Use mode='json' to handle datetime serialization
-            episode.model_dump(mode='json')
-            for episode in episodes
-        ]
+        formatted_episodes = [episodic_node_to_json(episode) for episode in episodes]
 
         # Return the Python list directly - MCP will handle serialization
         return formatted_episodes
@@ -0,0 +1,26 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core import Graphiti
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.memory_driver import InMemoryDriver
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.llm_client import LLMClient
+
+
+@pytest.fixture
+def graphiti() -> Graphiti:
+    """A Graphiti over an in-memory graph whose LLM extracts nothing from an episode."""
+    llm_client = MagicMock(spec=LLMClient)
+    llm_client.generate_response = AsyncMock(
+        return_value={'extracted_entities': [], 'entity_resolutions': [], 'edges': []}
+    )
+    embedder = MagicMock(spec=EmbedderClient)
+    embedder.create_batch = AsyncMock(return_value=[])
+    return Graphiti(
+        llm_client=llm_client,
+        embedder=embedder,
+        cross_encoder=MagicMock(spec=CrossEncoderClient),
+        graph_driver=InMemoryDriver(),
+    )
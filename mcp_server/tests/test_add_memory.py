@@ -0,0 +1,28 @@
+import graphiti_mcp_server as server
+import pytest
+
+from graphiti_core.nodes import EpisodicNode
+from graphiti_core.utils.episode_queue import EpisodeQueueWorkers, SQLiteEpisodeQueue
+
+
+@pytest.mark.asyncio
+async def test_add_memory_without_uuid_adds_a_new_episode(graphiti, tmp_path, monkeypatch):
+    queue = SQLiteEpisodeQueue(str(tmp_path / 'queue.db'))
+    workers = EpisodeQueueWorkers(queue, server.process_queued_episode, workers=1)
+    monkeypatch.setattr(server, 'graphiti_client', graphiti)
+    monkeypatch.setattr(server, 'episode_queue', queue)
+    monkeypatch.setattr(server, 'episode_workers', workers)
+    await workers.start()
+
+    response = await server.add_memory(name='note', episode_body='hello', group_id='g1')
+    assert 'error' not in response
+    assert await workers.wait_idle(timeout=10)
+
+    # the generated queue key must not be mistaken for the uuid of an existing episode
+    counts = await queue.counts('g1')
+    assert counts['g1'] == {'completed': 1}
+    stored = await EpisodicNode.get_by_group_ids(graphiti.driver, ['g1'])
+    assert [(episode.name, episode.content) for episode in stored] == [('note', 'hello')]
+
+    await workers.stop()
+    await queue.close()
@@ -14,6 +14,16 @@ class Settings(BaseSettings):
     neo4j_uri: str
     neo4j_user: str
     neo4j_password: str
+    # episodes from different groups are ingested concurrently by this many workers
+    ingest_workers: int = Field(4)
+    # POST /messages is rejected with 429 once this many messages are queued or running
+    ingest_max_pending_messages: int = Field(10_000)
+    # above 1, queued messages of a group are coalesced into add_episode_bulk calls of this size
+    ingest_batch_size: int = Field(1)
+    # SQLite database holding queued messages, so they survive restarts
+    ingest_queue_path: str = Field('ingest_queue.db')
+    # attempts per message before it is marked failed
+    ingest_max_attempts: int = Field(3)
 
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
@@ -1,13 +1,32 @@
 from .common import Message, Result
-from .ingest import AddEntityNodeRequest, AddMessagesRequest
-from .retrieve import FactResult, GetMemoryRequest, GetMemoryResponse, SearchQuery, SearchResults
+from .ingest import (
+    AddEntityNodeRequest,
+    AddMessagesRequest,
+    AddMessagesResponse,
+    GroupQueueStatus,
+    IngestJobStatus,
+    IngestQueueStatus,
+)
+from .retrieve import (
+    FactResult,
+    GetMemoryRequest,
+    GetMemoryResponse,
+    SearchQuery,
+    SearchResults,
+    SearchStreamUpdate,
+)
 
 __all__ = [
     'SearchQuery',
     'Message',
     'AddMessagesRequest',
     'AddEntityNodeRequest',
+    'AddMessagesResponse',
+    'IngestJobStatus',
+    'GroupQueueStatus',
+    'IngestQueueStatus',
     'SearchResults',
+    'SearchStreamUpdate',
     'FactResult',
     'Result',
     'GetMemoryRequest',
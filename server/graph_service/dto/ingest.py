@@ -1,6 +1,9 @@
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
-from graph_service.dto.common import Message
+from graph_service.dto.common import Message, Result
 
 
 class AddMessagesRequest(BaseModel):
@@ -13,3 +16,31 @@ class AddEntityNodeRequest(BaseModel):
     group_id: str = Field(..., description='The group id of the node to add')
     name: str = Field(..., description='The name of the node to add')
     summary: str = Field(default='', description='The summary of the node to add')
+
+
+class AddMessagesResponse(Result):
+    job_id: str = Field(..., description='The id of the ingestion job for the messages')
+
+
+class IngestJobStatus(BaseModel):
+    job_id: str
+    group_id: str
+    status: Literal['queued', 'running', 'completed', 'failed']
+    messages: int = Field(..., description='The number of messages in the job')
+    error: str | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+
+
+class GroupQueueStatus(BaseModel):
+    group_id: str
+    queued_messages: int
+    running_messages: int
+    failed_messages: int = Field(..., description='Messages that ran out of retry attempts')
+
+
+class IngestQueueStatus(BaseModel):
+    pending_messages: int = Field(..., description='Messages queued or being ingested')
+    max_pending_messages: int
+    workers: int
+    groups: list[GroupQueueStatus]
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -11,6 +12,9 @@ class SearchQuery(BaseModel):
     )
     query: str
     max_facts: int = Field(default=10, description='The maximum number of facts to retrieve')
+    as_of: datetime | None = Field(
+        default=None, description='Only retrieve facts that were true at this point in time'
+    )
 
 
 class FactResult(BaseModel):
@@ -30,6 +34,13 @@ class SearchResults(BaseModel):
     facts: list[FactResult]
 
 
+class SearchStreamUpdate(BaseModel):
+    stage: Literal['first_stage', 'final'] = Field(
+        ..., description='first_stage facts are unreranked and superseded by the final facts'
+    )
+    facts: list[FactResult]
+
+
 class GetMemoryRequest(BaseModel):
     group_id: str = Field(..., description='The group id of the memory to get')
     max_facts: int = Field(default=10, description='The maximum number of facts to retrieve')
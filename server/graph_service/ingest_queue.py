@@ -0,0 +1,175 @@
+import logging
+from uuid import uuid4
+
+from graphiti_core.nodes import EpisodeType  # type: ignore
+from graphiti_core.utils.bulk_utils import RawEpisode  # type: ignore
+from graphiti_core.utils.episode_queue import (  # type: ignore
+    EpisodeQueue,
+    EpisodeQueueWorkers,
+    NewEpisode,
+    QueuedEpisode,
+)
+
+from graph_service.dto import GroupQueueStatus, IngestJobStatus, IngestQueueStatus, Message
+from graph_service.zep_graphiti import ZepGraphiti
+
+logger = logging.getLogger(__name__)
+
+
+class IngestQueueFullError(Exception):
+    pass
+
+
+def episode_body(message: Message) -> str:
+    return f'{message.role or ""}({message.role_type}): {message.content}'
+
+
+def job_status(job_id: str, episodes: list[QueuedEpisode]) -> IngestJobStatus:
+    statuses = {episode.status for episode in episodes}
+    if 'failed' in statuses:
+        status = 'failed'
+    elif statuses == {'completed'}:
+        status = 'completed'
+    elif statuses == {'pending'}:
+        status = 'queued'
+    else:
+        status = 'running'
+
+    finished = status in ('completed', 'failed') and 'pending' not in statuses
+    return IngestJobStatus(
+        job_id=job_id,
+        group_id=episodes[0].group_id,
+        status=status,
+        messages=len(episodes),
+        error=next((episode.error for episode in episodes if episode.error), None),
+        created_at=min(episode.created_at for episode in episodes),
+        finished_at=max(episode.updated_at for episode in episodes) if finished else None,
+    )
+
+
+class IngestQueue:
+    """
+    Durable per-group queues of messages, drained by a bounded pool of workers.
+
+    Messages are stored in an EpisodeQueue before POST /messages returns, so queued work
+    survives restarts and failed episodes are retried. A group is handled by at most one
+    worker at a time, so its messages are ingested in the order they arrived.
+    """
+
+    def __init__(
+        self,
+        graphiti: ZepGraphiti,
+        queue: EpisodeQueue,
+        workers: int = 4,
+        max_pending_messages: int = 10_000,
+        batch_size: int = 1,
+    ):
+        self.graphiti = graphiti
+        self.queue = queue
+        self.max_pending_messages = max_pending_messages
+        self.batch_size = batch_size
+        self.workers = EpisodeQueueWorkers(
+            queue,
+            self._add,
+            self._add_bulk if batch_size > 1 else None,
+            workers=workers,
+            # without bulk ingestion a group still claims several messages per queue round trip
+            batch_size=batch_size if batch_size > 1 else 10,
+        )
+
+    async def start(self):
+        await self.workers.start()
+
+    async def stop(self, timeout: float):
+        # messages that are still queued are replayed on the next start
+        await self.workers.stop(timeout)
+        await self.queue.close()
+
+    async def submit(self, group_id: str, messages: list[Message]) -> IngestJobStatus:
+        pending = await self.pending_messages()
+        if pending + len(messages) > self.max_pending_messages:
+            raise IngestQueueFullError(f'{pending} messages are already pending ingestion')
+
+        job_id = str(uuid4())
+        episodes = await self.queue.enqueue(
+            [
+                NewEpisode(
+                    # the queue key makes retries and re-submitted messages idempotent
+                    uuid=message.uuid or str(uuid4()),
+                    group_id=group_id,
+                    job_id=job_id,
+                    payload=message.model_dump(mode='json'),
+                )
+                for message in messages
+            ]
+        )
+        self.workers.notify()
+        return job_status(job_id, episodes)
+
+    async def pending_messages(self) -> int:
+        counts = await self.queue.counts()
+        return sum(group.get('pending', 0) + group.get('running', 0) for group in counts.values())
+
+    async def get_job(self, job_id: str) -> IngestJobStatus | None:
+        episodes = await self.queue.get_job(job_id)
+        return job_status(job_id, episodes) if episodes else None
+
+    async def group_status(self, group_id: str) -> GroupQueueStatus:
+        counts = (await self.queue.counts(group_id)).get(group_id, {})
+        return GroupQueueStatus(
+            group_id=group_id,
+            queued_messages=counts.get('pending', 0),
+            running_messages=counts.get('running', 0),
+            failed_messages=counts.get('failed', 0),
+        )
+
+    async def status(self) -> IngestQueueStatus:
+        counts = await self.queue.counts()
+        groups = [
+            GroupQueueStatus(
+                group_id=group_id,
+                queued_messages=group.get('pending', 0),
+                running_messages=group.get('running', 0),
+                failed_messages=group.get('failed', 0),
+            )
+            for group_id, group in counts.items()
+            if group.get('pending') or group.get('running')
+        ]
+        return IngestQueueStatus(
+            pending_messages=sum(
+                group.queued_messages + group.running_messages for group in groups
+            ),
+            max_pending_messages=self.max_pending_messages,
+            workers=self.workers.workers,
+            groups=groups,
+        )
+
+    async def _add(self, episode: QueuedEpisode):
+        message = Message.model_validate(episode.payload)
+        await self.graphiti.add_episode(
+            # add_episode loads the episode a uuid names, so pass only the caller's own uuid
+            uuid=message.uuid,
+            group_id=episode.group_id,
+            name=message.name,
+            episode_body=episode_body(message),
+            reference_time=message.timestamp,
+            source=EpisodeType.message,
+            source_description=message.source_description,
+        )
+
+    async def _add_bulk(self, episodes: list[QueuedEpisode]):
+        logger.info(f'Ingesting {len(episodes)} messages for group {episodes[0].group_id}')
+        raw_episodes = []
+        for episode in episodes:
+            message = Message.model_validate(episode.payload)
+            raw_episodes.append(
+                RawEpisode(
+                    name=message.name,
+                    uuid=message.uuid,
+                    content=episode_body(message),
+                    source_description=message.source_description,
+                    source=EpisodeType.message,
+                    reference_time=message.timestamp,
+                )
+            )
+        await self.graphiti.add_episode_bulk(raw_episodes, group_id=episodes[0].group_id)
@@ -1,20 +1,26 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from graph_service.config import get_settings
 from graph_service.routers import ingest, retrieve
-from graph_service.zep_graphiti import initialize_graphiti
+from graph_service.zep_graphiti import check_graphiti_ready, create_graphiti
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
-    settings = get_settings()
-    await initialize_graphiti(settings)
-    yield
-    # Shutdown
-    # No need to close Graphiti here, as it's handled per-request
+async def lifespan(app: FastAPI):
+    # One Graphiti instance per process, so requests reuse warm Bolt and HTTP connection pools.
+    # Router lifespans run inside this one, so the ingest worker is drained before shutdown.
+    graphiti, openai_client = create_graphiti(get_settings())
+    try:
+        await graphiti.build_indices_and_constraints()
+        app.state.graphiti = graphiti
+        yield
+    finally:
+        app.state.graphiti = None
+        await graphiti.close()
+        await openai_client.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -27,3 +33,11 @@ app.include_router(ingest.router)
 @app.get('/healthcheck')
 async def healthcheck():
     return JSONResponse(content={'status': 'healthy'}, status_code=200)
+
+
+@app.get('/readiness')
+async def readiness(request: Request):
+    graphiti = getattr(request.app.state, 'graphiti', None)
+    if graphiti is None or not await check_graphiti_ready(graphiti):
+        return JSONResponse(content={'status': 'unavailable'}, status_code=503)
+    return JSONResponse(content={'status': 'ready'}, status_code=200)
@@ -1,49 +1,48 @@
-import asyncio
 from contextlib import asynccontextmanager
-from functools import partial
+from typing import Annotated
 
-from fastapi import APIRouter, FastAPI, status
-from graphiti_core.nodes import EpisodeType  # type: ignore
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, status
+from graphiti_core.utils.episode_queue import SQLiteEpisodeQueue  # type: ignore
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data  # type: ignore
 
-from graph_service.dto import AddEntityNodeRequest, AddMessagesRequest, Message, Result
+from graph_service.config import get_settings
+from graph_service.dto import (
+    AddEntityNodeRequest,
+    AddMessagesRequest,
+    AddMessagesResponse,
+    GroupQueueStatus,
+    IngestJobStatus,
+    IngestQueueStatus,
+    Result,
+)
+from graph_service.ingest_queue import IngestQueue, IngestQueueFullError
 from graph_service.zep_graphiti import ZepGraphitiDep
 
+# seconds to wait for queued jobs to finish on shutdown
+SHUTDOWN_TIMEOUT = 30
 
-class AsyncWorker:
-    def __init__(self):
-        self.queue = asyncio.Queue()
-        self.task = None
-
-    async def worker(self):
-        while True:
-            try:
-                print(f'Got a job: (size of remaining queue: {self.queue.qsize()})')
-                job = await self.queue.get()
-                await job()
-            except asyncio.CancelledError:
-                break
-
-    async def start(self):
-        self.task = asyncio.create_task(self.worker())
-
-    async def stop(self):
-        if self.task:
-            self.task.cancel()
-            await self.task
-        while not self.queue.empty():
-            self.queue.get_nowait()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    ingest_queue = IngestQueue(
+        app.state.graphiti,
+        SQLiteEpisodeQueue(settings.ingest_queue_path, max_attempts=settings.ingest_max_attempts),
+        workers=settings.ingest_workers,
+        max_pending_messages=settings.ingest_max_pending_messages,
+        batch_size=settings.ingest_batch_size,
+    )
+    await ingest_queue.start()
+    app.state.ingest_queue = ingest_queue
+    yield
+    await ingest_queue.stop(SHUTDOWN_TIMEOUT)
 
-async_worker = AsyncWorker()
 
+def get_ingest_queue(request: Request) -> IngestQueue:
+    return request.app.state.ingest_queue
 
-@asynccontextmanager
-async def lifespan(_: FastAPI):
-    await async_worker.start()
-    yield
-    await async_worker.stop()
 
+IngestQueueDep = Annotated[IngestQueue, Depends(get_ingest_queue)]
 
 router = APIRouter(lifespan=lifespan)
 
@@ -51,23 +50,34 @@ router = APIRouter(lifespan=lifespan)
 @router.post('/messages', status_code=status.HTTP_202_ACCEPTED)
 async def add_messages(
     request: AddMessagesRequest,
-    graphiti: ZepGraphitiDep,
-):
-    async def add_messages_task(m: Message):
-        await graphiti.add_episode(
-            uuid=m.uuid,
-            group_id=request.group_id,
-            name=m.name,
-            episode_body=f'{m.role or ""}({m.role_type}): {m.content}',
-            reference_time=m.timestamp,
-            source=EpisodeType.message,
-            source_description=m.source_description,
-        )
-
-    for m in request.messages:
-        await async_worker.queue.put(partial(add_messages_task, m))
-
-    return Result(message='Messages added to processing queue', success=True)
+    ingest_queue: IngestQueueDep,
+) -> AddMessagesResponse:
+    try:
+        job = await ingest_queue.submit(request.group_id, request.messages)
+    except IngestQueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e)) from e
+
+    return AddMessagesResponse(
+        message='Messages added to processing queue', success=True, job_id=job.job_id
+    )
+
+
+@router.get('/messages/queue', status_code=status.HTTP_200_OK)
+async def get_queue_status(ingest_queue: IngestQueueDep) -> IngestQueueStatus:
+    return await ingest_queue.status()
+
+
+@router.get('/messages/queue/{group_id}', status_code=status.HTTP_200_OK)
+async def get_group_queue_status(group_id: str, ingest_queue: IngestQueueDep) -> GroupQueueStatus:
+    return await ingest_queue.group_status(group_id)
+
+
+@router.get('/jobs/{job_id}', status_code=status.HTTP_200_OK)
+async def get_job_status(job_id: str, ingest_queue: IngestQueueDep) -> IngestJobStatus:
+    job = await ingest_queue.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Job {job_id} not found')
+    return job
 
 
 @router.post('/entity-node', status_code=status.HTTP_201_CREATED)
@@ -1,6 +1,16 @@
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
+from fastapi.responses import StreamingResponse
+from graphiti_core.edges import EntityEdge  # type: ignore
+from graphiti_core.search.search_config_recipes import (  # type: ignore
+    EDGE_HYBRID_SEARCH_CROSS_ENCODER,
+)
+from graphiti_core.utils.serialization import (  # type: ignore
+    FACT_FIELDS,
+    dumps,
+    entity_edge_to_json,
+)
 
 from graph_service.dto import (
     GetMemoryRequest,
@@ -8,24 +18,48 @@ from graph_service.dto import (
     Message,
     SearchQuery,
     SearchResults,
+    SearchStreamUpdate,
 )
 from graph_service.zep_graphiti import ZepGraphitiDep, get_fact_result_from_edge
 
 router = APIRouter()
 
 
-@router.post('/search', status_code=status.HTTP_200_OK)
+def facts_json(edges: list[EntityEdge]) -> list[dict]:
+    # serializes straight from the edges, skipping the FactResult models
+    return [entity_edge_to_json(edge, FACT_FIELDS) for edge in edges]
+
+
+@router.post('/search', status_code=status.HTTP_200_OK, response_model=SearchResults)
 async def search(query: SearchQuery, graphiti: ZepGraphitiDep):
     relevant_edges = await graphiti.search(
         group_ids=query.group_ids,
         query=query.query,
         num_results=query.max_facts,
+        as_of=query.as_of,
     )
-    facts = [get_fact_result_from_edge(edge) for edge in relevant_edges]
-    return SearchResults(
-        facts=facts,
+    return Response(dumps({'facts': facts_json(relevant_edges)}), media_type='application/json')
+
+
+@router.post('/search/stream', status_code=status.HTTP_200_OK, response_model=SearchStreamUpdate)
+async def search_stream(query: SearchQuery, graphiti: ZepGraphitiDep):
+    """
+    Streams newline-delimited JSON: unreranked facts as soon as the first-stage retrieval
+    finishes, followed by the cross-encoder reranked facts.
+    """
+    updates = graphiti.search_stream(
+        query=query.query,
+        config=EDGE_HYBRID_SEARCH_CROSS_ENCODER.model_copy(update={'limit': query.max_facts}),
+        group_ids=query.group_ids,
+        as_of=query.as_of,
     )
 
+    async def lines():
+        async for update in updates:
+            yield dumps({'stage': update.stage, 'facts': facts_json(update.results.edges)}) + b'\n'
+
+    return StreamingResponse(lines(), media_type='application/x-ndjson')
+
 
 @router.get('/entity-edge/{uuid}', status_code=status.HTTP_200_OK)
 async def get_entity_edge(uuid: str, graphiti: ZepGraphitiDep):
@@ -41,7 +75,7 @@ async def get_episodes(group_id: str, last_n: int, graphiti: ZepGraphitiDep):
     return episodes
 
 
-@router.post('/get-memory', status_code=status.HTTP_200_OK)
+@router.post('/get-memory', status_code=status.HTTP_200_OK, response_model=GetMemoryResponse)
 async def get_memory(
     request: GetMemoryRequest,
     graphiti: ZepGraphitiDep,
@@ -52,8 +86,7 @@ async def get_memory(
         query=combined_query,
         num_results=request.max_facts,
     )
-    facts = [get_fact_result_from_edge(edge) for edge in result]
-    return GetMemoryResponse(facts=facts)
+    return Response(dumps({'facts': facts_json(result)}), media_type='application/json')
 
 
 def compose_query_from_messages(messages: list[Message]):
@@ -1,22 +1,34 @@
+import asyncio
 import logging
 from typing import Annotated
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request, status
 from graphiti_core import Graphiti  # type: ignore
+from graphiti_core.cross_encoder import CrossEncoderClient, OpenAIRerankerClient  # type: ignore
 from graphiti_core.edges import EntityEdge  # type: ignore
-from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError, NodeNotFoundError
-from graphiti_core.llm_client import LLMClient  # type: ignore
-from graphiti_core.nodes import EntityNode, EpisodicNode  # type: ignore
+from graphiti_core.embedder import EmbedderClient, OpenAIEmbedder, OpenAIEmbedderConfig
+from graphiti_core.errors import EdgeNotFoundError, NodeNotFoundError
+from graphiti_core.llm_client import LLMClient, LLMConfig, OpenAIClient  # type: ignore
+from graphiti_core.nodes import EntityNode, EpisodicNode, Node  # type: ignore
+from openai import AsyncOpenAI
 
-from graph_service.config import ZepEnvDep
+from graph_service.config import Settings
 from graph_service.dto import FactResult
 
 logger = logging.getLogger(__name__)
 
 
 class ZepGraphiti(Graphiti):
-    def __init__(self, uri: str, user: str, password: str, llm_client: LLMClient | None = None):
-        super().__init__(uri, user, password, llm_client)
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        llm_client: LLMClient | None = None,
+        embedder: EmbedderClient | None = None,
+        cross_encoder: CrossEncoderClient | None = None,
+    ):
+        super().__init__(uri, user, password, llm_client, embedder, cross_encoder)
 
     async def save_entity_node(self, name: str, uuid: str, group_id: str, summary: str = ''):
         new_node = EntityNode(
@@ -37,24 +49,9 @@ class ZepGraphiti(Graphiti):
             raise HTTPException(status_code=404, detail=e.message) from e
 
     async def delete_group(self, group_id: str):
-        try:
-            edges = await EntityEdge.get_by_group_ids(self.driver, [group_id])
-        except GroupsEdgesNotFoundError:
-            logger.warning(f'No edges found for group {group_id}')
-            edges = []
-
-        nodes = await EntityNode.get_by_group_ids(self.driver, [group_id])
-
-        episodes = await EpisodicNode.get_by_group_ids(self.driver, [group_id])
-
-        for edge in edges:
-            await edge.delete(self.driver)
-
-        for node in nodes:
-            await node.delete(self.driver)
-
-        for episode in episodes:
-            await episode.delete(self.driver)
+        # Set-based, batched DETACH DELETE instead of loading the whole group into memory
+        deleted = await Node.delete_by_group_id(self.driver, group_id)
+        logger.info(f'Deleted {deleted} nodes for group {group_id}')
 
     async def delete_entity_edge(self, uuid: str):
         try:
@@ -71,32 +68,50 @@ class ZepGraphiti(Graphiti):
             raise HTTPException(status_code=404, detail=e.message) from e
 
 
-async def get_graphiti(settings: ZepEnvDep):
-    client = ZepGraphiti(
-        uri=settings.neo4j_uri,
-        user=settings.neo4j_user,
-        password=settings.neo4j_password,
+def create_graphiti(settings: Settings) -> tuple[ZepGraphiti, AsyncOpenAI]:
+    """
+    Build the process-wide Graphiti instance. The LLM, embedder and reranker share one OpenAI
+    HTTP connection pool, and the Neo4j driver keeps its Bolt pool for the life of the process.
+    """
+    openai_client = AsyncOpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
+    llm_config = LLMConfig(
+        api_key=settings.openai_api_key,
+        base_url=settings.openai_base_url,
+        model=settings.model_name,
     )
-    if settings.openai_base_url is not None:
-        client.llm_client.config.base_url = settings.openai_base_url
-    if settings.openai_api_key is not None:
-        client.llm_client.config.api_key = settings.openai_api_key
-    if settings.model_name is not None:
-        client.llm_client.model = settings.model_name
-
-    try:
-        yield client
-    finally:
-        await client.close()
-
+    embedder_config = OpenAIEmbedderConfig(
+        api_key=settings.openai_api_key, base_url=settings.openai_base_url
+    )
+    if settings.embedding_model_name is not None:
+        embedder_config.embedding_model = settings.embedding_model_name
 
-async def initialize_graphiti(settings: ZepEnvDep):
-    client = ZepGraphiti(
+    graphiti = ZepGraphiti(
         uri=settings.neo4j_uri,
         user=settings.neo4j_user,
         password=settings.neo4j_password,
+        llm_client=OpenAIClient(config=llm_config, client=openai_client),
+        embedder=OpenAIEmbedder(config=embedder_config, client=openai_client),
+        cross_encoder=OpenAIRerankerClient(config=llm_config, client=openai_client),
     )
-    await client.build_indices_and_constraints()
+    return graphiti, openai_client
+
+
+async def check_graphiti_ready(graphiti: ZepGraphiti, timeout: float = 5.0) -> bool:
+    try:
+        await asyncio.wait_for(graphiti.driver.execute_query('RETURN 1'), timeout)
+        return True
+    except Exception as e:
+        logger.warning(f'Graph database is not ready: {e}')
+        return False
+
+
+def get_graphiti(request: Request) -> ZepGraphiti:
+    graphiti = getattr(request.app.state, 'graphiti', None)
+    if graphiti is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail='Graphiti is not initialized'
+        )
+    return graphiti
 
 
 def get_fact_result_from_edge(edge: EntityEdge):
@@ -0,0 +1,131 @@
+from unittest.mock import DEFAULT, AsyncMock
+
+import pytest
+from graphiti_core.nodes import EpisodicNode  # type: ignore
+from graphiti_core.utils.episode_queue import QueuedEpisode, SQLiteEpisodeQueue  # type: ignore
+
+from graph_service.dto import Message
+from graph_service.ingest_queue import IngestQueue, IngestQueueFullError
+
+
+def message(content: str, uuid: str | None = None) -> Message:
+    return Message(content=content, uuid=uuid, role_type='user', role='alice')
+
+
+async def ingest(ingest_queue: IngestQueue, messages: list[Message]) -> list[QueuedEpisode]:
+    await ingest_queue.start()
+    job = await ingest_queue.submit('g1', messages)
+    assert await ingest_queue.workers.wait_idle(timeout=10)
+    episodes = await ingest_queue.queue.get_job(job.job_id)
+    await ingest_queue.stop(timeout=1)
+    return episodes
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('batch_size', [1, 2])
+async def test_messages_without_uuid_are_added_as_new_episodes(graphiti, tmp_path, batch_size):
+    queue = SQLiteEpisodeQueue(str(tmp_path / 'queue.db'))
+    ingest_queue = IngestQueue(graphiti, queue, workers=1, batch_size=batch_size)
+
+    episodes = await ingest(ingest_queue, [message('hello'), message('bye')])
+
+    # the generated queue keys must not be mistaken for the uuids of existing episodes
+    assert [episode.status for episode in episodes] == ['completed', 'completed']
+    stored = await EpisodicNode.get_by_group_ids(graphiti.driver, ['g1'])
+    assert sorted(episode.content for episode in stored) == [
+        'alice(user): bye',
+        'alice(user): hello',
+    ]
+    assert not {episode.uuid for episode in stored} & {episode.uuid for episode in episodes}
+
+
+@pytest.mark.asyncio
+async def test_submit_queues_a_job_until_the_queue_is_full(graphiti, tmp_path):
+    queue = SQLiteEpisodeQueue(str(tmp_path / 'queue.db'))
+    ingest_queue = IngestQueue(graphiti, queue, max_pending_messages=3)
+
+    job = await ingest_queue.submit('g1', [message('hello'), message('bye')])
+    assert (job.group_id, job.status, job.messages) == ('g1', 'queued', 2)
+    assert await ingest_queue.get_job(job.job_id) == job
+    assert await ingest_queue.get_job('unknown') is None
+    assert (await ingest_queue.group_status('g1')).queued_messages == 2
+
+    with pytest.raises(IngestQueueFullError):
+        await ingest_queue.submit('g2', [message('one'), message('two')])
+    assert (await ingest_queue.status()).pending_messages == 2
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_batches_are_added_in_bulk_in_order(graphiti, tmp_path):
+    graphiti.add_episode_bulk = AsyncMock(wraps=graphiti.add_episode_bulk)
+    queue = SQLiteEpisodeQueue(str(tmp_path / 'queue.db'))
+    ingest_queue = IngestQueue(graphiti, queue, workers=1, batch_size=2)
+
+    episodes = await ingest(ingest_queue, [message(str(i)) for i in range(3)])
+
+    assert [episode.status for episode in episodes] == ['completed'] * 3
+    batches = [
+        [raw_episode.content for raw_episode in call.args[0]]
+        for call in graphiti.add_episode_bulk.await_args_list
+    ]
+    assert batches == [['alice(user): 0', 'alice(user): 1'], ['alice(user): 2']]
+
+
+@pytest.mark.asyncio
+async def test_failed_messages_are_retried(graphiti, tmp_path):
+    graphiti.add_episode = AsyncMock(
+        wraps=graphiti.add_episode, side_effect=[RuntimeError('llm unavailable'), DEFAULT]
+    )
+    queue = SQLiteEpisodeQueue(str(tmp_path / 'queue.db'), retry_delay=0)
+    ingest_queue = IngestQueue(graphiti, queue, workers=1)
+
+    episodes = await ingest(ingest_queue, [message('hello')])
+
+    assert [(episode.status, episode.attempts) for episode in episodes] == [('completed', 2)]
+    assert graphiti.add_episode.await_count == 2
+    assert len(await EpisodicNode.get_by_group_ids(graphiti.driver, ['g1'])) == 1
+
+
+@pytest.mark.asyncio
+async def test_messages_that_keep_failing_fail_the_job(graphiti, tmp_path):
+    graphiti.add_episode = AsyncMock(side_effect=RuntimeError('llm unavailable'))
+    queue = SQLiteEpisodeQueue(str(tmp_path / 'queue.db'), max_attempts=2, retry_delay=0)
+    ingest_queue = IngestQueue(graphiti, queue, workers=1)
+
+    await ingest_queue.start()
+    job = await ingest_queue.submit('g1', [message('hello')])
+    assert await ingest_queue.workers.wait_idle(timeout=10)
+
+    status = await ingest_queue.get_job(job.job_id)
+    assert status is not None
+    assert (status.status, status.error) == ('failed', 'llm unavailable')
+    assert (await ingest_queue.group_status('g1')).failed_messages == 1
+    await ingest_queue.stop(timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_the_queue_and_replays_the_rest_on_start(graphiti, tmp_path):
+    path = str(tmp_path / 'queue.db')
+    ingest_queue = IngestQueue(graphiti, SQLiteEpisodeQueue(path), workers=1)
+    await ingest_queue.start()
+    first = await ingest_queue.submit('g1', [message('hello'), message('bye')])
+    await ingest_queue.stop(timeout=10)
+
+    # a queue that is stopped without a timeout leaves its messages queued
+    ingest_queue = IngestQueue(graphiti, SQLiteEpisodeQueue(path), workers=1)
+    second = await ingest_queue.submit('g1', [message('again')])
+    await ingest_queue.stop(timeout=0)
+
+    ingest_queue = IngestQueue(graphiti, SQLiteEpisodeQueue(path), workers=1)
+    queued = await ingest_queue.get_job(second.job_id)
+    assert queued is not None and queued.status == 'queued'
+    await ingest_queue.start()
+    assert await ingest_queue.workers.wait_idle(timeout=10)
+    for job_id in (first.job_id, second.job_id):
+        status = await ingest_queue.get_job(job_id)
+        assert status is not None and status.status == 'completed'
+    await ingest_queue.stop(timeout=1)
+
+    stored = await EpisodicNode.get_by_group_ids(graphiti.driver, ['g1'])
+    assert len(stored) == 3
@@ -0,0 +1,44 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from graphiti_core.edges import EntityEdge  # type: ignore
+from graphiti_core.utils.serialization import dumps  # type: ignore
+
+from graph_service.dto import SearchResults
+from graph_service.routers.retrieve import facts_json
+from graph_service.zep_graphiti import get_fact_result_from_edge
+
+
+def test_facts_json_matches_fact_result_serialization():
+    berlin = timezone(timedelta(hours=2))
+    edges = [
+        EntityEdge(
+            uuid='e1',
+            group_id='g1',
+            source_node_uuid='n1',
+            target_node_uuid='n2',
+            name='WORKS_AT',
+            fact='Alice works at Acme',
+            episodes=['ep1'],
+            created_at=datetime(2024, 5, 1, 12, 30, tzinfo=berlin),
+            valid_at=datetime(2024, 4, 1, 9, 0, 0, 250_000, tzinfo=berlin),
+            invalid_at=None,
+            expired_at=datetime(2024, 6, 1, tzinfo=timezone.utc),
+        ),
+        EntityEdge(
+            uuid='e2',
+            group_id='g1',
+            source_node_uuid='n2',
+            target_node_uuid='n1',
+            name='EMPLOYS',
+            fact='Acme employs Alice',
+            created_at=datetime(2024, 5, 1, 10, 30, tzinfo=timezone.utc),
+        ),
+    ]
+
+    expected = SearchResults(
+        facts=[get_fact_result_from_edge(edge) for edge in edges]
+    ).model_dump_json()
+
+    assert json.loads(dumps({'facts': facts_json(edges)})) == json.loads(expected)
+    assert json.loads(expected)['facts'][0]['created_at'] == '2024-05-01T10:30:00+00:00'
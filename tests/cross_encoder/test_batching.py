@@ -0,0 +1,69 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from graphiti_core.cross_encoder.batching import BatchedPredictor
+
+
+class PassageLengthModel:
+    def __init__(self):
+        self.batches: list[int] = []
+        self.threads: set[str] = set()
+
+    def predict(self, pairs: list[list[str]]) -> list[float]:
+        self.batches.append(len(pairs))
+        self.threads.add(threading.current_thread().name)
+        return [float(len(passage)) for _, passage in pairs]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_batches():
+    model = PassageLengthModel()
+    predictor = BatchedPredictor(model.predict, max_batch_size=4, max_wait_ms=50)
+
+    results = await asyncio.gather(
+        predictor.predict([['q', 'a'], ['q', 'aa']]),
+        predictor.predict([['q', 'aaa']]),
+        predictor.predict([['q', 'aaaa'], ['q', 'a']]),
+    )
+
+    assert results == [[1.0, 2.0], [3.0], [4.0, 1.0]]
+    # the first two requests fill a batch of three; adding the third would exceed four pairs
+    assert model.batches == [3, 2]
+    assert model.threads != {threading.current_thread().name}
+    assert (predictor.stats.requests, predictor.stats.batches, predictor.stats.pairs) == (3, 2, 5)
+    assert predictor.stats.mean_batch_size == 2.5
+    predictor.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller():
+    def predict(pairs: list[list[str]]) -> list[float]:
+        raise RuntimeError('model unavailable')
+
+    predictor = BatchedPredictor(predict, max_wait_ms=10)
+
+    results = await asyncio.gather(
+        predictor.predict([['q', 'a']]), predictor.predict([['q', 'b']]), return_exceptions=True
+    )
+
+    assert [str(result) for result in results] == ['model unavailable'] * 2
+    assert await predictor.predict([]) == []
+    predictor.close()
@@ -0,0 +1,61 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+
+from graphiti_core.cross_encoder import CachedCrossEncoderClient, CrossEncoderClient
+
+
+class LengthCrossEncoder(CrossEncoderClient):
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        self.calls.append(passages)
+        return sorted(((p, float(len(p))) for p in passages), key=lambda r: r[1], reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_only_missing_passages_reach_the_reranker():
+    reranker = LengthCrossEncoder()
+    client = CachedCrossEncoderClient(reranker)
+
+    assert await client.rank('query', ['aa', 'a']) == [('aa', 2.0), ('a', 1.0)]
+    ranked = await client.rank('query', ['a', 'aaa', 'a', 'aa'])
+    await client.rank('query', ['aaa', 'a'])
+    await client.rank('other query', ['a'])
+
+    assert ranked == [('aaa', 3.0), ('aa', 2.0), ('a', 1.0), ('a', 1.0)]
+    assert reranker.calls == [['aa', 'a'], ['aaa'], ['a']]
+    assert (client.stats.hits, client.stats.misses, client.stats.reranker_calls) == (4, 4, 3)
+    assert client.stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_and_keyed_by_model():
+    reranker = LengthCrossEncoder()
+    client = CachedCrossEncoderClient(reranker, cache_size=2)
+
+    await client.rank('query', ['a', 'bb', 'ccc'])
+    # 'a' was the least recently used score, and scoring it again evicts 'bb'
+    await client.rank('query', ['a'])
+
+    assert reranker.calls[-1] == ['a']
+    assert client.stats.evictions == 2
+    assert client.model == 'LengthCrossEncoder'
+    assert client._cache_key('q', 'p') != CachedCrossEncoderClient(reranker, model='v2')._cache_key(
+        'q', 'p'
+    )
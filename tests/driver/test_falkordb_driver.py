@@ -21,7 +21,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.driver.driver import GraphProvider, validate_driver_operations
 
 try:
     from graphiti_core.driver.falkordb_driver import FalkorDriver, FalkorDriverSession
@@ -213,6 +213,50 @@ class TestFalkorDriver:
 
             mock_execute.assert_called_once_with('CALL db.indexes() YIELD name DROP INDEX name')
 
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    def test_driver_operations_match_defaults(self):
+        """Test the driver's operation overrides accept the default implementations' arguments."""
+        import graphiti_core.graphiti  # noqa: F401
+
+        assert set(validate_driver_operations(FalkorDriver)) == {
+            'delete_node',
+            'delete_nodes_by_group_id',
+            'delete_nodes_by_uuids',
+        }
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_delete_node_runs_one_query_per_label(self):
+        """Test Node.delete is dispatched to the driver and matches each label separately."""
+        from graphiti_core.nodes import EntityNode
+
+        node = EntityNode(name='Alice', group_id='group')
+        with patch.object(self.driver, 'execute_query', new_callable=AsyncMock) as mock_execute:
+            await node.delete(self.driver)
+
+        assert mock_execute.call_count == 3
+        assert [call.kwargs['uuid'] for call in mock_execute.call_args_list] == [node.uuid] * 3
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_delete_nodes_by_group_id_deletes_in_chunks(self):
+        """Test group deletion repeats LIMIT-ed deletes until a chunk comes back short."""
+        from graphiti_core.nodes import Node
+
+        results = iter([([{'deleted': 2}], [], None), ([{'deleted': 1}], [], None)])
+        with patch.object(
+            self.driver,
+            'execute_query',
+            new_callable=AsyncMock,
+            side_effect=lambda *args, **kwargs: next(results, ([{'deleted': 0}], [], None)),
+        ) as mock_execute:
+            deleted = await Node.delete_by_group_id(self.driver, 'group', batch_size=2)
+
+        assert deleted == 3
+        # two chunks for the first label, one empty chunk for each of the other two
+        assert mock_execute.call_count == 4
+        assert mock_execute.call_args.kwargs == {'batch_size': 2, 'group_id': 'group'}
+
 
 class TestFalkorDriverSession:
     """Test FalkorDB driver session functionality."""
@@ -0,0 +1,315 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+import graphiti_core.graphiti  # noqa: F401  registers every driver operation
+from graphiti_core.driver.driver import (
+    DRIVER_OPERATIONS,
+    GraphProvider,
+    driver_operation,
+    validate_driver_operations,
+)
+from graphiti_core.driver.memory_driver import InMemoryDriver, tokenize
+from graphiti_core.edges import EntityEdge, EpisodicEdge
+from graphiti_core.errors import EdgeNotFoundError, NodeNotFoundError
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode, Node
+from graphiti_core.search.search_filters import ComparisonOperator, DateFilter, SearchFilters
+from graphiti_core.search.search_utils import (
+    edge_bfs_search,
+    edge_fulltext_search,
+    edge_similarity_search,
+    episode_mentions_reranker,
+    get_relevant_edges,
+    node_distance_reranker,
+    node_fulltext_search,
+    node_similarity_search,
+)
+from graphiti_core.utils.bulk_utils import add_nodes_and_edges_bulk
+from graphiti_core.utils.maintenance.graph_data_operations import (
+    get_nodes_mentioned_only_by_episode,
+    retrieve_episodes,
+)
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def entity(name: str, embedding: list[float], group_id: str = 'group', **kwargs) -> EntityNode:
+    return EntityNode(
+        name=name, group_id=group_id, name_embedding=embedding, created_at=NOW, **kwargs
+    )
+
+
+def fact(source: EntityNode, target: EntityNode, text: str, embedding: list[float], **kwargs):
+    return EntityEdge(
+        source_node_uuid=source.uuid,
+        target_node_uuid=target.uuid,
+        name='RELATES_TO',
+        fact=text,
+        fact_embedding=embedding,
+        group_id=source.group_id,
+        created_at=NOW,
+        **kwargs,
+    )
+
+
+def episode(content: str, minutes: int = 0, group_id: str = 'group') -> EpisodicNode:
+    return EpisodicNode(
+        name=content,
+        group_id=group_id,
+        source=EpisodeType.text,
+        source_description='test',
+        content=content,
+        valid_at=NOW + timedelta(minutes=minutes),
+        created_at=NOW,
+    )
+
+
+async def build_graph():
+    driver = InMemoryDriver()
+    alice = entity('Alice', [1.0, 0.0, 0.0], labels=['Person'])
+    bob = entity('Bob', [0.9, 0.1, 0.0], labels=['Person'])
+    acme = entity('Acme Corp', [0.0, 1.0, 0.0], labels=['Organization'])
+    works_at = fact(bob, acme, 'Bob works at Acme Corp', [0.0, 1.0, 0.0], valid_at=NOW)
+    knows = fact(alice, bob, 'Alice knows Bob', [1.0, 0.0, 0.0])
+    for node in (alice, bob, acme):
+        await node.save(driver)
+    for edge in (works_at, knows):
+        await edge.save(driver)
+    return driver, alice, bob, acme, works_at, knows
+
+
+def test_tokenize_splits_cjk_characters():
+    assert tokenize('Alice met 北京 friends') == ['alice', 'met', '北', '京', 'friends']
+
+
+@pytest.mark.asyncio
+async def test_driver_operation_dispatch():
+    class Driver(InMemoryDriver):
+        async def custom_operation(self, value: int, scale: int) -> int:
+            return value * scale
+
+    @driver_operation('custom_operation')
+    async def operation(driver, value: int, scale: int = 10) -> int:
+        return -1
+
+    assert await operation(Driver(), 2) == 20
+    assert await operation(driver=Driver(), value=3, scale=2) == 6
+    # drivers without the operation, including mocks, run the default implementation
+    assert await operation(AsyncMock(), 2) == -1
+
+    del DRIVER_OPERATIONS['custom_operation']
+
+
+def test_validate_driver_operations():
+    assert sorted(validate_driver_operations(InMemoryDriver)) == sorted(DRIVER_OPERATIONS)
+
+    class Driver(InMemoryDriver):
+        async def get_entity_node_by_uuid(self, node_uuid: str) -> EntityNode:
+            raise NotImplementedError()
+
+    with pytest.raises(TypeError, match='get_entity_node_by_uuid'):
+        validate_driver_operations(Driver)
+
+
+@pytest.mark.asyncio
+async def test_save_and_get():
+    driver, alice, bob, acme, _, knows = await build_graph()
+
+    assert driver.provider == GraphProvider.MEMORY
+    node = await EntityNode.get_by_uuid(driver, alice.uuid)
+    assert node.name == 'Alice'
+    assert node.labels == ['Person', 'Entity']
+    assert node.name_embedding is None
+
+    await node.load_name_embedding(driver)
+    assert node.name_embedding == [1.0, 0.0, 0.0]
+
+    # returned models are copies
+    node.labels.append('Changed')
+    assert (await EntityNode.get_by_uuid(driver, alice.uuid)).labels == ['Person', 'Entity']
+
+    edges = await EntityEdge.get_by_node_uuid(driver, bob.uuid)
+    assert len(edges) == 2
+    assert (await EntityEdge.get_by_uuid(driver, knows.uuid)).fact == 'Alice knows Bob'
+
+    with pytest.raises(NodeNotFoundError):
+        await EntityNode.get_by_uuid(driver, 'missing')
+    with pytest.raises(EdgeNotFoundError):
+        await EntityEdge.get_by_uuid(driver, 'missing')
+
+    nodes = await EntityNode.get_by_group_ids(driver, ['group'], limit=2)
+    assert [n.uuid for n in nodes] == sorted([alice.uuid, bob.uuid, acme.uuid])[::-1][:2]
+
+
+@pytest.mark.asyncio
+async def test_edges_require_existing_nodes():
+    driver = InMemoryDriver()
+    alice = entity('Alice', [1.0, 0.0])
+    await alice.save(driver)
+    dangling = fact(alice, entity('Bob', [0.0, 1.0]), 'Alice knows Bob', [1.0, 0.0])
+    await dangling.save(driver)
+
+    assert await EntityEdge.get_by_uuids(driver, [dangling.uuid]) == []
+
+
+@pytest.mark.asyncio
+async def test_fulltext_search():
+    driver, alice, bob, acme, works_at, _ = await build_graph()
+
+    nodes = await node_fulltext_search(driver, 'acme', SearchFilters(), ['group'])
+    assert [n.uuid for n in nodes] == [acme.uuid]
+
+    nodes = await node_fulltext_search(
+        driver, 'alice bob acme', SearchFilters(node_labels=['Person']), ['group']
+    )
+    assert {n.uuid for n in nodes} == {alice.uuid, bob.uuid}
+
+    assert await node_fulltext_search(driver, 'acme', SearchFilters(), ['other']) == []
+
+    created_before = SearchFilters(
+        created_at=[[DateFilter(date=NOW, comparison_operator=ComparisonOperator.less_than)]]
+    )
+    assert await node_fulltext_search(driver, 'acme', created_before, ['group']) == []
+
+    edges = await edge_fulltext_search(driver, 'works', SearchFilters(), ['group'])
+    assert [e.uuid for e in edges] == [works_at.uuid]
+
+
+@pytest.mark.asyncio
+async def test_similarity_search():
+    driver, alice, bob, _, works_at, knows = await build_graph()
+
+    nodes = await node_similarity_search(driver, [1.0, 0.0, 0.0], SearchFilters(), ['group'])
+    assert [n.uuid for n in nodes] == [alice.uuid, bob.uuid]
+
+    edges = await edge_similarity_search(
+        driver, [0.0, 1.0, 0.0], None, None, SearchFilters(), ['group'], min_score=0.0
+    )
+    assert [e.uuid for e in edges] == [works_at.uuid, knows.uuid]
+
+    edges = await edge_similarity_search(
+        driver, [0.0, 1.0, 0.0], alice.uuid, None, SearchFilters(), ['group'], min_score=0.0
+    )
+    assert [e.uuid for e in edges] == [knows.uuid]
+
+    # edges without a valid_at never match a date filter
+    date_filter = SearchFilters(
+        valid_at=[[DateFilter(date=NOW, comparison_operator=ComparisonOperator.equals)]]
+    )
+    edges = await edge_similarity_search(
+        driver, [0.0, 1.0, 0.0], None, None, date_filter, ['group'], min_score=0.0
+    )
+    assert [e.uuid for e in edges] == [works_at.uuid]
+
+    relevant = await get_relevant_edges(driver, [knows], SearchFilters())
+    assert [[e.uuid for e in edges] for edges in relevant] == [[knows.uuid]]
+    assert relevant[0][0].fact_embedding == [1.0, 0.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_as_of_search():
+    driver = InMemoryDriver()
+    alice = entity('Alice', [1.0, 0.0])
+    acme = entity('Acme Corp', [0.0, 1.0])
+    globex = entity('Globex', [0.0, 1.0])
+    for node in (alice, acme, globex):
+        await node.save(driver)
+    january, march, june = (NOW.replace(month=month) for month in (1, 3, 6))
+    # Alice worked at Acme until March, then joined Globex; the last fact has no known start
+    acme_job = fact(alice, acme, 'Alice works at Acme Corp', [1.0, 0.0], valid_at=january)
+    acme_job.invalid_at = march
+    globex_job = fact(alice, globex, 'Alice works at Globex', [1.0, 0.0], valid_at=march)
+    lunch = fact(alice, globex, 'Alice eats lunch at Globex', [1.0, 0.0])
+    lunch.created_at = june
+    for edge in (acme_job, globex_job, lunch):
+        await edge.save(driver)
+
+    async def facts_at(as_of: datetime) -> list[str]:
+        search_filter = SearchFilters(as_of=as_of)
+        edges = await edge_similarity_search(
+            driver, [1.0, 0.0], None, None, search_filter, ['group'], min_score=0.0
+        )
+        fulltext = await edge_fulltext_search(driver, 'alice', search_filter, ['group'])
+        assert {e.uuid for e in fulltext} == {e.uuid for e in edges}
+        return sorted(e.fact for e in edges)
+
+    assert await facts_at(january - timedelta(days=1)) == []
+    assert await facts_at(january) == ['Alice works at Acme Corp']
+    assert await facts_at(march) == ['Alice works at Globex']
+    assert await facts_at(june) == ['Alice eats lunch at Globex', 'Alice works at Globex']
+
+    # invalidating a fact updates the timeline
+    globex_job.invalid_at = june
+    await globex_job.save(driver)
+    assert await facts_at(june) == ['Alice eats lunch at Globex']
+
+
+@pytest.mark.asyncio
+async def test_bfs_and_rerankers():
+    driver, alice, bob, acme, works_at, knows = await build_graph()
+
+    edges = await edge_bfs_search(driver, [alice.uuid], 1, SearchFilters(), ['group'])
+    assert [e.uuid for e in edges] == [knows.uuid]
+
+    edges = await edge_bfs_search(driver, [alice.uuid], 2, SearchFilters(), ['group'])
+    assert {e.uuid for e in edges} == {knows.uuid, works_at.uuid}
+
+    uuids, scores = await node_distance_reranker(driver, [acme.uuid, bob.uuid], alice.uuid)
+    assert uuids == [bob.uuid, acme.uuid]
+    assert scores == [1.0, 0.0]
+
+    ep = episode('Bob met Alice')
+    await ep.save(driver)
+    for node in (alice, bob):
+        await EpisodicEdge(
+            source_node_uuid=ep.uuid, target_node_uuid=node.uuid, group_id='group', created_at=NOW
+        ).save(driver)
+    uuids, scores = await episode_mentions_reranker(driver, [[alice.uuid, bob.uuid]])
+    assert scores == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_retrieve_and_delete():
+    driver = InMemoryDriver()
+    episodes = [episode(f'episode {i}', minutes=i) for i in range(5)]
+    alice = entity('Alice', [1.0, 0.0])
+    bob = entity('Bob', [0.0, 1.0])
+    mentions = [
+        EpisodicEdge(source_node_uuid=ep.uuid, target_node_uuid=node.uuid, group_id='group',
+                     created_at=NOW)
+        for ep, node in ((episodes[0], alice), (episodes[0], bob), (episodes[1], bob))
+    ]  # fmt: skip
+    knows = fact(alice, bob, 'Alice knows Bob', [1.0, 0.0])
+
+    await add_nodes_and_edges_bulk(driver, episodes, mentions, [alice, bob], [knows], AsyncMock())
+
+    retrieved = await retrieve_episodes(driver, NOW + timedelta(minutes=3), 2, ['group'])
+    assert [e.content for e in retrieved] == ['episode 2', 'episode 3']
+
+    assert await get_nodes_mentioned_only_by_episode(driver, episodes[0].uuid) == [alice.uuid]
+
+    # deleting a node removes the edges attached to it
+    assert await Node.delete_by_uuids(driver, [alice.uuid]) == 1
+    assert await EntityEdge.get_by_uuids(driver, [knows.uuid]) == []
+    assert await node_fulltext_search(driver, 'alice', SearchFilters(), ['group']) == []
+
+    assert await Node.delete_by_group_id(driver, 'group') == 6
+    assert driver.episodes == {}
+    assert driver.episodic_edges == {}
@@ -0,0 +1,86 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from neo4j import EagerResult
+
+from graphiti_core.driver.neo4j_driver import Neo4jDriver
+from graphiti_core.nodes import Node
+from graphiti_core.utils.maintenance.graph_data_operations import (
+    get_nodes_mentioned_only_by_episode,
+)
+
+
+def make_driver(*records: list[dict]) -> Neo4jDriver:
+    """A Neo4jDriver whose queries return the given records, one list per query."""
+    driver = Neo4jDriver('bolt://localhost:7687', 'neo4j', 'password')
+    driver.client = MagicMock()
+    driver.client.execute_query = AsyncMock(
+        side_effect=[EagerResult(rows, MagicMock(), []) for rows in records]
+    )
+    return driver
+
+
+def sent_queries(driver: Neo4jDriver) -> list[tuple[str, dict]]:
+    return [(call.args[0], call.kwargs) for call in driver.client.execute_query.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_delete_by_group_id_deletes_and_reports_in_batches(caplog):
+    # two full batches of entities, then a short one ends each label
+    driver = make_driver(
+        [{'deleted': 2}], [{'deleted': 2}], [{'deleted': 1}], [{'deleted': 0}], [{'deleted': 0}]
+    )
+
+    with caplog.at_level(logging.INFO, logger='graphiti_core.nodes'):
+        deleted = await Node.delete_by_group_id(driver, 'g1', batch_size=2)
+
+    assert deleted == 5
+    queries = sent_queries(driver)
+    assert [query.split(')')[0] for query, _ in queries] == [
+        'MATCH (n:Entity',
+        'MATCH (n:Entity',
+        'MATCH (n:Entity',
+        'MATCH (n:Episodic',
+        'MATCH (n:Community',
+    ]
+    query, params = queries[0]
+    assert 'WHERE n.group_id = $group_id WITH n LIMIT $batch_size DETACH DELETE n' in query
+    assert (params['group_id'], params['batch_size']) == ('g1', 2)
+    assert [record.getMessage() for record in caplog.records] == [
+        'Deleted 2 nodes so far',
+        'Deleted 4 nodes so far',
+        'Deleted 5 nodes so far',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_nodes_mentioned_only_by_episode():
+    driver = make_driver([{'uuid': 'alice'}, {'uuid': 'bob'}])
+
+    assert await get_nodes_mentioned_only_by_episode(driver, 'ep1') == ['alice', 'bob']
+
+    [(query, params)] = sent_queries(driver)
+    assert query == (
+        'MATCH (:Episodic {uuid: $uuid})-[:MENTIONS]->(n:Entity) '
+        'MATCH (e:Episodic)-[:MENTIONS]->(n) '
+        'WITH n, count(DISTINCT e) AS episode_count WHERE episode_count = 1 '
+        'RETURN n.uuid AS uuid'
+    )
+    assert (params['uuid'], params['routing_']) == ('ep1', 'r')
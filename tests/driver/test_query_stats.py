@@ -0,0 +1,86 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from neo4j import EagerResult
+
+from graphiti_core.driver.neo4j_driver import Neo4jDriver
+from graphiti_core.driver.query_stats import canonical_query, record_query, track_queries
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import edge_similarity_search
+
+
+def test_canonical_query_keeps_string_literals():
+    query = """
+        MATCH (n:Entity)
+        WHERE n.name = 'two  spaces'   AND n.summary <> "tab\tand  space"
+        RETURN n
+    """
+
+    assert canonical_query(query) == (
+        """MATCH (n:Entity) WHERE n.name = 'two  spaces' AND n.summary <> "tab\tand  space" """
+        'RETURN n'
+    )
+    assert canonical_query('MATCH (n)\n\nRETURN n') == canonical_query('MATCH (n) RETURN n')
+
+
+def test_canonical_query_removes_comments():
+    query = """
+        // find the nodes
+        MATCH (n:Entity) /* a block
+        comment */ WHERE n.url = 'http://example.com' // it's a URL
+        RETURN n
+    """
+
+    assert canonical_query(query) == "MATCH (n:Entity) WHERE n.url = 'http://example.com' RETURN n"
+    assert canonical_query('// find nodes\nMATCH (n) RETURN n') == 'MATCH (n) RETURN n'
+
+
+def test_track_queries():
+    with track_queries() as stats:
+        record_query('MATCH (n) RETURN n', 2.0)
+        record_query('MATCH (n) RETURN n', 3.0)
+        record_query('MATCH (e) RETURN e', 1.0)
+    # queries outside the block are not recorded
+    record_query('MATCH (n) RETURN n', 2.0)
+
+    assert len(stats.shapes) == 2
+    assert stats.calls == 3
+    assert stats.total_ms == 6.0
+    slowest = stats.slowest(1)[0]
+    assert (slowest.query, slowest.calls, slowest.mean_ms) == ('MATCH (n) RETURN n', 2, 2.5)
+    assert stats.report().startswith('2 query shapes, 3 calls, 6.0 ms')
+
+
+@pytest.mark.asyncio
+async def test_neo4j_driver_sends_one_text_per_query_shape():
+    driver = Neo4jDriver('bolt://localhost:7687', 'neo4j', 'password')
+    driver.client = MagicMock()
+    driver.client.execute_query = AsyncMock(return_value=EagerResult([], MagicMock(), []))
+
+    with track_queries() as stats:
+        for group_ids in (['a'], ['b', 'c']):
+            await edge_similarity_search(driver, [1.0, 0.0], None, None, SearchFilters(), group_ids)
+        await edge_similarity_search(
+            driver, [1.0, 0.0], 'source', None, SearchFilters(edge_types=['KNOWS']), ['a']
+        )
+
+    queries = [call.args[0] for call in driver.client.execute_query.call_args_list]
+    assert queries[0] == queries[1] != queries[2]
+    assert '\n' not in queries[0]
+    assert [shape.calls for shape in stats.shapes.values()] == [2, 1]
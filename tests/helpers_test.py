@@ -15,12 +15,14 @@ limitations under the License.
 """
 
 import os
+from datetime import datetime, timezone
 
 import pytest
 from dotenv import load_dotenv
 
 from graphiti_core.driver.driver import GraphDriver
-from graphiti_core.helpers import lucene_sanitize
+from graphiti_core.edges import EntityEdge
+from graphiti_core.helpers import construct_trusted, lucene_sanitize
 
 load_dotenv()
 
@@ -92,5 +94,36 @@ def test_lucene_sanitize():
         assert assert_result == result
 
 
+def test_construct_trusted_matches_model_validate():
+    values = {
+        'uuid': 'e1',
+        'group_id': 'g1',
+        'source_node_uuid': 'n1',
+        'target_node_uuid': 'n2',
+        'created_at': datetime(2024, 1, 1, tzinfo=timezone.utc),
+        'name': 'WORKS_AT',
+        'fact': 'Alice works at Acme',
+        'fact_embedding': [0.1, 0.2],
+        'episodes': ['ep1'],
+        'expired_at': None,
+        'valid_at': datetime(2024, 1, 1, tzinfo=timezone.utc),
+        'invalid_at': None,
+        'attributes': {'since': 2020},
+    }
+
+    edge = construct_trusted(EntityEdge, dict(values))
+    validated = EntityEdge.model_validate(values)
+
+    # the pydantic internals set by hand must leave the model as complete as validation does
+    assert edge.__dict__ == validated.__dict__
+    assert edge.model_fields_set == validated.model_fields_set
+    assert (edge.__pydantic_extra__, edge.__pydantic_private__) == (
+        validated.__pydantic_extra__,
+        validated.__pydantic_private__,
+    )
+    assert edge.model_dump() == validated.model_dump()
+    assert edge.model_copy(update={'name': 'EMPLOYED_BY'}).name == 'EMPLOYED_BY'
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
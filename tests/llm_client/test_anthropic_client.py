@@ -25,6 +25,7 @@ from pydantic import BaseModel
 from graphiti_core.llm_client.anthropic_client import AnthropicClient
 from graphiti_core.llm_client.config import LLMConfig
 from graphiti_core.llm_client.errors import RateLimitError, RefusalError
+from graphiti_core.llm_client.usage import track_usage
 from graphiti_core.prompts.models import Message
 
 
@@ -128,6 +129,38 @@ class TestAnthropicClientGenerateResponse:
         assert result['test_field'] == 'test_value'
         mock_async_anthropic.messages.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_system_prompt_is_cacheable(self, anthropic_client, mock_async_anthropic):
+        """Test that the system prompt is sent as a cache breakpoint and usage is recorded."""
+        content_item = MagicMock()
+        content_item.type = 'tool_use'
+        content_item.input = {'test_field': 'test_value'}
+
+        mock_response = MagicMock()
+        mock_response.content = [content_item]
+        mock_response.usage.input_tokens = 1200
+        mock_response.usage.output_tokens = 20
+        mock_response.usage.cache_read_input_tokens = 1024
+        mock_response.usage.cache_creation_input_tokens = 0
+        mock_async_anthropic.messages.create.return_value = mock_response
+
+        messages = [
+            Message(role='system', content='System message'),
+            Message(role='user', content='User message'),
+        ]
+        with patch.object(anthropic_client, '_record_usage') as mock_record_usage:
+            await anthropic_client.generate_response(
+                messages=messages, response_model=ResponseModel
+            )
+
+        system = mock_async_anthropic.messages.create.call_args.kwargs['system']
+        assert system[0]['text'] == 'System message'
+        assert system[0]['cache_control'] == {'type': 'ephemeral'}
+
+        usage = mock_record_usage.call_args.args[1]
+        assert usage.cached_input_tokens == 1024
+        assert usage.input_tokens == 1200
+
     @pytest.mark.asyncio
     async def test_generate_response_with_text_response(
         self, anthropic_client, mock_async_anthropic
@@ -250,6 +283,18 @@ class TestAnthropicClientGenerateResponse:
         assert mock_async_anthropic.messages.create.call_count == 2
         assert result['test_field'] == 'correct_value'
 
+    @pytest.mark.asyncio
+    async def test_retries_are_counted_in_usage(self, anthropic_client, mock_async_anthropic):
+        """Attempts retried by generate_response itself count towards the call's retries."""
+        mock_async_anthropic.messages.create.side_effect = Exception('overloaded')
+
+        messages = [Message(role='user', content='Test message')]
+        with track_usage() as usage, pytest.raises(Exception, match='overloaded'):
+            await anthropic_client.generate_response(messages)
+
+        call = usage.calls[0]
+        assert (call.attempts, call.retries, call.error) == (3, 2, 'Exception')
+
 
 if __name__ == '__main__':
     pytest.main(['-v', 'test_anthropic_client.py'])
@@ -14,8 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from graphiti_core.llm_client.client import LLMClient
+from pydantic import BaseModel
+
+from graphiti_core.llm_client.client import LLMClient, add_static_instructions
 from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
 
 
 class MockLLMClient(LLMClient):
@@ -55,3 +58,25 @@ def test_clean_input():
 
     for input_str, expected in test_cases:
         assert client._clean_input(input_str) == expected, f'Failed for input: {repr(input_str)}'
+
+
+class ResponseModel(BaseModel):
+    answer: str
+
+
+def test_add_static_instructions_keeps_volatile_content_last():
+    def build(content: str) -> list[Message]:
+        return [
+            Message(role='system', content='static instructions'),
+            Message(role='user', content=content),
+        ]
+
+    first = build('episode one')
+    second = build('episode two')
+    add_static_instructions(first, ResponseModel)
+    add_static_instructions(second, ResponseModel)
+
+    # the schema goes into the system message so calls share a byte-identical prefix
+    assert first[0].content == second[0].content
+    assert 'answer' in first[0].content
+    assert first[1].content == 'episode one'
@@ -0,0 +1,138 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+import pytest
+from tenacity import wait_none
+
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.llm_client.errors import RateLimitError
+from graphiti_core.llm_client.usage import LLMCallUsage, TokenUsage, track_usage, usage_stage
+from graphiti_core.prompts.models import Message
+
+
+class UsageReportingClient(LLMClient):
+    """Reports fixed usage per attempt and fails the first `failures` attempts."""
+
+    def __init__(self, failures: int = 0):
+        super().__init__(LLMConfig(model='test-model'))
+        self.failures = failures
+
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=0, model_size=None
+    ):
+        self._record_usage(
+            'test-model', TokenUsage(input_tokens=100, output_tokens=10, cached_input_tokens=60)
+        )
+        if self.failures > 0:
+            self.failures -= 1
+            raise RateLimitError()
+        return {'content': 'test'}
+
+
+class RateLimitedClient(LLMClient):
+    """Fails the first `failures` attempts with a rate limit, before any usage is reported."""
+
+    def __init__(self, failures: int):
+        super().__init__(LLMConfig(model='test-model'))
+        self.failures = failures
+
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=0, model_size=None
+    ):
+        if self.failures > 0:
+            self.failures -= 1
+            raise RateLimitError()
+        self._record_usage('test-model', TokenUsage(input_tokens=100, output_tokens=10))
+        return {'content': 'test'}
+
+
+def make_messages() -> list[Message]:
+    return [Message(role='system', content='system'), Message(role='user', content='user')]
+
+
+@pytest.mark.asyncio
+async def test_usage_is_aggregated_per_stage():
+    client = UsageReportingClient()
+
+    async def extract():
+        with usage_stage('extract_nodes'):
+            await client.generate_response(make_messages())
+
+    with track_usage() as usage:
+        # child tasks inherit the tracker from the enclosing context
+        await asyncio.gather(extract(), extract())
+        with usage_stage('dedupe_nodes'):
+            await client.generate_response(make_messages())
+
+    # calls outside the block are not collected
+    await client.generate_response(make_messages())
+
+    assert len(usage.calls) == 3
+    by_stage = usage.by_stage
+    assert by_stage['extract_nodes'].calls == 2
+    assert by_stage['extract_nodes'].input_tokens == 200
+    assert by_stage['dedupe_nodes'].cached_input_tokens == 60
+    assert usage.total.output_tokens == 30
+    assert all(call.model == 'test-model' for call in usage.calls)
+
+
+@pytest.mark.asyncio
+async def test_retries_are_counted(monkeypatch):
+    # skip the exponential backoff between attempts
+    monkeypatch.setattr(LLMClient._generate_response_with_retry.retry, 'wait', wait_none())
+    client = UsageReportingClient(failures=1)
+
+    with track_usage() as usage:
+        await client.generate_response(make_messages())
+
+    call = usage.calls[0]
+    assert call.attempts == 2
+    assert call.retries == 1
+    assert call.input_tokens == 200
+
+
+@pytest.mark.asyncio
+async def test_attempts_without_usage_are_counted(monkeypatch):
+    monkeypatch.setattr(LLMClient._generate_response_with_retry.retry, 'wait', wait_none())
+    client = RateLimitedClient(failures=2)
+
+    with track_usage() as usage:
+        await client.generate_response(make_messages())
+
+    call = usage.calls[0]
+    assert (call.attempts, call.retries, call.failed) == (3, 2, False)
+    assert call.input_tokens == 100
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_are_reported(monkeypatch):
+    monkeypatch.setattr(LLMClient._generate_response_with_retry.retry, 'wait', wait_none())
+    recorded: list[LLMCallUsage] = []
+    monkeypatch.setattr('graphiti_core.llm_client.usage.record_llm_call_metrics', recorded.append)
+    client = RateLimitedClient(failures=10)
+
+    with track_usage() as usage, usage_stage('extract_nodes'), pytest.raises(RateLimitError):
+        await client.generate_response(make_messages())
+
+    call = usage.calls[0]
+    assert (call.attempts, call.retries, call.error) == (4, 3, 'RateLimitError')
+    assert call.input_tokens == 0
+    assert recorded == [call]
+    stage = usage.by_stage['extract_nodes']
+    assert (stage.calls, stage.failed_calls, stage.retries) == (1, 1, 3)
@@ -0,0 +1,63 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+
+from graphiti_core.telemetry import tracing
+from graphiti_core.telemetry.tracing import query_fingerprint, start_span, traced
+
+
+def test_query_fingerprint_ignores_formatting():
+    assert query_fingerprint('MATCH (n)\n    RETURN n') == query_fingerprint('MATCH (n) RETURN n')
+    assert query_fingerprint('MATCH (n) RETURN n') != query_fingerprint('MATCH (m) RETURN m')
+
+
+@pytest.mark.asyncio
+async def test_traced_passes_through_without_tracer(monkeypatch):
+    monkeypatch.setattr(tracing, '_tracer', None)
+
+    @traced('test.span')
+    async def search_things(query: str, group_ids: list[str] | None = None) -> list[str]:
+        return [query]
+
+    assert await search_things('q', group_ids=['g1']) == ['q']
+    assert search_things.__name__ == 'search_things'
+
+    with start_span('test.span', {'key': 'value'}) as span:
+        assert not span.is_recording()
+
+
+@pytest.mark.asyncio
+async def test_traced_records_span_attributes(monkeypatch):
+    sdk_trace = pytest.importorskip('opentelemetry.sdk.trace')
+    in_memory = pytest.importorskip('opentelemetry.sdk.trace.export.in_memory_span_exporter')
+    export = pytest.importorskip('opentelemetry.sdk.trace.export')
+
+    exporter = in_memory.InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, '_tracer', provider.get_tracer('test'))
+
+    @traced('test.search')
+    async def search_things(query: str, group_ids: list[str] | None = None) -> list[str]:
+        return [query, query]
+
+    await search_things('q', ['g1'])
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == 'test.search'
+    assert span.attributes['graphiti.group_ids'] == ('g1',)
+    assert span.attributes['graphiti.result_count'] == 2
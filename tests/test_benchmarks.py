@@ -0,0 +1,55 @@
+import pytest
+
+from benchmarks.fakes import FakeLLMClient
+from benchmarks.run import BenchmarkOptions, build_report, compare_reports, run_benchmarks
+from graphiti_core.prompts import prompt_library
+from graphiti_core.prompts.extract_nodes import ExtractedEntities
+
+
+@pytest.mark.asyncio
+async def test_fake_llm_extracts_entities_from_current_episode():
+    llm_client = FakeLLMClient()
+    context = {
+        'episode_content': 'Alice Chen: I met Bob Smith in Paris.',
+        'episode_timestamp': '2024-01-01T00:00:00Z',
+        'previous_episodes': ['Carol Kim: hello'],
+        'custom_prompt': '',
+        'entity_types': [],
+        'source_description': 'test',
+    }
+
+    response = await llm_client.generate_response(
+        prompt_library.extract_nodes.extract_message(context), response_model=ExtractedEntities
+    )
+
+    names = [entity['name'] for entity in response['extracted_entities']]
+    assert names == ['Alice Chen', 'Bob Smith', 'Paris']
+
+
+@pytest.mark.asyncio
+async def test_run_benchmarks_and_compare():
+    options = BenchmarkOptions(repeats=1, queries=1)
+    results = await run_benchmarks(
+        options,
+        names=['add_episode', 'search/EDGE_HYBRID_SEARCH_RRF', 'label_propagation', 'mmr'],
+        scales=[3],
+    )
+
+    report = build_report(options, results)
+    assert set(report['results']) == {
+        'add_episode[3]',
+        'add_episode_bulk[3]',
+        'search/EDGE_HYBRID_SEARCH_RRF[3]',
+        'label_propagation[3]',
+        'mmr[3]',
+    }
+    assert report['results']['add_episode[3]']['llm_calls'] > 0
+
+    slower = {
+        'results': {
+            key: {**result, 'median_s': result['median_s'] * 10}
+            for key, result in report['results'].items()
+        }
+    }
+    assert compare_reports(report, slower, threshold=0.2) == list(report['results'])
+    assert compare_reports(slower, report, threshold=0.2) == []
@@ -0,0 +1,134 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from neo4j import EagerResult
+from neo4j import time as neo4j_time
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.driver.neo4j_driver import Neo4jDriver
+from graphiti_core.edges import EntityEdge, get_entity_edge_from_record
+from graphiti_core.models.edges.edge_db_queries import get_entity_edge_return_query
+from graphiti_core.models.nodes.node_db_queries import (
+    get_community_node_return_query,
+    get_entity_node_return_query,
+)
+from graphiti_core.nodes import EntityNode, get_entity_node_from_record
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import node_fulltext_search
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def edge_record(**columns) -> dict:
+    return {
+        'uuid': 'edge',
+        'source_node_uuid': 'alice',
+        'target_node_uuid': 'bob',
+        'group_id': 'group',
+        'name': 'KNOWS',
+        'fact': 'Alice knows Bob',
+        'episodes': [],
+        'created_at': NOW.isoformat(),
+        'expired_at': None,
+        'valid_at': None,
+        'invalid_at': None,
+        # the map projection keeps the embedding key with a null value
+        'attributes': {'uuid': 'edge', 'fact_embedding': None, 'weight': 2},
+        **columns,
+    }
+
+
+def mock_neo4j_driver(records: list[dict]) -> Neo4jDriver:
+    driver = Neo4jDriver('bolt://localhost:7687', 'neo4j', 'password')
+    driver.client = MagicMock()
+    driver.client.execute_query = AsyncMock(return_value=EagerResult(records, MagicMock(), []))
+    return driver
+
+
+def test_return_queries_project_embeddings_out_of_the_attributes():
+    neo4j_edge = get_entity_edge_return_query(GraphProvider.NEO4J)
+    assert 'e {.*, fact_embedding: NULL} AS attributes' in neo4j_edge
+    assert 'AS fact_embedding' not in neo4j_edge
+    assert 'e.fact_embedding AS fact_embedding' in get_entity_edge_return_query(
+        GraphProvider.NEO4J, include_embeddings=True
+    )
+    assert '{} AS attributes' in get_entity_edge_return_query(
+        GraphProvider.NEO4J, include_attributes=False
+    )
+    # FalkorDB returns the whole property map and hydration drops the embedding
+    assert 'properties(e) AS attributes' in get_entity_edge_return_query(GraphProvider.FALKORDB)
+
+    assert 'n {.*, name_embedding: NULL} AS attributes' in get_entity_node_return_query(
+        GraphProvider.NEO4J
+    )
+    assert 'name_embedding' not in get_community_node_return_query()
+    assert 'n.name_embedding AS name_embedding' in get_community_node_return_query(True)
+
+
+@pytest.mark.asyncio
+async def test_edges_are_read_without_embeddings_unless_requested():
+    driver = mock_neo4j_driver([edge_record()])
+
+    edge = await EntityEdge.get_by_uuid(driver, 'edge')
+
+    assert edge.fact_embedding is None
+    assert edge.attributes == {'weight': 2}
+
+    driver = mock_neo4j_driver([edge_record(fact_embedding=[1.0, 0.0])])
+    edges = await EntityEdge.get_by_group_ids(driver, ['group'], with_embeddings=True)
+
+    query = driver.client.execute_query.call_args.args[0]
+    assert 'e.fact_embedding AS fact_embedding' in query
+    assert edges[0].fact_embedding == [1.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_search_queries_do_not_fetch_embeddings():
+    driver = mock_neo4j_driver([])
+
+    await node_fulltext_search(driver, 'alice', SearchFilters(), ['group'])
+
+    query = driver.client.execute_query.call_args.args[0]
+    assert 'properties(n)' not in query
+    assert 'n {.*, name_embedding: NULL} AS attributes' in query
+
+
+def test_hydration_matches_validated_models():
+    edge = get_entity_edge_from_record(edge_record(valid_at=NOW.isoformat()))
+    node = get_entity_node_from_record(
+        {
+            'uuid': 'alice',
+            'name': 'Alice',
+            'group_id': 'group',
+            'labels': ['Entity', 'Person'],
+            'created_at': neo4j_time.DateTime.from_native(NOW),
+            'summary': None,
+            'attributes': {'uuid': 'alice', 'name_embedding': None, 'age': 30},
+        }
+    )
+
+    # every field is set, so the unvalidated models dump like validated ones
+    assert set(edge.model_dump()) == set(EntityEdge.model_fields)
+    assert EntityEdge(**edge.model_dump()).model_dump() == edge.model_dump()
+    assert edge.valid_at == NOW
+    assert set(node.model_dump()) == set(EntityNode.model_fields)
+    assert EntityNode(**node.model_dump()).model_dump() == node.model_dump()
+    assert (node.created_at, node.summary, node.attributes) == (NOW, '', {'age': 30})
+    assert node.model_copy(update={'name': 'Alicia'}).name == 'Alicia'
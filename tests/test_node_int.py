@@ -117,6 +117,15 @@ async def test_entity_node(sample_entity_node, driver):
     node_count = await get_node_count(driver, uuid)
     assert node_count == 0
 
+    # Delete nodes by uuids in batches
+    await sample_entity_node.save(driver)
+    node_count = await get_node_count(driver, uuid)
+    assert node_count == 1
+    deleted = await EntityNode.delete_by_uuids(driver, [uuid], batch_size=1)
+    assert deleted == 1
+    node_count = await get_node_count(driver, uuid)
+    assert node_count == 0
+
     await driver.close()
 
 
@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+
+from graphiti_core.search.search_filters import (
+    ComparisonOperator,
+    DateFilter,
+    SearchFilters,
+    edge_search_filter_predicates,
+    edge_search_filter_query_constructor,
+    node_search_filter_query_constructor,
+)
+
+JAN = datetime(2024, 1, 1, tzinfo=timezone.utc)
+FEB = datetime(2024, 2, 1, tzinfo=timezone.utc)
+MAR = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+
+def date_filter(date: datetime, operator: ComparisonOperator) -> DateFilter:
+    return DateFilter(date=date, comparison_operator=operator)
+
+
+def test_edge_filters_name_parameters_per_group():
+    filters = SearchFilters(
+        valid_at=[
+            [
+                date_filter(JAN, ComparisonOperator.greater_than_equal),
+                date_filter(FEB, ComparisonOperator.less_than),
+            ],
+            [date_filter(MAR, ComparisonOperator.greater_than_equal)],
+        ]
+    )
+
+    predicates, params = edge_search_filter_predicates(filters)
+
+    assert predicates == (
+        '((e.valid_at >= $valid_at_0_0 AND e.valid_at < $valid_at_0_1)'
+        ' OR (e.valid_at >= $valid_at_1_0))',
+    )
+    assert params == {'valid_at_0_0': JAN, 'valid_at_0_1': FEB, 'valid_at_1_0': MAR}
+
+
+def test_edge_filters_put_selective_predicates_first():
+    filters = SearchFilters(
+        node_labels=['Person'],
+        edge_types=['WORKS_AT'],
+        expired_at=[[date_filter(JAN, ComparisonOperator.not_equals)]],
+        created_at=[[date_filter(FEB, ComparisonOperator.equals)]],
+        valid_at=[[date_filter(MAR, ComparisonOperator.less_than)]],
+    )
+
+    filter_query, params = edge_search_filter_query_constructor(filters)
+
+    assert filter_query.split('\nAND ')[1:] == [
+        'e.name IN $edge_types',
+        'e.created_at = $created_at_0_0',
+        'e.valid_at < $valid_at_0_0',
+        'e.expired_at <> $expired_at_0_0',
+        'n:Person AND m:Person',
+    ]
+    assert params['edge_types'] == ['WORKS_AT']
+
+
+def test_filter_text_only_depends_on_the_filter_shape():
+    first, first_params = edge_search_filter_query_constructor(
+        SearchFilters(invalid_at=[[date_filter(JAN, ComparisonOperator.greater_than)]])
+    )
+    second, second_params = edge_search_filter_query_constructor(
+        SearchFilters(invalid_at=[[date_filter(FEB, ComparisonOperator.greater_than)]])
+    )
+
+    assert first is second
+    assert first_params != second_params
+    # empty alternatives don't constrain the search
+    assert edge_search_filter_query_constructor(SearchFilters(valid_at=[[]])) == ('', {})
+
+
+def test_node_filters_support_created_at():
+    filters = SearchFilters(
+        node_labels=['Person', 'Organization'],
+        created_at=[[date_filter(JAN, ComparisonOperator.less_than_equal)]],
+        valid_at=[[date_filter(JAN, ComparisonOperator.less_than_equal)]],
+    )
+
+    filter_query, params = node_search_filter_query_constructor(filters)
+
+    assert filter_query == '\nAND n.created_at <= $created_at_0_0\nAND n:Person|Organization'
+    assert params == {'created_at_0_0': JAN}
+
+
+def test_edge_filters_as_of():
+    predicates, params = edge_search_filter_predicates(
+        SearchFilters(as_of=FEB, edge_types=['WORKS_AT'])
+    )
+
+    assert predicates == (
+        'e.name IN $edge_types',
+        '(e.valid_at <= $as_of OR (e.valid_at IS NULL AND e.created_at <= $as_of))',
+        '(e.invalid_at IS NULL OR e.invalid_at > $as_of)',
+    )
+    assert params == {'edge_types': ['WORKS_AT'], 'as_of': FEB}
+    assert node_search_filter_query_constructor(SearchFilters(as_of=FEB)) == ('', {})
@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.memory_driver import InMemoryDriver
+from graphiti_core.edges import EntityEdge
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search import search, search_stream
+from graphiti_core.search.search_config import (
+    EdgeReranker,
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    NodeReranker,
+    NodeSearchConfig,
+    NodeSearchMethod,
+    SearchConfig,
+)
+from graphiti_core.search.search_filters import SearchFilters
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class ReversingCrossEncoder(CrossEncoderClient):
+    """Scores passages in reverse alphabetical order, after a short delay."""
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        await asyncio.sleep(0.05)
+        ranked = sorted(passages, reverse=True)
+        return [(passage, 1 - i / len(ranked)) for i, passage in enumerate(ranked)]
+
+
+async def make_clients() -> GraphitiClients:
+    driver = InMemoryDriver()
+    alice, bob = (
+        EntityNode(name=name, group_id='group', name_embedding=[1.0, 0.0], created_at=NOW)
+        for name in ('Alice', 'Bob')
+    )
+    for node in (alice, bob):
+        await node.save(driver)
+    for text in ('Alice knows Bob', 'Bob knows Alice'):
+        await EntityEdge(
+            source_node_uuid=alice.uuid,
+            target_node_uuid=bob.uuid,
+            name='KNOWS',
+            fact=text,
+            fact_embedding=[1.0, 0.0],
+            group_id='group',
+            created_at=NOW,
+        ).save(driver)
+
+    embedder = MagicMock(spec=EmbedderClient)
+    embedder.create = AsyncMock(return_value=[1.0, 0.0])
+    return GraphitiClients(
+        driver=driver,
+        llm_client=MagicMock(spec=LLMClient),
+        embedder=embedder,
+        cross_encoder=ReversingCrossEncoder(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_stream_yields_first_stage_before_reranked_results():
+    clients = await make_clients()
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(
+            search_methods=[EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity],
+            reranker=EdgeReranker.cross_encoder,
+        ),
+        node_config=NodeSearchConfig(
+            search_methods=[NodeSearchMethod.bm25], reranker=NodeReranker.rrf
+        ),
+    )
+
+    updates = [
+        update
+        async for update in search_stream(clients, 'alice', ['group'], config, SearchFilters())
+    ]
+
+    stages = [(update.layer, update.stage) for update in updates]
+    # layers run concurrently; the reranked edges arrive last because the reranker is slow
+    assert sorted(stages[:2]) == [('edges', 'first_stage'), ('nodes', 'final')]
+    assert stages[2] == ('edges', 'final')
+    first_stage, final = (update for update in updates if update.layer == 'edges')
+    nodes = next(update for update in updates if update.layer == 'nodes')
+    assert nodes.results.nodes[0].name == 'Alice'
+    assert len(first_stage.results.edges) == 2
+    results = await search(clients, 'alice', ['group'], config, SearchFilters())
+    assert [edge.fact for edge in final.results.edges] == [edge.fact for edge in results.edges]
+    assert [edge.fact for edge in results.edges] == ['Bob knows Alice', 'Alice knows Bob']
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_search_without_results():
+    clients = await make_clients()
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(
+            search_methods=[EdgeSearchMethod.bm25],
+            reranker=EdgeReranker.cross_encoder,
+            reranker_early_exit=False,
+        ),
+        node_config=NodeSearchConfig(
+            search_methods=[NodeSearchMethod.bm25],
+            reranker=NodeReranker.cross_encoder,
+            reranker_early_exit=False,
+        ),
+    )
+
+    results = await search(clients, 'zebra', ['missing'], config, SearchFilters())
+
+    assert results.edges == [] and results.nodes == []
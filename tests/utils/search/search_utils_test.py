@@ -1,10 +1,16 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.nodes import EntityNode
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.search.search_utils import (
+    cross_encoder_rerank,
+    first_stage_rank,
+    hybrid_node_search,
+)
 
 
 @pytest.mark.asyncio
@@ -161,3 +167,61 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+class LengthCrossEncoder(CrossEncoderClient):
+    """Scores passages by their length and records the batches it was sent."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.batches: list[list[str]] = []
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        await asyncio.sleep(self.latency)
+        self.batches.append(passages)
+        return sorted(((p, float(len(p))) for p in passages), key=lambda r: r[1], reverse=True)
+
+
+def test_first_stage_rank_combines_rrf_and_cosine():
+    results = [['a', 'b', 'c'], ['b', 'a']]
+
+    assert first_stage_rank(results)[0] == ['a', 'b', 'c']
+
+    embeddings = {'a': [0.0, 1.0], 'b': [1.0, 0.0], 'c': [1.0, 0.0]}
+    uuids, scores = first_stage_rank(results, [1.0, 0.0], embeddings)
+    assert uuids == ['b', 'a', 'c']
+    assert scores[0] == pytest.approx(2.0)
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_rerank_stops_once_top_results_are_stable():
+    cross_encoder = LengthCrossEncoder()
+    passages = ['xxxx', 'xxx', 'xx', 'x', 'x', 'x']
+
+    ranked = await cross_encoder_rerank(cross_encoder, 'query', passages, limit=2)
+
+    # the second batch leaves the top two unchanged, so the third is never sent
+    assert cross_encoder.batches == [['xxxx', 'xxx'], ['xx', 'x']]
+    assert [passage for passage, _ in ranked] == ['xxxx', 'xxx', 'xx', 'x']
+
+    cross_encoder = LengthCrossEncoder()
+    await cross_encoder_rerank(cross_encoder, 'query', passages, limit=2, early_exit=False)
+    assert cross_encoder.batches == [passages]
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_rerank_timeout():
+    ranked = await cross_encoder_rerank(
+        LengthCrossEncoder(latency=1), 'query', ['a', 'b'], limit=2, timeout=0.01
+    )
+
+    assert ranked is None
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_rerank_without_passages():
+    cross_encoder = LengthCrossEncoder()
+
+    for early_exit in (True, False):
+        assert await cross_encoder_rerank(cross_encoder, 'q', [], 2, early_exit) == []
+    assert cross_encoder.batches == []
@@ -0,0 +1,128 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.driver.memory_driver import InMemoryDriver
+from graphiti_core.edges import CommunityEdge, EntityEdge, EpisodicEdge
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.utils.bulk_export import export_graph, import_graph, scan_embeddings
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+async def build_graph() -> InMemoryDriver:
+    driver = InMemoryDriver()
+    episode = EpisodicNode(
+        name='chat',
+        group_id='group',
+        source=EpisodeType.text,
+        source_description='test',
+        content='Alice, Bob and Carol met',
+        valid_at=NOW,
+        created_at=NOW,
+    )
+    await episode.save(driver)
+    nodes = [
+        EntityNode(name=name, group_id='group', name_embedding=[1.0, float(i)], created_at=NOW)
+        for i, name in enumerate(('Alice', 'Bob', 'Carol'))
+    ]
+    for node in nodes:
+        await node.save(driver)
+        await EpisodicEdge(
+            source_node_uuid=episode.uuid,
+            target_node_uuid=node.uuid,
+            group_id='group',
+            created_at=NOW,
+        ).save(driver)
+    for source, target in zip(nodes, nodes[1:], strict=False):
+        await EntityEdge(
+            source_node_uuid=source.uuid,
+            target_node_uuid=target.uuid,
+            name='KNOWS',
+            fact=f'{source.name} knows {target.name}',
+            fact_embedding=[0.0, 1.0],
+            group_id='group',
+            episodes=[episode.uuid],
+            created_at=NOW,
+        ).save(driver)
+    community = CommunityNode(
+        name='friends', group_id='group', name_embedding=[1.0, 1.0], created_at=NOW
+    )
+    await community.save(driver)
+    await CommunityEdge(
+        source_node_uuid=community.uuid,
+        target_node_uuid=nodes[0].uuid,
+        group_id='group',
+        created_at=NOW,
+    ).save(driver)
+    return driver
+
+
+@pytest.mark.asyncio
+async def test_scan_pages_through_groups_by_uuid():
+    driver = await build_graph()
+
+    batches = [batch async for batch in EntityNode.scan(driver, ['group'], batch_size=2)]
+    uuids = [node.uuid for batch in batches for node in batch]
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert uuids == sorted(uuids, reverse=True)
+    # edge getters raise on empty pages, scans just stop
+    assert [len(b) async for b in EntityEdge.scan(driver, ['group'], batch_size=2)] == [2]
+    assert [b async for b in EntityEdge.scan(driver, ['missing'])] == []
+
+    blocks = [block async for block in scan_embeddings(driver, ['group'], EntityNode, 2)]
+    assert [block.shape for _, block in blocks] == [(2, 2), (1, 2)]
+    assert [uuid for block_uuids, _ in blocks for uuid in block_uuids] == uuids
+
+
+@pytest.mark.asyncio
+async def test_export_and_import_round_trip(tmp_path):
+    driver = await build_graph()
+    path = str(tmp_path / 'group.jsonl')
+
+    exported = await export_graph(driver, ['group'], path, batch_size=2)
+
+    assert exported.model_dump() == {
+        'episodes': 1,
+        'entities': 3,
+        'communities': 1,
+        'episodic_edges': 3,
+        'entity_edges': 2,
+        'community_edges': 1,
+    }
+    with open(path) as file:
+        assert json.loads(file.readline())['format'] == 'graphiti-export'
+
+    embedder = MagicMock(spec=EmbedderClient)
+    target = InMemoryDriver()
+    imported = await import_graph(target, path, embedder, batch_size=4)
+    # importing again overwrites the same records
+    await import_graph(target, path, embedder, batch_size=4)
+
+    assert imported == exported
+    embedder.create.assert_not_called()
+    for model in (EntityNode, EntityEdge, EpisodicNode, CommunityNode):
+        source = [item async for batch in model.scan(driver, ['group']) for item in batch]
+        copied = [item async for batch in model.scan(target, ['group']) for item in batch]
+        assert [item.model_dump() for item in copied] == [item.model_dump() for item in source]
+    alice = (await EntityNode.get_by_group_ids(target, ['group'], with_embeddings=True))[0]
+    assert alice.name_embedding is not None
+
+
+@pytest.mark.asyncio
+async def test_import_without_embeddings_recomputes_them(tmp_path):
+    driver = await build_graph()
+    path = str(tmp_path / 'group.jsonl')
+    await export_graph(driver, ['group'], path, with_embeddings=False)
+
+    embedder = MagicMock(spec=EmbedderClient)
+    embedder.create = AsyncMock(return_value=[0.5, 0.5])
+    embedder.create_batch = AsyncMock(side_effect=lambda texts: [[0.5, 0.5] for _ in texts])
+    await import_graph(InMemoryDriver(), path, embedder)
+
+    # one batch of entity names, one of facts and the community on its own
+    assert [len(call.args[0]) for call in embedder.create_batch.await_args_list] == [3, 2]
+    assert embedder.create.await_count == 1
@@ -0,0 +1,264 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from tenacity import wait_none
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.memory_driver import InMemoryDriver
+from graphiti_core.edges import EntityEdge
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.utils.bulk_utils import (
+    add_nodes_and_edges_bulk,
+    add_triplets_bulk,
+    chunk_rows,
+    retrieve_previous_episodes_bulk,
+)
+
+
+def make_episode(name: str, group_id: str, valid_at: datetime) -> EpisodicNode:
+    return EpisodicNode(
+        uuid=name,
+        name=name,
+        group_id=group_id,
+        source=EpisodeType.message,
+        source_description='test',
+        content=name,
+        valid_at=valid_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_retrieve_previous_episodes_bulk_slices_windows_locally():
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    existing = [make_episode(f'old_{i}', 'g1', base + timedelta(minutes=i)) for i in range(4)]
+    batch = [
+        make_episode('new_0', 'g1', base + timedelta(minutes=2, seconds=30)),
+        make_episode('new_1', 'g1', base + timedelta(minutes=10)),
+        make_episode('new_2', 'g2', base),
+    ]
+
+    async def fake_window(driver, group_id, start_time, end_time, last_n, exclude_uuids):
+        assert set(exclude_uuids) == {e.uuid for e in batch if e.group_id == group_id}
+        return [e for e in existing if e.group_id == group_id]
+
+    with patch(
+        'graphiti_core.utils.bulk_utils.retrieve_episodes_in_window',
+        side_effect=fake_window,
+    ) as mock_window:
+        results = await retrieve_previous_episodes_bulk(AsyncMock(), batch)
+
+    # one query per group rather than one per episode
+    assert mock_window.call_count == 2
+
+    context = {episode.uuid: [e.uuid for e in previous] for episode, previous in results}
+    assert [episode.uuid for episode, _ in results] == ['new_0', 'new_1', 'new_2']
+    assert context['new_0'] == ['old_1', 'old_2', 'new_0']
+    assert context['new_1'] == ['new_0', 'old_3', 'new_1']
+    assert context['new_2'] == ['new_2']
+
+
+NAME_EMBEDDINGS = {
+    'alice': [1.0, 0.0, 0.0],
+    'bob': [0.0, 1.0, 0.0],
+    'carol': [0.0, 0.0, 1.0],
+    'robert': [0.0, 0.8, 0.6],
+}
+
+
+def make_clients(driver: InMemoryDriver) -> GraphitiClients:
+    embedder = MagicMock(spec=EmbedderClient)
+    embedder.create_batch = AsyncMock(
+        side_effect=lambda texts: [
+            NAME_EMBEDDINGS.get(text.strip().lower(), [1.0, 1.0, 1.0]) for text in texts
+        ]
+    )
+    return GraphitiClients(
+        driver=driver,
+        llm_client=MagicMock(spec=LLMClient),
+        embedder=embedder,
+        cross_encoder=MagicMock(spec=CrossEncoderClient),
+    )
+
+
+def triplet(source: str, name: str, target: str) -> tuple[EntityNode, EntityEdge, EntityNode]:
+    source_node = EntityNode(name=source, group_id='group')
+    target_node = EntityNode(name=target, group_id='group')
+    edge = EntityEdge(
+        source_node_uuid=source_node.uuid,
+        target_node_uuid=target_node.uuid,
+        name=name,
+        fact=f'{source} {name.lower()} {target}',
+        group_id='group',
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    return source_node, edge, target_node
+
+
+@pytest.mark.asyncio
+async def test_add_triplets_bulk_dedupes_without_llm():
+    driver = InMemoryDriver()
+    clients = make_clients(driver)
+
+    async def triplets():
+        yield triplet('Alice', 'KNOWS', 'Bob')
+        yield triplet('alice', 'KNOWS', ' Bob')
+        yield triplet('Bob', 'WORKS_WITH', 'Carol')
+        yield triplet('ALICE', 'KNOWS', 'Bob')
+
+    results = await add_triplets_bulk(clients, triplets(), chunk_size=2)
+
+    nodes = await EntityNode.get_by_group_ids(driver, ['group'])
+    edges = await EntityEdge.get_by_group_ids(driver, ['group'])
+    assert sorted(node.name for node in nodes) == ['Alice', 'Bob', 'Carol']
+    assert sorted(edge.name for edge in edges) == ['KNOWS', 'WORKS_WITH']
+    assert results.model_dump() == {
+        'nodes_created': 3,
+        'nodes_merged': 5,
+        'nodes_resolved_by_llm': 0,
+        'edges_created': 2,
+        'edges_merged': 2,
+    }
+    # one batch of names and one of facts per chunk
+    assert clients.embedder.create_batch.await_count == 4
+    clients.llm_client.generate_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_triplets_bulk_llm_fallback_only_for_ambiguous_nodes():
+    driver = InMemoryDriver()
+    clients = make_clients(driver)
+    await add_triplets_bulk(clients, [triplet('Robert', 'KNOWS', 'Alice')])
+
+    clients.llm_client.generate_response = AsyncMock(
+        return_value={
+            'entity_resolutions': [
+                {'id': 0, 'duplicate_idx': 0, 'name': 'Robert', 'duplicates': []}
+            ]
+        }
+    )
+    results = await add_triplets_bulk(
+        clients, [triplet('Bob', 'WORKS_WITH', 'Alice')], llm_fallback=True
+    )
+
+    # Alice matches by name, only Bob is close enough to Robert to ask the LLM
+    assert clients.llm_client.generate_response.await_count == 1
+    assert results.nodes_resolved_by_llm == 1
+    assert results.nodes_created == 0
+    nodes = await EntityNode.get_by_group_ids(driver, ['group'])
+    assert sorted(node.name for node in nodes) == ['Alice', 'Robert']
+    assert len(await EntityEdge.get_by_group_ids(driver, ['group'])) == 2
+
+    # without the fallback an ambiguous node is added as a new node
+    results = await add_triplets_bulk(clients, [triplet('Bob', 'WORKS_WITH', 'Alice')])
+    assert results.nodes_created == 1
+    assert clients.llm_client.generate_response.await_count == 1
+
+
+class RecordingSession(GraphDriverSession):
+    def __init__(self, driver: 'RecordingDriver'):
+        self.driver = driver
+        self.queries: list[tuple[str, dict[str, Any]]] = []
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    async def run(self, query: str, **kwargs: Any) -> Any:
+        if self.driver.failures > 0:
+            self.driver.failures -= 1
+            raise ConnectionError('connection reset')
+        self.queries.append((query, kwargs))
+
+    async def close(self):
+        pass
+
+    async def execute_write(self, func, *args, **kwargs):
+        self.driver.open_transactions += 1
+        try:
+            result = await func(self, *args, **kwargs)
+        finally:
+            self.driver.open_transactions -= 1
+        # only committed transactions are recorded
+        self.driver.transactions.append(self.queries)
+        return result
+
+
+class RecordingDriver(GraphDriver):
+    provider = GraphProvider.NEO4J
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.open_transactions = 0
+        self.transactions: list[list[tuple[str, dict[str, Any]]]] = []
+
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        return [], None, []
+
+    def session(self, database: str | None = None) -> GraphDriverSession:
+        return RecordingSession(self)
+
+    async def close(self):
+        pass
+
+    async def delete_all_indexes(self):
+        pass
+
+
+def test_chunk_rows_limits_rows_and_bytes():
+    rows = [{'uuid': str(i), 'name_embedding': [0.0] * 100} for i in range(5)]
+
+    assert [len(chunk) for chunk in chunk_rows(rows, max_rows=2)] == [2, 2, 1]
+    # each row is about 800 bytes of embedding
+    assert [len(chunk) for chunk in chunk_rows(rows, max_bytes=2000)] == [2, 2, 1]
+    assert [len(chunk) for chunk in chunk_rows(rows, max_bytes=10)] == [1, 1, 1, 1, 1]
+    assert chunk_rows([]) == []
+
+
+@pytest.mark.asyncio
+async def test_add_nodes_and_edges_bulk_small_load_is_one_transaction():
+    driver = RecordingDriver()
+    embedder = MagicMock(spec=EmbedderClient)
+    embedder.create_batch = AsyncMock(side_effect=lambda texts: [[1.0, 0.0] for _ in texts])
+    source_node, edge, target_node = triplet('Alice', 'KNOWS', 'Bob')
+
+    await add_nodes_and_edges_bulk(driver, [], [], [source_node, target_node], [edge], embedder)
+
+    # embeddings are created in batches before the transaction opens
+    assert [len(call.args[0]) for call in embedder.create_batch.await_args_list] == [2, 1]
+    assert len(driver.transactions) == 1
+    assert len(driver.transactions[0]) == 4
+
+
+@pytest.mark.asyncio
+async def test_add_nodes_and_edges_bulk_writes_chunks_and_retries_them():
+    driver = RecordingDriver(failures=1)
+    driver.bulk_write_concurrency = 2
+    triplets = [triplet(f'Person {i}', 'KNOWS', f'Friend {i}') for i in range(3)]
+    nodes = [node for source, _, target in triplets for node in (source, target)]
+    edges = [edge for _, edge, _ in triplets]
+    for node in nodes:
+        node.name_embedding = [1.0, 0.0]
+    for edge in edges:
+        edge.fact_embedding = [1.0, 0.0]
+
+    with (
+        patch('graphiti_core.utils.bulk_utils.BULK_WRITE_CHUNK_ROWS', 4),
+        patch('graphiti_core.utils.bulk_utils.wait_random_exponential', return_value=wait_none()),
+    ):
+        await add_nodes_and_edges_bulk(driver, [], [], nodes, edges, MagicMock(spec=EmbedderClient))
+
+    written = [
+        (next(iter(params)), len(next(iter(params.values()))))
+        for transaction in driver.transactions
+        for _, params in transaction
+    ]
+    # the failed chunk was retried, and all nodes were written before the edges
+    assert sorted(written[:2]) == [('nodes', 2), ('nodes', 4)]
+    assert written[2:] == [('entity_edges', 3)]
+    assert driver.failures == 0
+    assert driver.open_transactions == 0
@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.nodes import EpisodeType, EpisodicNode
+from graphiti_core.utils.context_window import (
+    ContextWindowManager,
+    PreviousEpisodesPolicy,
+    estimate_tokens,
+    truncate_to_tokens,
+)
+
+
+def make_episode(uuid: str, content: str) -> EpisodicNode:
+    return EpisodicNode(
+        uuid=uuid,
+        name=uuid,
+        group_id='g1',
+        source=EpisodeType.message,
+        source_description='test',
+        content=content,
+        valid_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_estimate_tokens():
+    assert estimate_tokens('') == 0
+    assert estimate_tokens('abcdefgh') == 2
+    assert estimate_tokens('你好世界') == 4
+
+
+def test_truncate_to_tokens():
+    text = 'word ' * 100
+    truncated = truncate_to_tokens(text, 10)
+    assert estimate_tokens(truncated) <= 10
+    assert truncated.endswith('…')
+    assert truncate_to_tokens('short', 10) == 'short'
+    assert truncate_to_tokens('short', 0) == ''
+
+
+def test_get_previous_episodes_applies_policy():
+    manager = ContextWindowManager(
+        policies={'extract_nodes': PreviousEpisodesPolicy(max_episodes=2, token_budget=30)}
+    )
+    episodes = [
+        make_episode('e0', 'oldest'),
+        make_episode('e1', 'short'),
+        make_episode('e2', 'x' * 400),
+    ]
+
+    contents = manager.get_previous_episodes('extract_nodes', episodes)
+
+    # only the two most recent episodes, the short one kept whole and the long one truncated
+    assert contents[0] == 'short'
+    assert contents[1].startswith('xxxx') and contents[1].endswith('…')
+    assert sum(estimate_tokens(content) for content in contents) <= 30
+    assert manager.get_previous_episodes('extract_nodes', None) == []
+
+
+@pytest.mark.asyncio
+async def test_summaries_are_cached_per_episode():
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock(return_value={'summary': 'summary of e0'})
+    manager = ContextWindowManager(
+        policies={'extract_attributes': PreviousEpisodesPolicy(max_episodes=1, token_budget=50)},
+        llm_client=llm_client,
+    )
+    episode = make_episode('e0', 'long content ' * 200)
+
+    await manager.summarize_episodes([episode])
+    await manager.summarize_episodes([episode])
+
+    assert llm_client.generate_response.await_count == 1
+    assert manager.get_previous_episodes('extract_attributes', [episode]) == ['summary of e0']
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from graphiti_core.utils.episode_queue import (
+    EpisodeQueueWorkers,
+    NewEpisode,
+    QueuedEpisode,
+    SQLiteEpisodeQueue,
+)
+
+
+def new_episode(uuid: str, group_id: str = 'g1', job_id: str | None = None) -> NewEpisode:
+    return NewEpisode(uuid=uuid, group_id=group_id, job_id=job_id, payload={'name': uuid})
+
+
+@pytest.mark.asyncio
+async def test_claims_follow_group_order_and_survive_restarts(tmp_path):
+    path = str(tmp_path / 'queue.db')
+    queue = SQLiteEpisodeQueue(path)
+    await queue.enqueue([new_episode('a1'), new_episode('b1', 'g2'), new_episode('a2')])
+    # re-submitting an episode is a no-op
+    queued = await queue.enqueue([new_episode('a1', job_id='other')])
+    assert (queued[0].seq, queued[0].job_id) == (1, None)
+
+    claimed = await queue.claim(limit=10)
+    assert [episode.uuid for episode in claimed] == ['a1', 'a2']
+    assert [episode.uuid for episode in await queue.claim(limit=10)] == ['b1']
+    # every group has an episode running
+    assert await queue.claim(limit=10) == []
+    await queue.complete(claimed[:1])
+    await queue.close()
+
+    # the episodes that were running are replayed after a restart
+    queue = SQLiteEpisodeQueue(path)
+    assert await queue.recover() == 2
+    assert [(episode.uuid, episode.attempts) for episode in await queue.claim(limit=10)] == [
+        ('b1', 2)
+    ]
+    assert [(episode.uuid, episode.attempts) for episode in await queue.claim(limit=10)] == [
+        ('a2', 2)
+    ]
+    assert (await queue.get('a1')).status == 'completed'
+    assert await queue.counts() == {'g1': {'completed': 1, 'running': 1}, 'g2': {'running': 1}}
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_episodes_are_retried_then_given_up(tmp_path):
+    queue = SQLiteEpisodeQueue(str(tmp_path / 'queue.db'), max_attempts=2, retry_delay=0)
+    await queue.enqueue([new_episode('a1'), new_episode('a2')])
+
+    claimed = await queue.claim(limit=10)
+    await queue.fail(claimed[:1], 'boom')
+    await queue.release(claimed[1:])
+    claimed = await queue.claim(limit=10)
+    assert [(episode.uuid, episode.attempts) for episode in claimed] == [('a1', 2), ('a2', 1)]
+
+    await queue.fail(claimed, 'boom')
+    episode = await queue.get('a1')
+    assert (episode.status, episode.error) == ('failed', 'boom')
+    assert [episode.uuid for episode in await queue.claim(limit=10)] == ['a2']
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_workers_handle_episodes_in_group_order(tmp_path):
+    queue = SQLiteEpisodeQueue(str(tmp_path / 'queue.db'), retry_delay=0)
+    handled: list[str] = []
+    failures = {'a2'}
+
+    async def handle(episode: QueuedEpisode):
+        await asyncio.sleep(0)
+        if episode.uuid in failures:
+            failures.discard(episode.uuid)
+            raise RuntimeError('transient')
+        handled.append(episode.uuid)
+
+    workers = EpisodeQueueWorkers(queue, handle, workers=2, batch_size=2, poll_interval=0.01)
+    await workers.start()
+    await queue.enqueue(
+        [new_episode('a1'), new_episode('a2'), new_episode('a3'), new_episode('b1', 'g2')]
+    )
+    workers.notify()
+    assert await workers.wait_idle(timeout=5)
+    await workers.stop()
+
+    assert [uuid for uuid in handled if uuid.startswith('a')] == ['a1', 'a2', 'a3']
+    assert sorted(handled) == ['a1', 'a2', 'a3', 'b1']
+    assert (await queue.get('a2')).attempts == 2
+    await queue.close()
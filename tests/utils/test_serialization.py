@@ -0,0 +1,84 @@
+import json
+from datetime import datetime, timezone
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.utils import serialization
+from graphiti_core.utils.serialization import (
+    FACT_FIELDS,
+    dumps,
+    entity_edge_to_json,
+    entity_node_to_json,
+    search_results_to_json,
+)
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_edge() -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid='alice',
+        target_node_uuid='bob',
+        name='KNOWS',
+        fact='Alice knows Bob',
+        fact_embedding=[0.1, 0.2],
+        group_id='group',
+        created_at=NOW,
+        valid_at=NOW,
+        # database property maps carry the embedding into the attributes
+        attributes={'fact_embedding': [0.1, 0.2], 'since': NOW, 'strength': 3},
+    )
+
+
+def parse_dates(value):
+    if isinstance(value, dict):
+        return {key: parse_dates(item) for key, item in value.items()}
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return value
+    return value
+
+
+def test_edge_json_matches_model_dump_without_embeddings():
+    edge = make_edge()
+
+    expected = edge.model_dump(mode='json', exclude={'fact_embedding'})
+    expected['attributes'].pop('fact_embedding')
+
+    assert parse_dates(entity_edge_to_json(edge)) == parse_dates(expected)
+    assert list(entity_edge_to_json(edge, FACT_FIELDS)) == list(FACT_FIELDS)
+    assert entity_edge_to_json(edge, include_embedding=True)['fact_embedding'] == [0.1, 0.2]
+
+
+def test_search_results_dump_with_and_without_orjson(monkeypatch):
+    node = EntityNode(
+        name='Alice', group_id='group', created_at=NOW, attributes={'name_embedding': [1.0]}
+    )
+    episode = EpisodicNode(
+        name='episode',
+        group_id='group',
+        created_at=NOW,
+        valid_at=NOW,
+        source=EpisodeType.message,
+        source_description='chat',
+        content='Alice: hi Bob',
+    )
+    results = SearchResults(
+        edges=[make_edge()],
+        edge_reranker_scores=[0.5],
+        nodes=[node],
+        episodes=[episode],
+    )
+
+    encoded = dumps(search_results_to_json(results))
+    monkeypatch.setattr(serialization, 'orjson', None)
+    assert json.loads(dumps(search_results_to_json(results))) == json.loads(encoded)
+
+    decoded = json.loads(encoded)
+    assert decoded['nodes'] == [entity_node_to_json(node)]
+    assert 'name_embedding' not in decoded['nodes'][0]['attributes']
+    assert decoded['episodes'][0]['source'] == 'message'
+    assert decoded['edges'][0]['attributes'] == {'since': NOW.isoformat(), 'strength': 3}